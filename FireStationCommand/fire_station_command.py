@@ -5,12 +5,16 @@ import asyncio
 import logging
 import math
 import random
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List
 
 import discord
 from redbot.core import commands, Config, bank
+from redbot.core.data_manager import cog_data_path
+
+from .player_store import LEADERBOARD_METRICS, PlayerStore
 
 try:
     import yaml
@@ -27,6 +31,7 @@ class FireStationCommand(commands.Cog):
     __version__ = "1.4.0"
     MISSION_SCHEMA_VERSION = 1
     MAX_COMMAND_LEVEL = 10
+    CAPABILITY_PROFILE_CACHE_SIZE = 512
     DEVELOPER_USER_ID = 132620654087241729
     STAGE_ALERT_CHOICE = "ALERT_CHOICE"
     STAGE_STAFF_TURNOUT = "STAFF_TURNOUT"
@@ -46,6 +51,8 @@ class FireStationCommand(commands.Cog):
         self.game_data = self._load_game_data()
 
         default_global = self._build_default_global_config()
+        # Set once players live in SQLite; from then on Config's copy is stale
+        default_global["player_store_migrated"] = False
 
         default_user: Dict[str, Any] = {
             "started": False,
@@ -71,17 +78,55 @@ class FireStationCommand(commands.Cog):
 
         self.config.register_global(**default_global)
         self.config.register_user(**default_user)
+        self._default_user = default_user
+        self.player_store: PlayerStore | None = None
 
         self.vehicle_definitions = self._build_vehicle_definitions()
         self.equipment_definitions = self._equipment_definitions()
         self.training_definitions = self._training_definitions()
         self.expansion_definitions = self._expansion_definitions()
         self.INCIDENTS = self._build_incidents()
+        self._incident_index_cache = self._build_incident_index(self.INCIDENTS)
+        self._capability_profiles: Dict[tuple, Dict[str, Any]] = {}
         self.VEHICLE_CATALOG = self._build_vehicle_catalog()
         self.EQUIPMENT_CATALOG = self._build_equipment_catalog()
         self.TRAINING_CATALOG = self._build_training_catalog()
         self.EXPANSION_CATALOG = self._build_expansion_catalog()
 
+    async def cog_load(self) -> None:
+        store = PlayerStore(cog_data_path(self) / "fsc_players.db", self._default_user)
+        try:
+            await asyncio.to_thread(store.initialize)
+            if not await asyncio.to_thread(store.is_migrated):
+                users = await self.config.all_users()
+                imported = await asyncio.to_thread(store.import_players, users)
+                log.info("Migrated %s FireStationCommand players from Config to SQLite", imported)
+        except Exception:
+            if await self.config.player_store_migrated():
+                log.exception("FireStationCommand player store unavailable after migration; not loading")
+                raise
+            log.exception("FireStationCommand player store unavailable; using Config for player state")
+            return
+        await self.config.player_store_migrated.set(True)
+        self.player_store = store
+
+    def _player_config(self, user: Any):
+        """Player state scope: the SQLite store once loaded, Red Config before migration."""
+        store = getattr(self, "player_store", None)
+        if store is None:
+            return self.config.user(user)
+        return store.user(user)
+
+    @asynccontextmanager
+    async def _player_transaction(self, user: Any):
+        """Player scope whose writes commit together when the block exits (Config writes as it goes)."""
+        store = getattr(self, "player_store", None)
+        if store is None:
+            yield self.config.user(user)
+            return
+        async with store.transaction(user) as scope:
+            yield scope
+
     # --------------------------------------------------
     # Static fallback data
     # --------------------------------------------------
@@ -693,31 +738,113 @@ class FireStationCommand(commands.Cog):
 
         return totals
 
-    def _readiness_score(self, mission: Dict[str, Any], data: Dict[str, Any]) -> int:
+    def _compile_incident(self, incident: Dict[str, Any]) -> Dict[str, Any]:
+        required_vehicles = incident.get("required_vehicles", [])
+        if not isinstance(required_vehicles, list):
+            required_vehicles = []
+
+        required_training: List[str] = []
+        for definitions, key in (
+            (self.vehicle_definitions, "required_vehicles"),
+            (self.equipment_definitions, "required_equipment"),
+        ):
+            item_ids = incident.get(key, [])
+            if not isinstance(item_ids, list):
+                continue
+            for item_id in item_ids:
+                item = definitions.get(str(item_id))
+                trainings = item.get("required_training", []) if item else []
+                if not isinstance(trainings, list):
+                    continue
+                for training in trainings:
+                    training_id = str(training)
+                    if training_id and training_id not in required_training:
+                        required_training.append(training_id)
+
+        return {
+            "incident": incident,
+            "unlock_level": self._unlock_level(incident),
+            "required_staff": int(incident.get("required_staff", self._required_staff_for_mission(incident))),
+            "required_caps": tuple(self._capabilities_from(incident).items()),
+            "required_vehicles": tuple(str(vehicle_id) for vehicle_id in required_vehicles),
+            "required_training": tuple(required_training),
+            "required_expansions": frozenset(self._required_expansion_ids(incident)),
+        }
+
+    def _capability_profile_key(self, data: Dict[str, Any]) -> tuple:
         vehicles = data.get("vehicles", [])
+        vehicle_key = tuple(
+            (
+                str(vehicle.get("catalog_id") or ""),
+                self._vehicle_condition(vehicle),
+                self._vehicle_is_out_of_service(vehicle),
+            )
+            for vehicle in (vehicles if isinstance(vehicles, list) else [])
+            if isinstance(vehicle, dict)
+        )
         xp = int(data.get("xp", 0))
-        command_level = int(data.get("command_level", self._command_level_for_xp(xp)))
-        staff_total = int(data.get("staff_total", 0))
-        required_staff = int(mission.get("required_staff", self._required_staff_for_mission(mission)))
+        return (
+            vehicle_key,
+            tuple(sorted(self._equipment_inventory_counts(data.get("equipment", [])).items())),
+            frozenset(self._training_inventory_set(data.get("trainings", []))),
+            frozenset(self._expansion_inventory_set(data.get("expansions", []))),
+            int(data.get("staff_total", 0)),
+            int(data.get("command_level", self._command_level_for_xp(xp))),
+        )
+
+    def _capability_profile(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the player's station capabilities, rebuilt only when fleet, kit or staff change."""
+        key = self._capability_profile_key(data)
+        profiles = getattr(self, "_capability_profiles", None)
+        if profiles is None:
+            profiles = self._capability_profiles = {}
+        profile = profiles.get(key)
+        if profile is not None:
+            return profile
+
+        vehicles = data.get("vehicles", [])
+        profile = {
+            "station_caps": self._station_capabilities(vehicles, data.get("equipment", [])),
+            "owned_vehicles": {
+                str(vehicle.get("catalog_id"))
+                for vehicle in (vehicles if isinstance(vehicles, list) else [])
+                if isinstance(vehicle, dict) and vehicle.get("catalog_id")
+            },
+            "trained": key[2],
+            "expansions": key[3],
+            "staff_total": key[4],
+            "command_level": key[5],
+            "readiness": {},
+        }
+        if len(profiles) >= self.CAPABILITY_PROFILE_CACHE_SIZE:
+            profiles.pop(next(iter(profiles)))
+        profiles[key] = profile
+        return profile
 
-        required_caps = self._capabilities_from(mission)
-        station_caps = self._station_capabilities(vehicles, data.get("equipment", []))
-        if required_caps:
+    @staticmethod
+    def _compiled_readiness(compiled: Dict[str, Any], profile: Dict[str, Any]) -> int:
+        station_caps = profile["station_caps"]
+        if compiled["required_caps"]:
             covered = 0.0
             needed = 0.0
-            for capability, required_value in required_caps.items():
+            for capability, required_value in compiled["required_caps"]:
                 needed += required_value
                 covered += min(station_caps.get(capability, 0.0), required_value)
             capability_score = covered / needed if needed > 0 else 1.0
         else:
             capability_score = 1.0
 
+        required_staff = compiled["required_staff"]
+        staff_total = profile["staff_total"]
         staff_score = min(1.0, staff_total / required_staff) if required_staff > 0 else 1.0
-        missing_vehicles = self._missing_required_vehicle_ids(mission, vehicles)
-        vehicle_score = 1.0 if not missing_vehicles else max(0.0, 1.0 - (len(missing_vehicles) * 0.5))
-        missing_training = self._missing_required_training_ids(mission, data)
-        training_score = 1.0 if not missing_training else max(0.0, 1.0 - (len(missing_training) * 0.25))
-        level_required = self._unlock_level(mission)
+        owned_vehicles = profile["owned_vehicles"]
+        missing_vehicles = sum(1 for vehicle_id in compiled["required_vehicles"] if vehicle_id not in owned_vehicles)
+        vehicle_score = max(0.0, 1.0 - (missing_vehicles * 0.5))
+        trained = profile["trained"]
+        missing_training = sum(1 for training_id in compiled["required_training"] if training_id not in trained)
+        training_score = max(0.0, 1.0 - (missing_training * 0.25))
+        command_level = profile["command_level"]
+        level_required = compiled["unlock_level"]
         level_score = 1.0 if command_level >= level_required else max(0.0, command_level / level_required)
 
         score = (
@@ -729,6 +856,9 @@ class FireStationCommand(commands.Cog):
         )
         return int(round(max(0.0, min(1.0, score)) * 100))
 
+    def _readiness_score(self, mission: Dict[str, Any], data: Dict[str, Any]) -> int:
+        return self._compiled_readiness(self._compile_incident(mission), self._capability_profile(data))
+
     def _mission_challenge_limit(self, command_level: int) -> int:
         roll = random.random()
         if roll < 0.05:
@@ -882,7 +1012,7 @@ class FireStationCommand(commands.Cog):
         channel: discord.abc.Messageable,
         user: discord.abc.User,
     ) -> bool:
-        data = await self.config.user(user).all()
+        data = await self._player_config(user).all()
         mission = data.get("active_mission", {}) or {}
         if not self._mission_due_action_ready(mission):
             return False
@@ -902,6 +1032,49 @@ class FireStationCommand(commands.Cog):
             return True
         return False
 
+    async def _defer_mission_action(
+        self,
+        channel: discord.abc.Messageable,
+        user: discord.abc.User,
+        mission: Dict[str, Any],
+    ) -> bool:
+        """Hand the mission's next due action to the Scheduler cog.
+
+        Returns False when the Scheduler is not loaded; the caller then waits
+        in memory as before, which does not survive a reload.
+        """
+        scheduler = self.bot.get_cog("Scheduler")
+        due_at = self._parse_timestamp(mission.get("next_action_at"))
+        if not scheduler or not mission.get("next_action") or due_at is None:
+            return False
+        await scheduler.schedule(
+            "FireStationCommand",
+            due_at,
+            {
+                "kind": "mission_action",
+                "user_id": user.id,
+                "channel_id": getattr(channel, "id", None),
+            },
+            key=f"mission:{user.id}",
+        )
+        return True
+
+    async def handle_scheduled_job(self, job: Dict[str, Any]) -> None:
+        """Scheduler callback: run a mission stage that became due."""
+        payload = job.get("payload") or {}
+        if payload.get("kind") != "mission_action":
+            return
+        user_id = int(payload.get("user_id") or 0)
+        user = self.bot.get_user(user_id)
+        if user is None:
+            try:
+                user = await self.bot.fetch_user(user_id)
+            except discord.HTTPException:
+                return
+        channel_id = payload.get("channel_id")
+        channel = self.bot.get_channel(int(channel_id)) if channel_id else None
+        await self._run_due_mission_action(channel or user, user)
+
     def _build_vehicle_definitions(self) -> Dict[str, Dict[str, Any]]:
         vehicles = self.game_data.get("vehicles", {}).get("vehicles", [])
         if not isinstance(vehicles, list):
@@ -1264,7 +1437,7 @@ class FireStationCommand(commands.Cog):
     # --------------------------------------------------
 
     async def _ensure_started(self, ctx: commands.Context) -> bool:
-        data = await self.config.user(ctx.author).all()
+        data = await self._player_config(ctx.author).all()
         if not data["started"]:
             await ctx.send("You have not started yet. Use `[p]fsc start` first.")
             return False
@@ -1274,7 +1447,7 @@ class FireStationCommand(commands.Cog):
         try:
             return int(await bank.get_balance(user))
         except Exception:
-            data = await self.config.user(user).all()
+            data = await self._player_config(user).all()
             return int(data.get("credits", 0))
 
     async def _give(self, user: discord.abc.User, amount: int) -> None:
@@ -1285,7 +1458,7 @@ class FireStationCommand(commands.Cog):
             return
         except Exception:
             pass
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         local = int(data.get("credits", 0))
         await user_conf.credits.set(local + amount)
@@ -1300,7 +1473,7 @@ class FireStationCommand(commands.Cog):
                 return True
         except Exception:
             pass
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         local = int(data.get("credits", 0))
         if local < amount:
@@ -1309,7 +1482,7 @@ class FireStationCommand(commands.Cog):
         return True
 
     async def _get_user_vehicles(self, user: discord.abc.User) -> List[Dict[str, Any]]:
-        data = await self.config.user(user).all()
+        data = await self._player_config(user).all()
         return data.get("vehicles", [])
 
     async def _award_mission_xp(
@@ -1372,7 +1545,7 @@ class FireStationCommand(commands.Cog):
         }
 
     async def _claim_daily_reward(self, user: discord.abc.User) -> discord.Embed:
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         now = self._utcnow()
         ready_at = self._daily_ready_at(data)
@@ -1392,8 +1565,9 @@ class FireStationCommand(commands.Cog):
         credits_reward = self._daily_credits_reward()
         xp_reward = self._daily_xp_reward()
         await self._give(user, credits_reward)
-        xp_result = await self._award_flat_xp(user_conf, data, xp_reward)
-        await user_conf.last_daily_at.set(self._format_timestamp(now))
+        async with self._player_transaction(user) as user_conf:
+            xp_result = await self._award_flat_xp(user_conf, data, xp_reward)
+            await user_conf.last_daily_at.set(self._format_timestamp(now))
         total_credits = await self._get_credits(user)
 
         embed = discord.Embed(
@@ -1421,7 +1595,7 @@ class FireStationCommand(commands.Cog):
         return embed
 
     async def _create_station(self, user: discord.abc.User) -> bool:
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         if data["started"]:
             return False
@@ -1434,32 +1608,33 @@ class FireStationCommand(commands.Cog):
             "image": "Images/Vehicles/engine_basic.png",
             "condition": 100,
         }
-        await user_conf.started.set(True)
-        await user_conf.vehicles.set([starter_vehicle])
-        await user_conf.next_vehicle_id.set(2)
-        await user_conf.equipment.set(
-            [
-                {"catalog_id": "hose", "quantity": 1},
-                {"catalog_id": "basic_tools", "quantity": 1},
-            ]
-        )
-        await user_conf.trainings.set(["basic_firefighting"])
-        await user_conf.expansions.set([])
-        await user_conf.station_level.set(1)
-        await user_conf.command_level.set(1)
-        await user_conf.xp.set(0)
-        await user_conf.reputation.set(0)
-        await user_conf.missions_completed.set(0)
-        await user_conf.station_type.set("volunteer")
-        await user_conf.staff_total.set(6)
-        await user_conf.staff_trained.set(0)
-        await user_conf.active_mission.set({})
+        async with self._player_transaction(user) as user_conf:
+            await user_conf.started.set(True)
+            await user_conf.vehicles.set([starter_vehicle])
+            await user_conf.next_vehicle_id.set(2)
+            await user_conf.equipment.set(
+                [
+                    {"catalog_id": "hose", "quantity": 1},
+                    {"catalog_id": "basic_tools", "quantity": 1},
+                ]
+            )
+            await user_conf.trainings.set(["basic_firefighting"])
+            await user_conf.expansions.set([])
+            await user_conf.station_level.set(1)
+            await user_conf.command_level.set(1)
+            await user_conf.xp.set(0)
+            await user_conf.reputation.set(0)
+            await user_conf.missions_completed.set(0)
+            await user_conf.station_type.set("volunteer")
+            await user_conf.staff_total.set(6)
+            await user_conf.staff_trained.set(0)
+            await user_conf.active_mission.set({})
 
         await self._give(user, 100_000)
         return True
 
     async def _apply_developer_test_state(self, user: discord.abc.User) -> None:
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         if not data.get("started", False):
             await self._create_station(user)
@@ -1486,25 +1661,26 @@ class FireStationCommand(commands.Cog):
         trainings = sorted(self.TRAINING_CATALOG)
         expansions = sorted(self.EXPANSION_CATALOG)
 
-        await user_conf.started.set(True)
-        await user_conf.developer_mode.set(True)
-        await user_conf.station_level.set(self.MAX_COMMAND_LEVEL)
-        await user_conf.command_level.set(self.MAX_COMMAND_LEVEL)
-        await user_conf.xp.set(self._xp_for_next_command_level(self.MAX_COMMAND_LEVEL - 1) or 7700)
-        await user_conf.reputation.set(100)
-        await user_conf.station_type.set("career")
-        await user_conf.staff_total.set(self._max_staff(self.MAX_COMMAND_LEVEL))
-        await user_conf.staff_trained.set(self._max_staff(self.MAX_COMMAND_LEVEL))
-        await user_conf.vehicles.set(vehicles)
-        await user_conf.next_vehicle_id.set(next_vehicle_id)
-        await user_conf.equipment.set(equipment)
-        await user_conf.trainings.set(trainings)
-        await user_conf.expansions.set(expansions)
-        await user_conf.active_mission.set({})
+        async with self._player_transaction(user) as user_conf:
+            await user_conf.started.set(True)
+            await user_conf.developer_mode.set(True)
+            await user_conf.station_level.set(self.MAX_COMMAND_LEVEL)
+            await user_conf.command_level.set(self.MAX_COMMAND_LEVEL)
+            await user_conf.xp.set(self._xp_for_next_command_level(self.MAX_COMMAND_LEVEL - 1) or 7700)
+            await user_conf.reputation.set(100)
+            await user_conf.station_type.set("career")
+            await user_conf.staff_total.set(self._max_staff(self.MAX_COMMAND_LEVEL))
+            await user_conf.staff_trained.set(self._max_staff(self.MAX_COMMAND_LEVEL))
+            await user_conf.vehicles.set(vehicles)
+            await user_conf.next_vehicle_id.set(next_vehicle_id)
+            await user_conf.equipment.set(equipment)
+            await user_conf.trainings.set(trainings)
+            await user_conf.expansions.set(expansions)
+            await user_conf.active_mission.set({})
         await self._give(user, 5_000_000)
 
     async def _build_developer_embed(self, user: discord.abc.User) -> discord.Embed:
-        data = await self.config.user(user).all()
+        data = await self._player_config(user).all()
         enabled = self._developer_mode_enabled(data)
         credits = await self._get_credits(user)
         embed = discord.Embed(
@@ -1806,6 +1982,26 @@ class FireStationCommand(commands.Cog):
             return True
         return command_level >= int(expansion.get("unlock_level", 1))
 
+    def _build_incident_index(self, incidents: List[Dict[str, Any]]) -> Dict[str, Any]:
+        tiers: Dict[int, List[Dict[str, Any]]] = {}
+        for position, incident in enumerate(incidents):
+            compiled = self._compile_incident(incident)
+            compiled["position"] = position
+            tiers.setdefault(compiled["unlock_level"], []).append(compiled)
+        return {
+            "source": incidents,
+            "size": len(incidents),
+            "tiers": sorted(tiers.items()),
+        }
+
+    def _incident_index(self) -> Dict[str, Any]:
+        index = getattr(self, "_incident_index_cache", None)
+        if index is None or index["source"] is not self.INCIDENTS or index["size"] != len(self.INCIDENTS):
+            index = self._incident_index_cache = self._build_incident_index(self.INCIDENTS)
+            # Cached readiness scores are keyed by position in the old index
+            self._capability_profiles = {}
+        return index
+
     def _pick_random_incident(self, data: Dict[str, Any] | None = None) -> Dict[str, Any]:
         if not data:
             return random.choice(self.INCIDENTS)
@@ -1814,21 +2010,30 @@ class FireStationCommand(commands.Cog):
 
         command_level = int(data.get("command_level", 1))
         challenge_limit = self._mission_challenge_limit(command_level)
+        index = self._incident_index()
+        profile = self._capability_profile(data)
+        scores = profile["readiness"]
         eligible: List[Dict[str, Any]] = []
         challenge: List[Dict[str, Any]] = []
         fallback: List[Dict[str, Any]] = []
 
-        for incident in self.INCIDENTS:
-            if self._missing_required_expansion_ids(incident, data):
-                continue
-            unlock_level = self._unlock_level(incident)
-            readiness = self._readiness_score(incident, data)
-            if unlock_level <= command_level and readiness >= 50:
-                eligible.append(incident)
-            elif unlock_level <= challenge_limit and readiness >= 35:
-                challenge.append(incident)
-            elif unlock_level <= challenge_limit:
-                fallback.append(incident)
+        # Tiers are sorted by unlock level, so nothing past the challenge limit is ever scored
+        for unlock_level, tier in index["tiers"]:
+            if unlock_level > challenge_limit:
+                break
+            for compiled in tier:
+                if not compiled["required_expansions"] <= profile["expansions"]:
+                    continue
+                position = compiled["position"]
+                readiness = scores.get(position)
+                if readiness is None:
+                    readiness = scores[position] = self._compiled_readiness(compiled, profile)
+                if unlock_level <= command_level and readiness >= 50:
+                    eligible.append(compiled["incident"])
+                elif readiness >= 35:
+                    challenge.append(compiled["incident"])
+                else:
+                    fallback.append(compiled["incident"])
 
         if eligible:
             return random.choice(eligible)
@@ -1953,7 +2158,7 @@ class FireStationCommand(commands.Cog):
         return f"{random.choice(options)} ETA {self._make_relative_text(minutes)}."
 
     async def _build_dashboard_embed(self, user: discord.abc.User) -> discord.Embed:
-        data = await self.config.user(user).all()
+        data = await self._player_config(user).all()
         if not data["started"]:
             return discord.Embed(
                 title="Fire Station Command",
@@ -2108,7 +2313,7 @@ class FireStationCommand(commands.Cog):
         *,
         ephemeral: bool = False,
     ) -> None:
-        data = await self.config.user(user).all()
+        data = await self._player_config(user).all()
         mission = data.get("active_mission", {}) or {}
         kwargs = {"ephemeral": True} if ephemeral else {}
         if not mission:
@@ -2191,7 +2396,7 @@ class FireStationCommand(commands.Cog):
         return embed
 
     async def _build_recruitment_embed(self, user: discord.abc.User) -> discord.Embed:
-        data = await self.config.user(user).all()
+        data = await self._player_config(user).all()
         lvl = int(data.get("station_level", 1))
         staff_total = int(data.get("staff_total", 0))
         max_staff = self._max_staff(lvl)
@@ -2586,7 +2791,7 @@ class FireStationCommand(commands.Cog):
         *,
         ephemeral: bool = False,
     ) -> None:
-        data = await self.config.user(user).all()
+        data = await self._player_config(user).all()
         vehicles = data.get("vehicles", [])
         max_veh = self._max_vehicles_for_data(data)
         if len(vehicles) >= max_veh:
@@ -2613,7 +2818,7 @@ class FireStationCommand(commands.Cog):
         *,
         ephemeral: bool = False,
     ) -> None:
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         active = data.get("active_mission", {}) or {}
         if active:
@@ -2664,7 +2869,7 @@ class FireStationCommand(commands.Cog):
             view.message = message
 
     async def _send_dashboard(self, ctx: commands.Context) -> None:
-        data = await self.config.user(ctx.author).all()
+        data = await self._player_config(ctx.author).all()
         embed = await self._build_dashboard_embed(ctx.author)
         if data["started"]:
             view = FscDashboardView(self, ctx.author, ctx.channel, ctx.guild, data=data)
@@ -2686,7 +2891,7 @@ class FireStationCommand(commands.Cog):
     @fsc_group.command(name="start")
     async def fsc_start(self, ctx: commands.Context):
         """Start your fire station career."""
-        user_conf = self.config.user(ctx.author)
+        user_conf = self._player_config(ctx.author)
         data = await user_conf.all()
         if data["started"]:
             await ctx.send("You already started.")
@@ -2707,7 +2912,7 @@ class FireStationCommand(commands.Cog):
             await ctx.send("Developer mode is not available for this account.")
             return
 
-        user_conf = self.config.user(ctx.author)
+        user_conf = self._player_config(ctx.author)
         data = await user_conf.all()
         enabled = not self._developer_mode_enabled(data)
         await user_conf.developer_mode.set(enabled)
@@ -2729,7 +2934,7 @@ class FireStationCommand(commands.Cog):
             await ctx.send("Developer menu is not available for this account.")
             return
 
-        data = await self.config.user(ctx.author).all()
+        data = await self._player_config(ctx.author).all()
         embed = await self._build_developer_embed(ctx.author)
         view = FscDeveloperView(self, ctx.author, ctx.channel, ctx.guild, data=data)
         message = await ctx.send(embed=embed, view=view)
@@ -2744,13 +2949,102 @@ class FireStationCommand(commands.Cog):
         embed = await self._claim_daily_reward(ctx.author)
         await ctx.send(embed=embed)
 
+    async def _leaderboard_rows(self, metric: str, limit: int, user_ids: List[int] | None = None) -> List[tuple]:
+        store = getattr(self, "player_store", None)
+        if store is not None:
+            return await asyncio.to_thread(store.leaderboard, metric, limit, user_ids)
+
+        rows = []
+        for user_id, data in (await self.config.all_users()).items():
+            if not data.get("started") or (user_ids is not None and user_id not in user_ids):
+                continue
+            if metric == "vehicles":
+                value = len(data.get("vehicles", []))
+            else:
+                value = int(data.get(metric, 0) or 0)
+            rows.append((int(user_id), value))
+        rows.sort(key=lambda row: (-row[1], row[0]))
+        return rows[:limit]
+
+    @fsc_group.command(name="leaderboard", aliases=["top"])
+    async def fsc_leaderboard(self, ctx: commands.Context, metric: str = "xp"):
+        """Show the top stations by xp, missions_completed, reputation, command_level or vehicles."""
+        metric = metric.lower()
+        if metric not in LEADERBOARD_METRICS:
+            await ctx.send(f"Unknown metric. Choose one of: {', '.join(LEADERBOARD_METRICS)}.")
+            return
+
+        user_ids = [member.id for member in ctx.guild.members] if ctx.guild else None
+        rows = await self._leaderboard_rows(metric, 10, user_ids)
+        if not rows:
+            await ctx.send("No stations have been started yet.")
+            return
+
+        lines = []
+        for rank, (user_id, value) in enumerate(rows, start=1):
+            user = self.bot.get_user(user_id)
+            name = user.display_name if user else f"User {user_id}"
+            lines.append(f"**{rank}.** {name} — {value:,}")
+        embed = discord.Embed(
+            title=f"Fire Station Command leaderboard: {metric.replace('_', ' ')}",
+            description="\n".join(lines),
+            color=discord.Color.gold(),
+        )
+        await ctx.send(embed=embed)
+
+    async def _player_stats(self) -> Dict[str, Any]:
+        store = getattr(self, "player_store", None)
+        if store is not None:
+            return await asyncio.to_thread(store.stats)
+
+        started = [data for data in (await self.config.all_users()).values() if data.get("started")]
+        owned: Dict[str, int] = {}
+        for data in started:
+            for vehicle in data.get("vehicles", []):
+                catalog_id = vehicle.get("catalog_id") if isinstance(vehicle, dict) else None
+                if catalog_id:
+                    owned[str(catalog_id)] = owned.get(str(catalog_id), 0) + 1
+        return {
+            "players": len(started),
+            "missions_completed": sum(int(data.get("missions_completed", 0) or 0) for data in started),
+            "xp": sum(int(data.get("xp", 0) or 0) for data in started),
+            "active_missions": sum(1 for data in started if data.get("active_mission")),
+            "vehicles": sum(len(data.get("vehicles", [])) for data in started),
+            "top_vehicles": sorted(owned.items(), key=lambda item: (-item[1], item[0]))[:5],
+        }
+
+    @fsc_group.command(name="stats")
+    async def fsc_stats(self, ctx: commands.Context):
+        """Show totals across every started station."""
+        stats = await self._player_stats()
+        if not stats["players"]:
+            await ctx.send("No stations have been started yet.")
+            return
+
+        embed = discord.Embed(title="Fire Station Command totals", color=discord.Color.gold())
+        embed.add_field(name="Stations", value=f"{stats['players']:,}", inline=True)
+        embed.add_field(name="Missions completed", value=f"{stats['missions_completed']:,}", inline=True)
+        embed.add_field(name="Active missions", value=f"{stats['active_missions']:,}", inline=True)
+        embed.add_field(name="Command XP", value=f"{stats['xp']:,}", inline=True)
+        embed.add_field(name="Vehicles", value=f"{stats['vehicles']:,}", inline=True)
+        if stats["top_vehicles"]:
+            embed.add_field(
+                name="Most owned vehicles",
+                value="\n".join(
+                    f"{self.VEHICLE_CATALOG.get(catalog_id, {}).get('name', catalog_id)} — {owned:,}"
+                    for catalog_id, owned in stats["top_vehicles"]
+                ),
+                inline=False,
+            )
+        await ctx.send(embed=embed)
+
     @fsc_group.command(name="status")
     async def fsc_status(self, ctx: commands.Context):
         """Show station, staff, vehicles, and active mission."""
         if not await self._ensure_started(ctx):
             return
 
-        user_conf = self.config.user(ctx.author)
+        user_conf = self._player_config(ctx.author)
         data = await user_conf.all()
         vehicles = data.get("vehicles", [])
         credits = await self._get_credits(ctx.author)
@@ -2810,7 +3104,7 @@ class FireStationCommand(commands.Cog):
         if not await self._ensure_started(ctx):
             return
 
-        data = await self.config.user(ctx.author).all()
+        data = await self._player_config(ctx.author).all()
         lvl = int(data.get("station_level", 1))
         xp = int(data.get("xp", 0))
         command_level = int(data.get("command_level", self._command_level_for_xp(xp)))
@@ -2873,7 +3167,7 @@ class FireStationCommand(commands.Cog):
             await ctx.send("Amount must be positive.")
             return
 
-        user_conf = self.config.user(ctx.author)
+        user_conf = self._player_config(ctx.author)
         data = await user_conf.all()
         lvl = int(data.get("station_level", 1))
         staff_total = int(data.get("staff_total", 0))
@@ -2917,7 +3211,7 @@ class FireStationCommand(commands.Cog):
         channel: discord.abc.Messageable | None = None,
         guild: discord.Guild | None = None,
     ):
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         lvl = int(data.get("station_level", 1))
         staff_total = int(data.get("staff_total", 0))
@@ -2974,7 +3268,7 @@ class FireStationCommand(commands.Cog):
         if not await self._ensure_started(ctx):
             return
 
-        user_conf = self.config.user(ctx.author)
+        user_conf = self._player_config(ctx.author)
         data = await user_conf.all()
         lvl = int(data.get("station_level", 1))
         xp = int(data.get("xp", 0))
@@ -3051,7 +3345,7 @@ class FireStationCommand(commands.Cog):
         channel: discord.abc.Messageable | None = None,
         guild: discord.Guild | None = None,
     ):
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         current_lvl = int(data.get("station_level", 1))
         xp = int(data.get("xp", 0))
@@ -3137,7 +3431,7 @@ class FireStationCommand(commands.Cog):
         if not await self._ensure_started(ctx):
             return
 
-        user_conf = self.config.user(ctx.author)
+        user_conf = self._player_config(ctx.author)
         data = await user_conf.all()
         stype = data.get("station_type", "volunteer")
         lvl = int(data.get("station_level", 1))
@@ -3184,7 +3478,7 @@ class FireStationCommand(commands.Cog):
         channel: discord.abc.Messageable | None = None,
         guild: discord.Guild | None = None,
     ):
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         stype = data.get("station_type", "volunteer")
         if stype == "career":
@@ -3233,7 +3527,7 @@ class FireStationCommand(commands.Cog):
         if not await self._ensure_started(ctx):
             return
 
-        data = await self.config.user(ctx.author).all()
+        data = await self._player_config(ctx.author).all()
         vehicles = data.get("vehicles", [])
         max_veh = self._max_vehicles_for_data(data)
         if len(vehicles) >= max_veh:
@@ -3253,7 +3547,7 @@ class FireStationCommand(commands.Cog):
         if not await self._ensure_started(ctx):
             return
 
-        data = await self.config.user(ctx.author).all()
+        data = await self._player_config(ctx.author).all()
         embed = self._build_equipment_shop_embed(data)
         view = EquipmentShopView(self, ctx.channel, ctx.author, ctx.guild, data=data)
         message = await ctx.send(embed=embed, view=view)
@@ -3265,7 +3559,7 @@ class FireStationCommand(commands.Cog):
         if not await self._ensure_started(ctx):
             return
 
-        data = await self.config.user(ctx.author).all()
+        data = await self._player_config(ctx.author).all()
         if not self._feature_available(data, "training"):
             await ctx.send(self._feature_locked_text("training"))
             return
@@ -3280,7 +3574,7 @@ class FireStationCommand(commands.Cog):
         if not await self._ensure_started(ctx):
             return
 
-        data = await self.config.user(ctx.author).all()
+        data = await self._player_config(ctx.author).all()
         embed = self._build_expansion_embed(data)
         view = ExpansionView(self, ctx.channel, ctx.author, ctx.guild, data=data)
         message = await ctx.send(embed=embed, view=view)
@@ -3292,7 +3586,7 @@ class FireStationCommand(commands.Cog):
         if not await self._ensure_started(ctx):
             return
 
-        data = await self.config.user(ctx.author).all()
+        data = await self._player_config(ctx.author).all()
         if not self._feature_available(data, "maintenance"):
             await ctx.send(self._feature_locked_text("maintenance"))
             return
@@ -3307,7 +3601,7 @@ class FireStationCommand(commands.Cog):
         if not await self._ensure_started(ctx):
             return
 
-        data = await self.config.user(ctx.author).all()
+        data = await self._player_config(ctx.author).all()
         credits = await self._get_credits(ctx.author)
         embed = self._build_parking_lot_embed(data, credits)
         view = ParkingLotView(self, ctx.channel, ctx.author, ctx.guild, data=data)
@@ -3320,7 +3614,7 @@ class FireStationCommand(commands.Cog):
         if not await self._ensure_started(ctx):
             return
 
-        user_conf = self.config.user(ctx.author)
+        user_conf = self._player_config(ctx.author)
         data = await user_conf.all()
         active = data.get("active_mission", {}) or {}
         if active:
@@ -3373,7 +3667,7 @@ class FireStationCommand(commands.Cog):
         user: discord.abc.User,
         mode: str,
     ):
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         mission = data.get("active_mission", {}) or {}
         if not self._mission_is_stage(mission, self.STAGE_ALERT_CHOICE):
@@ -3431,12 +3725,14 @@ class FireStationCommand(commands.Cog):
         await interaction.response.send_message(embed=embed, ephemeral=False)
 
         if minutes > 0:
+            if await self._defer_mission_action(channel, user, mission):
+                return
             await asyncio.sleep(int(minutes * 60))
 
         await self._show_turnout_result(channel, user)
 
     async def _show_turnout_result(self, channel: discord.abc.Messageable, user: discord.abc.User):
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         mission = data.get("active_mission", {}) or {}
         if not self._mission_is_stage(mission, self.STAGE_STAFF_TURNOUT):
@@ -3480,7 +3776,7 @@ class FireStationCommand(commands.Cog):
         channel: discord.abc.Messageable,
         user: discord.abc.User,
     ):
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         mission = data.get("active_mission", {}) or {}
         if not self._mission_is_stage(mission, self.STAGE_STAFF_TURNOUT):
@@ -3512,6 +3808,8 @@ class FireStationCommand(commands.Cog):
         embed.add_field(name="Additional ETA", value=self._make_relative_text(minutes), inline=True)
         await interaction.response.send_message(embed=embed, ephemeral=False)
 
+        if await self._defer_mission_action(channel, user, mission):
+            return
         await asyncio.sleep(int(minutes * 60))
         await self._show_turnout_result(channel, user)
 
@@ -3521,7 +3819,7 @@ class FireStationCommand(commands.Cog):
         channel: discord.abc.Messageable,
         user: discord.abc.User,
     ):
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         mission = data.get("active_mission", {}) or {}
         if not self._mission_is_stage(mission, self.STAGE_STAFF_TURNOUT):
@@ -3557,12 +3855,12 @@ class FireStationCommand(commands.Cog):
         channel: discord.abc.Messageable,
         user: discord.abc.User,
     ):
-        user_conf = self.config.user(user)
-        data = await user_conf.all()
-        reputation = int(data.get("reputation", 0))
-        reputation_delta = self._reputation_delta_for_outcome("skip")
-        await user_conf.reputation.set(reputation + reputation_delta)
-        await user_conf.active_mission.set({})
+        async with self._player_transaction(user) as user_conf:
+            data = await user_conf.all()
+            reputation = int(data.get("reputation", 0))
+            reputation_delta = self._reputation_delta_for_outcome("skip")
+            await user_conf.reputation.set(reputation + reputation_delta)
+            await user_conf.active_mission.set({})
         await interaction.response.send_message(
             f"Incident cancelled. Reputation change: {reputation_delta:+}.",
             ephemeral=False,
@@ -3605,14 +3903,14 @@ class FireStationCommand(commands.Cog):
             )
             return False
 
-        original_conf = self.config.user(original_user)
+        original_conf = self._player_config(original_user)
         original_data = await original_conf.all()
         original_mission = original_data.get("active_mission", {}) or {}
         if not self._mission_is_stage(original_mission, self.STAGE_STAFF_TURNOUT):
             await interaction.response.send_message("This incident is no longer available for takeover.", ephemeral=True)
             return False
 
-        new_conf = self.config.user(new_user)
+        new_conf = self._player_config(new_user)
         new_data = await new_conf.all()
         if not new_data.get("started", False):
             await interaction.response.send_message("Create a station before taking over incidents.", ephemeral=True)
@@ -3663,7 +3961,7 @@ class FireStationCommand(commands.Cog):
         user: discord.abc.User,
         values: List[str],
     ):
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         mission = data.get("active_mission", {}) or {}
         if not self._mission_is_stage(mission, self.STAGE_VEHICLE_SELECT):
@@ -3703,6 +4001,8 @@ class FireStationCommand(commands.Cog):
         embed.add_field(name="Vehicles dispatched", value=str(len(values)), inline=True)
         await interaction.response.send_message(embed=embed, ephemeral=False)
 
+        if await self._defer_mission_action(channel, user, mission):
+            return
         await asyncio.sleep(int(minutes * 60))
         await self._send_travel_update(channel, user)
 
@@ -3713,7 +4013,7 @@ class FireStationCommand(commands.Cog):
         *,
         sleep_after: bool = True,
     ):
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         mission = data.get("active_mission", {}) or {}
         if not self._mission_is_stage(mission, self.STAGE_TRAVEL):
@@ -3780,6 +4080,8 @@ class FireStationCommand(commands.Cog):
                 except Exception:
                     pass
 
+            if await self._defer_mission_action(channel, user, mission):
+                return
             if sleep_after:
                 await asyncio.sleep(int(minutes * 60))
                 await self._resolve_backup_window(channel, user)
@@ -3812,6 +4114,8 @@ class FireStationCommand(commands.Cog):
             except Exception:
                 pass
 
+        if await self._defer_mission_action(channel, user, mission):
+            return
         if sleep_after:
             await asyncio.sleep(int(minutes * 60))
             await self._resolve_incident(channel, user)
@@ -3823,7 +4127,7 @@ class FireStationCommand(commands.Cog):
         user: discord.abc.User,
         values: List[str],
     ):
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         mission = data.get("active_mission", {}) or {}
         if not self._mission_is_stage(mission, self.STAGE_SCENE_BACKUP):
@@ -3866,6 +4170,8 @@ class FireStationCommand(commands.Cog):
         embed.add_field(name="Backup ETA", value=self._make_relative_text(minutes), inline=True)
         await interaction.response.send_message(embed=embed, ephemeral=False)
 
+        if await self._defer_mission_action(channel, user, mission):
+            return
         await asyncio.sleep(int(minutes * 60))
         await self._resolve_incident(channel, user)
 
@@ -3888,7 +4194,7 @@ class FireStationCommand(commands.Cog):
         *,
         sleep_after: bool = True,
     ):
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         mission = data.get("active_mission", {}) or {}
         if not self._mission_is_stage(mission, self.STAGE_SCENE_BACKUP):
@@ -3920,6 +4226,8 @@ class FireStationCommand(commands.Cog):
             except Exception:
                 pass
 
+        if await self._defer_mission_action(channel, user, mission):
+            return
         if sleep_after:
             await asyncio.sleep(int(minutes * 60))
             await self._resolve_incident(channel, user)
@@ -3931,7 +4239,7 @@ class FireStationCommand(commands.Cog):
         *,
         forced_outcome_key: str | None = None,
     ) -> bool:
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         mission = data.get("active_mission", {}) or {}
         valid_forced_outcomes = {"success", "partial", "failure"}
@@ -3987,15 +4295,16 @@ class FireStationCommand(commands.Cog):
             outcome_key = "failure"
             narrative = mission.get("failure_narrative") or "The incident outcome is poor and needs review."
 
-        xp_result = await self._award_mission_xp(user_conf, data, mission, outcome_key)
-        reputation_delta = self._reputation_delta_for_outcome(outcome_key)
-        new_reputation = int(data.get("reputation", 0)) + reputation_delta
-        await user_conf.reputation.set(new_reputation)
-        updated_vehicles = self._apply_vehicle_wear(vehicles, dispatched_ids, outcome_key, data=data)
-        await user_conf.vehicles.set(updated_vehicles)
+        async with self._player_transaction(user) as user_conf:
+            xp_result = await self._award_mission_xp(user_conf, data, mission, outcome_key)
+            reputation_delta = self._reputation_delta_for_outcome(outcome_key)
+            new_reputation = int(data.get("reputation", 0)) + reputation_delta
+            await user_conf.reputation.set(new_reputation)
+            updated_vehicles = self._apply_vehicle_wear(vehicles, dispatched_ids, outcome_key, data=data)
+            await user_conf.vehicles.set(updated_vehicles)
+            await user_conf.active_mission.set({})
         await self._give(user, reward)
         total_credits = await self._get_credits(user)
-        await user_conf.active_mission.set({})
         repair_estimate = self._fleet_maintenance_cost(updated_vehicles)
         out_of_service = self._out_of_service_vehicle_text(updated_vehicles)
 
@@ -4049,7 +4358,7 @@ class FireStationCommand(commands.Cog):
         user: discord.abc.User,
         outcome_key: str,
     ) -> str:
-        data = await self.config.user(user).all()
+        data = await self._player_config(user).all()
         if not data.get("active_mission"):
             return "No active mission to resolve."
         handled = await self._resolve_incident(channel, user, forced_outcome_key=outcome_key)
@@ -4066,7 +4375,7 @@ class FireStationCommand(commands.Cog):
         *,
         edit_message: bool = False,
     ) -> None:
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         vehicles = data.get("vehicles", [])
         cost = self._fleet_maintenance_cost(vehicles)
@@ -4129,7 +4438,7 @@ class FireStationCommand(commands.Cog):
         edit_message: bool = False,
         guild: discord.Guild | None = None,
     ):
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
 
         catalog = self.VEHICLE_CATALOG
@@ -4245,8 +4554,9 @@ class FireStationCommand(commands.Cog):
         }
         vehicles.append(new_vehicle)
 
-        await user_conf.vehicles.set(vehicles)
-        await user_conf.next_vehicle_id.set(next_id + 1)
+        async with self._player_transaction(user) as user_conf:
+            await user_conf.vehicles.set(vehicles)
+            await user_conf.next_vehicle_id.set(next_id + 1)
 
         embed = discord.Embed(
             title="Vehicle purchased",
@@ -4278,7 +4588,7 @@ class FireStationCommand(commands.Cog):
         edit_message: bool = False,
         guild: discord.Guild | None = None,
     ):
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         if data.get("active_mission"):
             embed = self._build_vehicle_sale_embed(data)
@@ -4362,7 +4672,7 @@ class FireStationCommand(commands.Cog):
         edit_message: bool = False,
         guild: discord.Guild | None = None,
     ):
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
         credits = await self._get_credits(user)
         base_cost = self._parking_lot_base_cost_for_count(self._parking_lot_count(data))
@@ -4412,7 +4722,7 @@ class FireStationCommand(commands.Cog):
         edit_message: bool = False,
         guild: discord.Guild | None = None,
     ):
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
 
         if expansion_id not in self.EXPANSION_CATALOG:
@@ -4515,7 +4825,7 @@ class FireStationCommand(commands.Cog):
         edit_message: bool = False,
         guild: discord.Guild | None = None,
     ):
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
 
         if training_id not in self.TRAINING_CATALOG:
@@ -4617,7 +4927,7 @@ class FireStationCommand(commands.Cog):
         edit_message: bool = False,
         guild: discord.Guild | None = None,
     ):
-        user_conf = self.config.user(user)
+        user_conf = self._player_config(user)
         data = await user_conf.all()
 
         if equipment_id not in self.EQUIPMENT_CATALOG:
@@ -4797,7 +5107,7 @@ class FscStartView(FscTimedView):
     async def create_station(self, interaction: discord.Interaction, button: discord.ui.Button):
         created = await self.cog._create_station(self.user)
         embed = await self.cog._build_dashboard_embed(self.user)
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         view = FscDashboardView(self.cog, self.user, interaction.channel, interaction.guild, data=data)
         if created:
             await interaction.response.edit_message(embed=embed, view=view)
@@ -4930,7 +5240,7 @@ class FscDashboardView(FscTimedView):
         return FscDashboardView(self.cog, self.user, self.channel, self.guild, data=data or self.data)
 
     async def open_category(self, interaction: discord.Interaction, category: str) -> None:
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         embed = await self.cog._build_dashboard_embed(self.user)
         actions = self._category_actions(category, data)
         labels = [self.ACTION_LABELS[action] for action in actions]
@@ -4970,12 +5280,12 @@ class FscDashboardView(FscTimedView):
         await self.open_category(interaction, "Vehicle")
 
     async def refresh(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         embed = await self.cog._build_dashboard_embed(self.user)
         await interaction.response.edit_message(content=None, embed=embed, view=self._dashboard_view(data))
 
     async def station(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         if not data["started"]:
             embed = await self.cog._build_dashboard_embed(self.user)
             embed.add_field(name="Action required", value="Create a station first.", inline=False)
@@ -4985,7 +5295,7 @@ class FscDashboardView(FscTimedView):
         await interaction.response.edit_message(content=None, embed=embed, view=self._dashboard_view())
 
     async def recruit(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         if not data["started"]:
             embed = await self.cog._build_dashboard_embed(self.user)
             embed.add_field(name="Action required", value="Create a station first.", inline=False)
@@ -4996,7 +5306,7 @@ class FscDashboardView(FscTimedView):
         await interaction.response.edit_message(content=None, embed=embed, view=view)
 
     async def shop(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         if not data["started"]:
             embed = await self.cog._build_dashboard_embed(self.user)
             embed.add_field(name="Action required", value="Create a station first.", inline=False)
@@ -5022,7 +5332,7 @@ class FscDashboardView(FscTimedView):
         )
 
     async def sell_vehicle(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         if not data["started"]:
             embed = await self.cog._build_dashboard_embed(self.user)
             embed.add_field(name="Action required", value="Create a station first.", inline=False)
@@ -5045,7 +5355,7 @@ class FscDashboardView(FscTimedView):
         )
 
     async def parking(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         if not data["started"]:
             embed = await self.cog._build_dashboard_embed(self.user)
             embed.add_field(name="Action required", value="Create a station first.", inline=False)
@@ -5066,7 +5376,7 @@ class FscDashboardView(FscTimedView):
         )
 
     async def equipment(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         if not data["started"]:
             embed = await self.cog._build_dashboard_embed(self.user)
             embed.add_field(name="Action required", value="Create a station first.", inline=False)
@@ -5084,7 +5394,7 @@ class FscDashboardView(FscTimedView):
         await interaction.response.edit_message(content=None, embed=embed, view=view)
 
     async def training(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         if not data["started"]:
             embed = await self.cog._build_dashboard_embed(self.user)
             embed.add_field(name="Action required", value="Create a station first.", inline=False)
@@ -5107,7 +5417,7 @@ class FscDashboardView(FscTimedView):
         await interaction.response.edit_message(content=None, embed=embed, view=view)
 
     async def expansions(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         if not data["started"]:
             embed = await self.cog._build_dashboard_embed(self.user)
             embed.add_field(name="Action required", value="Create a station first.", inline=False)
@@ -5130,7 +5440,7 @@ class FscDashboardView(FscTimedView):
         await interaction.response.edit_message(content=None, embed=embed, view=view)
 
     async def maintenance(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         if not data["started"]:
             embed = await self.cog._build_dashboard_embed(self.user)
             embed.add_field(name="Action required", value="Create a station first.", inline=False)
@@ -5152,7 +5462,7 @@ class FscDashboardView(FscTimedView):
         await interaction.response.edit_message(content=None, embed=embed, view=view)
 
     async def upgrade(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         if not data["started"]:
             embed = await self.cog._build_dashboard_embed(self.user)
             embed.add_field(name="Action required", value="Create a station first.", inline=False)
@@ -5222,7 +5532,7 @@ class FscDashboardView(FscTimedView):
         await interaction.response.edit_message(content=None, embed=embed, view=view)
 
     async def career(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         if not data["started"]:
             embed = await self.cog._build_dashboard_embed(self.user)
             embed.add_field(name="Action required", value="Create a station first.", inline=False)
@@ -5289,7 +5599,7 @@ class FscDashboardView(FscTimedView):
         await interaction.response.edit_message(content=None, embed=embed, view=view)
 
     async def daily(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         if not data["started"]:
             embed = await self.cog._build_dashboard_embed(self.user)
             embed.add_field(name="Action required", value="Create a station first.", inline=False)
@@ -5297,13 +5607,13 @@ class FscDashboardView(FscTimedView):
             return
 
         embed = await self.cog._claim_daily_reward(self.user)
-        refreshed = await self.cog.config.user(self.user).all()
+        refreshed = await self.cog._player_config(self.user).all()
         await interaction.response.edit_message(content=None, embed=embed, view=self._dashboard_view(refreshed))
 
     async def mission(self, interaction: discord.Interaction, button: discord.ui.Button):
         channel = interaction.channel or self.channel
         guild = interaction.guild or self.guild
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         if not data["started"]:
             embed = await self.cog._build_dashboard_embed(self.user)
             embed.add_field(name="Action required", value="Create a station first.", inline=False)
@@ -5313,7 +5623,7 @@ class FscDashboardView(FscTimedView):
         active = data.get("active_mission", {}) or {}
         if active:
             if await self.cog._run_due_mission_action(channel, self.user):
-                refreshed = await self.cog.config.user(self.user).all()
+                refreshed = await self.cog._player_config(self.user).all()
                 active = refreshed.get("active_mission", {}) or {}
                 if not active:
                     embed = await self.cog._build_dashboard_embed(self.user)
@@ -5352,7 +5662,7 @@ class FscDashboardView(FscTimedView):
         )
         mission["missing_required_training"] = self.cog._missing_required_training_ids(incident, data)
         mission["readiness_score"] = self.cog._readiness_score(incident, data)
-        await self.cog.config.user(self.user).active_mission.set(mission)
+        await self.cog._player_config(self.user).active_mission.set(mission)
 
         embed = discord.Embed(
             title=f"🚨 New incident: {incident['name']}",
@@ -5387,7 +5697,7 @@ class FscDashboardView(FscTimedView):
         await interaction.response.edit_message(content=None, embed=embed, view=self._dashboard_view())
 
     async def devmenu(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         if not self.cog._developer_mode_enabled(data) or not self.cog._user_can_use_developer_mode(self.user):
             embed = await self.cog._build_dashboard_embed(self.user)
             embed.add_field(name="Developer menu", value="Developer mode is not enabled.", inline=False)
@@ -5462,7 +5772,7 @@ class FscDashboardCategoryView(FscTimedView):
         return interaction.user.id == self.user.id
 
     async def run_action(self, interaction: discord.Interaction, action: str) -> None:
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         dashboard = FscDashboardView(
             self.cog,
             self.user,
@@ -5484,7 +5794,7 @@ class FscDashboardCategoryView(FscTimedView):
 
     @discord.ui.button(label="Back", style=discord.ButtonStyle.secondary, row=4)
     async def back(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         embed = await self.cog._build_dashboard_embed(self.user)
         view = FscDashboardView(
             self.cog,
@@ -5518,7 +5828,7 @@ class FscDeveloperView(FscTimedView):
         return interaction.user.id == self.user.id and self.cog._user_can_use_developer_mode(interaction.user)
 
     async def _refresh(self, interaction: discord.Interaction, message: str) -> None:
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         embed = await self.cog._build_developer_embed(self.user)
         embed.add_field(name="Developer action", value=message, inline=False)
         view = FscDeveloperView(
@@ -5532,11 +5842,11 @@ class FscDeveloperView(FscTimedView):
 
     @discord.ui.button(label="Grant resources", style=discord.ButtonStyle.success)
     async def grant_resources(self, interaction: discord.Interaction, button: discord.ui.Button):
-        user_conf = self.cog.config.user(self.user)
-        data = await user_conf.all()
-        xp = max(int(data.get("xp", 0)), self.cog._xp_for_next_command_level(self.cog.MAX_COMMAND_LEVEL - 1) or 7700)
-        await user_conf.xp.set(xp)
-        await user_conf.command_level.set(self.cog.MAX_COMMAND_LEVEL)
+        async with self.cog._player_transaction(self.user) as user_conf:
+            data = await user_conf.all()
+            xp = max(int(data.get("xp", 0)), self.cog._xp_for_next_command_level(self.cog.MAX_COMMAND_LEVEL - 1) or 7700)
+            await user_conf.xp.set(xp)
+            await user_conf.command_level.set(self.cog.MAX_COMMAND_LEVEL)
         await self.cog._give(self.user, 1_000_000)
         await self._refresh(interaction, "Granted 1,000,000 credits and max command level XP.")
 
@@ -5547,7 +5857,7 @@ class FscDeveloperView(FscTimedView):
 
     @discord.ui.button(label="Clear mission", style=discord.ButtonStyle.secondary)
     async def clear_mission(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self.cog.config.user(self.user).active_mission.set({})
+        await self.cog._player_config(self.user).active_mission.set({})
         await self._refresh(interaction, "Cleared the active mission.")
 
     @discord.ui.button(label="Force success", style=discord.ButtonStyle.success, row=1)
@@ -5579,7 +5889,7 @@ class FscDeveloperView(FscTimedView):
 
     @discord.ui.button(label="Toggle off", style=discord.ButtonStyle.danger)
     async def toggle_off(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self.cog.config.user(self.user).developer_mode.set(False)
+        await self.cog._player_config(self.user).developer_mode.set(False)
         embed = await self.cog._build_dashboard_embed(self.user)
         embed.add_field(name="Developer mode", value="Developer mode disabled.", inline=False)
         view = FscDashboardView(
@@ -5592,7 +5902,7 @@ class FscDeveloperView(FscTimedView):
 
     @discord.ui.button(label="Back", style=discord.ButtonStyle.secondary, row=4)
     async def back(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         embed = await self.cog._build_dashboard_embed(self.user)
         view = FscDashboardView(
             self.cog,
@@ -5632,7 +5942,7 @@ class RecruitmentView(FscTimedView):
         await interaction.response.edit_message(content=None, embed=embed, view=self)
 
     async def _confirm_hire(self, interaction: discord.Interaction, requested_amount: int | None) -> None:
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         lvl = int(data.get("station_level", 1))
         staff_total = int(data.get("staff_total", 0))
         max_staff = self.cog._max_staff(lvl)
@@ -5818,7 +6128,7 @@ class TurnoutTakeoverView(FscTimedView):
 
     async def on_timeout(self) -> None:
         self._disable_children()
-        user_conf = self.cog.config.user(self.original_user)
+        user_conf = self.cog._player_config(self.original_user)
         data = await user_conf.all()
         mission = data.get("active_mission", {}) or {}
         if self.cog._mission_is_stage(mission, self.cog.STAGE_STAFF_TURNOUT):
@@ -6057,7 +6367,7 @@ class MissionControlView(FscTimedView):
 
     async def _refresh(self, interaction: discord.Interaction):
         if await self.cog._run_due_mission_action(interaction.channel or self.channel, self.user):
-            refreshed = await self.cog.config.user(self.user).all()
+            refreshed = await self.cog._player_config(self.user).all()
             mission = refreshed.get("active_mission", {}) or {}
             if not mission:
                 embed = await self.cog._build_dashboard_embed(self.user)
@@ -6077,7 +6387,7 @@ class MissionControlView(FscTimedView):
             await interaction.response.edit_message(content=None, embed=embed, view=view)
             return
 
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         mission = data.get("active_mission", {}) or {}
         if not mission:
             embed = await self.cog._build_dashboard_embed(self.user)
@@ -6164,7 +6474,7 @@ class VehicleShopSelect(discord.ui.Select):
         if not vdef:
             await interaction.response.send_message("Unknown vehicle type.", ephemeral=True)
             return
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         xp = int(data.get("xp", 0))
         command_level = int(data.get("command_level", self.cog._command_level_for_xp(xp)))
         if not self.cog._vehicle_is_unlocked(vdef, command_level, data):
@@ -6318,7 +6628,7 @@ class VehicleSaleSelect(discord.ui.Select):
         if choice == "none":
             await interaction.response.send_message("No vehicles are available to sell.", ephemeral=True)
             return
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         vehicle = next(
             (
                 owned
@@ -6391,7 +6701,7 @@ class VehicleSaleView(FscTimedView):
         embed = await self.cog._build_dashboard_embed(self.user)
         channel = interaction.channel or self.channel
         guild = interaction.guild or self.guild
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         view = FscDashboardView(self.cog, self.user, channel, guild, data=data)
         await interaction.response.edit_message(content=None, embed=embed, view=view)
 
@@ -6432,7 +6742,7 @@ class ParkingLotView(FscTimedView):
         embed = await self.cog._build_dashboard_embed(self.user)
         channel = interaction.channel or self.channel
         guild = interaction.guild or self.guild
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         view = FscDashboardView(self.cog, self.user, channel, guild, data=data)
         await interaction.response.edit_message(content=None, embed=embed, view=view)
 
@@ -6471,7 +6781,7 @@ class MaintenanceView(FscTimedView):
         embed = await self.cog._build_dashboard_embed(self.user)
         channel = interaction.channel or self.channel
         guild = interaction.guild or self.guild
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         view = FscDashboardView(self.cog, self.user, channel, guild, data=data)
         await interaction.response.edit_message(content=None, embed=embed, view=view)
 
@@ -6544,7 +6854,7 @@ class EquipmentShopSelect(discord.ui.Select):
             await interaction.response.send_message("Unknown equipment type.", ephemeral=True)
             return
 
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         xp = int(data.get("xp", 0))
         command_level = int(data.get("command_level", self.cog._command_level_for_xp(xp)))
         if not self.cog._equipment_is_unlocked(equipment, command_level, data):
@@ -6646,7 +6956,7 @@ class EquipmentShopView(FscTimedView):
 
     @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary)
     async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         page = max(0, self.page - 1)
         embed = self.cog._build_equipment_shop_embed(data)
         view = EquipmentShopView(self.cog, interaction.channel or self.channel, self.user, interaction.guild or self.guild, data=data, page=page)
@@ -6654,7 +6964,7 @@ class EquipmentShopView(FscTimedView):
 
     @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary)
     async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         max_page = max(0, math.ceil(len(self.cog.EQUIPMENT_CATALOG) / EquipmentShopSelect.PAGE_SIZE) - 1)
         page = min(max_page, self.page + 1)
         embed = self.cog._build_equipment_shop_embed(data)
@@ -6721,7 +7031,7 @@ class TrainingSelect(discord.ui.Select):
             await interaction.response.send_message("Unknown training type.", ephemeral=True)
             return
 
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         trained = self.cog._training_inventory_set(data.get("trainings", []))
         xp = int(data.get("xp", 0))
         command_level = int(data.get("command_level", self.cog._command_level_for_xp(xp)))
@@ -6871,7 +7181,7 @@ class ExpansionSelect(discord.ui.Select):
             await interaction.response.send_message("Unknown expansion type.", ephemeral=True)
             return
 
-        data = await self.cog.config.user(self.user).all()
+        data = await self.cog._player_config(self.user).all()
         owned = self.cog._expansion_inventory_set(data.get("expansions", []))
         xp = int(data.get("xp", 0))
         command_level = int(data.get("command_level", self.cog._command_level_for_xp(xp)))
@@ -7199,7 +7509,7 @@ class ConfirmVehiclePurchaseView(FscTimedView):
         except Exception:
             pass
         if self.edit_message:
-            data = await self.cog.config.user(self.user).all()
+            data = await self.cog._player_config(self.user).all()
             embed = self.cog._build_vehicle_shop_embed(data)
             embed.add_field(name="Purchase cancelled", value="No vehicle was purchased.", inline=False)
             view = VehicleShopView(
@@ -7265,7 +7575,7 @@ class ConfirmVehicleSaleView(FscTimedView):
         except Exception:
             pass
         if self.edit_message:
-            data = await self.cog.config.user(self.user).all()
+            data = await self.cog._player_config(self.user).all()
             embed = self.cog._build_vehicle_sale_embed(data)
             embed.add_field(name="Sale cancelled", value="No vehicle was sold.", inline=False)
             view = VehicleSaleView(
@@ -7328,7 +7638,7 @@ class ConfirmEquipmentPurchaseView(FscTimedView):
         except Exception:
             pass
         if self.edit_message:
-            data = await self.cog.config.user(self.user).all()
+            data = await self.cog._player_config(self.user).all()
             embed = self.cog._build_equipment_shop_embed(data)
             embed.add_field(name="Purchase cancelled", value="No equipment was purchased.", inline=False)
             view = EquipmentShopView(
@@ -7391,7 +7701,7 @@ class ConfirmTrainingView(FscTimedView):
         except Exception:
             pass
         if self.edit_message:
-            data = await self.cog.config.user(self.user).all()
+            data = await self.cog._player_config(self.user).all()
             embed = self.cog._build_training_embed(data)
             embed.add_field(name="Training cancelled", value="No training was completed.", inline=False)
             view = TrainingView(
@@ -7454,7 +7764,7 @@ class ConfirmExpansionView(FscTimedView):
         except Exception:
             pass
         if self.edit_message:
-            data = await self.cog.config.user(self.user).all()
+            data = await self.cog._player_config(self.user).all()
             embed = self.cog._build_expansion_embed(data)
             embed.add_field(name="Expansion cancelled", value="No expansion was built.", inline=False)
             view = ExpansionView(
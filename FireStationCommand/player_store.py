@@ -0,0 +1,521 @@
+"""SQLite store for FireStationCommand player state.
+
+Red's Config keeps each player as one JSON blob that is rewritten whole on
+every change. This store splits a player into indexed rows (profile, vehicles,
+inventory) so a change only touches the rows that differ, and leaderboards are
+plain SQL. ``PlayerStore.user(user)`` returns an object with the same
+``await scope.all()`` / ``await scope.field.set(value)`` surface the cog already
+uses on ``self.config.user(user)``; ``PlayerStore.transaction(user)`` gives the
+same surface but commits every field set in the block as one transaction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import sqlite3
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+
+# Profile columns and how to turn stored values back into Config-shaped values
+SCALAR_FIELDS: Dict[str, Tuple[str, Any]] = {
+    "started": ("INTEGER", bool),
+    "credits": ("INTEGER", int),
+    "next_vehicle_id": ("INTEGER", int),
+    "station_level": ("INTEGER", int),
+    "command_level": ("INTEGER", int),
+    "xp": ("INTEGER", int),
+    "reputation": ("INTEGER", int),
+    "missions_completed": ("INTEGER", int),
+    "station_type": ("TEXT", str),
+    "staff_total": ("INTEGER", int),
+    "staff_trained": ("INTEGER", int),
+    "developer_mode": ("INTEGER", bool),
+    "last_daily_at": ("TEXT", str),
+    "parking_lots": ("INTEGER", int),
+}
+INVENTORY_FIELDS = ("equipment", "trainings", "expansions")
+JSON_FIELDS = ("active_mission",)
+LEADERBOARD_METRICS = ("xp", "missions_completed", "reputation", "command_level", "vehicles")
+
+_MIGRATION_KEY = "config_migrated_at"
+# One shared encoder: json.dumps() with keyword arguments builds a new encoder per call
+_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
+def _dumps(value: Any) -> str:
+    return _ENCODER.encode(value)
+
+
+def _vehicle_keys(vehicles: List[Any]) -> List[str]:
+    """Stable row keys: the vehicle's own id, or its position when ids are missing or repeated."""
+    seen: set[str] = set()
+    keys: List[str] = []
+    for position, vehicle in enumerate(vehicles):
+        vehicle_id = vehicle.get("id") if isinstance(vehicle, dict) else None
+        key = str(vehicle_id) if vehicle_id is not None else ""
+        if not key or key in seen:
+            key = f"#{position}"
+        seen.add(key)
+        keys.append(key)
+    return keys
+
+
+def _inventory_item_id(item: Any) -> Optional[str]:
+    if isinstance(item, str):
+        return item
+    if isinstance(item, dict):
+        item_id = item.get("catalog_id") or item.get("id")
+        return str(item_id) if item_id else None
+    return None
+
+
+class PlayerStore:
+    """Per-entity SQLite tables for FireStationCommand players."""
+
+    def __init__(self, db_path: Union[str, Path], defaults: Dict[str, Any]):
+        self.db_path = str(db_path)
+        self.defaults = copy.deepcopy(defaults)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        conn.execute("PRAGMA busy_timeout = 30000")
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def initialize(self) -> None:
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        scalar_columns = ",\n".join(
+            f"{name} {sql_type}" for name, (sql_type, _) in SCALAR_FIELDS.items()
+        )
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(
+                f"""
+                CREATE TABLE IF NOT EXISTS fsc_players (
+                    user_id INTEGER PRIMARY KEY,
+                    {scalar_columns},
+                    active_mission TEXT NOT NULL DEFAULT '{{}}',
+                    extra TEXT NOT NULL DEFAULT '{{}}',
+                    updated_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_fsc_players_xp ON fsc_players(xp DESC);
+                CREATE INDEX IF NOT EXISTS idx_fsc_players_missions ON fsc_players(missions_completed DESC);
+                CREATE INDEX IF NOT EXISTS idx_fsc_players_reputation ON fsc_players(reputation DESC);
+                CREATE INDEX IF NOT EXISTS idx_fsc_players_level ON fsc_players(command_level DESC);
+
+                CREATE TABLE IF NOT EXISTS fsc_vehicles (
+                    user_id INTEGER NOT NULL REFERENCES fsc_players(user_id) ON DELETE CASCADE,
+                    vehicle_key TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    catalog_id TEXT,
+                    condition INTEGER,
+                    out_of_service_until TEXT,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (user_id, vehicle_key)
+                );
+                CREATE INDEX IF NOT EXISTS idx_fsc_vehicles_catalog ON fsc_vehicles(catalog_id);
+
+                CREATE TABLE IF NOT EXISTS fsc_inventory (
+                    user_id INTEGER NOT NULL REFERENCES fsc_players(user_id) ON DELETE CASCADE,
+                    kind TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    item_id TEXT,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (user_id, kind, position)
+                );
+                CREATE INDEX IF NOT EXISTS idx_fsc_inventory_item ON fsc_inventory(kind, item_id);
+
+                CREATE TABLE IF NOT EXISTS fsc_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                """
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    # --------------------------------------------------
+    # Reads
+    # --------------------------------------------------
+
+    def load_player(self, user_id: int) -> Dict[str, Any]:
+        conn = self._connect()
+        try:
+            return self._load_player(conn, int(user_id))
+        finally:
+            conn.close()
+
+    def _load_player(self, conn: sqlite3.Connection, user_id: int) -> Dict[str, Any]:
+        data = copy.deepcopy(self.defaults)
+        row = conn.execute("SELECT * FROM fsc_players WHERE user_id=?", (user_id,)).fetchone()
+        if row is None:
+            return data
+
+        for name, (_, cast) in SCALAR_FIELDS.items():
+            value = row[name]
+            if value is not None:
+                data[name] = cast(value)
+            elif name in data:
+                # Rows are created with the defaults, so NULL here is an explicit None write
+                data[name] = None
+        data["active_mission"] = json.loads(row["active_mission"])
+        data.update(json.loads(row["extra"]))
+
+        # Decode the fleet as one JSON array instead of one document per row
+        fleet = conn.execute(
+            """
+            SELECT '[' || COALESCE(group_concat(data, ','), '') || ']'
+            FROM (SELECT data FROM fsc_vehicles WHERE user_id=? ORDER BY position)
+            """,
+            (user_id,),
+        ).fetchone()[0]
+        data["vehicles"] = json.loads(fleet)
+        inventory: Dict[str, List[Any]] = {kind: [] for kind in INVENTORY_FIELDS}
+        for item in conn.execute(
+            "SELECT kind, data FROM fsc_inventory WHERE user_id=? ORDER BY kind, position",
+            (user_id,),
+        ):
+            inventory.setdefault(item["kind"], []).append(json.loads(item["data"]))
+        data.update(inventory)
+        return data
+
+    def leaderboard(
+        self,
+        metric: str = "xp",
+        limit: int = 10,
+        user_ids: Optional[Iterable[int]] = None,
+    ) -> List[Tuple[int, int]]:
+        """Top players for a metric as (user_id, value), optionally limited to some users."""
+        if metric not in LEADERBOARD_METRICS:
+            raise ValueError(f"Unknown leaderboard metric: {metric}")
+
+        params: List[Any] = []
+        where = "WHERE p.started = 1"
+        if user_ids is not None:
+            ids = [int(user_id) for user_id in user_ids]
+            if not ids:
+                return []
+            where += f" AND p.user_id IN ({','.join('?' for _ in ids)})"
+            params.extend(ids)
+
+        if metric == "vehicles":
+            query = f"""
+                SELECT p.user_id, COUNT(v.vehicle_key) AS value
+                FROM fsc_players p
+                LEFT JOIN fsc_vehicles v ON v.user_id = p.user_id
+                {where}
+                GROUP BY p.user_id
+                ORDER BY value DESC, p.user_id
+                LIMIT ?
+            """
+        else:
+            query = f"""
+                SELECT p.user_id, COALESCE(p.{metric}, 0) AS value
+                FROM fsc_players p
+                {where}
+                ORDER BY p.{metric} DESC, p.user_id
+                LIMIT ?
+            """
+        params.append(int(limit))
+
+        conn = self._connect()
+        try:
+            return [(int(row[0]), int(row[1])) for row in conn.execute(query, params)]
+        finally:
+            conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Totals across started players, computed in SQL."""
+        conn = self._connect()
+        try:
+            players = conn.execute(
+                """
+                SELECT COUNT(*) AS players,
+                       COALESCE(SUM(missions_completed), 0) AS missions,
+                       COALESCE(SUM(xp), 0) AS xp,
+                       COALESCE(SUM(CASE WHEN active_mission != '{}' THEN 1 ELSE 0 END), 0) AS active
+                FROM fsc_players
+                WHERE started = 1
+                """
+            ).fetchone()
+            vehicles = conn.execute(
+                """
+                SELECT COUNT(*)
+                FROM fsc_vehicles v
+                JOIN fsc_players p ON p.user_id = v.user_id
+                WHERE p.started = 1
+                """
+            ).fetchone()[0]
+            top_vehicles = conn.execute(
+                """
+                SELECT v.catalog_id, COUNT(*) AS owned
+                FROM fsc_vehicles v
+                JOIN fsc_players p ON p.user_id = v.user_id
+                WHERE p.started = 1 AND v.catalog_id IS NOT NULL
+                GROUP BY v.catalog_id
+                ORDER BY owned DESC, v.catalog_id
+                LIMIT 5
+                """
+            ).fetchall()
+        finally:
+            conn.close()
+        return {
+            "players": int(players["players"]),
+            "missions_completed": int(players["missions"]),
+            "xp": int(players["xp"]),
+            "active_missions": int(players["active"]),
+            "vehicles": int(vehicles),
+            "top_vehicles": [(row["catalog_id"], int(row["owned"])) for row in top_vehicles],
+        }
+
+    # --------------------------------------------------
+    # Writes
+    # --------------------------------------------------
+
+    def set_field(self, user_id: int, field: str, value: Any) -> None:
+        self.set_fields(user_id, {field: value})
+
+    def set_fields(self, user_id: int, values: Dict[str, Any]) -> None:
+        """Write several fields for one player in a single transaction."""
+        conn = self._connect()
+        try:
+            with conn:
+                for field, value in values.items():
+                    self._set_field(conn, int(user_id), field, value)
+        finally:
+            conn.close()
+
+    def _ensure_player(self, conn: sqlite3.Connection, user_id: int) -> None:
+        columns = ["user_id", "updated_at"]
+        values: List[Any] = [user_id, time.time()]
+        for name in SCALAR_FIELDS:
+            if name in self.defaults:
+                columns.append(name)
+                values.append(self.defaults[name])
+        conn.execute(
+            f"INSERT OR IGNORE INTO fsc_players ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})",
+            values,
+        )
+
+    def _set_field(self, conn: sqlite3.Connection, user_id: int, field: str, value: Any) -> None:
+        self._ensure_player(conn, user_id)
+        if field in SCALAR_FIELDS:
+            conn.execute(
+                f"UPDATE fsc_players SET {field}=?, updated_at=? WHERE user_id=?",
+                (value, time.time(), user_id),
+            )
+        elif field in JSON_FIELDS:
+            conn.execute(
+                f"UPDATE fsc_players SET {field}=?, updated_at=? WHERE user_id=?",
+                (_dumps(value), time.time(), user_id),
+            )
+        elif field == "vehicles":
+            self._write_vehicles(conn, user_id, value if isinstance(value, list) else [])
+        elif field in INVENTORY_FIELDS:
+            self._write_inventory(conn, user_id, field, value if isinstance(value, list) else [])
+        else:
+            row = conn.execute("SELECT extra FROM fsc_players WHERE user_id=?", (user_id,)).fetchone()
+            extra = json.loads(row["extra"])
+            extra[field] = value
+            conn.execute(
+                "UPDATE fsc_players SET extra=?, updated_at=? WHERE user_id=?",
+                (_dumps(extra), time.time(), user_id),
+            )
+
+    def _write_vehicles(self, conn: sqlite3.Connection, user_id: int, vehicles: List[Any]) -> None:
+        existing = {
+            row["vehicle_key"]: (row["position"], row["data"])
+            for row in conn.execute(
+                "SELECT vehicle_key, position, data FROM fsc_vehicles WHERE user_id=?",
+                (user_id,),
+            )
+        }
+        keys = _vehicle_keys(vehicles)
+        upserts = []
+        for position, (key, vehicle) in enumerate(zip(keys, vehicles)):
+            payload = _dumps(vehicle)
+            if existing.get(key) == (position, payload):
+                continue
+            is_dict = isinstance(vehicle, dict)
+            condition = vehicle.get("condition") if is_dict else None
+            upserts.append(
+                (
+                    user_id,
+                    key,
+                    position,
+                    str(vehicle.get("catalog_id")) if is_dict and vehicle.get("catalog_id") else None,
+                    condition if isinstance(condition, int) else None,
+                    vehicle.get("out_of_service_until") if is_dict else None,
+                    payload,
+                )
+            )
+
+        removed = [(user_id, key) for key in existing.keys() - set(keys)]
+        if removed:
+            conn.executemany("DELETE FROM fsc_vehicles WHERE user_id=? AND vehicle_key=?", removed)
+        if upserts:
+            conn.executemany(
+                """
+                INSERT INTO fsc_vehicles
+                    (user_id, vehicle_key, position, catalog_id, condition, out_of_service_until, data)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(user_id, vehicle_key) DO UPDATE SET
+                    position=excluded.position,
+                    catalog_id=excluded.catalog_id,
+                    condition=excluded.condition,
+                    out_of_service_until=excluded.out_of_service_until,
+                    data=excluded.data
+                """,
+                upserts,
+            )
+        if removed or upserts:
+            conn.execute("UPDATE fsc_players SET updated_at=? WHERE user_id=?", (time.time(), user_id))
+
+    def _write_inventory(self, conn: sqlite3.Connection, user_id: int, kind: str, items: List[Any]) -> None:
+        existing = {
+            row["position"]: row["data"]
+            for row in conn.execute(
+                "SELECT position, data FROM fsc_inventory WHERE user_id=? AND kind=?",
+                (user_id, kind),
+            )
+        }
+        upserts = []
+        for position, item in enumerate(items):
+            payload = _dumps(item)
+            if existing.get(position) != payload:
+                upserts.append((user_id, kind, position, _inventory_item_id(item), payload))
+
+        conn.execute(
+            "DELETE FROM fsc_inventory WHERE user_id=? AND kind=? AND position>=?",
+            (user_id, kind, len(items)),
+        )
+        if upserts:
+            conn.executemany(
+                """
+                INSERT INTO fsc_inventory (user_id, kind, position, item_id, data)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(user_id, kind, position) DO UPDATE SET
+                    item_id=excluded.item_id,
+                    data=excluded.data
+                """,
+                upserts,
+            )
+
+    def import_players(self, users: Dict[Any, Dict[str, Any]]) -> int:
+        """Copy Config player blobs into the store once. Returns the number imported."""
+        conn = self._connect()
+        try:
+            with conn:
+                if conn.execute("SELECT 1 FROM fsc_meta WHERE key=?", (_MIGRATION_KEY,)).fetchone():
+                    return 0
+                for user_id, data in users.items():
+                    merged = {**copy.deepcopy(self.defaults), **(data or {})}
+                    for field, value in merged.items():
+                        self._set_field(conn, int(user_id), field, value)
+                conn.execute(
+                    "INSERT INTO fsc_meta (key, value) VALUES (?, ?)",
+                    (_MIGRATION_KEY, str(time.time())),
+                )
+            return len(users)
+        finally:
+            conn.close()
+
+    def is_migrated(self) -> bool:
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT 1 FROM fsc_meta WHERE key=?", (_MIGRATION_KEY,)).fetchone() is not None
+        finally:
+            conn.close()
+
+    def delete_player(self, user_id: int) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM fsc_players WHERE user_id=?", (int(user_id),))
+        finally:
+            conn.close()
+
+    # --------------------------------------------------
+    # Config-shaped access
+    # --------------------------------------------------
+
+    def user(self, user: Any) -> "PlayerScope":
+        return PlayerScope(self, int(getattr(user, "id", user)))
+
+    @asynccontextmanager
+    async def transaction(self, user: Any) -> AsyncIterator["PlayerBatch"]:
+        """Collect one action's field sets and commit them together on exit.
+
+        Nothing is written if the block raises, so an action never leaves a
+        player half-updated.
+        """
+        batch = PlayerBatch(self, int(getattr(user, "id", user)))
+        yield batch
+        if batch.pending:
+            await asyncio.to_thread(self.set_fields, batch.user_id, batch.pending)
+
+
+class PlayerField:
+    """Stand-in for a Config value: ``await field()`` and ``await field.set(value)``."""
+
+    def __init__(self, scope: "PlayerScope", name: str):
+        self._scope = scope
+        self._name = name
+
+    async def __call__(self) -> Any:
+        data = await self._scope.all()
+        return data.get(self._name)
+
+    async def set(self, value: Any) -> None:
+        await self._scope.set_field(self._name, value)
+
+
+class PlayerScope:
+    """Stand-in for ``config.user(user)`` backed by ``PlayerStore``."""
+
+    def __init__(self, store: PlayerStore, user_id: int):
+        self.store = store
+        self.user_id = user_id
+
+    async def all(self) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.store.load_player, self.user_id)
+
+    async def set_field(self, name: str, value: Any) -> None:
+        await asyncio.to_thread(self.store.set_field, self.user_id, name, value)
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self.store.delete_player, self.user_id)
+
+    def __getattr__(self, name: str) -> PlayerField:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return PlayerField(self, name)
+
+
+class PlayerBatch(PlayerScope):
+    """``PlayerScope`` whose field sets wait for ``PlayerStore.transaction`` to commit them."""
+
+    def __init__(self, store: PlayerStore, user_id: int):
+        super().__init__(store, user_id)
+        self.pending: Dict[str, Any] = {}
+
+    async def all(self) -> Dict[str, Any]:
+        data = await super().all()
+        data.update(copy.deepcopy(self.pending))
+        return data
+
+    async def set_field(self, name: str, value: Any) -> None:
+        # Copy like Config does, so later mutation by the caller cannot change the queued write
+        self.pending[name] = copy.deepcopy(value)
+
+    async def clear(self) -> None:
+        self.pending.clear()
+        await super().clear()
@@ -27,6 +27,21 @@ log = logging.getLogger("red.FARA.MemberManager.automation")
 
 CONTRIBUTION_ALERT_MAX_PER_RUN = 5
 CONTRIBUTION_ALERT_SEND_DELAY_SECONDS = 2.0
+CONTRIBUTION_ALERT_COOLDOWN_SECONDS = 7 * 86400
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO timestamp, treating naive values as UTC."""
+    if not value:
+        return None
+    try:
+        # Handle both 'Z' and '+00:00' timezone formats
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
 
 
 class ContributionMonitor:
@@ -49,12 +64,13 @@ class ContributionMonitor:
         self.member_source = member_source
         self.alliance_scraper = member_source
         
-        # Track last alert per member to avoid spam
+        # Last alert per member to avoid spam, mirrored in the database
         self._last_alerts: Dict[str, int] = {}
     
     async def run(self):
         """Main monitoring loop."""
         log.info("Contribution monitor started")
+        await self._load_alert_state()
         
         while True:
             try:
@@ -82,6 +98,10 @@ class ContributionMonitor:
         3. Check cooldown (> 7 days since last alert)
         4. Check consistency (4+ checks below threshold)
         5. Send alert + create note if all checks pass
+        
+        Join dates, contribution history and alert state are each loaded
+        with a single bulk query up front, so a run costs a fixed number of
+        queries regardless of alliance size.
         """
         if not self.member_source:
             log.warning("MembersScraper not available, skipping contribution check")
@@ -103,10 +123,15 @@ class ContributionMonitor:
         max_alerts = max(1, int(CONTRIBUTION_ALERT_MAX_PER_RUN))
         send_delay = max(0.0, float(CONTRIBUTION_ALERT_SEND_DELAY_SECONDS))
         
+        await self._load_alert_state()
+        join_dates = await self._get_join_dates(logs_scraper)
+        overview = await self._get_contribution_overview(weeks=4)
+        
         for mc_member in mc_members:
             mc_id = mc_member.get("user_id") or mc_member.get("mc_user_id")
             if not mc_id:
                 continue
+            mc_id = str(mc_id)
             
             mc_name = mc_member.get("name", "Unknown")
             current_rate = mc_member.get("contribution_rate", 0.0)
@@ -115,8 +140,12 @@ class ContributionMonitor:
             if current_rate >= threshold:
                 continue
             
+            member_overview = overview.get(mc_id, {}) if overview is not None else {}
+            
             # 2. CHECK: Grace period (7 days in alliance)
-            join_date = await self._get_join_date(mc_id, mc_name, logs_scraper)
+            join_date = join_dates.get(mc_id) or join_dates.get(f"name:{mc_name}")
+            if not join_date:
+                join_date = _parse_timestamp(member_overview.get("first_seen"))
             if join_date:
                 days_in_alliance = (datetime.now(timezone.utc) - join_date).days
                 if days_in_alliance < 7:
@@ -130,12 +159,15 @@ class ContributionMonitor:
             last_alert = self._last_alerts.get(mc_id, 0)
             now = int(datetime.now(timezone.utc).timestamp())
             
-            if now - last_alert < (7 * 86400):
+            if now - last_alert < CONTRIBUTION_ALERT_COOLDOWN_SECONDS:
                 log.debug(f"Skipping {mc_name} ({mc_id}): cooldown active")
                 continue
             
             # 4. CHECK: Consistency (4 consecutive checks below threshold)
-            historical_rates = await self._get_historical_rates(mc_id, weeks=4)
+            if overview is not None:
+                historical_rates = member_overview.get("history", [])
+            else:
+                historical_rates = await self._get_historical_rates(mc_id, weeks=4)
             
             # Need at least 4 checks
             if len(historical_rates) < 4:
@@ -169,7 +201,7 @@ class ContributionMonitor:
             )
             
             if success:
-                self._last_alerts[mc_id] = now
+                await self._record_alert(mc_id, now, current_rate)
                 alerts_sent += 1
                 if send_delay and alerts_sent < max_alerts:
                     await asyncio.sleep(send_delay)
@@ -180,56 +212,101 @@ class ContributionMonitor:
             alerts_deferred,
         )
     
-    async def _get_join_date(
-        self,
-        mc_id: str,
-        mc_name: Optional[str],
-        logs_scraper
-    ) -> Optional[datetime]:
+    async def _load_alert_state(self) -> None:
         """
-        Get when member joined the alliance.
+        Load alert cooldowns from the MemberManager database.
         
-        Queries LogsScraper for 'added_to_alliance' event.
-        Returns None if not found or if LogsScraper unavailable.
+        Falls back to the in-memory state when the database does not
+        expose contribution alert storage.
+        """
+        get_alert_times = getattr(self.db, "get_contribution_alert_times", None)
+        if not get_alert_times:
+            return
+        
+        since = int(datetime.now(timezone.utc).timestamp()) - CONTRIBUTION_ALERT_COOLDOWN_SECONDS
+        try:
+            stored = await get_alert_times(since=since)
+        except Exception as e:
+            log.error(f"Failed to load contribution alert state: {e}", exc_info=True)
+            return
+        
+        for mc_id, alerted_at in stored.items():
+            if alerted_at > self._last_alerts.get(mc_id, 0):
+                self._last_alerts[mc_id] = alerted_at
+    
+    async def _record_alert(self, mc_id: str, alerted_at: int, rate: float) -> None:
+        """Remember an alert in memory and persist it for the next restart."""
+        self._last_alerts[mc_id] = alerted_at
+        
+        record_alert = getattr(self.db, "record_contribution_alert", None)
+        if not record_alert:
+            return
+        
+        try:
+            await record_alert(mc_id, alerted_at=alerted_at, rate=rate)
+        except Exception as e:
+            log.error(f"Failed to persist contribution alert for {mc_id}: {e}", exc_info=True)
+    
+    async def _get_join_dates(self, logs_scraper) -> Dict[str, datetime]:
+        """
+        Get when members joined the alliance, for all members at once.
+        
+        Queries LogsScraper for 'added_to_alliance' events. Keys are MC IDs,
+        plus ``name:<affected_name>`` for log rows without an MC ID.
+        Returns an empty dict if LogsScraper is unavailable.
         """
         if not logs_scraper:
             log.debug("LogsScraper not available for join date lookup")
-            return None
+            return {}
         
+        join_dates: Dict[str, datetime] = {}
         try:
             db_path = logs_scraper.db_path
             
             if not db_path.exists():
                 log.warning(f"LogsScraper database not found: {db_path}")
-                return None
+                return {}
             
             async with aiosqlite.connect(db_path) as db:
                 cursor = await db.execute(
                     """
-                    SELECT MIN(ts) as join_date 
-                    FROM logs 
-                    WHERE (affected_mc_id = ? OR affected_name = ?)
-                    AND action_key = 'added_to_alliance'
-                    """,
-                    (mc_id, mc_name)
+                    SELECT affected_mc_id, affected_name, MIN(ts) as join_date
+                    FROM logs
+                    WHERE action_key = 'added_to_alliance'
+                    GROUP BY affected_mc_id, affected_name
+                    """
                 )
-                result = await cursor.fetchone()
-                
-                if result and result[0]:
-                    # Parse ISO timestamp
-                    join_date_str = result[0]
-                    # Handle both 'Z' and '+00:00' timezone formats
-                    if join_date_str.endswith('Z'):
-                        join_date_str = join_date_str.replace('Z', '+00:00')
-                    
-                    join_date = datetime.fromisoformat(join_date_str)
-                    log.debug(f"Found join date for {mc_name} ({mc_id}): {join_date}")
-                    return join_date
-        
+                rows = await cursor.fetchall()
         except Exception as e:
-            log.error(f"Failed to get join date for {mc_id}: {e}", exc_info=True)
+            log.error(f"Failed to get join dates: {e}", exc_info=True)
+            return {}
         
-        return None
+        for mc_id, name, join_date_str in rows:
+            join_date = _parse_timestamp(join_date_str)
+            if not join_date:
+                continue
+            for key in (str(mc_id) if mc_id else None, f"name:{name}" if name else None):
+                if key and (key not in join_dates or join_date < join_dates[key]):
+                    join_dates[key] = join_date
+        
+        return join_dates
+    
+    async def _get_contribution_overview(self, weeks: int) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Get first-seen and recent contribution rates for all members.
+        
+        Returns None when the member source has no bulk API, in which
+        case history is looked up per member instead.
+        """
+        get_overview = getattr(self.member_source, "get_members_contribution_overview", None)
+        if not get_overview:
+            return None
+        
+        try:
+            return await get_overview(limit=weeks * 2)
+        except Exception as e:
+            log.error(f"Failed to get contribution overview: {e}", exc_info=True)
+            return None
     
     async def _get_historical_rates(
         self,
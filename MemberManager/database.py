@@ -11,7 +11,7 @@ import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 
 log = logging.getLogger("red.FARA.MemberManager.database")
 
@@ -37,6 +37,7 @@ class MemberDatabase:
     def __init__(self, db_path: str):
         self.db_path = Path(db_path)
         self._conn: Optional[aiosqlite.Connection] = None
+        self._write_listeners: List[Callable[..., None]] = []
     
     async def initialize(self):
         """Initialize database and create tables."""
@@ -58,6 +59,28 @@ class MemberDatabase:
         if self._conn:
             await self._conn.close()
     
+    def add_write_listener(self, callback: Callable[..., None]) -> None:
+        """
+        Register a callback for note, infraction and watchlist writes.
+        
+        The callback receives ``guild_id``, ``discord_id`` and ``mc_user_id``
+        keyword arguments; all three are None when the write was addressed
+        by reference code and the affected member is unknown.
+        """
+        self._write_listeners.append(callback)
+    
+    def _notify_write(
+        self,
+        guild_id: Optional[int] = None,
+        discord_id: Optional[int] = None,
+        mc_user_id: Optional[str] = None
+    ) -> None:
+        for callback in self._write_listeners:
+            try:
+                callback(guild_id=guild_id, discord_id=discord_id, mc_user_id=mc_user_id)
+            except Exception as e:
+                log.error(f"Write listener failed: {e}", exc_info=True)
+    
     async def _create_tables(self):
         """Create all database tables."""
         # Notes table - 🔧 FIXED: added updated_by_name column
@@ -178,6 +201,16 @@ class MemberDatabase:
             )
         """)
         
+        # Contribution alert state (survives restarts so cooldowns are honoured)
+        await self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS contribution_alerts (
+                mc_user_id TEXT PRIMARY KEY,
+                last_alert_at INTEGER NOT NULL,
+                last_rate REAL,
+                alert_count INTEGER NOT NULL DEFAULT 1
+            )
+        """)
+        
         # Create indices
         await self._conn.execute("CREATE INDEX IF NOT EXISTS idx_notes_discord ON notes(discord_id)")
         await self._conn.execute("CREATE INDEX IF NOT EXISTS idx_notes_mc ON notes(mc_user_id)")
@@ -284,6 +317,7 @@ class MemberDatabase:
             )
         )
         await self._conn.commit()
+        self._notify_write(guild_id, discord_id, mc_user_id)
         
         log.info(f"Created note {ref_code} for discord={discord_id}, mc={mc_user_id}")
         return ref_code
@@ -348,6 +382,7 @@ class MemberDatabase:
             (new_text, _timestamp(), updated_by, updated_by_name, new_hash, ref_code)
         )
         await self._conn.commit()
+        self._notify_write()
         
         return result.rowcount > 0
     
@@ -358,6 +393,7 @@ class MemberDatabase:
             (ref_code,)
         )
         await self._conn.commit()
+        self._notify_write()
         
         return result.rowcount > 0
     
@@ -368,6 +404,7 @@ class MemberDatabase:
             (1 if pinned else 0, ref_code)
         )
         await self._conn.commit()
+        self._notify_write()
         
         return result.rowcount > 0
     
@@ -420,6 +457,7 @@ class MemberDatabase:
             )
         )
         await self._conn.commit()
+        self._notify_write(guild_id, discord_id, mc_user_id)
         
         log.info(f"Created infraction {ref_code} for {target_name}")
         return ref_code
@@ -473,6 +511,7 @@ class MemberDatabase:
             (_timestamp(), revoked_by, reason, ref_code)
         )
         await self._conn.commit()
+        self._notify_write()
         
         return result.rowcount > 0
     
@@ -552,6 +591,39 @@ class MemberDatabase:
         
         return events
     
+    # ==================== CONTRIBUTION ALERTS ====================
+    
+    async def get_contribution_alert_times(self, since: Optional[int] = None) -> Dict[str, int]:
+        """Return ``{mc_user_id: last_alert_at}`` for alerts sent at or after ``since``."""
+        query = "SELECT mc_user_id, last_alert_at FROM contribution_alerts"
+        params: List[Any] = []
+        if since is not None:
+            query += " WHERE last_alert_at>=?"
+            params.append(int(since))
+        cursor = await self._conn.execute(query, params)
+        rows = await cursor.fetchall()
+        return {str(row["mc_user_id"]): int(row["last_alert_at"]) for row in rows}
+    
+    async def record_contribution_alert(
+        self,
+        mc_user_id: str,
+        alerted_at: Optional[int] = None,
+        rate: Optional[float] = None
+    ) -> None:
+        """Persist that a low contribution alert was sent for a member."""
+        await self._conn.execute(
+            """
+            INSERT INTO contribution_alerts (mc_user_id, last_alert_at, last_rate, alert_count)
+            VALUES (?, ?, ?, 1)
+            ON CONFLICT(mc_user_id) DO UPDATE SET
+                last_alert_at=excluded.last_alert_at,
+                last_rate=excluded.last_rate,
+                alert_count=contribution_alerts.alert_count + 1
+            """,
+            (str(mc_user_id), alerted_at if alerted_at is not None else _timestamp(), rate)
+        )
+        await self._conn.commit()
+    
     # ==================== WATCHLIST ====================
     
     async def add_to_watchlist(
@@ -578,6 +650,7 @@ class MemberDatabase:
             )
         )
         await self._conn.commit()
+        self._notify_write(guild_id, discord_id, mc_user_id)
         
         return cursor.lastrowid
     
@@ -641,6 +714,7 @@ class MemberDatabase:
             (_timestamp(), resolved_by, notes, watchlist_id)
         )
         await self._conn.commit()
+        self._notify_write()
         
         return result.rowcount > 0
 
@@ -16,6 +16,7 @@ FIXED: Timezone-aware datetime handling
 from __future__ import annotations
 import asyncio
 import logging
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
@@ -28,6 +29,7 @@ from redbot.core.data_manager import cog_data_path
 
 from .database import MemberDatabase
 from .models import MemberData
+from .profile_cache import MemberProfileCache
 from .views import MemberOverviewView
 from .utils import fuzzy_match_score, fuzzy_search_member
 from .automation import ContributionMonitor
@@ -37,6 +39,8 @@ log = logging.getLogger("red.FARA.MemberManager")
 
 __version__ = "2.2.4"
 
+PROFILE_SLOW_SOURCE_SECONDS = 2.0
+
 DEFAULTS = {
     "contribution_threshold": 5.0,
     "contribution_trend_weeks": 3,
@@ -135,6 +139,10 @@ class MemberManager(ConfigCommands, commands.Cog):
         self.logs_scraper: Optional[commands.Cog] = None
         self.sanction_manager: Optional[commands.Cog] = None
         
+        # Assembled member profiles, invalidated on note/infraction/watchlist writes
+        self._profile_cache = MemberProfileCache()
+        self._last_profile_timings: Dict[str, float] = {}
+        
         # Automation
         self.contribution_monitor: Optional[ContributionMonitor] = None
         self._automation_task: Optional[asyncio.Task] = None
@@ -154,6 +162,7 @@ class MemberManager(ConfigCommands, commands.Cog):
         # Initialize database
         self.db = MemberDatabase(str(self.db_path))
         await self.db.initialize()
+        self.db.add_write_listener(self._profile_cache.invalidate)
         log.info("Database initialized")
         
         # Detect and connect to other cogs
@@ -1773,7 +1782,14 @@ class MemberManager(ConfigCommands, commands.Cog):
             return
 
         data.contribution_data_status = "available"
-        data.contribution_history = await self._get_historical_rates_for_member(data.mc_user_id)
+        data.contribution_history, (join_date, join_source) = await asyncio.gather(
+            self._get_historical_rates_for_member(data.mc_user_id),
+            self._get_join_date_for_member(
+                data.mc_user_id,
+                data.mc_username,
+                self.logs_scraper,
+            ),
+        )
 
         if len(data.contribution_history) >= 2:
             current = data.contribution_history[0]
@@ -1785,11 +1801,6 @@ class MemberManager(ConfigCommands, commands.Cog):
             else:
                 data.contribution_trend = "down"
 
-        join_date, join_source = await self._get_join_date_for_member(
-            data.mc_user_id,
-            data.mc_username,
-            self.logs_scraper,
-        )
         data.contribution_join_source = join_source
         if join_date:
             data.mc_joined = join_date
@@ -1860,6 +1871,26 @@ class MemberManager(ConfigCommands, commands.Cog):
             inline=False
         )
         
+        cache_info = [
+            f"Cached profiles: {len(self._profile_cache)}",
+            f"Hits/misses: {self._profile_cache.hits}/{self._profile_cache.misses}",
+        ]
+        if self._last_profile_timings:
+            cache_info.append("Last build: " + ", ".join(
+                f"{name} {seconds * 1000:.0f}ms"
+                for name, seconds in sorted(
+                    self._last_profile_timings.items(),
+                    key=lambda item: item[1],
+                    reverse=True,
+                )
+            ))
+        
+        embed.add_field(
+            name="⏱️ Profile Sources",
+            value="\n".join(cache_info),
+            inline=False
+        )
+        
         all_cogs = [c.qualified_name for c in self.bot.cogs.values()]
         cog_list = ", ".join(sorted(all_cogs))
         
@@ -1965,6 +1996,28 @@ class MemberManager(ConfigCommands, commands.Cog):
         return None
     
     async def _build_member_data(
+        self,
+        guild: discord.Guild,
+        discord_id: Optional[int] = None,
+        mc_user_id: Optional[str] = None,
+        use_cache: bool = True
+    ) -> MemberData:
+        """Return a member profile, served from the short-lived cache when fresh."""
+        cache: Optional[MemberProfileCache] = getattr(self, "_profile_cache", None)
+        key = cache.make_key(guild.id, discord_id, mc_user_id) if cache is not None else None
+        
+        if cache is not None and use_cache:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        
+        data = await self._assemble_member_data(guild, discord_id, mc_user_id)
+        
+        if cache is not None:
+            cache.set(key, data)
+        return data
+    
+    async def _assemble_member_data(
         self,
         guild: discord.Guild,
         discord_id: Optional[int] = None,
@@ -1975,6 +2028,8 @@ class MemberManager(ConfigCommands, commands.Cog):
             discord_id=discord_id,
             mc_user_id=mc_user_id
         )
+        timings: Dict[str, float] = {}
+        link_started = time.perf_counter()
         
         # Get Discord data
         if discord_id:
@@ -2043,7 +2098,38 @@ class MemberManager(ConfigCommands, commands.Cog):
                 data.discord_roles = [r.name for r in member.roles if r.name != "@everyone"]
                 data.discord_joined = member.joined_at
         
-        # Get MC data from MembersScraper
+        timings["membersync"] = time.perf_counter() - link_started
+        
+        # The remaining sources only depend on the resolved identity
+        await asyncio.gather(
+            self._timed_profile_source("missionchief", self._load_mc_profile(data), timings),
+            self._timed_profile_source("notes", self._load_notes_count(guild, data), timings),
+            self._timed_profile_source("sanctions", self._load_sanction_stats(guild, data), timings),
+            self._timed_profile_source("watchlist", self._load_watchlist_status(guild, data), timings),
+        )
+        data.source_timings = timings
+        self._last_profile_timings = dict(timings)
+        
+        return data
+    
+    async def _timed_profile_source(
+        self,
+        name: str,
+        coro,
+        timings: Dict[str, float]
+    ) -> None:
+        """Await one profile source and record how long it took."""
+        started = time.perf_counter()
+        try:
+            await coro
+        finally:
+            elapsed = time.perf_counter() - started
+            timings[name] = elapsed
+            if elapsed >= PROFILE_SLOW_SOURCE_SECONDS:
+                log.warning("Slow member profile source %s: %.2fs", name, elapsed)
+    
+    async def _load_mc_profile(self, data: MemberData) -> None:
+        """Load the MembersScraper snapshot and contribution data."""
         mc_in_alliance = False
         if data.mc_user_id and self.members_scraper:
             try:
@@ -2063,94 +2149,104 @@ class MemberManager(ConfigCommands, commands.Cog):
             data.mc_role = "Left alliance"
 
         await self._populate_contribution_data(data)
+    
+    async def _load_notes_count(self, guild: discord.Guild, data: MemberData) -> None:
+        """Count stored notes for the member."""
+        if not self.db:
+            return
         
-        # Get notes count
-        if self.db:
-            try:
-                notes = await self.db.get_notes(
+        try:
+            notes = await self.db.get_notes(
+                guild_id=guild.id,
+                discord_id=data.discord_id,
+                mc_user_id=data.mc_user_id
+            )
+            data.notes_count = len(notes)
+        except Exception as e:
+            log.error(f"Failed to get notes: {e}")
+            data.notes_count = 0
+    
+    async def _load_sanction_stats(self, guild: discord.Guild, data: MemberData) -> None:
+        """Load active sanction count and severity from SanctionManager."""
+        if not self.sanction_manager:
+            return
+        
+        try:
+            get_member_sanctions = getattr(self.sanction_manager, "get_member_sanctions", None)
+            if get_member_sanctions:
+                sanctions = await asyncio.to_thread(
+                    get_member_sanctions,
                     guild_id=guild.id,
-                    discord_id=data.discord_id,
-                    mc_user_id=data.mc_user_id
+                    discord_user_id=data.discord_id,
+                    mc_user_id=data.mc_user_id,
                 )
-                data.notes_count = len(notes)
-            except Exception as e:
-                log.error(f"Failed to get notes: {e}")
-                data.notes_count = 0
-        
-        # Get sanctions from SanctionManager
-        if self.sanction_manager:
-            try:
-                get_member_sanctions = getattr(self.sanction_manager, "get_member_sanctions", None)
-                if get_member_sanctions:
-                    sanctions = get_member_sanctions(
-                        guild_id=guild.id,
-                        discord_user_id=data.discord_id,
-                        mc_user_id=data.mc_user_id,
-                    )
-                else:
-                    sanctions = self.sanction_manager.db.get_user_sanctions(
-                        guild_id=guild.id,
-                        discord_user_id=data.discord_id,
-                        mc_user_id=data.mc_user_id,
-                    )
-                
-                now = int(datetime.now(timezone.utc).timestamp())
-                thirty_days_ago = now - (30 * 86400)
-                
-                active_sanctions = []
-                for sanction in sanctions:
-                    status = sanction.get("status", "active")
-                    is_warning = "Warning" in sanction.get("sanction_type", "")
-                    created_at = sanction.get("created_at", 0)
-                    
-                    if status == "active":
-                        if not is_warning or created_at >= thirty_days_ago:
-                            active_sanctions.append(sanction)
-                
-                data.infractions_count = len(active_sanctions)
-                
-                data.severity_score = 0
-                for sanction in active_sanctions:
-                    stype = sanction.get("sanction_type", "")
-                    if "Warning" in stype:
-                        if "1st" in stype:
-                            data.severity_score += 2
-                        elif "2nd" in stype:
-                            data.severity_score += 4
-                        elif "3rd" in stype:
-                            data.severity_score += 6
-                        else:
-                            data.severity_score += 1
-                    elif "Kick" in stype:
-                        data.severity_score += 7
-                    elif "Ban" in stype:
-                        data.severity_score += 10
-                    elif "Mute" in stype:
-                        data.severity_score += 3
-                    else:
-                        data.severity_score += 1
-            
-            except Exception as e:
-                log.error(f"Failed to get sanctions: {e}")
-                data.infractions_count = 0
-                data.severity_score = 0
-
-        if self.db:
-            try:
-                watch_entries = await self.db.get_member_watchlist(
+            else:
+                sanctions = await asyncio.to_thread(
+                    self.sanction_manager.db.get_user_sanctions,
                     guild_id=guild.id,
-                    discord_id=data.discord_id,
+                    discord_user_id=data.discord_id,
                     mc_user_id=data.mc_user_id,
-                    status="active",
-                    limit=1,
                 )
-                if watch_entries:
-                    data.on_watchlist = True
-                    data.watchlist_reason = watch_entries[0].get("reason")
-            except Exception as e:
-                log.error(f"Failed to get watchlist status: {e}")
+            
+            now = int(datetime.now(timezone.utc).timestamp())
+            thirty_days_ago = now - (30 * 86400)
+            
+            active_sanctions = []
+            for sanction in sanctions:
+                status = sanction.get("status", "active")
+                is_warning = "Warning" in sanction.get("sanction_type", "")
+                created_at = sanction.get("created_at", 0)
+                
+                if status == "active":
+                    if not is_warning or created_at >= thirty_days_ago:
+                        active_sanctions.append(sanction)
+            
+            data.infractions_count = len(active_sanctions)
+            
+            data.severity_score = 0
+            for sanction in active_sanctions:
+                stype = sanction.get("sanction_type", "")
+                if "Warning" in stype:
+                    if "1st" in stype:
+                        data.severity_score += 2
+                    elif "2nd" in stype:
+                        data.severity_score += 4
+                    elif "3rd" in stype:
+                        data.severity_score += 6
+                    else:
+                        data.severity_score += 1
+                elif "Kick" in stype:
+                    data.severity_score += 7
+                elif "Ban" in stype:
+                    data.severity_score += 10
+                elif "Mute" in stype:
+                    data.severity_score += 3
+                else:
+                    data.severity_score += 1
         
-        return data
+        except Exception as e:
+            log.error(f"Failed to get sanctions: {e}")
+            data.infractions_count = 0
+            data.severity_score = 0
+    
+    async def _load_watchlist_status(self, guild: discord.Guild, data: MemberData) -> None:
+        """Flag members with an active watchlist entry."""
+        if not self.db:
+            return
+        
+        try:
+            watch_entries = await self.db.get_member_watchlist(
+                guild_id=guild.id,
+                discord_id=data.discord_id,
+                mc_user_id=data.mc_user_id,
+                status="active",
+                limit=1,
+            )
+            if watch_entries:
+                data.on_watchlist = True
+                data.watchlist_reason = watch_entries[0].get("reason")
+        except Exception as e:
+            log.error(f"Failed to get watchlist status: {e}")
 
 
 async def setup(bot: Red):
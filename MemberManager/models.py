@@ -57,6 +57,9 @@ class MemberData:
     watchlist_reason: Optional[str] = None
     is_verified: bool = False
     
+    # Seconds spent per data source while assembling this profile
+    source_timings: Dict[str, float] = field(default_factory=dict)
+    
     def has_discord(self) -> bool:
         """Check if member has Discord data."""
         return self.discord_id is not None
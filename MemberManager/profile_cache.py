@@ -0,0 +1,109 @@
+"""
+Short-lived cache for assembled member profiles.
+
+Building a profile touches MemberSync, MembersScraper, LogsScraper, the
+MemberManager database and SanctionManager. Views and lookups often open the
+same member several times in a row, so finished profiles are kept for a short
+TTL and dropped as soon as a note, infraction or watchlist entry changes.
+"""
+
+from __future__ import annotations
+
+import copy
+import time
+from typing import Dict, Optional, Tuple
+
+from .models import MemberData
+
+PROFILE_CACHE_TTL_SECONDS = 60.0
+PROFILE_CACHE_MAX_ENTRIES = 256
+
+ProfileKey = Tuple[int, Optional[int], Optional[str]]
+
+
+class MemberProfileCache:
+    """TTL cache of MemberData keyed by (guild, discord member, MC member)."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = PROFILE_CACHE_TTL_SECONDS,
+        max_entries: int = PROFILE_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[ProfileKey, Tuple[float, MemberData]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        guild_id: int,
+        discord_id: Optional[int],
+        mc_user_id: Optional[str],
+    ) -> ProfileKey:
+        return (
+            int(guild_id),
+            int(discord_id) if discord_id is not None else None,
+            str(mc_user_id) if mc_user_id else None,
+        )
+
+    def get(self, key: ProfileKey) -> Optional[MemberData]:
+        """Return a copy of a fresh cached profile, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        stored_at, data = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        # Views mutate their MemberData (e.g. notes_count), so never hand out the cached object
+        return copy.deepcopy(data)
+
+    def set(self, key: ProfileKey, data: MemberData) -> None:
+        if len(self._entries) >= self.max_entries and key not in self._entries:
+            oldest = min(self._entries, key=lambda item: self._entries[item][0])
+            del self._entries[oldest]
+        self._entries[key] = (time.monotonic(), copy.deepcopy(data))
+
+    def invalidate(
+        self,
+        guild_id: Optional[int] = None,
+        discord_id: Optional[int] = None,
+        mc_user_id: Optional[str] = None,
+    ) -> int:
+        """
+        Drop cached profiles for a member.
+
+        Matches on either identity, in the request key or in the resolved
+        profile. With no identity at all, every profile (in the guild, if
+        given) is dropped. Returns the number of removed entries.
+        """
+        mc_user_id = str(mc_user_id) if mc_user_id else None
+        stale = []
+        for key, (_, data) in self._entries.items():
+            if guild_id is not None and key[0] != guild_id:
+                continue
+            if discord_id is None and mc_user_id is None:
+                stale.append(key)
+                continue
+            discord_ids = {key[1], data.discord_id}
+            mc_user_ids = {key[2], data.mc_user_id}
+            if (discord_id is not None and discord_id in discord_ids) or (
+                mc_user_id is not None and mc_user_id in mc_user_ids
+            ):
+                stale.append(key)
+
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1539,7 +1539,8 @@ class RefreshButton(discord.ui.Button):
                 self.parent_view.member_data = await cog._build_member_data(
                     guild=guild,
                     discord_id=self.parent_view.member_data.discord_id,
-                    mc_user_id=self.parent_view.member_data.mc_user_id
+                    mc_user_id=self.parent_view.member_data.mc_user_id,
+                    use_cache=False
                 )
         
         await self.parent_view._update_view(interaction)
@@ -21,6 +21,7 @@ log = logging.getLogger("red.fara.admintimednotifications")
 DEFAULT_REMINDER_CHANNEL_ID = 1421625293130567690
 DEFAULT_MANAGEMENT_CHANNEL_ID = 1426226521231589507
 DEFAULT_LOG_CHANNEL_ID = 668919729762730004
+SCHEDULER_SAFETY_SWEEP_SECONDS = 15 * 60
 LOCAL_TIMEZONE_NAME = "Europe/Amsterdam"
 MANAGEMENT_PANEL_TITLE = "Admin timer management"
 
@@ -201,6 +202,18 @@ def split_due_reminders(
     return due, pending
 
 
+def next_wake_ts(reminders: list[dict[str, Any]]) -> Optional[int]:
+    """Earliest moment any reminder becomes due, scheduled or snoozed."""
+    candidates = []
+    for reminder in reminders:
+        snooze_until = int(reminder.get("snooze_until") or 0)
+        if snooze_until:
+            candidates.append(snooze_until)
+        else:
+            candidates.append(int(reminder.get("next_run", 0)))
+    return min(candidates) if candidates else None
+
+
 def normalize_recurrence(value: str) -> str:
     recurrence = (value or "").strip().lower()
     aliases = {
@@ -923,16 +936,50 @@ class AdminTimedNotifications(commands.Cog):
                     self.bot.add_view(ReminderActionView(self, int(reminder_id)))
             await self.ensure_management_panel(guild, create=True)
 
+    def get_scheduler(self):
+        return self.bot.get_cog("Scheduler")
+
+    async def schedule_guild_wake(self, guild: discord.Guild):
+        """Ask the shared Scheduler to wake this cog when the next timer is due."""
+        scheduler = self.get_scheduler()
+        if not scheduler:
+            return
+        reminders = await self.config.guild(guild).reminders()
+        wake_at = next_wake_ts(reminders)
+        key = f"guild:{guild.id}"
+        if wake_at is None:
+            await scheduler.cancel("AdminTimedNotifications", key=key)
+            return
+        await scheduler.schedule(
+            "AdminTimedNotifications",
+            wake_at,
+            {"guild_id": guild.id},
+            key=key,
+        )
+
+    async def handle_scheduled_job(self, job: dict[str, Any]):
+        """Scheduler callback: post the timers of one guild that became due."""
+        guild = self.bot.get_guild(int((job.get("payload") or {}).get("guild_id", 0)))
+        if not guild:
+            return
+        await self.run_due_reminders([guild])
+        await self.schedule_guild_wake(guild)
+
     async def reminder_loop(self):
         await self.bot.wait_until_red_ready()
         while True:
+            scheduler = self.get_scheduler()
             try:
                 await self.run_due_reminders()
+                if scheduler:
+                    for guild in self.bot.guilds:
+                        await self.schedule_guild_wake(guild)
             except asyncio.CancelledError:
                 raise
             except Exception:
                 log.exception("Admin reminder loop failed")
-            await asyncio.sleep(60)
+            # The Scheduler wakes us exactly on time; this is only a safety sweep then
+            await asyncio.sleep(SCHEDULER_SAFETY_SWEEP_SECONDS if scheduler else 60)
 
     async def can_manage(self, guild: discord.Guild, user: Any) -> bool:
         if not guild:
@@ -1131,6 +1178,7 @@ class AdminTimedNotifications(commands.Cog):
         async with self.config.guild(guild).reminders() as reminders:
             reminders.append(reminder)
         self.bot.add_view(ReminderActionView(self, int(reminder["id"])))
+        await self.schedule_guild_wake(guild)
         await self.ensure_management_panel(guild, create=False)
         await self.log_timer_action(guild, "created", reminder, actor=actor)
 
@@ -1145,6 +1193,7 @@ class AdminTimedNotifications(commands.Cog):
                     kept.append(reminder)
             reminders[:] = kept
         if removed:
+            await self.schedule_guild_wake(guild)
             await self.ensure_management_panel(guild, create=False)
             await self.log_timer_action(guild, "removed", removed, actor=actor)
             return True
@@ -1163,6 +1212,8 @@ class AdminTimedNotifications(commands.Cog):
                     reminder["snooze_until"] = int(snooze_until)
                     updated = dict(reminder)
                     break
+        if updated:
+            await self.schedule_guild_wake(guild)
         return updated or {}
 
     async def send_reminder_message(
@@ -1253,9 +1304,9 @@ class AdminTimedNotifications(commands.Cog):
                 ephemeral=True,
             )
 
-    async def run_due_reminders(self):
+    async def run_due_reminders(self, guilds: Optional[list[discord.Guild]] = None):
         current_ts = int(datetime.now(timezone.utc).timestamp())
-        for guild in self.bot.guilds:
+        for guild in self.bot.guilds if guilds is None else guilds:
             reminders = await self.config.guild(guild).reminders()
             due_items = []
             for reminder in reminders:
@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 from bs4 import BeautifulSoup
 import re
+import time
 
 try:
     from .fara_db import (
@@ -13,6 +14,7 @@ try:
         finish_scrape_run_for_path,
         start_scrape_run_for_path,
     )
+    from .mc_requests import mc_request_slot
 except ImportError:  # pragma: no cover - direct module loading in local tooling
     from fara_db import (
         connect_database,
@@ -20,6 +22,58 @@ except ImportError:  # pragma: no cover - direct module loading in local tooling
         finish_scrape_run_for_path,
         start_scrape_run_for_path,
     )
+    from mc_requests import mc_request_slot
+
+# The scraper is the only cog that fetches the applications page; NewMemberNotify
+# subscribes to its feed, so a short interval still means one request per cycle
+FEED_INTERVAL_MINUTES = 5
+FEED_START_DELAY_SECONDS = 90
+# The snapshot history in `applications` keeps its original hourly cadence
+HISTORY_INTERVAL_SECONDS = 3600
+
+
+def parse_pending_applications(html):
+    """Return pending applications that carry an accept link, in page order.
+
+    Each entry has the MissionChief application id used by the accept/deny
+    endpoints plus the applicant's name, profile URL and profile id.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    applications = []
+    seen = set()
+    for row in soup.find_all('tr'):
+        accept_link = row.find('a', href=lambda x: x and '/verband/bewerbungen/annehmen/' in x)
+        if not accept_link:
+            continue
+        app_id = accept_link.get('href', '').split('/annehmen/')[-1].strip().strip('/')
+        if not app_id or app_id in seen:
+            continue
+        seen.add(app_id)
+
+        applicant_id = 0
+        username_link = row.find('a', href=lambda x: x and '/profile/' in x)
+        if username_link:
+            username = username_link.get_text(strip=True)
+            profile_url = username_link.get('href', '')
+            id_match = profile_url.split('/profile/')[-1].split('/')[0]
+            applicant_id = int(id_match) if id_match.isdigit() else 0
+            if profile_url and not profile_url.startswith('http'):
+                profile_url = f"https://www.missionchief.com{profile_url}"
+        else:
+            name_cell = row.find('td')
+            username = name_cell.get_text(strip=True) if name_cell else f"User_{app_id}"
+            for btn_text in ["Accept", "Deny", "Annehmen", "Ablehnen"]:
+                username = username.replace(btn_text, "").strip()
+            profile_url = f"https://www.missionchief.com/profile/{app_id}"
+
+        applications.append({
+            'id': app_id,
+            'username': username or f"User_{app_id}",
+            'profile_url': profile_url,
+            'applicant_id': applicant_id,
+        })
+    return applications
+
 
 class ApplicationsScraper(commands.Cog):
     """Scrapes alliance applications from MissionChief"""
@@ -27,6 +81,7 @@ class ApplicationsScraper(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.config = Config.get_conf(self, identifier=1621005, force_registration=True)
+        self.config.register_global(feed_interval_minutes=FEED_INTERVAL_MINUTES)
         
         # Setup database path in shared location
         base_path = data_manager.cog_data_path(raw_name="scraper_databases")
@@ -36,6 +91,8 @@ class ApplicationsScraper(commands.Cog):
         self.base_url = "https://www.missionchief.com"
         self.applications_url = f"{self.base_url}/verband/bewerbungen"
         self.scraping_task = None
+        self._subscribers = []
+        self._last_history_at = 0.0
         self._init_database()
         
     def cog_load(self):
@@ -67,7 +124,11 @@ class ApplicationsScraper(commands.Cog):
                 priority=priority,
                 ttl_seconds=ttl_seconds,
             )
-    
+
+    def _mc_request_slot(self, priority="scraper"):
+        """Pace one MissionChief request through CookieManager's request governor."""
+        return mc_request_slot(getattr(self, "bot", None), "ApplicationsScraper", priority)
+
     def _init_database(self):
         """Initialize SQLite database with schema"""
         conn = connect_database(self.db_path)
@@ -91,6 +152,29 @@ class ApplicationsScraper(commands.Cog):
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_status ON applications(status)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_scrape_time ON applications(scrape_timestamp)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_applicant ON applications(applicant_id)')
+        
+        # Current view of the applications page, one row per MissionChief application
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS application_state (
+                application_id TEXT PRIMARY KEY,
+                applicant_id INTEGER,
+                applicant_name TEXT,
+                profile_url TEXT,
+                fingerprint TEXT NOT NULL,
+                present INTEGER NOT NULL DEFAULT 1,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                last_changed TEXT NOT NULL
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_application_state_present ON application_state(present, first_seen)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_application_state_applicant ON application_state(applicant_id)')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS application_feed_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        ''')
         ensure_scrape_runs_table(cursor)
         
         conn.commit()
@@ -188,66 +272,204 @@ class ApplicationsScraper(commands.Cog):
             'scrape_timestamp': scrape_timestamp
         }
     
-    async def _scrape_applications(self, session):
-        """Scrape applications page"""
+    async def _fetch_applications_page(self, session):
+        """Fetch the applications page; returns the HTML or None when it could not be read"""
         await self._report_bot_status("fetching alliance applications page")
         url = self.applications_url
         
         for attempt in range(3):
             try:
-                await asyncio.sleep(1.5)
-                
-                async with session.get(url) as response:
+                async with self._mc_request_slot(), session.get(url) as response:
                     if response.status != 200:
                         print(f"[ApplicationsScraper] Page returned status {response.status}")
-                        return []
+                        return None
                     
                     html = await response.text()
                     
                     if not await self._check_logged_in(html):
                         print("[ApplicationsScraper] Session expired, will retry on next run")
-                        return []
+                        return None
                     
-                    soup = BeautifulSoup(html, 'html.parser')
-                    applications_data = []
-                    scrape_timestamp = datetime.utcnow().isoformat()
-                    
-                    # Method 1: Look for table with applications
-                    table = soup.find('table', class_='table')
-                    if table:
-                        rows = table.find('tbody').find_all('tr') if table.find('tbody') else table.find_all('tr')
-                        
-                        for row in rows:
-                            app_data = self._parse_application(row, scrape_timestamp)
-                            if app_data['applicant_name']:  # Valid application
-                                applications_data.append(app_data)
-                    
-                    # Method 2: Look for card/panel based layout
-                    cards = soup.find_all('div', class_=lambda x: x and ('card' in x.lower() or 'panel' in x.lower()))
-                    for card in cards:
-                        app_data = self._parse_application(card, scrape_timestamp)
-                        if app_data['applicant_name']:
-                            applications_data.append(app_data)
-                    
-                    # Method 3: Look for list items
-                    list_items = soup.find_all('li', class_=lambda x: x and 'application' in x.lower())
-                    for item in list_items:
-                        app_data = self._parse_application(item, scrape_timestamp)
-                        if app_data['applicant_name']:
-                            applications_data.append(app_data)
-                    
-                    return applications_data
+                    return html
                     
             except asyncio.TimeoutError:
                 print(f"[ApplicationsScraper] Timeout, attempt {attempt + 1}")
                 if attempt == 2:
-                    return []
+                    return None
             except Exception as e:
                 print(f"[ApplicationsScraper] Error scraping applications: {e}")
                 if attempt == 2:
-                    return []
+                    return None
+        
+        return None
+    
+    def _parse_applications_page(self, html, scrape_timestamp):
+        """Parse every application element on the page into history rows"""
+        soup = BeautifulSoup(html, 'html.parser')
+        applications_data = []
+        
+        # Method 1: Look for table with applications
+        table = soup.find('table', class_='table')
+        if table:
+            rows = table.find('tbody').find_all('tr') if table.find('tbody') else table.find_all('tr')
+            
+            for row in rows:
+                app_data = self._parse_application(row, scrape_timestamp)
+                if app_data['applicant_name']:  # Valid application
+                    applications_data.append(app_data)
+        
+        # Method 2: Look for card/panel based layout
+        cards = soup.find_all('div', class_=lambda x: x and ('card' in x.lower() or 'panel' in x.lower()))
+        for card in cards:
+            app_data = self._parse_application(card, scrape_timestamp)
+            if app_data['applicant_name']:
+                applications_data.append(app_data)
+        
+        # Method 3: Look for list items
+        list_items = soup.find_all('li', class_=lambda x: x and 'application' in x.lower())
+        for item in list_items:
+            app_data = self._parse_application(item, scrape_timestamp)
+            if app_data['applicant_name']:
+                applications_data.append(app_data)
+        
+        return applications_data
+    
+    async def _scrape_applications(self, session):
+        """Scrape applications page"""
+        html = await self._fetch_applications_page(session)
+        if html is None:
+            return []
+        return self._parse_applications_page(html, datetime.utcnow().isoformat())
+    
+    # ---------- Application feed ----------
+    
+    def subscribe_applications(self, callback):
+        """Register ``async callback(events)`` for new or changed applications.
+        
+        Each event is a dict with ``event`` ("new" or "changed"), ``id``,
+        ``username``, ``profile_url``, ``applicant_id`` and ``first_seen``.
+        Subscribing twice with the same callback is a no-op.
+        """
+        subscribers = self._feed_subscribers()
+        if callback not in subscribers:
+            subscribers.append(callback)
+    
+    def unsubscribe_applications(self, callback):
+        subscribers = self._feed_subscribers()
+        if callback in subscribers:
+            subscribers.remove(callback)
+    
+    def _feed_subscribers(self):
+        if getattr(self, '_subscribers', None) is None:
+            self._subscribers = []
+        return self._subscribers
+    
+    def _sync_application_state(self, pending, seen_at):
+        """Diff the pending list against application_state; returns (events, baseline)
         
-        return []
+        The first sync against an empty feed only records a baseline, so loading the
+        cog does not announce applications that were already waiting.
+        """
+        conn = connect_database(self.db_path)
+        try:
+            cursor = conn.cursor()
+            baseline = cursor.execute(
+                "SELECT 1 FROM application_feed_meta WHERE key = 'baseline_at'"
+            ).fetchone() is None
+            
+            ids = [app['id'] for app in pending]
+            known = {}
+            if ids:
+                placeholders = ",".join("?" for _ in ids)
+                for row in cursor.execute(
+                    f"SELECT application_id, fingerprint, present, first_seen FROM application_state "
+                    f"WHERE application_id IN ({placeholders})",
+                    ids,
+                ):
+                    known[row[0]] = row
+            
+            events = []
+            for app in pending:
+                fingerprint = f"{app['username']}|{app['profile_url']}"
+                row = known.get(app['id'])
+                if row is None:
+                    cursor.execute('''
+                        INSERT INTO application_state
+                        (application_id, applicant_id, applicant_name, profile_url, fingerprint,
+                         present, first_seen, last_seen, last_changed)
+                        VALUES (?, ?, ?, ?, ?, 1, ?, ?, ?)
+                    ''', (app['id'], app['applicant_id'], app['username'], app['profile_url'],
+                          fingerprint, seen_at, seen_at, seen_at))
+                    events.append({**app, 'event': 'new', 'first_seen': seen_at})
+                elif row[1] != fingerprint or not row[2]:
+                    cursor.execute('''
+                        UPDATE application_state
+                        SET applicant_id = ?, applicant_name = ?, profile_url = ?, fingerprint = ?,
+                            present = 1, last_seen = ?, last_changed = ?
+                        WHERE application_id = ?
+                    ''', (app['applicant_id'], app['username'], app['profile_url'], fingerprint,
+                          seen_at, seen_at, app['id']))
+                    events.append({**app, 'event': 'changed', 'first_seen': row[3]})
+                else:
+                    cursor.execute(
+                        "UPDATE application_state SET last_seen = ? WHERE application_id = ?",
+                        (seen_at, app['id']),
+                    )
+            
+            # Anything no longer listed was accepted, denied or withdrawn
+            if ids:
+                cursor.execute(
+                    f"UPDATE application_state SET present = 0, last_changed = ? "
+                    f"WHERE present = 1 AND application_id NOT IN ({placeholders})",
+                    [seen_at, *ids],
+                )
+            else:
+                cursor.execute(
+                    "UPDATE application_state SET present = 0, last_changed = ? WHERE present = 1",
+                    (seen_at,),
+                )
+            
+            if baseline:
+                cursor.execute(
+                    "INSERT OR REPLACE INTO application_feed_meta (key, value) VALUES ('baseline_at', ?)",
+                    (seen_at,),
+                )
+                events = []
+            conn.commit()
+            return events, baseline
+        finally:
+            conn.close()
+    
+    def _current_applications_sync(self):
+        conn = connect_database(self.db_path)
+        try:
+            rows = conn.execute('''
+                SELECT application_id, applicant_name, profile_url, applicant_id, first_seen
+                FROM application_state
+                WHERE present = 1
+                ORDER BY first_seen, application_id
+            ''').fetchall()
+        finally:
+            conn.close()
+        return [
+            {'id': row[0], 'username': row[1], 'profile_url': row[2], 'applicant_id': row[3], 'first_seen': row[4]}
+            for row in rows
+        ]
+    
+    async def refresh_applications(self):
+        """Scrape now and publish any feed updates; returns False when the page could not be read"""
+        return await self._scrape_all_applications()
+    
+    async def current_applications(self):
+        """Pending applications as of the last successful scrape, oldest first"""
+        return await asyncio.to_thread(self._current_applications_sync)
+    
+    async def _publish_application_events(self, events):
+        for callback in list(self._feed_subscribers()):
+            try:
+                await callback(events)
+            except Exception as e:
+                print(f"[ApplicationsScraper] Application feed subscriber failed: {e}")
     
     async def _scrape_all_applications(self, ctx=None):
         async with self._bot_status("checking alliance applications"):
@@ -275,7 +497,31 @@ class ApplicationsScraper(commands.Cog):
                 await ctx.send("❌ Failed to get session. Is CookieManager loaded and logged in?")
             return False
         
-        applications = await self._scrape_applications(session)
+        html = await self._fetch_applications_page(session)
+        if html is None:
+            finish_scrape_run_for_path(
+                self.db_path,
+                run_id,
+                "failed",
+                pages_attempted=1,
+                errors=1,
+                message="applications page unavailable",
+            )
+            if ctx:
+                await ctx.send("❌ Could not read the applications page. Is the session still logged in?")
+            return False
+        
+        pending = parse_pending_applications(html)
+        events, baseline = await asyncio.to_thread(self._sync_application_state, pending, scrape_timestamp)
+        if events:
+            await self._publish_application_events(events)
+        
+        # Snapshot history keeps its hourly cadence even though the feed polls more often
+        now = time.monotonic()
+        record_history = ctx is not None or now - getattr(self, '_last_history_at', 0.0) >= HISTORY_INTERVAL_SECONDS
+        applications = self._parse_applications_page(html, scrape_timestamp) if record_history else []
+        if record_history:
+            self._last_history_at = now
         
         # Save to database
         if applications:
@@ -316,12 +562,15 @@ class ApplicationsScraper(commands.Cog):
                 rows_parsed=len(applications),
                 rows_inserted=new_count,
                 duplicates=max(0, len(applications) - new_count),
-                message=f"{len(applications)} applications scraped",
+                message=f"{len(applications)} applications scraped, {len(events)} feed updates",
             )
             
             if ctx:
-                pending = sum(1 for a in applications if a['status'] == 'pending')
-                await ctx.send(f"✅ Scraped {len(applications)} applications ({pending} pending, {new_count} new)")
+                pending_count = sum(1 for a in applications if a['status'] == 'pending')
+                await ctx.send(
+                    f"✅ Scraped {len(applications)} applications ({pending_count} pending, {new_count} new, "
+                    f"{len(events)} published{' - feed baseline recorded' if baseline else ''})"
+                )
             return True
         else:
             finish_scrape_run_for_path(
@@ -330,27 +579,26 @@ class ApplicationsScraper(commands.Cog):
                 "success",
                 pages_attempted=1,
                 pages_succeeded=1,
-                rows_parsed=0,
-                message="no applications found",
+                rows_parsed=len(pending),
+                message=f"{len(pending)} pending applications, {len(events)} feed updates",
             )
             if ctx:
                 await ctx.send("ℹ️ No applications found (this is normal if there are no pending applications)")
             return True  # Not an error, just no applications
     
     async def _background_scraper(self):
-        """Background task that runs every hour"""
+        """Background task feeding application subscribers; history is written hourly"""
         await self.bot.wait_until_ready()
-        await asyncio.sleep(3300)  # Stagger: 55 minutes offset
+        await asyncio.sleep(FEED_START_DELAY_SECONDS)
         
         while not self.bot.is_closed():
             try:
-                print(f"[ApplicationsScraper] Starting automatic scrape at {datetime.utcnow()}")
                 await self._scrape_all_applications()
-                print("[ApplicationsScraper] Automatic scrape completed")
             except Exception as e:
                 print(f"[ApplicationsScraper] Background task error: {e}")
             
-            await asyncio.sleep(3600)
+            interval_minutes = await self.config.feed_interval_minutes()
+            await asyncio.sleep(max(1, int(interval_minutes)) * 60)
     
     @commands.command(name="scrape_applications")
     @commands.is_owner()
@@ -360,6 +608,16 @@ class ApplicationsScraper(commands.Cog):
         success = await self._scrape_all_applications(ctx)
         if success:
             await ctx.send("✅ Applications scrape completed successfully")
+    
+    @commands.command(name="applications_interval")
+    @commands.is_owner()
+    async def applications_interval(self, ctx, minutes: int):
+        """Set how often the applications page is polled for the feed (Owner only)"""
+        if minutes < 1:
+            await ctx.send("❌ Interval must be at least 1 minute.")
+            return
+        await self.config.feed_interval_minutes.set(minutes)
+        await ctx.send(f"✅ Applications feed interval set to {minutes} minutes.")
 
 async def setup(bot):
     await bot.add_cog(ApplicationsScraper(bot))
@@ -0,0 +1,137 @@
+import logging
+from typing import Any, Dict, Iterable, Optional
+
+log = logging.getLogger("red.assetmanager.sync")
+
+# Educations and buildings first so vehicle links resolve against this sync's rows
+WRITE_ORDER = ("educations", "buildings", "vehicles", "equipment")
+# Vehicle links depend on these sources, so vehicles are re-linked when they change
+VEHICLE_LINK_SOURCES = ("educations", "buildings")
+
+
+def sync_educations(db, github_sync, educations_data: dict) -> dict:
+    """Write educations; returns the per-source result used by the changelog."""
+    changes = github_sync.detect_changes(db.get_all_educations(), educations_data)
+    db.upsert_educations(
+        github_sync.normalize_education_data(game_id, raw_data)
+        for game_id, raw_data in educations_data.items()
+    )
+    log.info(f"Synced educations: {len(educations_data)} total")
+    return {'success': True, 'changes': changes}
+
+
+def sync_buildings(db, github_sync, buildings_data: dict) -> dict:
+    """Write buildings."""
+    changes = github_sync.detect_changes(db.get_all_buildings(), buildings_data)
+    db.upsert_buildings(
+        github_sync.normalize_building_data(game_id, raw_data)
+        for game_id, raw_data in buildings_data.items()
+    )
+    log.info(f"Synced buildings: {len(buildings_data)} total")
+    return {'success': True, 'changes': changes}
+
+
+def sync_equipment(db, github_sync, equipment_data: dict) -> dict:
+    """Write equipment."""
+    changes = github_sync.detect_changes(db.get_all_equipment(), equipment_data)
+    db.upsert_equipment(
+        github_sync.normalize_equipment_data(game_id, raw_data)
+        for game_id, raw_data in equipment_data.items()
+    )
+    log.info(f"Synced equipment: {len(equipment_data)} total")
+    return {'success': True, 'changes': changes}
+
+
+def sync_vehicles(db, github_sync, vehicles_data: dict) -> dict:
+    """Write vehicles and replace their building and training links in bulk."""
+    changes = github_sync.detect_changes(db.get_all_vehicles(), vehicles_data)
+    vehicles = [
+        github_sync.normalize_vehicle_data(game_id, raw_data)
+        for game_id, raw_data in vehicles_data.items()
+    ]
+    db.upsert_vehicles(vehicles)
+
+    vehicle_ids = db.game_id_map("vehicles")
+    building_ids = db.game_id_map("buildings")
+    education_ids = db.education_ids_by_key()
+    if not education_ids:
+        log.warning("No educations found in database - training links cannot be created!")
+
+    building_links = []
+    education_links = []
+    for vehicle in vehicles:
+        vehicle_id = vehicle_ids[vehicle['game_id']]
+        for building_game_id in vehicle['specials'].get('possibleBuildings') or []:
+            building_id = building_ids.get(building_game_id)
+            if building_id is not None:
+                building_links.append((vehicle_id, building_id))
+        for training_key in vehicle.get('education_keys', []):
+            education_id = education_ids.get(training_key)
+            if education_id is None:
+                log.warning(f"⚠️ Training key '{training_key}' not found in educations for {vehicle['name']}")
+            else:
+                education_links.append((vehicle_id, education_id))
+
+    db.replace_vehicle_links(
+        [vehicle_ids[vehicle['game_id']] for vehicle in vehicles],
+        building_links,
+        education_links
+    )
+    log.info(
+        f"Synced vehicles: {len(vehicles)} total, {len(building_links)} building links, "
+        f"{len(education_links)} training links created"
+    )
+    return {'success': True, 'changes': changes}
+
+
+WRITERS = {
+    "educations": sync_educations,
+    "buildings": sync_buildings,
+    "vehicles": sync_vehicles,
+    "equipment": sync_equipment,
+}
+
+
+def apply_full_sync(
+    db,
+    github_sync,
+    all_data: Dict[str, Optional[dict]],
+    unchanged: Iterable[str] = ()
+) -> Dict[str, Dict[str, Any]]:
+    """Write every fetched source in one transaction and log each to sync_history.
+
+    Each source runs in its own savepoint, so one failing source is rolled back
+    without losing the others. Sources in ``unchanged`` (304 from GitHub and
+    already written by this process) are skipped.
+    """
+    unchanged = set(unchanged)
+    results = {source: {'success': False, 'changes': {}} for source in ("vehicles", "buildings", "equipment", "educations")}
+    history = []
+    written = set()
+
+    with db.transaction():
+        for source in WRITE_ORDER:
+            data = all_data.get(source)
+            if not data:
+                continue
+            if source in unchanged and not (source == "vehicles" and written & set(VEHICLE_LINK_SOURCES)):
+                results[source] = {
+                    'success': True,
+                    'changes': {'added': [], 'updated': [], 'removed': []},
+                    'unchanged': True
+                }
+                continue
+            try:
+                with db.savepoint(f"sync_{source}"):
+                    results[source] = WRITERS[source](db, github_sync, data)
+            except Exception as e:
+                log.error(f"Error syncing {source}: {e}", exc_info=True)
+                results[source] = {'success': False, 'changes': {}, 'error': str(e)}
+                history.append((source, {}, False, str(e)))
+            else:
+                written.add(source)
+                history.append((source, results[source]['changes'], True, None))
+
+    for source, changes, success, error in history:
+        db.log_sync(source, changes, success, error)
+    return results
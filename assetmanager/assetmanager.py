@@ -8,8 +8,9 @@ import json
 import re
 from datetime import datetime, timedelta
 from typing import Optional, List
-from difflib import get_close_matches
 
+from .asset_sync import apply_full_sync
+from .catalog import AssetCatalog
 from .database import AssetDatabase
 from .github_sync import GitHubSync
 from .utils.embeds import (
@@ -52,8 +53,12 @@ class AssetManager(commands.Cog):
         self.db = AssetDatabase(self.db_path)
         self.db.connect()
         self.db.initialize_tables()
+        # Lookup commands answer from this snapshot; it is replaced after every sync
+        self.catalog = AssetCatalog.load(self.db)
         
         self.github_sync = GitHubSync()
+        # Sources written successfully by this process; unchanged ones can be skipped
+        self._applied_sources = set()
         
         self.sync_task = None
         
@@ -118,33 +123,16 @@ class AssetManager(commands.Cog):
             log.info("Fetching data from GitHub...")
             all_data = await self.github_sync.fetch_all()
             
-            # ===== CRITICAL FIX: Sync educations FIRST so they exist when linking vehicles =====
-            if all_data['educations']:
-                results['educations'] = await self.sync_educations(all_data['educations'])
-            else:
-                log.warning("No educations data received")
-            
-            # Now sync vehicles (can link to educations that now exist)
-            if all_data['vehicles']:
-                results['vehicles'] = await self.sync_vehicles(all_data['vehicles'])
-            else:
-                log.warning("No vehicles data received")
-            
-            # Sync buildings (OPTIONAL - may fail due to complex JavaScript)
-            if all_data['buildings']:
-                try:
-                    results['buildings'] = await self.sync_buildings(all_data['buildings'])
-                except Exception as e:
-                    log.warning(f"Buildings sync failed (non-critical): {e}")
-                    results['buildings'] = {'success': False, 'changes': {}, 'error': 'Parsing failed - contains JavaScript functions'}
-            else:
-                log.warning("No buildings data received (this is expected if parsing failed)")
+            for source, data in all_data.items():
+                if not data:
+                    # Buildings may fail to parse; the other sources still sync
+                    log.warning(f"No {source} data received")
             
-            # Sync equipment
-            if all_data['equipment']:
-                results['equipment'] = await self.sync_equipment(all_data['equipment'])
-            else:
-                log.warning("No equipment data received")
+            # Skip sources GitHub reports unchanged, unless the last write of them failed
+            unchanged = self.github_sync.unchanged_sources() & self._applied_sources
+            results = apply_full_sync(self.db, self.github_sync, all_data, unchanged)
+            self._applied_sources = {source for source, result in results.items() if result['success']}
+            self.reload_catalog()
             
             await self.config.last_sync.set(datetime.utcnow().isoformat())
             
@@ -163,124 +151,14 @@ class AssetManager(commands.Cog):
         
         return results
     
-    async def sync_vehicles(self, vehicles_data: dict) -> dict:
-        """Sync vehicles to database with FIXED education linking."""
-        try:
-            old_vehicles = self.db.get_all_vehicles()
-            changes = self.github_sync.detect_changes(old_vehicles, vehicles_data)
-            
-            # ===== CRITICAL: Get educations AFTER they've been synced =====
-            all_educations = self.db.get_all_educations()
-            
-            if not all_educations:
-                log.warning("No educations found in database - training links cannot be created!")
-            else:
-                log.debug(f"Found {len(all_educations)} educations for linking")
-            
-            training_links_made = 0
-            
-            for game_id, raw_data in vehicles_data.items():
-                normalized = self.github_sync.normalize_vehicle_data(game_id, raw_data)
-                vehicle_id = self.db.insert_vehicle(normalized)
-                
-                self.db.clear_all_relations(vehicle_id)
-                
-                # Link buildings
-                possible_buildings = raw_data.get('possibleBuildings', [])
-                for building_game_id in possible_buildings:
-                    building = self.db.get_building_by_name(str(building_game_id))
-                    if building:
-                        self.db.link_vehicle_building(vehicle_id, building['id'])
-                
-                # ===== FIXED: Link educations/trainings using training keys =====
-                training_keys = normalized.get('education_keys', [])  # Changed from 'training_keys' to match github_sync output
-                
-                if training_keys:
-                    log.debug(f"Vehicle {normalized['name']} has training keys: {training_keys}")
-                    
-                    for training_key in training_keys:
-                        # Find education with matching key
-                        matched = False
-                        for education in all_educations:
-                            if education.get('key') == training_key:
-                                self.db.link_vehicle_education(vehicle_id, education['id'])
-                                training_links_made += 1
-                                matched = True
-                                log.info(f"✅ Linked {normalized['name']} -> {education['name']} (key: {training_key})")
-                                break
-                        
-                        if not matched:
-                            log.warning(f"⚠️ Training key '{training_key}' not found in educations for {normalized['name']}")
-            
-            self.db.log_sync('vehicles', changes, True)
-            log.info(f"Synced vehicles: {len(vehicles_data)} total, {training_links_made} training links created")
-            
-            return {'success': True, 'changes': changes}
-            
-        except Exception as e:
-            log.error(f"Error syncing vehicles: {e}", exc_info=True)
-            self.db.log_sync('vehicles', {}, False, str(e))
-            return {'success': False, 'changes': {}}
-    
-    async def sync_buildings(self, buildings_data: dict) -> dict:
-        """Sync buildings to database."""
-        try:
-            old_buildings = self.db.get_all_buildings()
-            changes = self.github_sync.detect_changes(old_buildings, buildings_data)
-            
-            for game_id, raw_data in buildings_data.items():
-                normalized = self.github_sync.normalize_building_data(game_id, raw_data)
-                self.db.insert_building(normalized)
-            
-            self.db.log_sync('buildings', changes, True)
-            log.info(f"Synced buildings: {len(buildings_data)} total")
-            
-            return {'success': True, 'changes': changes}
-            
-        except Exception as e:
-            log.error(f"Error syncing buildings: {e}", exc_info=True)
-            self.db.log_sync('buildings', {}, False, str(e))
-            return {'success': False, 'changes': {}}
-    
-    async def sync_equipment(self, equipment_data: dict) -> dict:
-        """Sync equipment to database."""
-        try:
-            old_equipment = self.db.get_all_equipment()
-            changes = self.github_sync.detect_changes(old_equipment, equipment_data)
-            
-            for game_id, raw_data in equipment_data.items():
-                normalized = self.github_sync.normalize_equipment_data(game_id, raw_data)
-                self.db.insert_equipment(normalized)
-            
-            self.db.log_sync('equipment', changes, True)
-            log.info(f"Synced equipment: {len(equipment_data)} total")
-            
-            return {'success': True, 'changes': changes}
-            
-        except Exception as e:
-            log.error(f"Error syncing equipment: {e}", exc_info=True)
-            self.db.log_sync('equipment', {}, False, str(e))
-            return {'success': False, 'changes': {}}
-    
-    async def sync_educations(self, educations_data: dict) -> dict:
-        """Sync educations to database."""
-        try:
-            old_educations = self.db.get_all_educations()
-            changes = self.github_sync.detect_changes(old_educations, educations_data)
-            
-            for game_id, raw_data in educations_data.items():
-                normalized = self.github_sync.normalize_education_data(game_id, raw_data)
-                self.db.insert_education(normalized)
-            
-            self.db.log_sync('educations', changes, True)
-            log.info(f"Synced educations: {len(educations_data)} total")
-            
-            return {'success': True, 'changes': changes}
-            
-        except Exception as e:
-            log.error(f"Error syncing educations: {e}", exc_info=True)
-            self.db.log_sync('educations', {}, False, str(e))
-            return {'success': False, 'changes': {}}
+    def reload_catalog(self) -> AssetCatalog:
+        """Rebuild the in-memory catalog from the database."""
+        self.catalog = AssetCatalog.load(self.db)
+        log.info(
+            f"Asset catalog loaded: {len(self.catalog.vehicles)} vehicles, {len(self.catalog.buildings)} buildings, "
+            f"{len(self.catalog.equipment)} equipment, {len(self.catalog.educations)} trainings"
+        )
+        return self.catalog
     
     async def post_changelog(self, results: dict):
         """Post changelog to configured channel."""
@@ -335,32 +213,27 @@ class AssetManager(commands.Cog):
     async def vehicle_info(self, ctx: commands.Context, *, vehicle_name: str):
         """Show detailed information about a vehicle."""
         async with ctx.typing():
-            vehicle = self.db.get_vehicle_by_name(vehicle_name)
+            catalog = self.catalog
+            matches = catalog.vehicles.resolve(vehicle_name, limit=5)
             
-            if not vehicle:
-                all_vehicles = self.db.get_all_vehicles()
-                vehicle_names = [v['name'] for v in all_vehicles]
-                matches = get_close_matches(vehicle_name, vehicle_names, n=5, cutoff=0.6)
-                
-                if not matches:
-                    await ctx.send(embed=create_error_embed(
-                        f"Vehicle '{vehicle_name}' not found.\n"
-                        "Use `[p]vehicles list` to see all available vehicles."
-                    ))
-                    return
-                
-                if len(matches) == 1:
-                    vehicle = self.db.get_vehicle_by_name(matches[0])
-                else:
-                    match_list = "\n".join([f"{i+1}. {name}" for i, name in enumerate(matches)])
-                    await ctx.send(
-                        f"Multiple vehicles found matching '{vehicle_name}':\n```\n{match_list}\n```\n"
-                        f"Please be more specific."
-                    )
-                    return
+            if not matches:
+                await ctx.send(embed=create_error_embed(
+                    f"Vehicle '{vehicle_name}' not found.\n"
+                    "Use `[p]vehicles list` to see all available vehicles."
+                ))
+                return
             
-            buildings = self.db.get_vehicle_buildings(vehicle['id'])
-            educations = self.db.get_vehicle_educations(vehicle['id'])
+            if len(matches) > 1:
+                match_list = "\n".join([f"{i+1}. {match['name']}" for i, match in enumerate(matches)])
+                await ctx.send(
+                    f"Multiple vehicles found matching '{vehicle_name}':\n```\n{match_list}\n```\n"
+                    f"Please be more specific."
+                )
+                return
+            
+            vehicle = matches[0]
+            buildings = list(catalog.buildings_for(vehicle['id']))
+            educations = list(catalog.educations_for(vehicle['id']))
             
             embed = create_vehicle_embed(vehicle, buildings, educations)
             await ctx.send(embed=embed)
@@ -377,7 +250,7 @@ class AssetManager(commands.Cog):
         """
         async with ctx.typing():
             # Get all vehicles
-            vehicles = self.db.get_all_vehicles()
+            vehicles = list(self.catalog.vehicles.items)
             
             if not vehicles:
                 await ctx.send(embed=create_error_embed(
@@ -442,23 +315,16 @@ class AssetManager(commands.Cog):
             
             # Find each vehicle
             for vehicle_name in vehicle_names:
-                vehicle = self.db.get_vehicle_by_name(vehicle_name)
+                # Exact name first, then the closest fuzzy match
+                matches = self.catalog.vehicles.resolve(vehicle_name, limit=1)
                 
-                if not vehicle:
-                    # Try fuzzy search
-                    all_vehicles = self.db.get_all_vehicles()
-                    vehicle_names_list = [v['name'] for v in all_vehicles]
-                    matches = get_close_matches(vehicle_name, vehicle_names_list, n=1, cutoff=0.6)
-                    
-                    if matches:
-                        vehicle = self.db.get_vehicle_by_name(matches[0])
-                    else:
-                        await ctx.send(embed=create_error_embed(
-                            f"Vehicle '{vehicle_name}' not found."
-                        ))
-                        return
+                if not matches:
+                    await ctx.send(embed=create_error_embed(
+                        f"Vehicle '{vehicle_name}' not found."
+                    ))
+                    return
                 
-                vehicles.append(vehicle)
+                vehicles.append(matches[0])
             
             # Create comparison embed
             embed = create_comparison_embed(vehicles)
@@ -475,25 +341,21 @@ class AssetManager(commands.Cog):
         Example: [p]check Type 1 fire engine
         """
         async with ctx.typing():
-            vehicle = self.db.get_vehicle_by_name(vehicle_name)
+            catalog = self.catalog
+            # Exact name first, then the closest fuzzy match
+            matches = catalog.vehicles.resolve(vehicle_name, limit=1)
             
-            if not vehicle:
-                # Try fuzzy search
-                all_vehicles = self.db.get_all_vehicles()
-                vehicle_names = [v['name'] for v in all_vehicles]
-                matches = get_close_matches(vehicle_name, vehicle_names, n=1, cutoff=0.6)
-                
-                if not matches:
-                    await ctx.send(embed=create_error_embed(
-                        f"Vehicle '{vehicle_name}' not found."
-                    ))
-                    return
-                
-                vehicle = self.db.get_vehicle_by_name(matches[0])
+            if not matches:
+                await ctx.send(embed=create_error_embed(
+                    f"Vehicle '{vehicle_name}' not found."
+                ))
+                return
+            
+            vehicle = matches[0]
             
             # Get related data
-            buildings = self.db.get_vehicle_buildings(vehicle['id'])
-            educations = self.db.get_vehicle_educations(vehicle['id'])
+            buildings = catalog.buildings_for(vehicle['id'])
+            educations = catalog.educations_for(vehicle['id'])
             
             # Create requirements embed
             embed = discord.Embed(
@@ -584,7 +446,7 @@ class AssetManager(commands.Cog):
     async def vehicle_list(self, ctx: commands.Context):
         """List all available vehicles."""
         async with ctx.typing():
-            vehicles = self.db.get_all_vehicles()
+            vehicles = self.catalog.vehicles.items
             
             if not vehicles:
                 await ctx.send(embed=create_error_embed(
@@ -603,7 +465,7 @@ class AssetManager(commands.Cog):
     async def vehicle_search(self, ctx: commands.Context, *, query: str):
         """Search for vehicles by name."""
         async with ctx.typing():
-            results = self.db.search_vehicles(query)
+            results = self.catalog.vehicles.search(query)
             
             if not results:
                 await ctx.send(embed=create_error_embed(
@@ -633,38 +495,31 @@ class AssetManager(commands.Cog):
     async def building_info(self, ctx: commands.Context, *, building_name: str):
         """Show detailed information about a building."""
         async with ctx.typing():
-            building = self.db.get_building_by_name(building_name)
+            matches = self.catalog.buildings.resolve(building_name, limit=5)
             
-            if not building:
-                all_buildings = self.db.get_all_buildings()
-                building_names = [b['name'] for b in all_buildings]
-                matches = get_close_matches(building_name, building_names, n=5, cutoff=0.6)
-                
-                if not matches:
-                    await ctx.send(embed=create_error_embed(
-                        f"Building '{building_name}' not found.\n"
-                        "Use `[p]building list` to see all available buildings."
-                    ))
-                    return
-                
-                if len(matches) == 1:
-                    building = self.db.get_building_by_name(matches[0])
-                else:
-                    match_list = "\n".join([f"{i+1}. {name}" for i, name in enumerate(matches)])
-                    await ctx.send(
-                        f"Multiple buildings found matching '{building_name}':\n```\n{match_list}\n```\n"
-                        f"Please be more specific."
-                    )
-                    return
+            if not matches:
+                await ctx.send(embed=create_error_embed(
+                    f"Building '{building_name}' not found.\n"
+                    "Use `[p]building list` to see all available buildings."
+                ))
+                return
             
-            embed = create_building_embed(building)
+            if len(matches) > 1:
+                match_list = "\n".join([f"{i+1}. {match['name']}" for i, match in enumerate(matches)])
+                await ctx.send(
+                    f"Multiple buildings found matching '{building_name}':\n```\n{match_list}\n```\n"
+                    f"Please be more specific."
+                )
+                return
+            
+            embed = create_building_embed(matches[0])
             await ctx.send(embed=embed)
     
     @building.command(name="list", aliases=["l", "all"])
     async def building_list(self, ctx: commands.Context):
         """List all available buildings."""
         async with ctx.typing():
-            buildings = self.db.get_all_buildings()
+            buildings = self.catalog.buildings.items
             
             if not buildings:
                 await ctx.send(embed=create_error_embed(
@@ -691,49 +546,32 @@ class AssetManager(commands.Cog):
     async def equipment_info(self, ctx: commands.Context, *, equipment_name: str):
         """Show detailed information about equipment."""
         async with ctx.typing():
-            # Search for equipment
-            all_equipment = self.db.get_all_equipment()
-            
-            # Try exact match first
-            equipment = None
-            for eq in all_equipment:
-                if eq['name'].lower() == equipment_name.lower():
-                    equipment = eq
-                    break
+            # Exact match first, then fuzzy search
+            matches = self.catalog.equipment.resolve(equipment_name, limit=5)
             
-            if not equipment:
-                # Try fuzzy search
-                equipment_names = [e['name'] for e in all_equipment]
-                matches = get_close_matches(equipment_name, equipment_names, n=5, cutoff=0.6)
-                
-                if not matches:
-                    await ctx.send(embed=create_error_embed(
-                        f"Equipment '{equipment_name}' not found.\n"
-                        "Use `[p]equipment list` to see all available equipment."
-                    ))
-                    return
-                
-                if len(matches) == 1:
-                    for eq in all_equipment:
-                        if eq['name'] == matches[0]:
-                            equipment = eq
-                            break
-                else:
-                    match_list = "\n".join([f"{i+1}. {name}" for i, name in enumerate(matches)])
-                    await ctx.send(
-                        f"Multiple equipment found matching '{equipment_name}':\n```\n{match_list}\n```\n"
-                        f"Please be more specific."
-                    )
-                    return
+            if not matches:
+                await ctx.send(embed=create_error_embed(
+                    f"Equipment '{equipment_name}' not found.\n"
+                    "Use `[p]equipment list` to see all available equipment."
+                ))
+                return
+            
+            if len(matches) > 1:
+                match_list = "\n".join([f"{i+1}. {match['name']}" for i, match in enumerate(matches)])
+                await ctx.send(
+                    f"Multiple equipment found matching '{equipment_name}':\n```\n{match_list}\n```\n"
+                    f"Please be more specific."
+                )
+                return
             
-            embed = create_equipment_embed(equipment)
+            embed = create_equipment_embed(matches[0])
             await ctx.send(embed=embed)
     
     @equipment.command(name="list", aliases=["l", "all"])
     async def equipment_list(self, ctx: commands.Context):
         """List all available equipment."""
         async with ctx.typing():
-            equipment = self.db.get_all_equipment()
+            equipment = self.catalog.equipment.items
             
             if not equipment:
                 await ctx.send(embed=create_error_embed(
@@ -759,49 +597,32 @@ class AssetManager(commands.Cog):
     async def training_info(self, ctx: commands.Context, *, training_name: str):
         """Show detailed information about a training."""
         async with ctx.typing():
-            # Search for training
-            all_trainings = self.db.get_all_educations()
-            
-            # Try exact match first
-            training = None
-            for t in all_trainings:
-                if t['name'].lower() == training_name.lower():
-                    training = t
-                    break
+            # Exact match first, then fuzzy search
+            matches = self.catalog.educations.resolve(training_name, limit=5)
             
-            if not training:
-                # Try fuzzy search
-                training_names = [t['name'] for t in all_trainings]
-                matches = get_close_matches(training_name, training_names, n=5, cutoff=0.6)
-                
-                if not matches:
-                    await ctx.send(embed=create_error_embed(
-                        f"Training '{training_name}' not found.\n"
-                        "Use `[p]training list` to see all available trainings."
-                    ))
-                    return
-                
-                if len(matches) == 1:
-                    for t in all_trainings:
-                        if t['name'] == matches[0]:
-                            training = t
-                            break
-                else:
-                    match_list = "\n".join([f"{i+1}. {name}" for i, name in enumerate(matches)])
-                    await ctx.send(
-                        f"Multiple trainings found matching '{training_name}':\n```\n{match_list}\n```\n"
-                        f"Please be more specific."
-                    )
-                    return
+            if not matches:
+                await ctx.send(embed=create_error_embed(
+                    f"Training '{training_name}' not found.\n"
+                    "Use `[p]training list` to see all available trainings."
+                ))
+                return
+            
+            if len(matches) > 1:
+                match_list = "\n".join([f"{i+1}. {match['name']}" for i, match in enumerate(matches)])
+                await ctx.send(
+                    f"Multiple trainings found matching '{training_name}':\n```\n{match_list}\n```\n"
+                    f"Please be more specific."
+                )
+                return
             
-            embed = create_education_embed(training)
+            embed = create_education_embed(matches[0])
             await ctx.send(embed=embed)
     
     @training.command(name="list", aliases=["l", "all"])
     async def training_list(self, ctx: commands.Context):
         """List all available trainings."""
         async with ctx.typing():
-            trainings = self.db.get_all_educations()
+            trainings = self.catalog.educations.items
             
             if not trainings:
                 await ctx.send(embed=create_error_embed(
@@ -937,7 +758,7 @@ class AssetManager(commands.Cog):
             await ctx.send(f"**Training keys found:** `{normalized.get('education_keys', [])}`")
             
             # Show all educations with keys
-            all_educations = self.db.get_all_educations()
+            all_educations = self.catalog.educations.items
             education_keys = [f"{e['name']}: {e.get('key')}" for e in all_educations if e.get('key')]
             
             await ctx.send(f"**Available education keys ({len(education_keys)}):**\n```\n" + "\n".join(education_keys[:20]) + "\n```")
@@ -1002,6 +823,7 @@ class AssetManager(commands.Cog):
                 
                 await msg.edit(content="🔍 Step 3: Inserting to DB...")
                 vehicle_id = self.db.insert_vehicle(test_vehicle)
+                self.reload_catalog()
                 await ctx.send(f"✅ Inserted with ID {vehicle_id}")
                 
                 await msg.edit(content="✅ All tests passed!")
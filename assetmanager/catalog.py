@@ -0,0 +1,151 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from difflib import get_close_matches
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+try:
+    from rapidfuzz import fuzz, process
+    from rapidfuzz.utils import default_process
+except ImportError:  # pragma: no cover - difflib keeps lookups working without rapidfuzz
+    fuzz = process = default_process = None
+
+# Same threshold the commands used with difflib.get_close_matches
+FUZZY_CUTOFF = 0.6
+ASSET_KINDS = ("vehicles", "buildings", "equipment", "educations")
+
+Asset = Mapping[str, Any]
+
+
+def _freeze(row: Dict[str, Any]) -> Asset:
+    return MappingProxyType(dict(row))
+
+
+def _normalize(name: str) -> str:
+    if default_process is not None:
+        return default_process(name)
+    return " ".join(name.casefold().split())
+
+
+class NameIndex:
+    """Exact and fuzzy name lookup over one asset type."""
+
+    def __init__(self, items: Iterable[Asset]):
+        self.items: Tuple[Asset, ...] = tuple(items)
+        self._keys = tuple(_normalize(item.get('name') or "") for item in self.items)
+        exact: Dict[str, Asset] = {}
+        by_key: Dict[str, Asset] = {}
+        for item, key in zip(self.items, self._keys):
+            exact.setdefault((item.get('name') or "").casefold(), item)
+            by_key.setdefault(key, item)
+        self._exact = MappingProxyType(exact)
+        self._by_key = MappingProxyType(by_key)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def get(self, name: str) -> Optional[Asset]:
+        """Case-insensitive exact match."""
+        return self._exact.get(name.strip().casefold())
+
+    def closest(self, query: str, limit: int = 5, cutoff: float = FUZZY_CUTOFF) -> List[Asset]:
+        """Best fuzzy matches, most similar first."""
+        key = _normalize(query)
+        if not key or not self.items:
+            return []
+        if process is not None:
+            matches = process.extract(
+                key, self._keys, scorer=fuzz.ratio, processor=None,
+                limit=limit, score_cutoff=cutoff * 100
+            )
+            return [self.items[index] for _, _, index in matches]
+        return [self._by_key[match] for match in get_close_matches(key, self._keys, n=limit, cutoff=cutoff)]
+
+    def resolve(self, query: str, limit: int = 5) -> List[Asset]:
+        """The exact match alone if there is one, else the closest fuzzy matches."""
+        exact = self.get(query)
+        if exact is not None:
+            return [exact]
+        return self.closest(query, limit)
+
+    def search(self, query: str, limit: int = 15) -> List[Asset]:
+        """Names containing ``query``, falling back to fuzzy matches when none do."""
+        needle = query.strip().casefold()
+        hits = [item for item in self.items if needle in (item.get('name') or "").casefold()]
+        return hits or self.closest(query, limit)
+
+
+@dataclass(frozen=True)
+class AssetCatalog:
+    """Read-only snapshot of the asset tables, rebuilt after every sync.
+
+    Rows are frozen mappings shaped like ``AssetDatabase`` returns them, sorted by
+    name; vehicle building and training relations are joined up front so lookup
+    commands never query SQLite.
+    """
+
+    vehicles: NameIndex = field(default_factory=lambda: NameIndex(()))
+    buildings: NameIndex = field(default_factory=lambda: NameIndex(()))
+    equipment: NameIndex = field(default_factory=lambda: NameIndex(()))
+    educations: NameIndex = field(default_factory=lambda: NameIndex(()))
+    vehicles_by_id: Mapping[int, Asset] = field(default_factory=lambda: MappingProxyType({}))
+    vehicle_buildings: Mapping[int, Tuple[Asset, ...]] = field(default_factory=lambda: MappingProxyType({}))
+    vehicle_educations: Mapping[int, Tuple[Asset, ...]] = field(default_factory=lambda: MappingProxyType({}))
+    loaded_at: Optional[datetime] = None
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Mapping[str, Iterable[Dict[str, Any]]],
+        building_links: Iterable[Tuple[int, int]] = (),
+        education_links: Iterable[Tuple[int, int]] = ()
+    ) -> "AssetCatalog":
+        frozen = {
+            kind: tuple(sorted((_freeze(row) for row in rows.get(kind, ())), key=lambda row: row['name']))
+            for kind in ASSET_KINDS
+        }
+        buildings_by_id = {row['id']: row for row in frozen["buildings"]}
+        educations_by_id = {row['id']: row for row in frozen["educations"]}
+        return cls(
+            vehicles=NameIndex(frozen["vehicles"]),
+            buildings=NameIndex(frozen["buildings"]),
+            equipment=NameIndex(frozen["equipment"]),
+            educations=NameIndex(frozen["educations"]),
+            vehicles_by_id=MappingProxyType({row['id']: row for row in frozen["vehicles"]}),
+            vehicle_buildings=cls._join(building_links, buildings_by_id),
+            vehicle_educations=cls._join(education_links, educations_by_id),
+            loaded_at=datetime.utcnow()
+        )
+
+    @classmethod
+    def load(cls, db) -> "AssetCatalog":
+        """Read the whole catalog with one query per table."""
+        building_links, education_links = db.get_vehicle_links()
+        return cls.from_rows(
+            {
+                "vehicles": db.get_all_vehicles(),
+                "buildings": db.get_all_buildings(),
+                "equipment": db.get_all_equipment(),
+                "educations": db.get_all_educations(),
+            },
+            building_links,
+            education_links
+        )
+
+    @staticmethod
+    def _join(links: Iterable[Tuple[int, int]], targets: Mapping[int, Asset]) -> Mapping[int, Tuple[Asset, ...]]:
+        joined: Dict[int, List[Asset]] = {}
+        for vehicle_id, target_id in links:
+            target = targets.get(target_id)
+            if target is not None:
+                joined.setdefault(vehicle_id, []).append(target)
+        return MappingProxyType({
+            vehicle_id: tuple(sorted(items, key=lambda row: row['name']))
+            for vehicle_id, items in joined.items()
+        })
+
+    def buildings_for(self, vehicle_id: int) -> Tuple[Asset, ...]:
+        return self.vehicle_buildings.get(vehicle_id, ())
+
+    def educations_for(self, vehicle_id: int) -> Tuple[Asset, ...]:
+        return self.vehicle_educations.get(vehicle_id, ())
@@ -1,7 +1,8 @@
 import sqlite3
 import json
 import logging
-from typing import Optional, List, Dict, Any
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -329,6 +330,182 @@ class AssetDatabase:
         cursor.execute("SELECT * FROM educations ORDER BY name")
         return [self._row_to_dict(row) for row in cursor.fetchall()]
     
+    # ========== BULK SYNC OPERATIONS ==========
+    # These do not commit; call them inside transaction() so a full sync is one write.
+
+    @contextmanager
+    def transaction(self):
+        """Run the block in one explicit transaction, rolled back on error."""
+        previous = self.conn.isolation_level
+        self.conn.commit()
+        self.conn.isolation_level = None
+        self.conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        else:
+            self.conn.execute("COMMIT")
+        finally:
+            self.conn.isolation_level = previous
+
+    @contextmanager
+    def savepoint(self, name: str):
+        """Nested rollback point inside transaction(); an error undoes only this block."""
+        self.conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute(f"ROLLBACK TO {name}")
+            self.conn.execute(f"RELEASE {name}")
+            raise
+        else:
+            self.conn.execute(f"RELEASE {name}")
+
+    def upsert_vehicles(self, vehicles: Iterable[Dict[str, Any]]):
+        """Insert or update vehicles by game_id, keeping existing row ids."""
+        now = datetime.utcnow()
+        self.conn.executemany("""
+            INSERT INTO vehicles
+            (game_id, name, min_personnel, max_personnel, price, water_tank,
+             foam_tank, pump_capacity, specials, last_updated)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(game_id) DO UPDATE SET
+                name = excluded.name,
+                min_personnel = excluded.min_personnel,
+                max_personnel = excluded.max_personnel,
+                price = excluded.price,
+                water_tank = excluded.water_tank,
+                foam_tank = excluded.foam_tank,
+                pump_capacity = excluded.pump_capacity,
+                specials = excluded.specials,
+                last_updated = excluded.last_updated
+        """, [
+            (
+                vehicle.get('game_id'),
+                vehicle.get('name'),
+                vehicle.get('min_personnel'),
+                vehicle.get('max_personnel'),
+                vehicle.get('price'),
+                vehicle.get('water_tank'),
+                vehicle.get('foam_tank'),
+                vehicle.get('pump_capacity'),
+                json.dumps(vehicle.get('specials', {})),
+                now
+            )
+            for vehicle in vehicles
+        ])
+
+    def upsert_buildings(self, buildings: Iterable[Dict[str, Any]]):
+        """Insert or update buildings by game_id, keeping existing row ids."""
+        now = datetime.utcnow()
+        self.conn.executemany("""
+            INSERT INTO buildings (game_id, name, caption, last_updated)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(game_id) DO UPDATE SET
+                name = excluded.name,
+                caption = excluded.caption,
+                last_updated = excluded.last_updated
+        """, [
+            (building.get('game_id'), building.get('name'), building.get('caption'), now)
+            for building in buildings
+        ])
+
+    def upsert_equipment(self, equipment: Iterable[Dict[str, Any]]):
+        """Insert or update equipment by game_id, keeping existing row ids."""
+        now = datetime.utcnow()
+        self.conn.executemany("""
+            INSERT INTO equipment
+            (game_id, name, size, credits, coins, min_staff, max_staff, last_updated)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(game_id) DO UPDATE SET
+                name = excluded.name,
+                size = excluded.size,
+                credits = excluded.credits,
+                coins = excluded.coins,
+                min_staff = excluded.min_staff,
+                max_staff = excluded.max_staff,
+                last_updated = excluded.last_updated
+        """, [
+            (
+                item.get('game_id'),
+                item.get('name'),
+                item.get('size'),
+                item.get('credits'),
+                item.get('coins'),
+                item.get('min_staff'),
+                item.get('max_staff'),
+                now
+            )
+            for item in equipment
+        ])
+
+    def upsert_educations(self, educations: Iterable[Dict[str, Any]]):
+        """Insert or update educations by game_id, keeping existing row ids."""
+        now = datetime.utcnow()
+        self.conn.executemany("""
+            INSERT INTO educations
+            (game_id, name, duration, cost, building_type, key, last_updated)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(game_id) DO UPDATE SET
+                name = excluded.name,
+                duration = excluded.duration,
+                cost = excluded.cost,
+                building_type = excluded.building_type,
+                key = excluded.key,
+                last_updated = excluded.last_updated
+        """, [
+            (
+                education.get('game_id'),
+                education.get('name'),
+                education.get('duration'),
+                education.get('cost'),
+                education.get('building_type'),
+                education.get('key'),
+                now
+            )
+            for education in educations
+        ])
+
+    def game_id_map(self, table: str) -> Dict[int, int]:
+        """Map game_id to row id for one of the asset tables."""
+        if table not in ("vehicles", "buildings", "equipment", "educations"):
+            raise ValueError(f"Unknown asset table: {table}")
+        return {game_id: row_id for row_id, game_id in self.conn.execute(f"SELECT id, game_id FROM {table}")}
+
+    def education_ids_by_key(self) -> Dict[str, int]:
+        """Map training key to education id; the first by name wins, as in linking before."""
+        ids: Dict[str, int] = {}
+        for row_id, key in self.conn.execute("SELECT id, key FROM educations WHERE key IS NOT NULL ORDER BY name"):
+            ids.setdefault(key, row_id)
+        return ids
+
+    def replace_vehicle_links(
+        self,
+        vehicle_ids: Iterable[int],
+        building_links: Iterable[Tuple[int, int]],
+        education_links: Iterable[Tuple[int, int]]
+    ):
+        """Replace the building and education links of the given vehicles."""
+        vehicle_params = [(vehicle_id,) for vehicle_id in vehicle_ids]
+        self.conn.executemany("DELETE FROM vehicle_buildings WHERE vehicle_id = ?", vehicle_params)
+        self.conn.executemany("DELETE FROM vehicle_educations WHERE vehicle_id = ?", vehicle_params)
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO vehicle_buildings (vehicle_id, building_id) VALUES (?, ?)",
+            list(building_links)
+        )
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO vehicle_educations (vehicle_id, education_id) VALUES (?, ?)",
+            list(education_links)
+        )
+
+    def get_vehicle_links(self) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """Return every (vehicle_id, building_id) and (vehicle_id, education_id) link."""
+        building_links = [tuple(row) for row in self.conn.execute("SELECT vehicle_id, building_id FROM vehicle_buildings")]
+        education_links = [tuple(row) for row in self.conn.execute("SELECT vehicle_id, education_id FROM vehicle_educations")]
+        return building_links, education_links
+
     # ========== SYNC HISTORY OPERATIONS ==========
     
     def log_sync(self, source: str, changes: Dict[str, Any], success: bool, error_message: str = None):
@@ -1,6 +1,6 @@
 import aiohttp
+import asyncio
 import re
-import json
 import logging
 from typing import Dict, List, Any, Optional, Tuple
 
@@ -14,11 +14,297 @@ GITHUB_URLS = {
 }
 
 
+# One master pattern tokenizes the whole file in a single pass. Comments and
+# whitespace are matched so they can be skipped, never searched for separately.
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<skip>\s+|//[^\n]*|/\*.*?\*/)
+    |(?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\]|\\.)*`)
+    |(?P<number>0[xX][0-9a-fA-F_]+|(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d+)?)
+    |(?P<spread>\.\.\.)
+    |(?P<arrow>=>)
+    |(?P<ident>[A-Za-z_$][\w$]*)
+    |(?P<punct>[{}\[\]():,])
+    |(?P<other>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+_ESCAPE_RE = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|.)", re.DOTALL)
+_SIMPLE_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0", "\n": "", "\r\n": ""}
+_LITERAL_IDENTS = {"true": True, "false": False, "null": None, "undefined": None}
+_OPENERS = {"{": "}", "[": "]", "(": ")"}
+_SKIPPED = object()
+
+
+class TSParseError(ValueError):
+    """Raised when a TypeScript object literal cannot be parsed."""
+
+    def __init__(self, message: str, pos: int):
+        super().__init__(message)
+        self.pos = pos
+
+
+def _unescape(body: str) -> str:
+    def replace(match):
+        escape = match.group(1)
+        if escape.startswith("u{"):
+            return chr(int(escape[2:-1], 16))
+        if escape[0] in "ux" and len(escape) > 1:
+            return chr(int(escape[1:], 16))
+        return _SIMPLE_ESCAPES.get(escape, escape)
+
+    return _ESCAPE_RE.sub(replace, body) if "\\" in body else body
+
+
+def _number(text: str):
+    text = text.replace("_", "")
+    if text[:2] in ("0x", "0X"):
+        return int(text, 16)
+    if any(char in text for char in ".eE"):
+        return float(text)
+    return int(text)
+
+
+class _TSLiteralParser:
+    """Recursive-descent reader for the object literals in LSSM's i18n exports.
+
+    Literals (objects, arrays, strings, numbers, booleans, null) become Python
+    values. Any other expression - functions, arrow functions, computed values,
+    references to imports - is skipped by bracket depth, and the property or
+    array element holding it is dropped, as are properties named ``*Function``.
+    ``...Array(n).fill(value)`` spreads expand to ``n`` copies of ``value``.
+    Dropped values that are not code are listed in ``skipped`` by property path,
+    so an upstream change that turns a field into an expression gets noticed.
+    """
+
+    def __init__(self, content: str):
+        self.tokens = [
+            (match.lastgroup, match.group(), match.start())
+            for match in _TOKEN_RE.finditer(content)
+            if match.lastgroup != "skip"
+        ]
+        self.index = 0
+        self.end = len(content)
+        self.path: List[str] = []
+        self.skipped: List[str] = []
+
+    def peek(self, offset: int = 0) -> Tuple[str, str, int]:
+        index = self.index + offset
+        return self.tokens[index] if index < len(self.tokens) else ("eof", "", self.end)
+
+    def take(self) -> Tuple[str, str, int]:
+        token = self.peek()
+        self.index += 1
+        return token
+
+    def expect(self, text: str) -> None:
+        kind, value, pos = self.take()
+        if value != text or kind not in ("punct", "other"):
+            raise TSParseError(f"expected {text!r}, found {value!r}", pos)
+
+    def find_export(self) -> bool:
+        """Move to the exported object: ``registerEquipment({...})`` or ``export default``.
+
+        ``export default name;`` follows ``name`` back to its ``const`` declaration.
+        """
+        values = [value for _, value, _ in self.tokens]
+        for index, value in enumerate(values[:-2]):
+            if value == "registerEquipment" and values[index + 1] == "(" and values[index + 2] == "{":
+                self.index = index + 2
+                return True
+        for index, value in enumerate(values[:-1]):
+            if value == "export" and values[index + 1] == "default":
+                target = index + 2
+                if target < len(values) and self.tokens[target][0] == "ident" and values[target] not in _LITERAL_IDENTS:
+                    target = self._declaration_value(values[target])
+                if target is None or target >= len(values) or values[target] not in ("{", "["):
+                    return False
+                self.index = target
+                return True
+        return False
+
+    def _declaration_value(self, name: str) -> Optional[int]:
+        """Index of the literal assigned by ``const|let|var name[: Type] = ...``."""
+        values = [value for _, value, _ in self.tokens]
+        for index in range(1, len(values)):
+            if values[index] == name and values[index - 1] in ("const", "let", "var"):
+                for position in range(index + 1, len(values)):
+                    if values[position] == "=":
+                        return position + 1
+                return None
+        return None
+
+    def skip_expression(self) -> None:
+        """Skip tokens up to the ``,``, ``;`` or closing bracket that ends the current value."""
+        depth = 0
+        while True:
+            kind, value, pos = self.peek()
+            if kind == "eof":
+                if depth:
+                    raise TSParseError("unbalanced brackets in skipped expression", pos)
+                return
+            if kind == "punct":
+                if value in _OPENERS:
+                    depth += 1
+                elif value in ("}", "]", ")"):
+                    if depth == 0:
+                        return
+                    depth -= 1
+                elif value == "," and depth == 0:
+                    return
+            elif value == ";" and depth == 0:
+                return
+            self.take()
+
+    def parse_value(self):
+        kind, value, pos = self.peek()
+        if kind == "punct" and value == "{":
+            result = self.parse_object()
+        elif kind == "punct" and value == "[":
+            result = self.parse_array()
+        elif kind == "string":
+            self.take()
+            result = _unescape(value[1:-1])
+        elif kind == "number":
+            self.take()
+            result = _number(value)
+        elif kind == "other" and value == "-" and self.peek(1)[0] == "number":
+            self.take()
+            result = -_number(self.take()[1])
+        elif kind == "ident" and value in _LITERAL_IDENTS:
+            self.take()
+            result = _LITERAL_IDENTS[value]
+        else:
+            is_code = value in ("function", "async", "(") or self.peek(1)[0] == "arrow"
+            self.skip_expression()
+            if not is_code:
+                self.skipped.append(".".join(self.path))
+            return _SKIPPED
+
+        kind, value, _ = self.peek()
+        if kind == "punct" and value in (",", "}", "]", ")") or kind == "eof" or value == ";":
+            return result
+        if kind == "ident" and value in ("as", "satisfies"):
+            # Type assertion on a literal: keep the value, skip the type
+            self.skip_expression()
+            return result
+        # The literal is only the start of a larger expression (`60 * 60`, `a + b`)
+        self.skip_expression()
+        self.skipped.append(".".join(self.path))
+        return _SKIPPED
+
+    def parse_object(self) -> Dict[str, Any]:
+        self.expect("{")
+        result: Dict[str, Any] = {}
+        while True:
+            kind, value, pos = self.peek()
+            if kind == "punct" and value == "}":
+                self.take()
+                return result
+            if kind == "spread":
+                self.take()
+                self.skip_expression()
+            else:
+                key = self.parse_key()
+                if self.peek()[1] == "(":
+                    # Method shorthand: name(args) { body }
+                    self.skip_expression()
+                    self.skip_expression()
+                else:
+                    self.expect(":")
+                    self.path.append(key)
+                    item = self.parse_value()
+                    self.path.pop()
+                    if item is not _SKIPPED and not key.lower().endswith("function"):
+                        result[key] = item
+            kind, value, pos = self.take()
+            if value == "}" and kind == "punct":
+                return result
+            if value != "," or kind != "punct":
+                raise TSParseError(f"expected ',' or '}}' in object, found {value!r}", pos)
+
+    def parse_key(self) -> str:
+        kind, value, pos = self.take()
+        if kind == "string":
+            return _unescape(value[1:-1])
+        if kind in ("ident", "number"):
+            return str(_number(value)) if kind == "number" else value
+        if kind == "punct" and value == "[":
+            # Computed key: keep a literal one, otherwise the property is skipped later
+            key = self.parse_value()
+            self.expect("]")
+            return str(key) if key is not _SKIPPED else "__computed__Function"
+        raise TSParseError(f"unexpected {value!r} where a property name was expected", pos)
+
+    def parse_array(self) -> List[Any]:
+        self.expect("[")
+        result: List[Any] = []
+        while True:
+            kind, value, pos = self.peek()
+            if kind == "punct" and value == "]":
+                self.take()
+                return result
+            if kind == "spread":
+                self.take()
+                result.extend(self.parse_spread())
+            else:
+                self.path.append(str(len(result)))
+                item = self.parse_value()
+                self.path.pop()
+                if item is not _SKIPPED:
+                    result.append(item)
+            kind, value, pos = self.take()
+            if value == "]" and kind == "punct":
+                return result
+            if value != "," or kind != "punct":
+                raise TSParseError(f"expected ',' or ']' in array, found {value!r}", pos)
+
+    def parse_spread(self) -> List[Any]:
+        """Expand ``...Array(n).fill(v)`` / ``...new Array(n).fill(v)``; skip any other spread."""
+        start = self.index
+        if self.peek()[1] == "new":
+            self.take()
+        if self.peek()[1] == "Array" and self.peek(1)[1] == "(" and self.peek(2)[0] == "number" and self.peek(3)[1] == ")":
+            count = _number(self.peek(2)[1])
+            if self.peek(4)[1] == "." and self.peek(5)[1] == "fill" and self.peek(6)[1] == "(":
+                self.index += 7
+                value = self.parse_value()
+                if value is not _SKIPPED and self.peek()[1] == ")":
+                    self.take()
+                    return [value] * int(count)
+        self.index = start
+        self.skip_expression()
+        return []
+
+
+def parse_ts_export(content: str) -> Any:
+    """Parse the exported object literal of an LSSM i18n TypeScript file in one pass.
+
+    Returns None when the file has no ``export default`` or ``registerEquipment``
+    object; raises ``TSParseError`` for malformed literals.
+    """
+    parser = _TSLiteralParser(content)
+    if not parser.find_export():
+        return None
+    value = parser.parse_value()
+    if parser.skipped:
+        log.warning(
+            "Dropped %d computed value(s) that are not literals: %s",
+            len(parser.skipped),
+            ", ".join(parser.skipped[:10]) + (" ..." if len(parser.skipped) > 10 else ""),
+        )
+    return None if value is _SKIPPED else value
+
+
 class GitHubSync:
     """Handles fetching and parsing data from GitHub."""
     
     def __init__(self):
         self.session: Optional[aiohttp.ClientSession] = None
+        # url -> {"etag", "last_modified", "content"} for conditional requests
+        self._validators: Dict[str, Dict[str, Optional[str]]] = {}
+        # url -> True when the last fetch got 304 Not Modified
+        self.not_modified: Dict[str, bool] = {}
         
     async def create_session(self):
         """Create aiohttp session."""
@@ -31,14 +317,36 @@ class GitHubSync:
             await self.session.close()
             
     async def fetch_file(self, url: str) -> Optional[str]:
-        """Fetch a file from GitHub."""
+        """Fetch a file from GitHub.
+
+        Repeat fetches send ``If-None-Match``/``If-Modified-Since``; on 304 the
+        previously fetched content is returned and ``not_modified[url]`` is set.
+        """
         await self.create_session()
         
+        cached = self._validators.get(url)
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        
         try:
             timeout = aiohttp.ClientTimeout(total=30)
-            async with self.session.get(url, timeout=timeout) as response:
+            async with self.session.get(url, timeout=timeout, headers=headers) as response:
+                if response.status == 304 and cached:
+                    self.not_modified[url] = True
+                    log.info(f"Not modified since last fetch: {url}")
+                    return cached["content"]
                 if response.status == 200:
                     content = await response.text()
+                    self.not_modified[url] = False
+                    self._validators[url] = {
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                        "content": content,
+                    }
                     log.info(f"Successfully fetched: {url}")
                     return content
                 else:
@@ -50,165 +358,36 @@ class GitHubSync:
         except Exception as e:
             log.error(f"Unexpected error fetching {url}: {e}")
             return None
+
+    def unchanged_sources(self) -> set:
+        """Sources whose last fetch was answered with 304 Not Modified."""
+        return {source for source, url in GITHUB_URLS.items() if self.not_modified.get(url)}
     
     def parse_typescript_export(self, content: str) -> Optional[Dict[int, Any]]:
         """Parse TypeScript export default object to Python dict."""
         try:
-            # Remove comments
-            content = re.sub(r'//.*', '', content)
-            content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-            content = re.sub(r'import\s+.*?;', '', content, flags=re.DOTALL)
-            
-            # SPECIAL CASE: Equipment uses registerEquipment wrapper
-            equipment_match = re.search(r'registerEquipment\s*\(\s*(\{.+\})\s*\)', content, re.DOTALL)
-            if equipment_match:
-                obj_str = equipment_match.group(1)
-            else:
-                # Find the export default block
-                match = re.search(r'export\s+default\s+(\{.+\})', content, re.DOTALL)
-                if not match:
-                    log.error("Could not find export default pattern")
-                    return None
-                obj_str = match.group(1)
-            
-            # Remove numeric separators
-            obj_str = re.sub(r'(\d)_(\d)', r'\1\2', obj_str)
-            
-            # CRITICAL: Remove JavaScript spread syntax
-            obj_str = re.sub(r'\.\.\.\s*Array\s*\(\s*\d+\s*\)\s*\.fill\s*\([^)]+\)', '[]', obj_str)
-            obj_str = re.sub(r'\.\.\.\s*new\s+Array\s*\(\s*\d+\s*\)\s*\.fill\s*\([^)]+\)', '[]', obj_str)
-            
-            # CRITICAL: Remove properties ending with "Function" and their entire values
-            # Use a more sophisticated approach that tracks nesting
-            def remove_function_properties(text):
-                lines = text.split('\n')
-                result = []
-                skip_mode = False
-                nesting_level = 0
-                
-                for i, line in enumerate(lines):
-                    # Check if this line defines a property ending with "Function"
-                    if re.search(r'"\w*[Ff]unction"\s*:', line):
-                        skip_mode = True
-                        nesting_level = 0
-                        continue
-                    
-                    if skip_mode:
-                        # Count nesting depth
-                        nesting_level += line.count('(') + line.count('{') + line.count('[')
-                        nesting_level -= line.count(')') + line.count('}') + line.count(']')
-                        
-                        # If we're back to level 0 or negative and hit a comma, we're done
-                        if nesting_level <= 0 and ',' in line:
-                            skip_mode = False
-                            continue
-                        
-                        # Still inside the function value
-                        continue
-                    
-                    result.append(line)
-                
-                return '\n'.join(result)
-            
-            obj_str = remove_function_properties(obj_str)
-            
-            # Also remove any remaining lines with JavaScript operators (but keep data)
-            lines = obj_str.split('\n')
-            cleaned = []
-            for line in lines:
-                # Keep lines that look like data (have colons for properties)
-                if ':' in line:
-                    cleaned.append(line)
-                # Keep structural lines
-                elif line.strip() in ['{', '}', '[', ']', '},', '],', ',']:
-                    cleaned.append(line)
-                # Keep empty lines
-                elif not line.strip():
-                    cleaned.append(line)
-                # Skip lines that are clearly JavaScript code
-                elif any(op in line for op in ['=>', '??', 'typeof', 'Math.', 'Object.']):
-                    continue
-                else:
-                    cleaned.append(line)
-            
-            obj_str = '\n'.join(cleaned)
-            
-            # Handle apostrophes BEFORE converting quotes
-            obj_str = re.sub(r"([a-zA-Z])'([a-zA-Z])", r'\1__APOS__\2', obj_str)
-            
-            # Convert single quotes to double quotes
-            obj_str = obj_str.replace("'", '"')
-            
-            # Restore apostrophes
-            obj_str = obj_str.replace('__APOS__', "'")
-            
-            # Fix multi-line strings
-            lines = obj_str.split('\n')
-            result_lines = []
-            in_string = False
-            current_line = ""
-            
-            for line in lines:
-                quote_count = line.count('"') - line.count('\\"')
-                
-                if in_string:
-                    current_line += " " + line.strip()
-                    if quote_count % 2 == 1:
-                        in_string = False
-                        result_lines.append(current_line)
-                        current_line = ""
-                else:
-                    if quote_count % 2 == 1:
-                        in_string = True
-                        current_line = line
-                    else:
-                        result_lines.append(line)
-            
-            obj_str = '\n'.join(result_lines)
-            
-            # Quote numeric keys
-            obj_str = re.sub(r'([\n\r]\s*)(\d+)(\s*):', r'\1"\2"\3:', obj_str)
-            
-            # Quote alphabetic keys
-            lines = obj_str.split('\n')
-            result_lines = []
-            
-            for line in lines:
-                new_line = re.sub(r'^(\s*)([a-zA-Z_][a-zA-Z0-9_]*)(\s*):', r'\1"\2"\3:', line)
-                new_line = re.sub(r'(,\s*)([a-zA-Z_][a-zA-Z0-9_]*)(\s*):', r'\1"\2"\3:', new_line)
-                new_line = re.sub(r'(\{\s*)([a-zA-Z_][a-zA-Z0-9_]*)(\s*):', r'\1"\2"\3:', new_line)
-                result_lines.append(new_line)
-            
-            obj_str = '\n'.join(result_lines)
-            
-            # Remove trailing commas
-            obj_str = re.sub(r',(\s*[\}\]])', r'\1', obj_str)
-            
-            # Parse to JSON
-            parsed = json.loads(obj_str)
-            
-            # Convert numeric string keys to int keys (for vehicles/buildings)
-            result = {}
-            for key, value in parsed.items():
-                try:
-                    result[int(key)] = value
-                except ValueError:
-                    # Keep string keys as-is (for equipment/educations)
-                    result[key] = value
-            
-            return result
-            
-        except json.JSONDecodeError as e:
-            log.error(f"JSON decode error at position {e.pos}: {e.msg}")
-            if obj_str and hasattr(e, 'pos'):
-                start = max(0, e.pos - 200)
-                end = min(len(obj_str), e.pos + 200)
-                context = obj_str[start:end]
-                log.error(f"Context: {context}")
+            parsed = parse_ts_export(content)
+        except TSParseError as e:
+            log.error(f"Parse error at position {e.pos}: {e}")
+            start = max(0, e.pos - 200)
+            log.error(f"Context: {content[start:e.pos + 200]}")
             return None
-        except Exception as e:
-            log.error(f"Parse error: {e}", exc_info=True)
+        if parsed is None:
+            log.error("Could not find export default pattern")
+            return None
+        if not isinstance(parsed, dict):
+            log.error(f"Export is a {type(parsed).__name__}, expected an object")
             return None
+
+        # Convert numeric string keys to int keys (for vehicles/buildings)
+        result = {}
+        for key, value in parsed.items():
+            try:
+                result[int(key)] = value
+            except ValueError:
+                # Keep string keys as-is (for equipment/educations)
+                result[key] = value
+        return result
     
     async def fetch_vehicles(self) -> Optional[Dict[int, Dict[str, Any]]]:
         """Fetch and parse vehicles data."""
@@ -262,12 +441,19 @@ class GitHubSync:
         return None
     
     async def fetch_all(self) -> Dict[str, Optional[Dict[int, Dict[str, Any]]]]:
-        """Fetch all data sources."""
+        """Fetch all data sources concurrently."""
+        await self.create_session()
+        vehicles, buildings, equipment, educations = await asyncio.gather(
+            self.fetch_vehicles(),
+            self.fetch_buildings(),
+            self.fetch_equipment(),
+            self.fetch_educations(),
+        )
         return {
-            "vehicles": await self.fetch_vehicles(),
-            "buildings": await self.fetch_buildings(),
-            "equipment": await self.fetch_equipment(),
-            "educations": await self.fetch_educations()
+            "vehicles": vehicles,
+            "buildings": buildings,
+            "equipment": equipment,
+            "educations": educations
         }
     
     def normalize_vehicle_data(self, game_id: int, raw_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import re
+import time
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -13,6 +15,12 @@ from redbot.core import Config, commands
 from redbot.core.bot import Red
 from redbot.core.utils.chat_formatting import pagify
 
+log = logging.getLogger("red.fara.botstatus")
+
+# Activity changes inside this window are published as one presence update
+PRESENCE_DEBOUNCE_SECONDS = 2.0
+# Keeps BotStatus well under the gateway presence limit (5 updates per minute)
+PRESENCE_MIN_INTERVAL_SECONDS = 15.0
 
 DEFAULT_GLOBAL = {
     "enabled": True,
@@ -216,6 +224,11 @@ class BotStatus(commands.Cog):
         self._activities: dict[str, StatusActivity] = {}
         self._report_tokens: dict[str, str] = {}
         self._presence_lock = asyncio.Lock()
+        self._settings: Optional[dict] = None
+        self._publish_task: Optional[asyncio.Task] = None
+        self._last_presence: Optional[tuple[str, str]] = None
+        self._last_sent_at = 0.0
+        self.presence_stats = {"requested": 0, "coalesced": 0, "sent": 0, "unchanged": 0}
 
     async def cog_load(self):
         self._restore_task = asyncio.create_task(self.restore_status())
@@ -223,11 +236,22 @@ class BotStatus(commands.Cog):
     def cog_unload(self):
         if self._restore_task:
             self._restore_task.cancel()
+        if self._publish_task:
+            self._publish_task.cancel()
 
     async def restore_status(self):
         wait_ready = getattr(self.bot, "wait_until_red_ready", None) or self.bot.wait_until_ready
         await wait_ready()
-        await self.refresh_presence()
+        await self.refresh_presence(immediate=True)
+
+    async def _get_settings(self) -> dict:
+        if self._settings is None:
+            self._settings = await self.config.all()
+        return self._settings
+
+    async def _set_setting(self, key: str, value) -> None:
+        await getattr(self.config, key).set(value)
+        self._settings = None
 
     async def set_presence(self, activity_type: str, text: str):
         cleaned_type = clean_activity_type(activity_type)
@@ -252,22 +276,64 @@ class BotStatus(commands.Cog):
                 if token in self._activities
             }
 
-    async def refresh_presence(self):
+    async def _render_presence(self) -> Optional[tuple[str, str]]:
+        settings = await self._get_settings()
+        if not settings["enabled"]:
+            return None
+
+        active = choose_activity(list(self._activities.values()))
+        if active:
+            max_length = max(16, min(128, int(settings["presence_max_length"])))
+            text = compact_activity_text(active.source, active.detail, max_length=max_length)
+            return clean_activity_type(active.activity_type), text[:128]
+
+        idle_text = settings["idle_text"]
+        if idle_text:
+            return clean_activity_type(settings["idle_type"]), idle_text[:128]
+        return None
+
+    async def _publish_presence(self) -> bool:
         async with self._presence_lock:
             self._purge_expired()
-            if not await self.config.enabled():
-                return
-
-            active = choose_activity(list(self._activities.values()))
-            if active:
-                max_length = max(16, min(128, int(await self.config.presence_max_length())))
-                text = compact_activity_text(active.source, active.detail, max_length=max_length)
-                await self.set_presence(active.activity_type, text)
-                return
+            rendered = await self._render_presence()
+            if rendered is None:
+                return False
+            if rendered == self._last_presence:
+                self.presence_stats["unchanged"] += 1
+                return False
+            await self.set_presence(*rendered)
+            self._last_presence = rendered
+            self._last_sent_at = time.monotonic()
+            self.presence_stats["sent"] += 1
+            return True
+
+    async def _publish_after_debounce(self):
+        wait = max(
+            PRESENCE_DEBOUNCE_SECONDS,
+            self._last_sent_at + PRESENCE_MIN_INTERVAL_SECONDS - time.monotonic(),
+        )
+        await asyncio.sleep(wait)
+        # Changes made while publishing schedule a fresh update instead of being dropped
+        self._publish_task = None
+        try:
+            await self._publish_presence()
+        except Exception:
+            log.exception("BotStatus could not update presence")
+
+    async def refresh_presence(self, *, immediate: bool = False):
+        """Publish the current status; background changes are debounced and coalesced."""
+        if immediate:
+            if self._publish_task:
+                self._publish_task.cancel()
+                self._publish_task = None
+            await self._publish_presence()
+            return
 
-            idle_text = await self.config.idle_text()
-            if idle_text:
-                await self.set_presence(await self.config.idle_type(), idle_text)
+        self.presence_stats["requested"] += 1
+        if self._publish_task is not None and not self._publish_task.done():
+            self.presence_stats["coalesced"] += 1
+            return
+        self._publish_task = asyncio.create_task(self._publish_after_debounce())
 
     async def start_activity(
         self,
@@ -396,24 +462,25 @@ class BotStatus(commands.Cog):
         except ValueError:
             await ctx.send("Type must be: playing, listening, watching, competing.")
             return
-        await self.config.idle_type.set(cleaned_type)
-        await self.config.idle_text.set(text[:128])
-        await self.config.enabled.set(True)
-        await self.refresh_presence()
+        await self._set_setting("idle_type", cleaned_type)
+        await self._set_setting("idle_text", text[:128])
+        await self._set_setting("enabled", True)
+        await self.refresh_presence(immediate=True)
         await ctx.send("Bot idle status updated.")
 
     @botstatusset.command(name="enable")
     async def botstatusset_enable(self, ctx: commands.Context):
         """Enable BotStatus presence management."""
-        await self.config.enabled.set(True)
-        await self.refresh_presence()
+        await self._set_setting("enabled", True)
+        await self.refresh_presence(immediate=True)
         await ctx.send("BotStatus enabled.")
 
     @botstatusset.command(name="disable")
     async def botstatusset_disable(self, ctx: commands.Context):
         """Disable BotStatus presence management and clear activity."""
-        await self.config.enabled.set(False)
+        await self._set_setting("enabled", False)
         await self.bot.change_presence(activity=None)
+        self._last_presence = None
         await ctx.send("BotStatus disabled.")
 
     @botstatusset.command(name="commandtracking")
@@ -431,8 +498,8 @@ class BotStatus(commands.Cog):
         if length < 16 or length > 128:
             await ctx.send("Length must be between 16 and 128.")
             return
-        await self.config.presence_max_length.set(length)
-        await self.refresh_presence()
+        await self._set_setting("presence_max_length", length)
+        await self.refresh_presence(immediate=True)
         await ctx.send(f"BotStatus presence max length set to {length}.")
 
     @commands.command(name="botstatus")
@@ -453,6 +520,11 @@ class BotStatus(commands.Cog):
                 if active
                 else "idle"
             ),
+            "Presence updates: "
+            f"{self.presence_stats['sent']} sent, "
+            f"{self.presence_stats['unchanged']} unchanged, "
+            f"{self.presence_stats['coalesced']} coalesced "
+            f"of {self.presence_stats['requested']} requested",
         ]
 
         if self._activities:
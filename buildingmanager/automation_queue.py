@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+WAKE_DEADLINE = "deadline"
+WAKE_SIGNAL = "signal"
+WAKE_FALLBACK = "fallback"
+
+
+@dataclass
+class QueueEntry:
+    key: Hashable
+    due_at: float
+    enqueued_at: float
+    # Alliance funds this entry waits for; a balance signal at or above it wakes the entry early
+    needs_funds: Optional[int] = None
+
+
+@dataclass
+class QueueMetrics:
+    deadline_wakeups: int = 0
+    signal_wakeups: int = 0
+    fallback_wakeups: int = 0
+    runs: int = 0
+    funds_releases: int = 0
+    completed: int = 0
+    total_completion_seconds: float = 0.0
+    max_completion_seconds: float = 0.0
+
+
+class DeadlineQueue:
+    """Work items ordered by the time they next become eligible.
+
+    Instead of waking on a fixed interval and re-checking every item, a worker
+    ``wait``s until the earliest deadline or a signal. Items blocked on alliance
+    funds carry the amount they need; ``note_funds`` makes the ones a new balance
+    covers due at once, so they do not have to be polled.
+    """
+
+    def __init__(self, name: str, *, clock: Callable[[], float] = time.time):
+        self.name = name
+        self._clock = clock
+        self._entries: Dict[Hashable, QueueEntry] = {}
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._sequence = itertools.count()
+        self._signal = asyncio.Event()
+        self.metrics = QueueMetrics()
+        self.last_funds: Optional[int] = None
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def keys(self) -> List[Hashable]:
+        return list(self._entries)
+
+    def waiting_for_funds(self) -> int:
+        now = self._clock()
+        return sum(1 for entry in self._entries.values() if entry.needs_funds is not None and entry.due_at > now)
+
+    def _push(self, entry: QueueEntry) -> None:
+        if math.isfinite(entry.due_at):
+            heapq.heappush(self._heap, (entry.due_at, next(self._sequence), entry.key))
+
+    def schedule(self, key: Hashable, due_at: float, *, needs_funds: Optional[int] = None) -> None:
+        """Add or move ``key`` so it becomes due at ``due_at``."""
+        previous = self._entries.get(key)
+        entry = QueueEntry(
+            key=key,
+            due_at=float(due_at),
+            enqueued_at=previous.enqueued_at if previous else self._clock(),
+            needs_funds=needs_funds,
+        )
+        self._entries[key] = entry
+        self._push(entry)
+        if previous is None or entry.due_at < previous.due_at:
+            # A sleeping worker computed its timeout from an older, later deadline
+            self._signal.set()
+
+    def requeue(self, key: Hashable, due_at: float) -> None:
+        """Schedule ``key`` again, keeping the funds amount it waits for."""
+        entry = self._entries.get(key)
+        self.schedule(key, due_at, needs_funds=entry.needs_funds if entry else None)
+
+    def remove(self, key: Hashable, *, completed: bool = False) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None or not completed:
+            return
+        elapsed = max(0.0, self._clock() - entry.enqueued_at)
+        self.metrics.completed += 1
+        self.metrics.total_completion_seconds += elapsed
+        self.metrics.max_completion_seconds = max(self.metrics.max_completion_seconds, elapsed)
+
+    def note_funds(self, funds: Optional[int]) -> int:
+        """Record a new alliance balance and make the entries it covers due now."""
+        if funds is None:
+            return 0
+        self.last_funds = int(funds)
+        now = self._clock()
+        released = 0
+        for entry in self._entries.values():
+            if entry.needs_funds is not None and entry.needs_funds <= funds and entry.due_at > now:
+                entry.due_at = now
+                self._push(entry)
+                released += 1
+        if released:
+            self.metrics.funds_releases += released
+            self._signal.set()
+        return released
+
+    def wake(self) -> None:
+        """Make a waiting worker re-check the queue now."""
+        self._signal.set()
+
+    def next_due_at(self) -> Optional[float]:
+        while self._heap:
+            due_at, _, key = self._heap[0]
+            entry = self._entries.get(key)
+            if entry is None or entry.due_at != due_at:
+                # Superseded by a later schedule() or removed
+                heapq.heappop(self._heap)
+                continue
+            return due_at
+        return None
+
+    def pop_due(self, limit: Optional[int] = None) -> List[Hashable]:
+        """Keys whose time has come, earliest first.
+
+        Popped keys stay in the queue without a deadline until the caller
+        schedules or removes them.
+        """
+        now = self._clock()
+        due: List[Hashable] = []
+        while limit is None or len(due) < limit:
+            due_at = self.next_due_at()
+            if due_at is None or due_at > now:
+                break
+            _, _, key = heapq.heappop(self._heap)
+            self._entries[key].due_at = math.inf
+            due.append(key)
+        self.metrics.runs += len(due)
+        return due
+
+    async def wait(self, max_seconds: float) -> str:
+        """Sleep until the next deadline, a signal, or at most ``max_seconds``."""
+        due_at = self.next_due_at()
+        timeout = max_seconds
+        if due_at is not None:
+            timeout = min(max_seconds, max(0.0, due_at - self._clock()))
+        if not self._signal.is_set() and timeout > 0:
+            try:
+                await asyncio.wait_for(self._signal.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        if self._signal.is_set():
+            self._signal.clear()
+            reason = WAKE_SIGNAL
+            self.metrics.signal_wakeups += 1
+        elif due_at is not None and timeout < max_seconds:
+            reason = WAKE_DEADLINE
+            self.metrics.deadline_wakeups += 1
+        else:
+            reason = WAKE_FALLBACK
+            self.metrics.fallback_wakeups += 1
+        return reason
+
+
+def _format_duration(seconds: float) -> str:
+    if seconds < 90:
+        return f"{seconds:.0f}s"
+    if seconds < 90 * 60:
+        return f"{seconds / 60:.0f}m"
+    return f"{seconds / 3600:.1f}h"
+
+
+def format_queue_metrics(queue: DeadlineQueue) -> List[str]:
+    """Status lines for one queue: depth, next deadline, wake-ups and time to completion."""
+    metrics = queue.metrics
+    due_at = queue.next_due_at()
+    next_text = "none" if due_at is None else _format_duration(max(0.0, due_at - queue._clock()))
+    lines = [
+        f"{queue.name}: {len(queue)} queued ({queue.waiting_for_funds()} waiting for funds), next due in {next_text}",
+        f"  wake-ups: {metrics.deadline_wakeups} deadline, {metrics.signal_wakeups} signal, "
+        f"{metrics.fallback_wakeups} fallback; {metrics.runs} runs, {metrics.funds_releases} released by funds",
+    ]
+    if metrics.completed:
+        average = metrics.total_completion_seconds / metrics.completed
+        lines.append(
+            f"  completed: {metrics.completed}, time to build avg {_format_duration(average)} "
+            f"/ max {_format_duration(metrics.max_completion_seconds)}"
+        )
+    if queue.last_funds is not None:
+        lines.append(f"  last known alliance funds: {queue.last_funds:,} credits")
+    return lines
@@ -0,0 +1,602 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from contextlib import nullcontext, suppress
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+log = logging.getLogger("red.fara.board_watcher")
+
+MISSIONCHIEF_BASE_URL = "https://www.missionchief.com"
+BOARD_WATCH_POLL_SECONDS = 5 * 60
+# Content hashes kept per thread and subscriber for edit detection
+EDIT_TRACKING_LIMIT = 200
+
+# Attribute on the bot that holds the process-wide watcher shared by every cog copy of this module
+SHARED_ATTRIBUTE = "_fara_board_watcher"
+
+
+@dataclass
+class BoardPost:
+    post_id: int
+    author_id: Optional[str]
+    author_name: str
+    created_at: str
+    content: str
+
+
+@dataclass
+class BoardPage:
+    posts: List[BoardPost]
+    last_page: int = 1
+    current_user_id: Optional[str] = None
+    reply_action: Optional[str] = None
+    reply_token: Optional[str] = None
+
+
+class BoardPageParser(HTMLParser):
+    """Parse MissionChief alliance board pages into posts and reply form data."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.posts: List[BoardPost] = []
+        self.page_numbers: List[int] = []
+        self.current_user_id: Optional[str] = None
+        self.reply_action: Optional[str] = None
+        self.reply_token: Optional[str] = None
+        self._post: Optional[dict] = None
+        self._post_depth = 0
+        self._content_depth = 0
+        self._capture_author = False
+        self._capture_content = False
+        self._capture_page_number = False
+        self._capture_active_page = False
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        attr = {key: value for key, value in attrs}
+
+        if tag == "div" and str(attr.get("id") or "").startswith("post-on-page-"):
+            self._post = {
+                "post_id": None,
+                "author_id": None,
+                "author_name": "",
+                "created_at": "",
+                "content": [],
+            }
+            self._post_depth = 1
+            return
+
+        if self._post is not None and tag == "div":
+            self._post_depth += 1
+            classes = str(attr.get("class") or "")
+            if "col-md-11" in classes:
+                self._content_depth = self._post_depth
+                self._capture_content = True
+
+        if self._post is not None and tag == "a":
+            href = str(attr.get("href") or "")
+            profile_match = re.search(r"/profile/(\d+)", href)
+            if profile_match and not self._post.get("author_id"):
+                self._post["author_id"] = profile_match.group(1)
+                self._capture_author = True
+
+            post_match = re.search(r"/alliance_posts/(\d+)", href)
+            if post_match:
+                self._post["post_id"] = int(post_match.group(1))
+
+        if self._post is not None and tag == "span":
+            title = attr.get("title")
+            if title and not self._post.get("created_at"):
+                self._post["created_at"] = str(title)
+
+        if self._post is not None and self._capture_content and tag == "br":
+            self._post["content"].append("\n")
+
+        if tag == "a":
+            href = str(attr.get("href") or "")
+            page_match = re.search(r"[?&]page=(\d+)", href)
+            if page_match:
+                self.page_numbers.append(int(page_match.group(1)))
+            self._capture_page_number = bool(page_match)
+
+        if tag == "li" and "active" in str(attr.get("class") or ""):
+            self._capture_active_page = True
+
+        if tag == "form" and str(attr.get("id") or "") == "new_alliance_post":
+            self.reply_action = attr.get("action")
+
+        if tag == "input" and attr.get("name") == "authenticity_token":
+            token = attr.get("value")
+            if token:
+                self.reply_token = token
+
+    def handle_data(self, data: str):
+        if "user_id =" in data:
+            match = re.search(r"user_id\s*=\s*(\d+)", data)
+            if match:
+                self.current_user_id = match.group(1)
+
+        if self._post is not None and self._capture_author:
+            text = re.sub(r"\s+", " ", data).strip()
+            if text:
+                self._post["author_name"] = text
+
+        if self._post is not None and self._capture_content:
+            self._post["content"].append(data)
+
+        if self._capture_page_number:
+            with suppress(ValueError):
+                self.page_numbers.append(int(data.strip()))
+
+        if self._capture_active_page:
+            with suppress(ValueError):
+                self.page_numbers.append(int(data.strip()))
+
+    def handle_endtag(self, tag: str):
+        if self._capture_author and tag == "a":
+            self._capture_author = False
+
+        if self._capture_page_number and tag == "a":
+            self._capture_page_number = False
+
+        if self._capture_active_page and tag == "li":
+            self._capture_active_page = False
+
+        if self._post is not None and tag == "div":
+            if self._capture_content and self._post_depth == self._content_depth:
+                self._capture_content = False
+                self._content_depth = 0
+
+            self._post_depth -= 1
+            if self._post_depth <= 0:
+                self._finish_post()
+
+    def _finish_post(self) -> None:
+        if self._post is None:
+            return
+
+        post_id = self._post.get("post_id")
+        if post_id is None:
+            self._post = None
+            return
+
+        content = "".join(self._post.get("content") or [])
+        content = re.sub(r"\n\s*\n+", "\n", content)
+        content = re.sub(r"[ \t]+", " ", content).strip()
+        self.posts.append(
+            BoardPost(
+                post_id=int(post_id),
+                author_id=self._post.get("author_id"),
+                author_name=str(self._post.get("author_name") or "Unknown"),
+                created_at=str(self._post.get("created_at") or ""),
+                content=content,
+            )
+        )
+        self._post = None
+
+    def page(self) -> BoardPage:
+        return BoardPage(
+            posts=self.posts,
+            last_page=max(self.page_numbers or [1]),
+            current_user_id=self.current_user_id,
+            reply_action=self.reply_action,
+            reply_token=self.reply_token,
+        )
+
+
+def parse_board_page(html: str) -> BoardPage:
+    parser = BoardPageParser()
+    parser.feed(html or "")
+    return parser.page()
+
+
+def board_thread_url(thread_id: int, page: Optional[int] = None, base_url: str = MISSIONCHIEF_BASE_URL) -> str:
+    url = f"{base_url}/alliance_threads/{int(thread_id)}"
+    return f"{url}?page={int(page)}" if page and int(page) > 1 else url
+
+
+@dataclass
+class BoardFetch:
+    """Result of reading the newest page of a thread."""
+
+    page: BoardPage
+    status: Optional[int]
+    page_number: int = 1
+    requests: int = 0
+    # Posts from the previously newest page and every page after it, when the thread grew since the last poll
+    earlier_posts: List[BoardPost] = field(default_factory=list)
+
+
+async def _get_board_page(session, url: str, request_slot: Callable[[], Any]) -> Tuple[BoardPage, Optional[int]]:
+    async with request_slot():
+        async with session.get(url, allow_redirects=True) as response:
+            status = getattr(response, "status", None)
+            html = await response.text()
+    return parse_board_page(html), status
+
+
+def _failed(status: Optional[int]) -> bool:
+    return status is not None and int(status) >= 400
+
+
+async def fetch_board_thread(
+    session,
+    thread_id: int,
+    *,
+    page_hint: Optional[int] = None,
+    base_url: str = MISSIONCHIEF_BASE_URL,
+    request_slot: Callable[[], Any] = nullcontext,
+) -> BoardFetch:
+    """Fetch the newest page of a thread, starting at ``page_hint`` when the caller knows it.
+
+    Without a hint this costs two requests on multi-page threads (page one to learn
+    the page count, then the last page); with a current hint it costs one. When the
+    thread grew past the hint, every page from the hint to the new last page is read
+    so no post in between is skipped. ``request_slot`` is entered once per request.
+    """
+    hint = int(page_hint) if page_hint and int(page_hint) > 1 else None
+    page, status = await _get_board_page(session, board_thread_url(thread_id, hint, base_url), request_slot)
+    requests = 1
+    number = hint or 1
+    if hint and (_failed(status) or not page.posts):
+        # The thread shrank (posts deleted) or the hint is stale; start over from page one
+        page, status = await _get_board_page(session, board_thread_url(thread_id, None, base_url), request_slot)
+        requests += 1
+        number = 1
+        hint = None
+    if _failed(status):
+        return BoardFetch(page, status, number, requests)
+
+    earlier_posts: List[BoardPost] = []
+    if page.last_page > number:
+        last_page = page.last_page
+        if hint:
+            earlier_posts = list(page.posts)
+            for middle in range(number + 1, last_page):
+                middle_page, status = await _get_board_page(session, board_thread_url(thread_id, middle, base_url), request_slot)
+                requests += 1
+                if _failed(status):
+                    # Keep the old hint so the next poll walks these pages again
+                    return BoardFetch(middle_page, status, number, requests)
+                earlier_posts.extend(middle_page.posts)
+        number = last_page
+        page, status = await _get_board_page(session, board_thread_url(thread_id, number, base_url), request_slot)
+        requests += 1
+    return BoardFetch(page, status, number, requests, earlier_posts)
+
+
+async def fetch_latest_board_page(
+    session,
+    thread_id: int,
+    *,
+    base_url: str = MISSIONCHIEF_BASE_URL,
+    request_slot: Callable[[], Any] = nullcontext,
+) -> Tuple[BoardPage, Optional[int]]:
+    """Return ``(page, status)`` for the last page of a thread."""
+    fetched = await fetch_board_thread(session, thread_id, base_url=base_url, request_slot=request_slot)
+    return fetched.page, fetched.status
+
+
+def _content_hash(post: BoardPost) -> str:
+    return hashlib.sha1(post.content.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class BoardUpdate:
+    """New and edited posts of one thread, delivered to one subscriber.
+
+    ``first_poll`` is set when the subscriber has no cursor for the thread yet (after
+    a restart, a rewind or a thread change); every post on the page is then new and
+    the subscriber decides from its own stored state what it already handled.
+    """
+
+    thread_id: int
+    page: BoardPage
+    session: Any
+    new_posts: List[BoardPost]
+    edited_posts: List[BoardPost]
+    first_poll: bool = False
+
+
+@dataclass
+class BoardThreadStats:
+    polls: int = 0
+    requests: int = 0
+    errors: int = 0
+    last_status: Optional[int] = None
+    last_page: int = 1
+    fetch_seconds: float = 0.0
+    last_fetch_seconds: float = 0.0
+    new_posts: int = 0
+    edited_posts: int = 0
+    dispatch_seconds: float = 0.0
+    # Upper bound on how long a new post waited: time since the previous successful poll
+    last_detection_seconds: Optional[float] = None
+    max_detection_seconds: float = 0.0
+    last_success_at: Optional[float] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "polls": self.polls,
+            "requests": self.requests,
+            "errors": self.errors,
+            "last_status": self.last_status,
+            "last_page": self.last_page,
+            "requests_per_poll": round(self.requests / self.polls, 2) if self.polls else 0.0,
+            "avg_fetch_ms": round(self.fetch_seconds / self.polls * 1000, 1) if self.polls else 0.0,
+            "last_fetch_ms": round(self.last_fetch_seconds * 1000, 1),
+            "new_posts": self.new_posts,
+            "edited_posts": self.edited_posts,
+            "dispatch_ms": round(self.dispatch_seconds * 1000, 1),
+            "last_detection_seconds": (
+                None if self.last_detection_seconds is None else round(self.last_detection_seconds, 1)
+            ),
+            "max_detection_seconds": round(self.max_detection_seconds, 1),
+        }
+
+
+@dataclass
+class _Subscription:
+    owner: str
+    threads: Callable[[], Awaitable[Iterable[int]]]
+    callback: Callable[[BoardUpdate], Awaitable[Any]]
+    cursors: Dict[int, int] = field(default_factory=dict)
+    hashes: Dict[int, Dict[int, str]] = field(default_factory=dict)
+
+
+class BoardWatcher:
+    """Poll every subscribed MissionChief forum thread on one schedule.
+
+    Each subscriber names the threads it wants through an async ``threads`` callable
+    (read every poll, so config changes apply without re-subscribing) and receives a
+    ``BoardUpdate`` with the posts it has not seen. A thread wanted by several
+    subscribers is fetched and parsed once per poll. The newest page number is
+    remembered per thread, so a poll normally costs one request.
+
+    A subscriber's cursor only advances when its callback returns; if it raises, the
+    same posts are delivered again on the next poll. ``request_slot`` returns an async
+    context manager held around each page request, so CookieManager's request governor
+    spends one token per request.
+    """
+
+    def __init__(
+        self,
+        session_provider: Callable[[], Awaitable[Any]],
+        *,
+        poll_seconds: float = BOARD_WATCH_POLL_SECONDS,
+        base_url: str = MISSIONCHIEF_BASE_URL,
+        wait_ready: Optional[Callable[[], Awaitable[Any]]] = None,
+        request_slot: Optional[Callable[[], Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        self._session_provider = session_provider
+        self._request_slot = request_slot or nullcontext
+        self.poll_seconds = poll_seconds
+        self.base_url = base_url
+        self._wait_ready = wait_ready
+        self._clock = clock
+        self._sleep = sleep
+        self._subscriptions: Dict[str, _Subscription] = {}
+        self._last_pages: Dict[int, int] = {}
+        self._stats: Dict[int, BoardThreadStats] = {}
+        self._poll_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(
+        self,
+        owner: str,
+        threads: Callable[[], Awaitable[Iterable[int]]],
+        callback: Callable[[BoardUpdate], Awaitable[Any]],
+    ) -> None:
+        """Register (or replace) ``owner``'s subscription and start polling."""
+        self._subscriptions[owner] = _Subscription(owner, threads, callback)
+        self._ensure_task()
+
+    def unsubscribe(self, owner: str) -> None:
+        self._subscriptions.pop(owner, None)
+        if not self._subscriptions and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def rewind(self, owner: str, thread_id: Optional[int] = None) -> None:
+        """Forget ``owner``'s cursor so its next update is a first poll."""
+        subscription = self._subscriptions.get(owner)
+        if subscription is None:
+            return
+        if thread_id is None:
+            subscription.cursors.clear()
+            subscription.hashes.clear()
+        else:
+            subscription.cursors.pop(int(thread_id), None)
+            subscription.hashes.pop(int(thread_id), None)
+
+    def stats(self, thread_id: Optional[int] = None) -> Dict[int, Dict[str, Any]]:
+        """Per-thread poll cost and detection latency."""
+        if thread_id is not None:
+            stats = self._stats.get(int(thread_id))
+            return {int(thread_id): stats.as_dict()} if stats else {}
+        return {key: value.as_dict() for key, value in self._stats.items()}
+
+    def _ensure_task(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop yet; the next subscribe from inside the bot starts polling
+            return
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        if self._wait_ready is not None:
+            await self._wait_ready()
+        while True:
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                log.exception("Board watcher poll error: %s", exc)
+            await self._sleep(self.poll_seconds)
+
+    async def poll_once(self) -> None:
+        """Fetch every wanted thread once and dispatch updates."""
+        async with self._poll_lock:
+            targets: Dict[int, List[_Subscription]] = {}
+            for subscription in list(self._subscriptions.values()):
+                try:
+                    thread_ids = await subscription.threads()
+                except Exception as exc:
+                    log.exception("Board watcher could not read threads for %s: %s", subscription.owner, exc)
+                    continue
+                for thread_id in thread_ids or ():
+                    targets.setdefault(int(thread_id), []).append(subscription)
+            if not targets:
+                return
+
+            session = await self._session_provider()
+            if session is None:
+                log.info("Board watcher poll skipped: no MissionChief session")
+                return
+            for thread_id, subscriptions in targets.items():
+                await self._poll_thread(session, thread_id, subscriptions)
+
+    async def _poll_thread(self, session, thread_id: int, subscriptions: List[_Subscription]) -> None:
+        stats = self._stats.setdefault(thread_id, BoardThreadStats())
+        stats.polls += 1
+        started = self._clock()
+        try:
+            fetched = await fetch_board_thread(
+                session,
+                thread_id,
+                page_hint=self._last_pages.get(thread_id),
+                base_url=self.base_url,
+                request_slot=self._request_slot,
+            )
+        except Exception as exc:
+            stats.errors += 1
+            log.warning("Board watcher could not fetch thread %s: %s", thread_id, exc)
+            return
+        finally:
+            stats.last_fetch_seconds = self._clock() - started
+            stats.fetch_seconds += stats.last_fetch_seconds
+
+        stats.requests += fetched.requests
+        stats.last_status = fetched.status
+        if _failed(fetched.status):
+            stats.errors += 1
+            log.warning("Board watcher: thread %s returned HTTP %s", thread_id, fetched.status)
+            return
+
+        self._last_pages[thread_id] = stats.last_page = fetched.page_number
+        posts = sorted(
+            {post.post_id: post for post in [*fetched.earlier_posts, *fetched.page.posts]}.values(),
+            key=lambda post: post.post_id,
+        )
+        hashes = {post.post_id: _content_hash(post) for post in posts}
+        previous_success = stats.last_success_at
+        stats.last_success_at = self._clock()
+
+        for subscription in subscriptions:
+            cursor = subscription.cursors.get(thread_id)
+            known = subscription.hashes.get(thread_id, {})
+            if cursor is None:
+                new_posts, edited_posts = list(posts), []
+            else:
+                new_posts = [post for post in posts if post.post_id > cursor]
+                edited_posts = [
+                    post
+                    for post in posts
+                    if post.post_id <= cursor and post.post_id in known and known[post.post_id] != hashes[post.post_id]
+                ]
+
+            if new_posts or edited_posts:
+                dispatch_started = self._clock()
+                try:
+                    await subscription.callback(
+                        BoardUpdate(
+                            thread_id=thread_id,
+                            page=fetched.page,
+                            session=session,
+                            new_posts=new_posts,
+                            edited_posts=edited_posts,
+                            first_poll=cursor is None,
+                        )
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    log.exception("Board watcher subscriber %s failed for thread %s: %s", subscription.owner, thread_id, exc)
+                    continue
+                finally:
+                    stats.dispatch_seconds = self._clock() - dispatch_started
+                if cursor is not None:
+                    stats.new_posts += len(new_posts)
+                    stats.edited_posts += len(edited_posts)
+                    if new_posts and previous_success is not None:
+                        stats.last_detection_seconds = stats.last_success_at - previous_success
+                        stats.max_detection_seconds = max(stats.max_detection_seconds, stats.last_detection_seconds)
+
+            merged = {**known, **hashes}
+            subscription.hashes[thread_id] = {
+                post_id: merged[post_id] for post_id in sorted(merged)[-EDIT_TRACKING_LIMIT:]
+            }
+            if posts:
+                subscription.cursors[thread_id] = max(cursor or 0, posts[-1].post_id)
+
+
+def format_board_watch_stats(stats: Optional[Dict[str, Any]]) -> str:
+    """One status line from ``BoardWatcher.stats`` for a thread."""
+    if not stats:
+        return "Watcher: not polled yet"
+    detection = stats["last_detection_seconds"]
+    last_detection = "n/a" if detection is None else f"{detection:.0f}s"
+    return (
+        f"Watcher: {stats['polls']} polls, {stats['requests_per_poll']} requests/poll, "
+        f"avg fetch {stats['avg_fetch_ms']} ms, {stats['errors']} errors, "
+        f"detection latency last {last_detection} / max {stats['max_detection_seconds']:.0f}s"
+    )
+
+
+async def _cookie_manager_session(bot: Any) -> Any:
+    cookie_manager = bot.get_cog("CookieManager") if hasattr(bot, "get_cog") else None
+    if not cookie_manager or not hasattr(cookie_manager, "get_session"):
+        return None
+    return await cookie_manager.get_session()
+
+
+def _cookie_manager_request_slot(bot: Any) -> Any:
+    cookie_manager = bot.get_cog("CookieManager") if hasattr(bot, "get_cog") else None
+    if not cookie_manager or not hasattr(cookie_manager, "request_slot"):
+        return nullcontext()
+    return cookie_manager.request_slot("BoardWatcher", "board")
+
+
+def shared_board_watcher(bot: Any) -> BoardWatcher:
+    """Return the bot-wide watcher, creating it on first use.
+
+    Each cog packages its own copy of this module, so the instance lives on the bot
+    rather than in a module global; that keeps one poll schedule for every cog.
+    """
+    watcher = getattr(bot, SHARED_ATTRIBUTE, None)
+    if watcher is None:
+
+        async def session_provider():
+            return await _cookie_manager_session(bot)
+
+        watcher = BoardWatcher(
+            session_provider,
+            wait_ready=getattr(bot, "wait_until_red_ready", None),
+            request_slot=lambda: _cookie_manager_request_slot(bot),
+        )
+        try:
+            setattr(bot, SHARED_ATTRIBUTE, watcher)
+        except AttributeError:
+            pass
+    return watcher
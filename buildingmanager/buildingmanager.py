@@ -8,6 +8,7 @@ import hashlib
 import html as html_lib
 import math
 import os
+import random
 import struct
 import tempfile
 from html.parser import HTMLParser
@@ -16,12 +17,11 @@ import json
 import logging
 import re
 import sqlite3
-import time
 import unicodedata
 import zipfile
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from urllib.parse import parse_qs, quote, unquote, urljoin, urlparse
 from zoneinfo import ZoneInfo
 
@@ -30,6 +30,49 @@ from redbot.core import commands, Config
 from redbot.core.bot import Red
 from redbot.core.utils.chat_formatting import box
 
+try:
+    from .automation_queue import DeadlineQueue, WAKE_FALLBACK, format_queue_metrics
+    from .board_watcher import (
+        BoardPage,
+        BoardPageParser,
+        BoardPost,
+        BoardUpdate,
+        fetch_latest_board_page,
+        format_board_watch_stats,
+        parse_board_page,
+        shared_board_watcher,
+    )
+    from .geocode_cache import ProviderRateLimiter, shared_geocode_cache
+    from .mc_actions import (
+        ReplayUnavailable,
+        format_action_stats,
+        playwright_installed,
+        shared_action_engine,
+    )
+    from .mc_requests import mc_request_slot
+    from .overpass_stream import OverpassElementStream, overpass_grid_tiles, overpass_import_key
+except ImportError:  # pragma: no cover - direct module loading in local tooling
+    from automation_queue import DeadlineQueue, WAKE_FALLBACK, format_queue_metrics
+    from board_watcher import (
+        BoardPage,
+        BoardPageParser,
+        BoardPost,
+        BoardUpdate,
+        fetch_latest_board_page,
+        format_board_watch_stats,
+        parse_board_page,
+        shared_board_watcher,
+    )
+    from geocode_cache import ProviderRateLimiter, shared_geocode_cache
+    from mc_actions import (
+        ReplayUnavailable,
+        format_action_stats,
+        playwright_installed,
+        shared_action_engine,
+    )
+    from mc_requests import mc_request_slot
+    from overpass_stream import OverpassElementStream, overpass_grid_tiles, overpass_import_key
+
 log = logging.getLogger("red.cog.building_manager")
 
 BASE_URL = "https://www.missionchief.com"
@@ -39,7 +82,7 @@ MISSIONCHIEF_ALLIANCE_BUILDINGS_URL = f"{BASE_URL}/verband/gebauede"
 MISSIONCHIEF_ALLIANCE_FUNDS_URL = f"{BASE_URL}/verband/kasse"
 DEFAULT_REQUEST_PANEL_CHANNEL_ID = 1421627971831070730
 BOARD_THREAD_ID = 6165
-BOARD_POLL_SECONDS = 5 * 60
+BOARD_WATCH_OWNER = "BuildingManager"
 BOARD_GUIDE_SYNC_SECONDS = 60 * 60
 BOARD_CLEANUP_SECONDS = 10 * 60
 BOARD_POST_DELETE_AFTER_SECONDS = 12 * 60 * 60
@@ -66,6 +109,8 @@ BUILDING_LOOKUP_MAX_ALLIANCE_LIST_PAGES = 8
 BUILDING_AUTOMATION_RETRY_SECONDS = 6 * 60 * 60
 BUILDING_AUTOMATION_LOOP_SECONDS = 15 * 60
 BUILDING_CREATION_QUEUE_LOOP_SECONDS = 15 * 60
+# Entries held for funds are re-checked this often when no balance signal wakes them sooner
+BUILDING_FUNDS_RECHECK_SECONDS = 60 * 60
 BUILDING_AUTOMATION_MAX_ACTIONS_PER_RUN = 30
 BUILDING_AUTOMATION_MAX_EXTENSION_STARTS_PER_RUN = BUILDING_AUTOMATION_MAX_ACTIONS_PER_RUN
 BUILDING_AUTOMATION_MAX_SCRIPT_STEPS_PER_RUN = BUILDING_AUTOMATION_MAX_EXTENSION_STARTS_PER_RUN + 10
@@ -75,6 +120,7 @@ BUILDING_AUTOMATION_EXCLUDED_EXTENSIONS = {
 }
 AUTO_CANDIDATE_MIN_FUNDS = 5_000_000
 AUTO_CANDIDATE_LOOP_SECONDS = 15 * 60
+AUTO_CANDIDATE_FUNDS_BLOCKED_TEXT = "blocked by funds safety rule"
 AUTO_CANDIDATE_DEFAULT_TIME = "07:00"
 AUTO_CANDIDATE_DEFAULT_TIMEZONE = "America/New_York"
 AUTO_CANDIDATE_DUPLICATE_RADIUS_METERS = 250
@@ -86,10 +132,24 @@ AUTO_CANDIDATE_REFILL_MAX_EXTRACT_BYTES = 350 * 1024 * 1024
 GEOFABRIK_INDEX_URL = "https://download.geofabrik.de/index-v1.json"
 OVERPASS_API_URL = "https://overpass-api.de/api/interpreter"
 OVERPASS_IMPORT_AREA_WARNING_DEGREES = 0.35
+# Larger boxes are imported as a grid of cells this size, one Overpass query each
+OVERPASS_IMPORT_TILE_DEGREES = OVERPASS_IMPORT_AREA_WARNING_DEGREES
+OVERPASS_IMPORT_TILE_PAUSE_SECONDS = 1
+OVERPASS_REQUEST_TIMEOUT_SECONDS = 240
+OVERPASS_STREAM_CHUNK_BYTES = 64 * 1024
+OVERPASS_UPSERT_BATCH_SIZE = 500
 PLAYWRIGHT_SETUP_MESSAGE = (
     "Playwright browser automation is not ready. Install the BuildingManager requirements and run "
     "`python -m playwright install chromium` in the same Python environment as Redbot."
 )
+# Scopes of the pre-aggregated building_stats counters read by the buildstats embeds
+STATS_SCOPE_REQUESTS = "requests"
+STATS_SCOPE_ACTIONS = "actions"
+STATS_SCOPE_USER_DENIALS = "user_denials"
+STATS_SCOPE_ADMIN_DENIALS = "admin_denials"
+STATS_SCOPE_TYPE_DENIALS = "type_denials"
+STATS_RESPONSE_ACTIONS = ("approved", "denied")
+STATS_RECENT_DAYS = 7
 REQUEST_PANEL_TITLE = "🏢 Building Request System"
 
 BOARD_BUILDING_TYPE_ALIASES = {
@@ -195,7 +255,24 @@ BUILDING_DIAGNOSTICS_SCRIPT = r"""
 """.strip()
 BUILDING_CREATE_SCRIPT = r"""
 async (config) => {
-  const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+  // Resolve as soon as the page satisfies predicate, re-checking on DOM changes instead of a fixed delay
+  const waitFor = (predicate, timeoutMs) => new Promise((resolve) => {
+    if (predicate()) {
+      resolve(true);
+      return;
+    }
+    const observer = new MutationObserver(() => {
+      if (!predicate()) return;
+      observer.disconnect();
+      clearTimeout(timer);
+      resolve(true);
+    });
+    const timer = setTimeout(() => {
+      observer.disconnect();
+      resolve(predicate());
+    }, timeoutMs);
+    observer.observe(document.body, { subtree: true, childList: true, attributes: true });
+  });
   const visibleText = (element) => [element?.value, element?.textContent, element?.getAttribute?.("title"), element?.getAttribute?.("aria-label")]
     .filter(Boolean)
     .join(" ")
@@ -257,6 +334,21 @@ async (config) => {
     return null;
   }
 
+  function allianceBuildCandidates() {
+    return [...document.querySelectorAll('input[type="submit"], button[type="submit"], button:not([type])')]
+      .map((button, index) => ({ button, index, text: visibleText(button), context: allianceContext(button) }))
+      .filter((item) => {
+        const text = item.text.toLowerCase();
+        return item.context
+          && isVisible(item.button)
+          && !item.button.disabled
+          && !item.button.hasAttribute("disabled")
+          && text.includes("build")
+          && text.includes("credits")
+          && !text.includes("coins");
+      });
+  }
+
   const form = document.querySelector("#new_building") || document.querySelector('form[action*="/buildings"]');
   if (!form) return fail("MissionChief building form was not loaded.");
 
@@ -264,7 +356,10 @@ async (config) => {
   if (!typeSelect) return fail("MissionChief building type field was not found.");
   typeSelect.value = String(config.buildingTypeId || "");
   dispatch(typeSelect);
-  await sleep(300);
+  await waitFor(
+    () => fieldValue("building[building_type]") === String(config.buildingTypeId || "") && allianceBuildCandidates().length > 0,
+    3000,
+  );
 
   if (fieldValue("building[building_type]") !== String(config.buildingTypeId || "")) {
     return fail(`MissionChief did not accept building type ${config.buildingTypeId}.`);
@@ -281,19 +376,7 @@ async (config) => {
     dispatch(buildAnother);
   }
 
-  const buttons = [...document.querySelectorAll('input[type="submit"], button[type="submit"], button:not([type])')];
-  const candidates = buttons
-    .map((button, index) => ({ button, index, text: visibleText(button), context: allianceContext(button) }))
-    .filter((item) => {
-      const text = item.text.toLowerCase();
-      return item.context
-        && isVisible(item.button)
-        && !item.button.disabled
-        && !item.button.hasAttribute("disabled")
-        && text.includes("build")
-        && text.includes("credits")
-        && !text.includes("coins");
-    });
+  const candidates = allianceBuildCandidates();
 
   if (candidates.length < 1) {
     return fail("No enabled alliance build button was found.");
@@ -711,7 +794,6 @@ async (config) => {
   const targetTaxId = targetTaxIds[targetTax];
 
   const normalize = (value) => String(value || "").replace(/\s+/g, " ").trim().toLowerCase();
-  const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
   const csrf = () => document.querySelector('meta[name="csrf-token"]')?.content || "";
 
   const fail = (reason, extra = {}) => ({
@@ -848,7 +930,6 @@ async (config) => {
         response: String(taxResult.text || "").slice(0, 500),
       });
     }
-    await sleep(500);
     return {
       ok: true,
       action: "set_tax",
@@ -902,7 +983,6 @@ async (config) => {
         response: String(levelResult.text || "").slice(0, 500),
       });
     }
-    await sleep(500);
     return {
       ok: true,
       action: "start_level_upgrade",
@@ -954,7 +1034,6 @@ async (config) => {
       response: String(extensionResult.text || "").slice(0, 500),
     });
   }
-  await sleep(500);
   return {
     ok: true,
     action: "start_extension",
@@ -1249,24 +1328,96 @@ def _overpass_element_to_candidate_record(element: Dict[str, Any]) -> Tuple[Opti
         "raw_tags_json": json.dumps(tags, ensure_ascii=False, sort_keys=True),
     }, None
 
+def _overpass_candidate_records(
+    elements: Iterable[Any],
+    stats: Dict[str, int],
+    seen: Set[str],
+) -> Iterator[Dict[str, Any]]:
+    """Convert Overpass elements one at a time, skipping ids already in ``seen``."""
+    for element in elements:
+        stats["source_elements"] += 1
+        if isinstance(element, dict) and element.get("type") and element.get("id") is not None:
+            # Ways and relations crossing a tile border come back from both tiles
+            source_id = f"{element.get('type')}/{element.get('id')}"
+            if source_id in seen:
+                stats["duplicates"] += 1
+                continue
+            seen.add(source_id)
+        record, _reason = _overpass_element_to_candidate_record(element)
+        if record:
+            stats["accepted"] += 1
+            yield record
+        else:
+            stats["rejected"] += 1
+
 def parse_overpass_auto_build_candidates(data: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
     """Parse Overpass JSON into clean automatic building candidates."""
-    candidates: List[Dict[str, Any]] = []
     stats = {
         "source_elements": 0,
         "accepted": 0,
         "rejected": 0,
+        "duplicates": 0,
     }
-    for element in data.get("elements") or []:
-        stats["source_elements"] += 1
-        record, _reason = _overpass_element_to_candidate_record(element)
-        if record:
-            candidates.append(record)
-            stats["accepted"] += 1
-        else:
-            stats["rejected"] += 1
+    candidates = list(_overpass_candidate_records(data.get("elements") or [], stats, set()))
     return candidates, stats
 
+class OverpassCandidateImport:
+    """Filter, dedupe and store Overpass elements as they are parsed.
+
+    The response is read with ``OverpassElementStream`` and accepted candidates
+    are upserted every ``batch_size`` records, one transaction per batch, so an
+    import holds one batch in memory instead of the whole response. ``stats``
+    can carry totals over from an earlier, interrupted run.
+    """
+
+    STAT_KEYS = ("source_elements", "accepted", "rejected", "duplicates", "inserted", "updated", "skipped")
+
+    def __init__(
+        self,
+        db: "BuildingDatabase",
+        *,
+        batch_size: int = OVERPASS_UPSERT_BATCH_SIZE,
+        stats: Optional[Dict[str, Any]] = None,
+    ):
+        self.db = db
+        self.batch_size = max(1, int(batch_size))
+        self.stats = {key: int((stats or {}).get(key) or 0) for key in self.STAT_KEYS}
+        self.seen: Set[str] = set()
+        self._batch: List[Dict[str, Any]] = []
+
+    def add(self, elements: Iterable[Any]) -> None:
+        for record in _overpass_candidate_records(elements, self.stats, self.seen):
+            self._batch.append(record)
+            if len(self._batch) >= self.batch_size:
+                self.flush()
+
+    def flush(self) -> None:
+        if not self._batch:
+            return
+        db_stats = self.db.upsert_auto_candidates(self._batch)
+        self._batch = []
+        for key in ("inserted", "updated", "skipped"):
+            self.stats[key] += int(db_stats.get(key, 0))
+
+    def read_bytes(self, payload: bytes) -> OverpassElementStream:
+        """Import an Overpass export that is already in memory, such as an attachment."""
+        stream = OverpassElementStream()
+        view = memoryview(payload)
+        for start in range(0, len(view), OVERPASS_STREAM_CHUNK_BYTES):
+            self.add(stream.feed(bytes(view[start:start + OVERPASS_STREAM_CHUNK_BYTES])))
+        self.add(stream.close())
+        self.flush()
+        return stream
+
+    async def read(self, chunks: AsyncIterable[bytes]) -> OverpassElementStream:
+        """Import a streamed Overpass response, such as ``response.content.iter_chunked``."""
+        stream = OverpassElementStream()
+        async for chunk in chunks:
+            self.add(stream.feed(chunk))
+        self.add(stream.close())
+        self.flush()
+        return stream
+
 def build_overpass_candidate_query(
     south: float,
     west: float,
@@ -1309,17 +1460,6 @@ def build_overpass_candidate_query(
         ]
     )
 
-def overpass_import_area_notice(south: float, west: float, north: float, east: float) -> Optional[str]:
-    """Return a warning when a bounding box is likely too large for public Overpass."""
-    height = abs(float(north) - float(south))
-    width = abs(float(east) - float(west))
-    if height > OVERPASS_IMPORT_AREA_WARNING_DEGREES or width > OVERPASS_IMPORT_AREA_WARNING_DEGREES:
-        return (
-            "This area is fairly large for the public Overpass server. If it returns HTTP 504, "
-            "split the import into smaller boxes or import `hospital` and `prison` separately."
-        )
-    return None
-
 def format_overpass_http_error(status: int, body: str, *, building_type: str) -> str:
     """Return a short admin-facing error for an Overpass failure."""
     text = html_lib.unescape(re.sub(r"<[^>]+>", " ", str(body or "")))
@@ -2137,6 +2277,88 @@ class AutoBuildPlan:
     duplicate_building_id: Optional[int] = None
     duplicate_check_source: str = "not checked"
 
+
+@dataclass
+class AutoBuildSlotResult:
+    """Outcome of one automatic candidate build slot."""
+
+    message: str
+    # Set when the funds safety rule held the slot; the scheduler waits for this many credits
+    funds_minimum: Optional[int] = None
+
+    @property
+    def blocked_on_funds(self) -> bool:
+        return self.funds_minimum is not None
+
+
+class AutoCandidateWorkQueue:
+    """Pre-shuffled candidates for one building type, drained by the daily build loop.
+
+    The queue is filled a batch at a time from ``sample_auto_candidate_ids``,
+    shuffled once, and keeps that order, so a dry run previews the candidate
+    the next real run takes. Queued ids are re-read in one query per chunk
+    before they are offered; ones used, marked or purged since sampling drop out.
+    """
+
+    def __init__(
+        self,
+        db: "BuildingDatabase",
+        building_type: str,
+        *,
+        batch_size: int = AUTO_CANDIDATE_SELECTION_POOL,
+        rng: Optional[random.Random] = None,
+    ):
+        self.db = db
+        self.building_type = building_type
+        self.batch_size = max(1, int(batch_size))
+        self.rng = rng or random
+        self._pending: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _refill(self, minimum: int) -> None:
+        if len(self._pending) >= minimum:
+            return
+        sampled = self.db.sample_auto_candidate_ids(
+            self.building_type,
+            limit=max(self.batch_size, minimum),
+            rng=self.rng,
+        )
+        self.rng.shuffle(sampled)
+        queued = set(self._pending)
+        self._pending.extend(candidate_id for candidate_id in sampled if candidate_id not in queued)
+
+    def candidates(self, limit: int) -> Iterator[AutoBuildCandidate]:
+        """Yield up to ``limit`` still-available candidates from the head of the queue."""
+        self._refill(limit)
+        yielded = 0
+        resampled = False
+        examined: Set[int] = set()
+        while yielded < limit:
+            chunk = [candidate_id for candidate_id in self._pending if candidate_id not in examined][: limit - yielded]
+            if not chunk:
+                # Everything queued had gone stale: sample once more before reporting none
+                if yielded or resampled:
+                    return
+                resampled = True
+                self._refill(limit)
+                continue
+            examined.update(chunk)
+            current = {candidate.candidate_id: candidate for candidate in self.db.get_auto_candidates(chunk)}
+            for candidate_id in chunk:
+                candidate = current.get(candidate_id)
+                if candidate is None or candidate.status != "available" or candidate.building_type != self.building_type:
+                    self.discard(candidate_id)
+                    continue
+                yielded += 1
+                yield candidate
+
+    def discard(self, candidate_id: int) -> None:
+        with contextlib.suppress(ValueError):
+            self._pending.remove(int(candidate_id))
+
+
 async def safe_update(interaction: discord.Interaction, *, content=None, embed=None, view=None):
     """Robust message updater for component/modal callbacks."""
     try:
@@ -2162,22 +2384,8 @@ async def safe_update(interaction: discord.Interaction, *, content=None, embed=N
             pass
 
 
-@dataclass
-class BoardBuildingPost:
-    post_id: int
-    author_id: Optional[str]
-    author_name: str
-    created_at: str
-    content: str
-
-
-@dataclass
-class BoardPage:
-    posts: List[BoardBuildingPost]
-    last_page: int = 1
-    current_user_id: Optional[str] = None
-    reply_action: Optional[str] = None
-    reply_token: Optional[str] = None
+# Board pages are parsed by the shared watcher into one post model for every cog
+BoardBuildingPost = BoardPost
 
 
 @dataclass(frozen=True)
@@ -2194,164 +2402,8 @@ class MissionChiefForm:
     fields: Dict[str, str]
 
 
-class BuildingBoardPageParser(HTMLParser):
-    """Parse MissionChief alliance board pages for building requests and reply form data."""
-
-    def __init__(self):
-        super().__init__(convert_charrefs=True)
-        self.posts: List[BoardBuildingPost] = []
-        self.page_numbers: List[int] = []
-        self.current_user_id: Optional[str] = None
-        self.reply_action: Optional[str] = None
-        self.reply_token: Optional[str] = None
-        self._post: Optional[dict] = None
-        self._post_depth = 0
-        self._content_depth = 0
-        self._capture_author = False
-        self._capture_content = False
-        self._capture_page_number = False
-        self._capture_active_page = False
-
-    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
-        attr = {key: value for key, value in attrs}
-
-        if tag == "div" and str(attr.get("id") or "").startswith("post-on-page-"):
-            self._post = {
-                "post_id": None,
-                "author_id": None,
-                "author_name": "",
-                "created_at": "",
-                "content": [],
-            }
-            self._post_depth = 1
-            return
-
-        if self._post is not None and tag == "div":
-            self._post_depth += 1
-            classes = str(attr.get("class") or "")
-            if "col-md-11" in classes:
-                self._content_depth = self._post_depth
-                self._capture_content = True
-
-        if self._post is not None and tag == "a":
-            href = str(attr.get("href") or "")
-            profile_match = re.search(r"/profile/(\d+)", href)
-            if profile_match and not self._post.get("author_id"):
-                self._post["author_id"] = profile_match.group(1)
-                self._capture_author = True
-
-            post_match = re.search(r"/alliance_posts/(\d+)", href)
-            if post_match:
-                self._post["post_id"] = int(post_match.group(1))
-
-        if self._post is not None and tag == "span":
-            title = attr.get("title")
-            if title and not self._post.get("created_at"):
-                self._post["created_at"] = str(title)
-
-        if self._post is not None and self._capture_content and tag == "br":
-            self._post["content"].append("\n")
-
-        if tag == "a":
-            href = str(attr.get("href") or "")
-            page_match = re.search(r"[?&]page=(\d+)", href)
-            if page_match:
-                self.page_numbers.append(int(page_match.group(1)))
-            self._capture_page_number = bool(page_match)
-
-        if tag == "li" and "active" in str(attr.get("class") or ""):
-            self._capture_active_page = True
-
-        if tag == "form" and str(attr.get("id") or "") == "new_alliance_post":
-            self.reply_action = attr.get("action")
-
-        if tag == "input" and attr.get("name") == "authenticity_token":
-            token = attr.get("value")
-            if token:
-                self.reply_token = token
-
-    def handle_data(self, data: str):
-        if "user_id =" in data:
-            match = re.search(r"user_id\s*=\s*(\d+)", data)
-            if match:
-                self.current_user_id = match.group(1)
-
-        if self._post is not None and self._capture_author:
-            text = re.sub(r"\s+", " ", data).strip()
-            if text:
-                self._post["author_name"] = text
-
-        if self._post is not None and self._capture_content:
-            self._post["content"].append(data)
-
-        if self._capture_page_number:
-            try:
-                self.page_numbers.append(int(data.strip()))
-            except ValueError:
-                pass
-
-        if self._capture_active_page:
-            try:
-                self.page_numbers.append(int(data.strip()))
-            except ValueError:
-                pass
-
-    def handle_endtag(self, tag: str):
-        if self._capture_author and tag == "a":
-            self._capture_author = False
-
-        if self._capture_page_number and tag == "a":
-            self._capture_page_number = False
-
-        if self._capture_active_page and tag == "li":
-            self._capture_active_page = False
-
-        if self._post is not None and tag == "div":
-            if self._capture_content and self._post_depth == self._content_depth:
-                self._capture_content = False
-                self._content_depth = 0
-
-            self._post_depth -= 1
-            if self._post_depth <= 0:
-                self._finish_post()
-
-    def _finish_post(self) -> None:
-        if self._post is None:
-            return
-
-        post_id = self._post.get("post_id")
-        if post_id is None:
-            self._post = None
-            return
-
-        content = "".join(self._post.get("content") or [])
-        content = re.sub(r"\n\s*\n+", "\n", content)
-        content = re.sub(r"[ \t]+", " ", content).strip()
-        self.posts.append(
-            BoardBuildingPost(
-                post_id=int(post_id),
-                author_id=self._post.get("author_id"),
-                author_name=str(self._post.get("author_name") or "Unknown"),
-                created_at=str(self._post.get("created_at") or ""),
-                content=content,
-            )
-        )
-        self._post = None
-
-    def page(self) -> BoardPage:
-        return BoardPage(
-            posts=self.posts,
-            last_page=max(self.page_numbers or [1]),
-            current_user_id=self.current_user_id,
-            reply_action=self.reply_action,
-            reply_token=self.reply_token,
-        )
-
-
-def parse_building_board_page(html: str) -> BoardPage:
-    parser = BuildingBoardPageParser()
-    parser.feed(html or "")
-    return parser.page()
+BuildingBoardPageParser = BoardPageParser
+parse_building_board_page = parse_board_page
 
 
 class MissionChiefFormParser(HTMLParser):
@@ -2419,6 +2471,97 @@ def parse_missionchief_forms(html: str) -> List[MissionChiefForm]:
     return parser.forms
 
 
+class MissionChiefLinkParser(HTMLParser):
+    """Collect links and the Rails CSRF meta token from a MissionChief page."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links: List[Tuple[Dict[str, str], str]] = []
+        self.csrf_token = ""
+        self._link: Optional[Dict[str, str]] = None
+        self._link_text: List[str] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        attr = {key: value or "" for key, value in attrs}
+        if tag == "meta" and attr.get("name") == "csrf-token":
+            self.csrf_token = attr.get("content", "")
+        elif tag == "a":
+            self._link = attr
+            self._link_text = []
+
+    def handle_data(self, data: str):
+        if self._link is not None:
+            self._link_text.append(data)
+
+    def handle_endtag(self, tag: str):
+        if tag == "a" and self._link is not None:
+            self.links.append((self._link, "".join(self._link_text)))
+            self._link = None
+
+
+def missionchief_csrf_token(html: str) -> str:
+    """Return the page's CSRF token, from the meta tag or a form's authenticity_token."""
+    parser = MissionChiefLinkParser()
+    parser.feed(html or "")
+    if parser.csrf_token:
+        return parser.csrf_token
+    for form in parse_missionchief_forms(html):
+        token = form.fields.get("authenticity_token")
+        if token:
+            return token
+    return ""
+
+
+def _parse_credit_text(text: str) -> Optional[int]:
+    # Same first-run match as parseCredits in BUILDING_AUTOMATION_DIRECT_SCRIPT
+    match = re.search(r"([\d.,\s]+)", str(text or ""))
+    if not match:
+        return None
+    digits = re.sub(r"[^\d]", "", match.group(1))
+    return int(digits) if digits else None
+
+
+def extract_building_level(html: str) -> Optional[int]:
+    match = re.search(r"<dt><strong>Level:</strong></dt>\s*<dd>\s*(\d+)", str(html or ""), flags=re.IGNORECASE)
+    return int(match.group(1)) if match else None
+
+
+def building_tax_is_target(html: str, building_id: str, target_tax: int, target_tax_id: int) -> bool:
+    parser = MissionChiefLinkParser()
+    parser.feed(html or "")
+    href = f"/buildings/{building_id}/alliance_costs/{target_tax_id}"
+    for attrs, text in parser.links:
+        classes = attrs.get("class", "").split()
+        if attrs.get("href") != href or "btn" not in classes or "btn-alliance_costs" not in classes:
+            continue
+        return f"{target_tax}%" in " ".join(text.split()).lower() and "btn-success" in attrs.get("class", "").lower()
+    return False
+
+
+def extract_building_extension_offers(html: str, building_id: str) -> List[Dict[str, Any]]:
+    """Credit-priced extension links on a building page, one per extension id, by id."""
+    parser = MissionChiefLinkParser()
+    parser.feed(html or "")
+    pattern = re.compile(rf"^/buildings/{re.escape(str(building_id))}/extension/credits/(\d+)")
+    offers: Dict[int, Dict[str, Any]] = {}
+    for attrs, text in parser.links:
+        href = attrs.get("href", "")
+        match = pattern.match(href)
+        if not match:
+            continue
+        extension_id = int(match.group(1))
+        offers.setdefault(
+            extension_id,
+            {
+                "extId": extension_id,
+                "price": _parse_credit_text(text),
+                "href": href,
+                "label": " ".join((text or href).split()),
+            },
+        )
+    return [offers[key] for key in sorted(offers)]
+
+
 def _is_supported_board_maps_url(value: str) -> bool:
     try:
         parsed = urlparse(value.strip())
@@ -2461,6 +2604,17 @@ def _normalize_facility_text(text: str) -> str:
     return re.sub(r"\s+", " ", text).strip()
 
 
+_NORMALIZED_FACILITY_TERMS: Dict[str, str] = {}
+
+
+def _normalized_facility_term(term: str) -> str:
+    """Return ``_normalize_facility_text(term)`` for a fixed detection term, cached per term."""
+    normalized = _NORMALIZED_FACILITY_TERMS.get(term)
+    if normalized is None:
+        normalized = _NORMALIZED_FACILITY_TERMS[term] = _normalize_facility_text(term)
+    return normalized
+
+
 def _levenshtein_distance(left: str, right: str) -> int:
     """Return a small edit distance for short request words."""
     if left == right:
@@ -2613,12 +2767,17 @@ class LocationDetails:
     detected_facility_type: Optional[str] = None
 
 
+class GeocodeProviderError(Exception):
+    """A geocoding provider could not answer; unlike an empty result this is never cached."""
+
+
 class LocationParser:
     """Parse and geocode location inputs."""
     
-    # Rate limiting for Nominatim (1 req/sec)
-    _last_nominatim_call = 0
-    _nominatim_delay = 1.0
+    # Shared geocode cache, set by BuildingManager; without it lookups are uncached
+    geocode_cache = None
+    # Per-provider spacing used when no shared cache (and its limiter) is attached
+    _rate_limiter = ProviderRateLimiter()
     _health_keywords = {
         "hospital",
         "medical",
@@ -2938,14 +3097,22 @@ class LocationParser:
         if coords:
             lat, lon = coords
             coordinates_str = f"{lat}, {lon}"
-            geocode = await cls.reverse_geocode_details(lat, lon, google_key=google_key)
+            geocode = await cls._cached_geocode(
+                cls._geocode_namespace("reverse", google_key=google_key),
+                coordinates_str,
+                lambda: cls.reverse_geocode_details(lat, lon, google_key=google_key),
+            )
         else:
             geocode = None
             for query in cls._location_query_candidates(place_name, resolved_input):
-                geocode = await cls.forward_geocode_details(
+                geocode = await cls._cached_geocode(
+                    cls._geocode_namespace("forward", google_key=google_key, mapsco_key=mapsco_key),
                     query,
-                    google_key=google_key,
-                    mapsco_key=mapsco_key,
+                    lambda query=query: cls.forward_geocode_details(
+                        query,
+                        google_key=google_key,
+                        mapsco_key=mapsco_key,
+                    ),
                 )
                 if geocode and geocode.get("coordinates"):
                     break
@@ -2973,16 +3140,49 @@ class LocationParser:
             detected_facility_type=detected_facility_type,
         )
     
+    @staticmethod
+    def _geocode_namespace(
+        direction: str,
+        *,
+        google_key: Optional[str] = None,
+        mapsco_key: Optional[str] = None,
+    ) -> str:
+        """Cache namespace for a lookup; a new provider key starts from fresh answers."""
+        providers = [name for name, key in (("google", google_key), ("mapsco", mapsco_key)) if key]
+        if direction == "reverse":
+            providers = [name for name in providers if name == "google"]
+        return f"buildingmanager:{direction}:{'+'.join(['nominatim', *providers])}"
+
+    @classmethod
+    async def _cached_geocode(cls, namespace: str, query: str, fetch) -> Optional[dict]:
+        """Run ``fetch`` through the shared geocode cache when one is attached.
+
+        Only real answers are cached, including "no result"; a provider failure
+        returns None for this request and is retried on the next one.
+        """
+        cache = cls.geocode_cache
+        try:
+            if cache is None:
+                return await fetch()
+            details, _cached = await cache.lookup(namespace, query, fetch)
+        except GeocodeProviderError as exc:
+            log.warning("Geocoding %r failed: %s", query, exc)
+            return None
+        return details
+
+    @classmethod
+    async def _throttle(cls, provider: str) -> None:
+        """Respect the provider's request spacing, shared across cogs when possible."""
+        cache = cls.geocode_cache
+        if cache is not None:
+            await cache.throttle(provider)
+        else:
+            await cls._rate_limiter.wait(provider)
+
     @classmethod
     async def geocode_nominatim(cls, lat: float, lon: float) -> Optional[str]:
         """Reverse geocode using Nominatim."""
-        # Rate limiting
-        now = time.time()
-        elapsed = now - cls._last_nominatim_call
-        if elapsed < cls._nominatim_delay:
-            await asyncio.sleep(cls._nominatim_delay - elapsed)
-        
-        cls._last_nominatim_call = time.time()
+        await cls._throttle("nominatim")
         
         url = "https://nominatim.openstreetmap.org/reverse"
         params = {
@@ -3015,24 +3215,35 @@ class LocationParser:
         *,
         google_key: Optional[str] = None,
     ) -> Optional[dict]:
-        """Reverse geocode and return structured address details."""
-        details = await cls.reverse_geocode_nominatim_details(lat, lon)
-        if details:
-            return details
+        """Reverse geocode and return structured address details.
 
+        Raises GeocodeProviderError when no provider answered and at least one failed.
+        """
+        providers = [lambda: cls.reverse_geocode_nominatim_details(lat, lon)]
         if google_key:
-            return await cls.reverse_geocode_google_details(lat, lon, google_key)
+            providers.append(lambda: cls.reverse_geocode_google_details(lat, lon, google_key))
+        return await cls._first_geocode_details(providers)
+
+    @staticmethod
+    async def _first_geocode_details(providers) -> Optional[dict]:
+        """Return the first provider's details; an outright failure only counts if nobody answers."""
+        failure: Optional[GeocodeProviderError] = None
+        for provider in providers:
+            try:
+                details = await provider()
+            except GeocodeProviderError as exc:
+                failure = exc
+                continue
+            if details:
+                return details
+        if failure is not None:
+            raise failure
         return None
 
     @classmethod
     async def reverse_geocode_nominatim_details(cls, lat: float, lon: float) -> Optional[dict]:
         """Reverse geocode using Nominatim with country and region details."""
-        now = time.time()
-        elapsed = now - cls._last_nominatim_call
-        if elapsed < cls._nominatim_delay:
-            await asyncio.sleep(cls._nominatim_delay - elapsed)
-
-        cls._last_nominatim_call = time.time()
+        await cls._throttle("nominatim")
 
         url = "https://nominatim.openstreetmap.org/reverse"
         params = {
@@ -3049,11 +3260,13 @@ class LocationParser:
             async with aiohttp.ClientSession() as session:
                 async with session.get(url, params=params, headers=headers, timeout=10) as resp:
                     if resp.status != 200:
-                        return None
+                        raise GeocodeProviderError(f"Nominatim reverse returned HTTP {resp.status}")
                     data = await resp.json()
+        except GeocodeProviderError:
+            raise
         except Exception as e:
             log.warning("Nominatim structured reverse geocoding failed: %r", e)
-            return None
+            raise GeocodeProviderError(f"Nominatim reverse failed: {e!r}") from e
 
         return cls._nominatim_result_to_details(data)
 
@@ -3065,26 +3278,22 @@ class LocationParser:
         google_key: Optional[str] = None,
         mapsco_key: Optional[str] = None,
     ) -> Optional[dict]:
-        """Forward geocode text or place names."""
+        """Forward geocode text or place names.
+
+        Raises GeocodeProviderError when no provider answered and at least one failed.
+        """
+        providers = []
         if google_key:
-            details = await cls.forward_geocode_google_details(query, google_key)
-            if details:
-                return details
+            providers.append(lambda: cls.forward_geocode_google_details(query, google_key))
         if mapsco_key:
-            details = await cls.forward_geocode_mapsco_details(query, mapsco_key)
-            if details:
-                return details
-        return await cls.forward_geocode_nominatim_details(query)
+            providers.append(lambda: cls.forward_geocode_mapsco_details(query, mapsco_key))
+        providers.append(lambda: cls.forward_geocode_nominatim_details(query))
+        return await cls._first_geocode_details(providers)
 
     @classmethod
     async def forward_geocode_nominatim_details(cls, query: str) -> Optional[dict]:
         """Forward geocode using Nominatim for addresses or place names."""
-        now = time.time()
-        elapsed = now - cls._last_nominatim_call
-        if elapsed < cls._nominatim_delay:
-            await asyncio.sleep(cls._nominatim_delay - elapsed)
-
-        cls._last_nominatim_call = time.time()
+        await cls._throttle("nominatim")
 
         url = "https://nominatim.openstreetmap.org/search"
         params = {
@@ -3102,11 +3311,13 @@ class LocationParser:
             async with aiohttp.ClientSession() as session:
                 async with session.get(url, params=params, headers=headers, timeout=10) as resp:
                     if resp.status != 200:
-                        return None
+                        raise GeocodeProviderError(f"Nominatim search returned HTTP {resp.status}")
                     data = await resp.json()
+        except GeocodeProviderError:
+            raise
         except Exception as e:
             log.warning("Nominatim structured forward geocoding failed: %r", e)
-            return None
+            raise GeocodeProviderError(f"Nominatim search failed: {e!r}") from e
 
         if not data:
             return None
@@ -3129,6 +3340,7 @@ class LocationParser:
         }
         timeout = aiohttp.ClientTimeout(total=GEOCODE_MAPS_TIMEOUT_SECONDS)
 
+        await cls._throttle("geocode.maps.co")
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.get(
@@ -3139,11 +3351,13 @@ class LocationParser:
                 ) as resp:
                     if resp.status != 200:
                         log.warning("geocode.maps.co returned HTTP %s for BuildingManager query %r", resp.status, query)
-                        return None
+                        raise GeocodeProviderError(f"geocode.maps.co returned HTTP {resp.status}")
                     data = await resp.json(content_type=None)
+        except GeocodeProviderError:
+            raise
         except Exception as e:
             log.warning("geocode.maps.co forward geocoding failed: %r", e)
-            return None
+            raise GeocodeProviderError(f"geocode.maps.co failed: {e!r}") from e
 
         if not data:
             return None
@@ -3174,17 +3388,26 @@ class LocationParser:
     @staticmethod
     async def _google_geocode_details(url: str, params: dict) -> Optional[dict]:
         """Run a Google geocoding request and normalize the first result."""
+        await LocationParser._throttle("google")
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.get(url, params=params, timeout=10) as resp:
                     if resp.status != 200:
-                        return None
+                        raise GeocodeProviderError(f"Google geocoding returned HTTP {resp.status}")
                     data = await resp.json()
+        except GeocodeProviderError:
+            raise
         except Exception as e:
             log.warning("Google structured geocoding failed: %r", e)
-            return None
+            raise GeocodeProviderError(f"Google geocoding failed: {e!r}") from e
 
-        if data.get("status") != "OK" or not data.get("results"):
+        status = data.get("status")
+        if status == "ZERO_RESULTS":
+            return None
+        if status != "OK":
+            # OVER_QUERY_LIMIT, REQUEST_DENIED and UNKNOWN_ERROR say nothing about the address
+            raise GeocodeProviderError(f"Google geocoding returned status {status}")
+        if not data.get("results"):
             return None
         return LocationParser._google_result_to_details(data["results"][0])
 
@@ -3272,7 +3495,8 @@ class LocationParser:
     @staticmethod
     def _contains_facility_term(text: str, terms: Iterable[str]) -> bool:
         searchable = f" {text} "
-        return any(f" {_normalize_facility_text(term)} " in searchable for term in terms)
+        # Normalizing the fixed term lists on every call dominated Overpass imports
+        return any(f" {_normalized_facility_term(term)} " in searchable for term in terms)
 
     @classmethod
     def detect_supported_building_type(
@@ -3344,6 +3568,7 @@ class LocationParser:
             "key": api_key
         }
         
+        await LocationParser._throttle("google")
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.get(url, params=params, timeout=10) as resp:
@@ -3356,6 +3581,119 @@ class LocationParser:
         
         return None
 
+# ---------- Statistics counters ----------
+
+# (scope, subject_id, building_type, bucket, day); 0, '' and '' mean "all" in the last four
+StatKey = Tuple[str, int, str, str, str]
+
+
+@dataclass
+class StatDelta:
+    """One change to a building_stats counter row."""
+
+    key: StatKey
+    count: int = 1
+    label: str = ""
+    seconds: Optional[int] = None
+
+
+def _stats_day(timestamp: int) -> str:
+    return datetime.fromtimestamp(int(timestamp), timezone.utc).strftime("%Y-%m-%d")
+
+
+def _stat_deltas(
+    scope: str,
+    subjects: Iterable[Tuple[int, str]],
+    building_type: Optional[str],
+    buckets: Iterable[str],
+    *,
+    count: int = 1,
+    day: str = "",
+    seconds: Optional[int] = None,
+) -> List[StatDelta]:
+    """Deltas for every subject/type rollup of ``buckets``: the row itself and its "all" rows.
+
+    Subject labels (usernames for the top lists) are kept on the total rows only.
+    """
+    types = [""] if not building_type else [str(building_type), ""]
+    return [
+        StatDelta((scope, int(subject), type_key, str(bucket), day), count, label if not bucket else "", seconds)
+        for subject, label in subjects
+        for type_key in types
+        for bucket in dict.fromkeys(buckets)
+    ]
+
+
+def _request_stat_deltas(
+    user_id: int,
+    username: Optional[str],
+    building_type: str,
+    status: str,
+    created_at: int,
+) -> List[StatDelta]:
+    """Counters a new request adds: its totals, its status and its submission day."""
+    subjects = [(int(user_id), str(username or "")), (0, "")]
+    return [
+        *_stat_deltas(STATS_SCOPE_REQUESTS, subjects, building_type, ["", str(status)]),
+        *_stat_deltas(STATS_SCOPE_REQUESTS, [(0, "")], building_type, [""], day=_stats_day(created_at)),
+    ]
+
+
+def _status_change_stat_deltas(user_id: int, building_type: str, old_status: str, new_status: str) -> List[StatDelta]:
+    """Move a request from one status counter to another."""
+    if old_status == new_status:
+        return []
+    subjects = [(int(user_id), ""), (0, "")]
+    return [
+        *_stat_deltas(STATS_SCOPE_REQUESTS, subjects, building_type, [str(old_status)], count=-1),
+        *_stat_deltas(STATS_SCOPE_REQUESTS, subjects, building_type, [str(new_status)]),
+    ]
+
+
+def _action_stat_deltas(
+    *,
+    admin_user_id: Optional[int],
+    admin_username: Optional[str],
+    action_type: str,
+    denial_reason: Optional[str],
+    timestamp: int,
+    request: Optional[Tuple[int, str, int]],
+) -> List[StatDelta]:
+    """Counters one logged action adds; ``request`` is (user_id, building_type, created_at) when it exists."""
+    subjects = [(0, "")]
+    if admin_user_id is not None:
+        subjects.insert(0, (int(admin_user_id), str(admin_username or "")))
+    building_type = request[1] if request else None
+    seconds = None
+    if request and action_type in STATS_RESPONSE_ACTIONS:
+        seconds = int(timestamp) - int(request[2])
+    deltas = [
+        *_stat_deltas(STATS_SCOPE_ACTIONS, subjects, building_type, [""]),
+        *_stat_deltas(STATS_SCOPE_ACTIONS, subjects, building_type, [str(action_type)], seconds=seconds),
+        *_stat_deltas(STATS_SCOPE_ACTIONS, [(0, "")], None, [str(action_type)], day=_stats_day(timestamp)),
+    ]
+    if action_type == "denied":
+        reason = str(denial_reason or "")
+        if request:
+            deltas.extend(_stat_deltas(STATS_SCOPE_USER_DENIALS, [(request[0], "")], None, [reason]))
+            deltas.append(StatDelta((STATS_SCOPE_TYPE_DENIALS, 0, str(request[1]), reason, "")))
+        if admin_user_id is not None:
+            deltas.extend(_stat_deltas(STATS_SCOPE_ADMIN_DENIALS, [(int(admin_user_id), "")], None, [reason]))
+    return deltas
+
+
+def _merge_stat_delta(rows: Dict[StatKey, List[Any]], delta: StatDelta) -> None:
+    """Apply a delta to in-memory rows [count, timed_count, total_seconds, min, max, label], as the upsert does."""
+    row = rows.setdefault(delta.key, [0, 0, 0, None, None, ""])
+    row[0] += delta.count
+    if delta.seconds is not None:
+        row[1] += 1
+        row[2] += delta.seconds
+        row[3] = delta.seconds if row[3] is None else min(row[3], delta.seconds)
+        row[4] = delta.seconds if row[4] is None else max(row[4], delta.seconds)
+    if delta.label:
+        row[5] = delta.label
+
 # ---------- Database ----------
 
 class BuildingDatabase:
@@ -3405,17 +3743,6 @@ class BuildingDatabase:
             )
         ''')
         
-        # Geocoding cache table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS geocoding_cache (
-                location_input TEXT PRIMARY KEY,
-                coordinates TEXT,
-                address TEXT,
-                provider TEXT,
-                cached_at INTEGER
-            )
-        ''')
-        
         # Building types table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS building_types (
@@ -3476,6 +3803,12 @@ class BuildingDatabase:
             )
         ''')
 
+        # Candidate sampling seeks by type, status and id without touching the table rows
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_building_auto_candidates_eligible
+            ON building_auto_candidates (building_type, status, candidate_id)
+        ''')
+
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS building_auto_runs (
                 run_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -3511,9 +3844,67 @@ class BuildingDatabase:
                 updated_at INTEGER NOT NULL
             )
         ''')
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS building_stats (
+                guild_id INTEGER NOT NULL,
+                scope TEXT NOT NULL,
+                subject_id INTEGER NOT NULL DEFAULT 0,
+                building_type TEXT NOT NULL DEFAULT '',
+                bucket TEXT NOT NULL DEFAULT '',
+                day TEXT NOT NULL DEFAULT '',
+                count INTEGER NOT NULL DEFAULT 0,
+                timed_count INTEGER NOT NULL DEFAULT 0,
+                total_seconds INTEGER NOT NULL DEFAULT 0,
+                min_seconds INTEGER,
+                max_seconds INTEGER,
+                label TEXT NOT NULL DEFAULT '',
+                PRIMARY KEY (guild_id, scope, subject_id, building_type, bucket, day)
+            )
+        ''')
+        # Top-N lists walk this index from the largest count instead of sorting every subject
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_building_stats_ranking
+            ON building_stats (guild_id, scope, building_type, bucket, day, count)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_building_requests_user_created
+            ON building_requests (guild_id, user_id, created_at)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_building_actions_admin_timestamp
+            ON building_actions (guild_id, admin_user_id, timestamp)
+        ''')
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS building_auto_overpass_imports (
+                import_key TEXT PRIMARY KEY,
+                building_type TEXT NOT NULL,
+                tile_count INTEGER NOT NULL,
+                next_tile INTEGER NOT NULL DEFAULT 0,
+                status TEXT NOT NULL,
+                source_elements INTEGER NOT NULL DEFAULT 0,
+                accepted INTEGER NOT NULL DEFAULT 0,
+                rejected INTEGER NOT NULL DEFAULT 0,
+                duplicates INTEGER NOT NULL DEFAULT 0,
+                inserted INTEGER NOT NULL DEFAULT 0,
+                updated INTEGER NOT NULL DEFAULT 0,
+                skipped INTEGER NOT NULL DEFAULT 0,
+                reason TEXT,
+                started_at INTEGER NOT NULL,
+                updated_at INTEGER NOT NULL
+            )
+        ''')
         
         conn.commit()
+        # Databases from before the counters existed: fill them once from history
+        cursor.execute("SELECT 1 FROM building_stats LIMIT 1")
+        needs_counters = cursor.fetchone() is None
+        cursor.execute("SELECT 1 FROM building_requests LIMIT 1")
+        needs_counters = needs_counters and cursor.fetchone() is not None
         conn.close()
+        if needs_counters:
+            self.rebuild_stats()
     
     def add_request(self, guild_id: int, user_id: int, username: str, building_type: str,
                    building_name: str, location_input: str, coordinates: Optional[str],
@@ -3532,6 +3923,7 @@ class BuildingDatabase:
               coordinates, address, notes, now, now))
         
         request_id = cursor.lastrowid
+        self._apply_stat_deltas(cursor, guild_id, _request_stat_deltas(user_id, username, building_type, "pending", now))
         conn.commit()
         conn.close()
         
@@ -3541,12 +3933,26 @@ class BuildingDatabase:
         """Update request status."""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
+        # Read the old status in the write transaction so the counters cannot miss a change
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute(
+            "SELECT guild_id, user_id, building_type, status FROM building_requests WHERE request_id = ?",
+            (request_id,),
+        )
+        previous = cursor.fetchone()
         
         cursor.execute('''
             UPDATE building_requests 
             SET status = ?, updated_at = ?
             WHERE request_id = ?
         ''', (status, ts(), request_id))
+        if previous:
+            guild_id, user_id, building_type, old_status = previous
+            self._apply_stat_deltas(
+                cursor,
+                guild_id,
+                _status_change_stat_deltas(user_id, building_type, old_status, status),
+            )
         
         conn.commit()
         conn.close()
@@ -3594,6 +4000,7 @@ class BuildingDatabase:
         """Log an action on a request."""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
+        now = ts()
         
         cursor.execute('''
             INSERT INTO building_actions
@@ -3601,41 +4008,28 @@ class BuildingDatabase:
              denial_reason, previous_values, timestamp)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         ''', (request_id, guild_id, admin_user_id, admin_username, action_type,
-              denial_reason, previous_values, ts()))
+              denial_reason, previous_values, now))
+        cursor.execute(
+            "SELECT user_id, building_type, created_at FROM building_requests WHERE request_id = ?",
+            (request_id,),
+        )
+        request = cursor.fetchone()
+        self._apply_stat_deltas(
+            cursor,
+            guild_id,
+            _action_stat_deltas(
+                admin_user_id=admin_user_id,
+                admin_username=admin_username,
+                action_type=action_type,
+                denial_reason=denial_reason,
+                timestamp=now,
+                request=request,
+            ),
+        )
         
         conn.commit()
         conn.close()
     
-    def get_cached_geocode(self, location_input: str) -> Optional[Tuple[str, str, str]]:
-        """Get cached geocoding result."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT coordinates, address, provider 
-            FROM geocoding_cache 
-            WHERE location_input = ?
-        ''', (location_input,))
-        
-        result = cursor.fetchone()
-        conn.close()
-        
-        return result if result else None
-    
-    def cache_geocode(self, location_input: str, coordinates: str, address: str, provider: str):
-        """Cache geocoding result."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO geocoding_cache
-            (location_input, coordinates, address, provider, cached_at)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (location_input, coordinates, address, provider, ts()))
-        
-        conn.commit()
-        conn.close()
-
     @staticmethod
     def _candidate_row_to_model(row: sqlite3.Row) -> AutoBuildCandidate:
         """Convert a candidate row to a typed model."""
@@ -3756,25 +4150,94 @@ class BuildingDatabase:
         conn.close()
         return stats
 
-    def get_random_auto_candidates(self, building_type: str, *, limit: int = 25) -> List[AutoBuildCandidate]:
-        """Return random available candidates for one building type."""
+    def sample_auto_candidate_ids(
+        self,
+        building_type: str,
+        *,
+        limit: int = 25,
+        rng: Optional[random.Random] = None,
+    ) -> List[int]:
+        """Return up to ``limit`` random available candidate ids for one building type.
+
+        ``ORDER BY RANDOM()`` sorted every eligible row per call. This draws random
+        points in the eligible id range and takes the next eligible id after each,
+        one index seek apiece on ``idx_building_auto_candidates_eligible``, so the
+        cost follows ``limit`` rather than the table size. Ids after a long gap of
+        used or purged candidates are somewhat more likely; when the draws come up
+        short, a contiguous run from a random point fills the rest.
+        """
+        rng = rng or random
+        limit = int(limit)
+        building_type = str(building_type)
         conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
-        cursor.execute(
-            '''
-            SELECT *
+        # Separate MIN and MAX queries each resolve to a single seek at one end of the index
+        bounds = []
+        for aggregate in ("MIN", "MAX"):
+            cursor.execute(
+                f'''
+                SELECT {aggregate}(candidate_id)
+                FROM building_auto_candidates
+                WHERE building_type = ? AND status = 'available'
+                ''',
+                (building_type,),
+            )
+            bounds.append(cursor.fetchone()[0])
+        low, high = bounds
+        if low is None or limit <= 0:
+            conn.close()
+            return []
+
+        next_eligible = '''
+            SELECT candidate_id
             FROM building_auto_candidates
-            WHERE building_type = ?
-              AND status = 'available'
-            ORDER BY RANDOM()
+            WHERE building_type = ? AND status = 'available' AND candidate_id >= ?
+            ORDER BY candidate_id
             LIMIT ?
-            ''',
-            (str(building_type), int(limit)),
+        '''
+        sampled: Dict[int, None] = {}
+        for _attempt in range(limit * 2):
+            if len(sampled) >= limit:
+                break
+            cursor.execute(next_eligible, (building_type, rng.randint(low, high), 1))
+            row = cursor.fetchone()
+            if row:
+                sampled[int(row[0])] = None
+        if len(sampled) < limit:
+            # Few eligible rows, or clustered ones: walk from a random point and wrap around
+            start = rng.randint(low, high)
+            cursor.execute(next_eligible, (building_type, start, limit * 2))
+            run = [int(row[0]) for row in cursor.fetchall()]
+            cursor.execute(next_eligible, (building_type, low, limit * 2))
+            run.extend(int(row[0]) for row in cursor.fetchall() if int(row[0]) < start)
+            for candidate_id in run:
+                if len(sampled) >= limit:
+                    break
+                sampled.setdefault(candidate_id, None)
+        conn.close()
+        return list(sampled)
+
+    def get_auto_candidates(self, candidate_ids: Iterable[int]) -> List[AutoBuildCandidate]:
+        """Return the given candidates, in the given order, skipping unknown ids."""
+        ids = [int(candidate_id) for candidate_id in candidate_ids]
+        if not ids:
+            return []
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute(
+            f"SELECT * FROM building_auto_candidates WHERE candidate_id IN ({', '.join('?' for _ in ids)})",
+            ids,
         )
-        rows = cursor.fetchall()
+        by_id = {int(row["candidate_id"]): self._candidate_row_to_model(row) for row in cursor.fetchall()}
         conn.close()
-        return [self._candidate_row_to_model(row) for row in rows]
+        return [by_id[candidate_id] for candidate_id in ids if candidate_id in by_id]
+
+    def get_random_auto_candidates(self, building_type: str, *, limit: int = 25) -> List[AutoBuildCandidate]:
+        """Return random available candidates for one building type."""
+        candidate_ids = self.sample_auto_candidate_ids(building_type, limit=limit)
+        random.shuffle(candidate_ids)
+        return self.get_auto_candidates(candidate_ids)
 
     def get_auto_candidate(self, candidate_id: int) -> Optional[AutoBuildCandidate]:
         """Return one automatic build candidate."""
@@ -3855,6 +4318,76 @@ class BuildingDatabase:
         conn.commit()
         conn.close()
 
+    def get_auto_overpass_import(self, import_key: str) -> Optional[Dict[str, Any]]:
+        """Return the progress cursor of one tiled Overpass import."""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT * FROM building_auto_overpass_imports WHERE import_key = ?",
+            (str(import_key),),
+        )
+        row = cursor.fetchone()
+        conn.close()
+        return dict(row) if row else None
+
+    def record_auto_overpass_import(
+        self,
+        *,
+        import_key: str,
+        building_type: str,
+        tile_count: int,
+        next_tile: int,
+        status: str,
+        stats: Dict[str, int],
+        reason: Optional[str] = None,
+    ) -> None:
+        """Store how far a tiled Overpass import got and its running totals."""
+        now = ts()
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute(
+            '''
+            INSERT INTO building_auto_overpass_imports
+            (import_key, building_type, tile_count, next_tile, status, source_elements, accepted,
+             rejected, duplicates, inserted, updated, skipped, reason, started_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(import_key) DO UPDATE SET
+                building_type = excluded.building_type,
+                tile_count = excluded.tile_count,
+                next_tile = excluded.next_tile,
+                status = excluded.status,
+                source_elements = excluded.source_elements,
+                accepted = excluded.accepted,
+                rejected = excluded.rejected,
+                duplicates = excluded.duplicates,
+                inserted = excluded.inserted,
+                updated = excluded.updated,
+                skipped = excluded.skipped,
+                reason = excluded.reason,
+                updated_at = excluded.updated_at
+            ''',
+            (
+                str(import_key),
+                str(building_type),
+                int(tile_count),
+                int(next_tile),
+                str(status),
+                int(stats.get("source_elements", 0)),
+                int(stats.get("accepted", 0)),
+                int(stats.get("rejected", 0)),
+                int(stats.get("duplicates", 0)),
+                int(stats.get("inserted", 0)),
+                int(stats.get("updated", 0)),
+                int(stats.get("skipped", 0)),
+                _truncate_text(reason, 900) if reason else None,
+                now,
+                now,
+            ),
+        )
+        conn.commit()
+        conn.close()
+
     def purge_geofabrik_auto_candidates(self, *, include_used: bool = False) -> Dict[str, int]:
         """Remove imported Geofabrik candidates and reset extract import history."""
         conn = sqlite3.connect(self.db_path)
@@ -4113,6 +4646,22 @@ class BuildingDatabase:
         conn.close()
         return [self._automation_row_to_job(row) for row in rows]
 
+    def get_pending_automation_jobs(self) -> List[BuildingAutomationJob]:
+        """Return every automation job that still has work left, due or not."""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute(
+            '''
+            SELECT * FROM building_automation_jobs
+            WHERE status IN ('queued', 'waiting', 'failed')
+            ORDER BY next_run_at ASC, job_id ASC
+            '''
+        )
+        rows = cursor.fetchall()
+        conn.close()
+        return [self._automation_row_to_job(row) for row in rows]
+
     def get_recent_automation_jobs(self, guild_id: int, *, limit: int = 10) -> List[BuildingAutomationJob]:
         """Return recent automation jobs for admin status output."""
         conn = sqlite3.connect(self.db_path)
@@ -4197,60 +4746,260 @@ class BuildingDatabase:
         conn.commit()
         conn.close()
     
+    @staticmethod
+    def _apply_stat_deltas(cursor: sqlite3.Cursor, guild_id: int, deltas: Iterable[StatDelta]) -> None:
+        """Upsert counter deltas on the caller's cursor, inside its transaction."""
+        cursor.executemany(
+            '''
+            INSERT INTO building_stats
+            (guild_id, scope, subject_id, building_type, bucket, day, count, timed_count,
+             total_seconds, min_seconds, max_seconds, label)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(guild_id, scope, subject_id, building_type, bucket, day) DO UPDATE SET
+                count = building_stats.count + excluded.count,
+                timed_count = building_stats.timed_count + excluded.timed_count,
+                total_seconds = building_stats.total_seconds + excluded.total_seconds,
+                min_seconds = CASE
+                    WHEN excluded.min_seconds IS NULL THEN building_stats.min_seconds
+                    WHEN building_stats.min_seconds IS NULL THEN excluded.min_seconds
+                    ELSE MIN(building_stats.min_seconds, excluded.min_seconds)
+                END,
+                max_seconds = CASE
+                    WHEN excluded.max_seconds IS NULL THEN building_stats.max_seconds
+                    WHEN building_stats.max_seconds IS NULL THEN excluded.max_seconds
+                    ELSE MAX(building_stats.max_seconds, excluded.max_seconds)
+                END,
+                label = CASE WHEN excluded.label != '' THEN excluded.label ELSE building_stats.label END
+            ''',
+            [
+                (
+                    int(guild_id),
+                    *delta.key,
+                    int(delta.count),
+                    0 if delta.seconds is None else 1,
+                    int(delta.seconds or 0),
+                    delta.seconds,
+                    delta.seconds,
+                    delta.label,
+                )
+                for delta in deltas
+            ],
+        )
+
+    @staticmethod
+    def _stats_from_history(cursor: sqlite3.Cursor) -> Dict[Tuple[int, StatKey], List[Any]]:
+        """Recompute every counter row from building_requests and building_actions."""
+        rows_by_guild: Dict[int, Dict[StatKey, List[Any]]] = {}
+        requests: Dict[int, Tuple[int, str, int]] = {}
+        cursor.execute(
+            '''
+            SELECT request_id, guild_id, user_id, username, building_type, status, created_at
+            FROM building_requests
+            ORDER BY request_id
+            '''
+        )
+        for request_id, guild_id, user_id, username, building_type, status, created_at in cursor.fetchall():
+            requests[int(request_id)] = (int(user_id), str(building_type), int(created_at))
+            rows = rows_by_guild.setdefault(int(guild_id), {})
+            for delta in _request_stat_deltas(user_id, username, building_type, status, created_at):
+                _merge_stat_delta(rows, delta)
+        cursor.execute(
+            '''
+            SELECT request_id, guild_id, admin_user_id, admin_username, action_type, denial_reason, timestamp
+            FROM building_actions
+            ORDER BY action_id
+            '''
+        )
+        for request_id, guild_id, admin_user_id, admin_username, action_type, denial_reason, timestamp in cursor.fetchall():
+            rows = rows_by_guild.setdefault(int(guild_id), {})
+            deltas = _action_stat_deltas(
+                admin_user_id=admin_user_id,
+                admin_username=admin_username,
+                action_type=action_type,
+                denial_reason=denial_reason,
+                timestamp=timestamp,
+                request=requests.get(int(request_id)) if request_id is not None else None,
+            )
+            for delta in deltas:
+                _merge_stat_delta(rows, delta)
+        return {
+            (guild_id, key): row
+            for guild_id, rows in rows_by_guild.items()
+            for key, row in rows.items()
+        }
+
+    @staticmethod
+    def _stored_stats(cursor: sqlite3.Cursor) -> Dict[Tuple[int, StatKey], List[Any]]:
+        cursor.execute(
+            '''
+            SELECT guild_id, scope, subject_id, building_type, bucket, day, count, timed_count,
+                   total_seconds, min_seconds, max_seconds, label
+            FROM building_stats
+            '''
+        )
+        return {
+            (int(row[0]), (str(row[1]), int(row[2]), str(row[3]), str(row[4]), str(row[5]))): list(row[6:])
+            for row in cursor.fetchall()
+        }
+
+    @staticmethod
+    def _stats_mismatches(
+        stored: Dict[Tuple[int, StatKey], List[Any]],
+        expected: Dict[Tuple[int, StatKey], List[Any]],
+    ) -> int:
+        # A status counter that dropped back to zero stays as a row; history has no row for it
+        live_stored = {key: row for key, row in stored.items() if row[0] or row[1]}
+        live_expected = {key: row for key, row in expected.items() if row[0] or row[1]}
+        return sum(1 for key in live_stored.keys() | live_expected.keys() if live_stored.get(key) != live_expected.get(key))
+
+    def verify_stats(self) -> Dict[str, int]:
+        """Compare the counters with a recount of the raw history."""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        expected = self._stats_from_history(cursor)
+        stored = self._stored_stats(cursor)
+        conn.close()
+        return {"rows": len(expected), "mismatched": self._stats_mismatches(stored, expected)}
+
+    def rebuild_stats(self) -> Dict[str, int]:
+        """Replace the counters with a recount of the raw history and report how many rows had drifted."""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        # No request can change between the recount and the replacement
+        cursor.execute("BEGIN IMMEDIATE")
+        expected = self._stats_from_history(cursor)
+        mismatched = self._stats_mismatches(self._stored_stats(cursor), expected)
+        cursor.execute("DELETE FROM building_stats")
+        cursor.executemany(
+            '''
+            INSERT INTO building_stats
+            (guild_id, scope, subject_id, building_type, bucket, day, count, timed_count,
+             total_seconds, min_seconds, max_seconds, label)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''',
+            [(guild_id, *key, *row) for (guild_id, key), row in expected.items() if row[0] or row[1]],
+        )
+        conn.commit()
+        conn.close()
+        return {"rows": len(expected), "mismatched": mismatched}
+
+    @staticmethod
+    def _stat_counts(
+        cursor: sqlite3.Cursor,
+        guild_id: int,
+        scope: str,
+        subject_id: int,
+        building_type: str,
+    ) -> Dict[str, int]:
+        """Bucket -> count for one subject/type, leaving out the total row and empty buckets."""
+        cursor.execute(
+            '''
+            SELECT bucket, count
+            FROM building_stats
+            WHERE guild_id = ? AND scope = ? AND subject_id = ? AND building_type = ? AND day = ''
+              AND bucket != '' AND count > 0
+            ''',
+            (guild_id, scope, subject_id, building_type),
+        )
+        return dict(cursor.fetchall())
+
+    @staticmethod
+    def _stat_type_counts(cursor: sqlite3.Cursor, guild_id: int, scope: str, subject_id: int) -> List[Tuple[str, str, int]]:
+        """(building type, bucket, count) rows for one subject."""
+        cursor.execute(
+            '''
+            SELECT building_type, bucket, count
+            FROM building_stats
+            WHERE guild_id = ? AND scope = ? AND subject_id = ? AND building_type != '' AND day = ''
+              AND bucket != '' AND count > 0
+            ORDER BY building_type, bucket
+            ''',
+            (guild_id, scope, subject_id),
+        )
+        return cursor.fetchall()
+
+    @staticmethod
+    def _stat_top_subjects(
+        cursor: sqlite3.Cursor,
+        guild_id: int,
+        scope: str,
+        building_type: str = "",
+        limit: int = 5,
+    ) -> List[Tuple[str, int]]:
+        """(label, count) of the subjects with the highest totals."""
+        cursor.execute(
+            '''
+            SELECT label, count
+            FROM building_stats
+            WHERE guild_id = ? AND scope = ? AND building_type = ? AND bucket = '' AND day = ''
+              AND subject_id != 0 AND count > 0
+            ORDER BY count DESC
+            LIMIT ?
+            ''',
+            (guild_id, scope, building_type, int(limit)),
+        )
+        return cursor.fetchall()
+
+    @staticmethod
+    def _stat_reasons(
+        cursor: sqlite3.Cursor,
+        guild_id: int,
+        scope: str,
+        subject_id: int,
+        building_type: str = "",
+    ) -> List[Tuple[Optional[str], int]]:
+        """(denial reason, count), most common first; an empty bucket is a denial without a reason."""
+        cursor.execute(
+            '''
+            SELECT bucket, count
+            FROM building_stats
+            WHERE guild_id = ? AND scope = ? AND subject_id = ? AND building_type = ? AND day = ''
+              AND count > 0
+            ORDER BY count DESC
+            ''',
+            (guild_id, scope, subject_id, building_type),
+        )
+        return [(reason or None, count) for reason, count in cursor.fetchall()]
+
+    @staticmethod
+    def _stat_response_times(cursor: sqlite3.Cursor, guild_id: int, subject_id: int) -> Tuple[Optional[float], Optional[int], Optional[int]]:
+        """(average, fastest, slowest) seconds from request to approval or denial."""
+        cursor.execute(
+            '''
+            SELECT SUM(timed_count), SUM(total_seconds), MIN(min_seconds), MAX(max_seconds)
+            FROM building_stats
+            WHERE guild_id = ? AND scope = ? AND subject_id = ? AND building_type = '' AND day = ''
+              AND bucket IN (?, ?)
+            ''',
+            (guild_id, STATS_SCOPE_ACTIONS, subject_id, *STATS_RESPONSE_ACTIONS),
+        )
+        timed, total, fastest, slowest = cursor.fetchone()
+        if not timed:
+            return None, None, None
+        return total / timed, fastest, slowest
+
     def get_stats_overall(self, guild_id: int) -> dict:
         """Get overall statistics."""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
-        # Total counts by status
-        cursor.execute('''
-            SELECT status, COUNT(*) 
-            FROM building_requests 
-            WHERE guild_id = ?
-            GROUP BY status
-        ''', (guild_id,))
-        status_counts = dict(cursor.fetchall())
-        
-        # By building type
-        cursor.execute('''
-            SELECT building_type, status, COUNT(*)
-            FROM building_requests
-            WHERE guild_id = ?
-            GROUP BY building_type, status
-        ''', (guild_id,))
-        type_stats = cursor.fetchall()
-        
-        # Top requesters
-        cursor.execute('''
-            SELECT username, COUNT(*) as count
-            FROM building_requests
-            WHERE guild_id = ?
-            GROUP BY user_id
-            ORDER BY count DESC
-            LIMIT 5
-        ''', (guild_id,))
-        top_requesters = cursor.fetchall()
-        
-        # Top admins
-        cursor.execute('''
-            SELECT admin_username, COUNT(*) as count
-            FROM building_actions
-            WHERE guild_id = ? AND admin_user_id IS NOT NULL
-            GROUP BY admin_user_id
-            ORDER BY count DESC
-            LIMIT 5
-        ''', (guild_id,))
-        top_admins = cursor.fetchall()
+        status_counts = self._stat_counts(cursor, guild_id, STATS_SCOPE_REQUESTS, 0, "")
+        type_stats = self._stat_type_counts(cursor, guild_id, STATS_SCOPE_REQUESTS, 0)
+        top_requesters = self._stat_top_subjects(cursor, guild_id, STATS_SCOPE_REQUESTS)
+        top_admins = self._stat_top_subjects(cursor, guild_id, STATS_SCOPE_ACTIONS)
+        avg_response_time, _fastest, _slowest = self._stat_response_times(cursor, guild_id, 0)
         
-        # Average response time
+        # Daily rollups for the recent window
+        first_day = _stats_day(ts() - (STATS_RECENT_DAYS - 1) * 86400)
         cursor.execute('''
-            SELECT AVG(ba.timestamp - br.created_at) as avg_time
-            FROM building_requests br
-            JOIN building_actions ba ON br.request_id = ba.request_id
-            WHERE br.guild_id = ? AND ba.action_type IN ('approved', 'denied')
-        ''', (guild_id,))
-        avg_response_result = cursor.fetchone()
-        avg_response_time = avg_response_result[0] if avg_response_result[0] else 0
+            SELECT scope, bucket, SUM(count)
+            FROM building_stats
+            WHERE guild_id = ? AND subject_id = 0 AND building_type = '' AND day >= ?
+              AND ((scope = ? AND bucket = '') OR (scope = ? AND bucket IN (?, ?)))
+            GROUP BY scope, bucket
+        ''', (guild_id, first_day, STATS_SCOPE_REQUESTS, STATS_SCOPE_ACTIONS, *STATS_RESPONSE_ACTIONS))
+        recent = {bucket or "requests": int(count or 0) for _scope, bucket, count in cursor.fetchall()}
         
         conn.close()
         
@@ -4259,7 +5008,8 @@ class BuildingDatabase:
             "type_stats": type_stats,
             "top_requesters": top_requesters,
             "top_admins": top_admins,
-            "avg_response_time": avg_response_time
+            "avg_response_time": avg_response_time or 0,
+            "recent_days": recent,
         }
     
     def get_stats_user(self, guild_id: int, user_id: int) -> dict:
@@ -4267,34 +5017,9 @@ class BuildingDatabase:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
-        # Total counts by status
-        cursor.execute('''
-            SELECT status, COUNT(*) 
-            FROM building_requests 
-            WHERE guild_id = ? AND user_id = ?
-            GROUP BY status
-        ''', (guild_id, user_id))
-        status_counts = dict(cursor.fetchall())
-        
-        # By building type
-        cursor.execute('''
-            SELECT building_type, status, COUNT(*)
-            FROM building_requests
-            WHERE guild_id = ? AND user_id = ?
-            GROUP BY building_type, status
-        ''', (guild_id, user_id))
-        type_stats = cursor.fetchall()
-        
-        # Denial reasons
-        cursor.execute('''
-            SELECT ba.denial_reason, COUNT(*) as count
-            FROM building_actions ba
-            JOIN building_requests br ON ba.request_id = br.request_id
-            WHERE br.guild_id = ? AND br.user_id = ? AND ba.action_type = 'denied'
-            GROUP BY ba.denial_reason
-            ORDER BY count DESC
-        ''', (guild_id, user_id))
-        denial_reasons = cursor.fetchall()
+        status_counts = self._stat_counts(cursor, guild_id, STATS_SCOPE_REQUESTS, user_id, "")
+        type_stats = self._stat_type_counts(cursor, guild_id, STATS_SCOPE_REQUESTS, user_id)
+        denial_reasons = self._stat_reasons(cursor, guild_id, STATS_SCOPE_USER_DENIALS, user_id)
         
         # Recent requests
         cursor.execute('''
@@ -4320,46 +5045,10 @@ class BuildingDatabase:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
-        # Total actions by type
-        cursor.execute('''
-            SELECT action_type, COUNT(*)
-            FROM building_actions
-            WHERE guild_id = ? AND admin_user_id = ?
-            GROUP BY action_type
-        ''', (guild_id, admin_user_id))
-        action_counts = dict(cursor.fetchall())
-        
-        # By building type
-        cursor.execute('''
-            SELECT br.building_type, ba.action_type, COUNT(*)
-            FROM building_actions ba
-            JOIN building_requests br ON ba.request_id = br.request_id
-            WHERE ba.guild_id = ? AND ba.admin_user_id = ?
-            GROUP BY br.building_type, ba.action_type
-        ''', (guild_id, admin_user_id))
-        type_stats = cursor.fetchall()
-        
-        # Denial reasons breakdown
-        cursor.execute('''
-            SELECT denial_reason, COUNT(*) as count
-            FROM building_actions
-            WHERE guild_id = ? AND admin_user_id = ? AND action_type = 'denied'
-            GROUP BY denial_reason
-            ORDER BY count DESC
-        ''', (guild_id, admin_user_id))
-        denial_breakdown = cursor.fetchall()
-        
-        # Response times
-        cursor.execute('''
-            SELECT 
-                AVG(ba.timestamp - br.created_at) as avg_time,
-                MIN(ba.timestamp - br.created_at) as min_time,
-                MAX(ba.timestamp - br.created_at) as max_time
-            FROM building_actions ba
-            JOIN building_requests br ON ba.request_id = br.request_id
-            WHERE ba.guild_id = ? AND ba.admin_user_id = ? AND ba.action_type IN ('approved', 'denied')
-        ''', (guild_id, admin_user_id))
-        response_times = cursor.fetchone()
+        action_counts = self._stat_counts(cursor, guild_id, STATS_SCOPE_ACTIONS, admin_user_id, "")
+        type_stats = self._stat_type_counts(cursor, guild_id, STATS_SCOPE_ACTIONS, admin_user_id)
+        denial_breakdown = self._stat_reasons(cursor, guild_id, STATS_SCOPE_ADMIN_DENIALS, admin_user_id)
+        response_times = self._stat_response_times(cursor, guild_id, admin_user_id)
         
         # Recent actions
         cursor.execute('''
@@ -4378,7 +5067,7 @@ class BuildingDatabase:
             "action_counts": action_counts,
             "type_stats": type_stats,
             "denial_breakdown": denial_breakdown,
-            "response_times": response_times or (0, 0, 0),
+            "response_times": response_times,
             "recent_actions": recent_actions
         }
     
@@ -4387,52 +5076,29 @@ class BuildingDatabase:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
-        # Total counts by status
-        cursor.execute('''
-            SELECT status, COUNT(*)
-            FROM building_requests
-            WHERE guild_id = ? AND building_type = ?
-            GROUP BY status
-        ''', (guild_id, building_type))
-        status_counts = dict(cursor.fetchall())
-        
-        # Top requesters for this type
-        cursor.execute('''
-            SELECT username, COUNT(*) as count
-            FROM building_requests
-            WHERE guild_id = ? AND building_type = ?
-            GROUP BY user_id
-            ORDER BY count DESC
-            LIMIT 5
-        ''', (guild_id, building_type))
-        top_requesters = cursor.fetchall()
-        
-        # Most common denial reason
-        cursor.execute('''
-            SELECT ba.denial_reason, COUNT(*) as count
-            FROM building_actions ba
-            JOIN building_requests br ON ba.request_id = br.request_id
-            WHERE br.guild_id = ? AND br.building_type = ? AND ba.action_type = 'denied'
-            GROUP BY ba.denial_reason
-            ORDER BY count DESC
-            LIMIT 1
-        ''', (guild_id, building_type))
-        common_denial = cursor.fetchone()
+        status_counts = self._stat_counts(cursor, guild_id, STATS_SCOPE_REQUESTS, 0, building_type)
+        top_requesters = self._stat_top_subjects(cursor, guild_id, STATS_SCOPE_REQUESTS, building_type)
+        denials = self._stat_reasons(cursor, guild_id, STATS_SCOPE_TYPE_DENIALS, 0, building_type)
+        common_denial = denials[0] if denials else None
         
         # Approval rate by admin
         cursor.execute('''
-            SELECT 
-                ba.admin_username,
-                SUM(CASE WHEN ba.action_type = 'approved' THEN 1 ELSE 0 END) as approved,
-                COUNT(*) as total
-            FROM building_actions ba
-            JOIN building_requests br ON ba.request_id = br.request_id
-            WHERE br.guild_id = ? AND br.building_type = ? 
-              AND ba.action_type IN ('approved', 'denied')
-              AND ba.admin_user_id IS NOT NULL
-            GROUP BY ba.admin_user_id
-        ''', (guild_id, building_type))
-        admin_rates = cursor.fetchall()
+            SELECT decided.subject_id, total.label, decided.bucket, decided.count
+            FROM building_stats decided
+            JOIN building_stats total
+              ON total.guild_id = decided.guild_id AND total.scope = decided.scope
+             AND total.subject_id = decided.subject_id AND total.building_type = decided.building_type
+             AND total.bucket = '' AND total.day = ''
+            WHERE decided.guild_id = ? AND decided.scope = ? AND decided.building_type = ? AND decided.day = ''
+              AND decided.subject_id != 0 AND decided.bucket IN (?, ?) AND decided.count > 0
+            ORDER BY decided.subject_id
+        ''', (guild_id, STATS_SCOPE_ACTIONS, building_type, *STATS_RESPONSE_ACTIONS))
+        rates: Dict[int, List[Any]] = {}
+        for subject_id, label, bucket, count in cursor.fetchall():
+            rate = rates.setdefault(subject_id, [label, 0, 0])
+            rate[1] += count if bucket == "approved" else 0
+            rate[2] += count
+        admin_rates = [tuple(rate) for rate in rates.values()]
         
         conn.close()
         
@@ -4870,13 +5536,13 @@ class AdminDecisionView(discord.ui.View):
 
         try:
             create_result = await asyncio.wait_for(
-                self.cog._create_alliance_building_browser(self.req),
+                self.cog._create_alliance_building(self.req),
                 timeout=BUILDING_APPROVAL_CREATE_TIMEOUT_SECONDS,
             )
         except asyncio.TimeoutError:
             try:
                 create_result = await asyncio.wait_for(
-                    self.cog._find_created_alliance_building_browser(
+                    self.cog._find_created_alliance_building(
                         self.req,
                         reason=(
                             "MissionChief building creation timed out, but the created building "
@@ -4894,7 +5560,7 @@ class AdminDecisionView(discord.ui.View):
         if building_create_result_needs_recovery(create_result):
             try:
                 recovered_result = await asyncio.wait_for(
-                    self.cog._find_created_alliance_building_browser(
+                    self.cog._find_created_alliance_building(
                         self.req,
                         reason=(
                             "MissionChief building creation returned a timeout, but the created building "
@@ -5271,15 +5937,22 @@ class BuildingManager(commands.Cog):
         from redbot.core import data_manager
         db_path = str(data_manager.cog_data_path(self) / "building_manager.db")
         self.db = BuildingDatabase(db_path)
+        LocationParser.geocode_cache = shared_geocode_cache(self.bot)
 
         self._panel_task = None
         self._automation_task = None
         self._creation_queue_task = None
-        self._board_poll_task = None
+        self._board_poll_targets: Dict[int, Tuple[discord.Guild, dict]] = {}
+        self._board_watcher = shared_board_watcher(self.bot)
         self._board_guide_task = None
         self._board_cleanup_task = None
         self._auto_candidate_task = None
+        self._automation_queue = DeadlineQueue("Post-creation automation")
+        self._funds_queue = DeadlineQueue("Waiting for funds")
+        self._auto_candidate_queue = DeadlineQueue("Daily candidate builds")
+        self._auto_candidate_work: Dict[str, AutoCandidateWorkQueue] = {}
         self._browser_lock = asyncio.Lock()
+        self._actions = shared_action_engine(self.bot)
         self._persistent_view_registered = False
         self._register_persistent_views()
         self._start_panel_task()
@@ -5289,14 +5962,15 @@ class BuildingManager(commands.Cog):
         self._start_auto_candidate_task()
 
     def cog_unload(self):  # <-- Let op: 4 spaties inspringing, zelfde niveau als __init__
+        LocationParser.geocode_cache = None
         if getattr(self, "_panel_task", None):
             self._panel_task.cancel()
         if getattr(self, "_automation_task", None):
             self._automation_task.cancel()
         if getattr(self, "_creation_queue_task", None):
             self._creation_queue_task.cancel()
-        if getattr(self, "_board_poll_task", None):
-            self._board_poll_task.cancel()
+        if getattr(self, "_board_watcher", None):
+            self._board_watcher.unsubscribe(BOARD_WATCH_OWNER)
         if getattr(self, "_board_guide_task", None):
             self._board_guide_task.cancel()
         if getattr(self, "_board_cleanup_task", None):
@@ -5339,9 +6013,8 @@ class BuildingManager(commands.Cog):
         self._creation_queue_task = self.bot.loop.create_task(self._building_creation_queue_loop())
 
     def _start_board_tasks(self):
-        """Start MissionChief board polling, guide sync, and cleanup workers."""
-        if not self._board_poll_task or self._board_poll_task.done():
-            self._board_poll_task = self.bot.loop.create_task(self._board_poll_loop())
+        """Subscribe to the shared board watcher and start guide sync and cleanup workers."""
+        self._board_watcher.subscribe(BOARD_WATCH_OWNER, self._board_watch_threads, self._on_board_update)
         if not self._board_guide_task or self._board_guide_task.done():
             self._board_guide_task = self.bot.loop.create_task(self._board_guide_loop())
         if not self._board_cleanup_task or self._board_cleanup_task.done():
@@ -5360,6 +6033,10 @@ class BuildingManager(commands.Cog):
             return None
         return cookie_manager
 
+    def _mc_request_slot(self, priority: str = "scraper"):
+        """Pace one MissionChief request through CookieManager's request governor."""
+        return mc_request_slot(getattr(self, "bot", None), "BuildingManager", priority)
+
     async def _get_session(self):
         """Return the MissionChief aiohttp session from CookieManager."""
         cookie_manager = self._cookie_manager()
@@ -5758,13 +6435,13 @@ class BuildingManager(commands.Cog):
         """Create an approved building and queue post-creation automation when possible."""
         try:
             create_result = await asyncio.wait_for(
-                self._create_alliance_building_browser(req),
+                self._create_alliance_building(req),
                 timeout=BUILDING_APPROVAL_CREATE_TIMEOUT_SECONDS,
             )
         except asyncio.TimeoutError:
             try:
                 create_result = await asyncio.wait_for(
-                    self._find_created_alliance_building_browser(
+                    self._find_created_alliance_building(
                         req,
                         reason=(
                             "MissionChief building creation timed out, but the created building "
@@ -5783,7 +6460,7 @@ class BuildingManager(commands.Cog):
         if building_create_result_needs_recovery(create_result):
             try:
                 recovered_result = await asyncio.wait_for(
-                    self._find_created_alliance_building_browser(
+                    self._find_created_alliance_building(
                         req,
                         reason=(
                             "MissionChief building creation returned a timeout, but the created building "
@@ -6209,24 +6886,21 @@ class BuildingManager(commands.Cog):
             return "Building request approved and automatically created in MissionChief."
         return f"Building request approved, but automatic creation needs staff follow-up: {create_result.reason}"
 
-    async def _board_poll_loop(self) -> None:
-        """Poll configured MissionChief board topics for new building requests."""
-        await self.bot.wait_until_ready()
-        while True:
-            try:
-                guild_configs: List[Tuple[discord.Guild, dict]] = []
-                for guild in self.bot.guilds:
-                    conf = await self.config.guild(guild).all()
-                    guild_configs.append((guild, conf))
+    async def _board_watch_threads(self) -> List[int]:
+        """Board topics the shared watcher should poll for new building requests."""
+        guild_configs: List[Tuple[discord.Guild, dict]] = []
+        for guild in self.bot.guilds:
+            conf = await self.config.guild(guild).all()
+            guild_configs.append((guild, conf))
+        self._board_poll_targets = self._select_board_poll_targets(guild_configs)
+        return list(self._board_poll_targets)
 
-                poll_targets = self._select_board_poll_targets(guild_configs)
-                for guild, conf in poll_targets.values():
-                    await self._poll_building_board_for_guild(guild, conf)
-            except asyncio.CancelledError:
-                break
-            except Exception as exc:
-                log.exception("BuildingManager board poll loop error: %s", exc)
-            await asyncio.sleep(BOARD_POLL_SECONDS)
+    async def _on_board_update(self, update: BoardUpdate) -> None:
+        target = self._board_poll_targets.get(update.thread_id)
+        if target is None:
+            return
+        guild, conf = target
+        await self._process_building_board_update(guild, conf, update)
 
     def _select_board_poll_targets(
         self,
@@ -6263,22 +6937,14 @@ class BuildingManager(commands.Cog):
             score += 1
         return score
 
-    async def _poll_building_board_for_guild(self, guild: discord.Guild, conf: dict) -> None:
+    async def _process_building_board_update(self, guild: discord.Guild, conf: dict, update: BoardUpdate) -> None:
         if not conf.get("admin_channel_id"):
             log.info("Building board poll skipped: admin channel is not configured for guild %s", guild.id)
             return
 
-        cookie_manager = self._cookie_manager()
-        if not cookie_manager:
-            log.info("Building board poll skipped: CookieManager is not loaded")
-            return
-
-        thread_id = int(conf.get("board_thread_id") or BOARD_THREAD_ID)
-        session = await cookie_manager.get_session()
-        page, status = await self._fetch_building_board_latest_page(session, thread_id)
-        if status is not None and int(status) >= 400:
-            log.warning("Building board poll failed: thread %s returned HTTP %s", thread_id, status)
-            return
+        thread_id = update.thread_id
+        session = update.session
+        page = update.page
         if not page.posts:
             return
 
@@ -6306,7 +6972,7 @@ class BuildingManager(commands.Cog):
 
         new_posts = [
             post
-            for post in sorted(page.posts, key=lambda item: item.post_id)
+            for post in update.new_posts
             if post.post_id > last_seen
             and post.post_id not in processed_post_ids
             and post.author_id != page.current_user_id
@@ -6346,21 +7012,7 @@ class BuildingManager(commands.Cog):
             await self.config.guild(guild).board_last_seen_post_id.set(latest_post_id)
 
     async def _fetch_building_board_latest_page(self, session, thread_id: int) -> Tuple[BoardPage, Optional[int]]:
-        base_url = f"{BASE_URL}/alliance_threads/{int(thread_id)}"
-        async with session.get(base_url, allow_redirects=True) as response:
-            status = getattr(response, "status", None)
-            html = await response.text()
-        page = parse_building_board_page(html)
-        if status is not None and int(status) >= 400:
-            return page, status
-
-        if page.last_page > 1:
-            last_url = f"{base_url}?page={page.last_page}"
-            async with session.get(last_url, allow_redirects=True) as response:
-                status = getattr(response, "status", None)
-                html = await response.text()
-            page = parse_building_board_page(html)
-        return page, status
+        return await fetch_latest_board_page(session, thread_id, base_url=BASE_URL)
 
     def _normalize_board_post_ids(self, values) -> List[int]:
         post_ids: List[int] = []
@@ -7064,50 +7716,56 @@ class BuildingManager(commands.Cog):
 
     async def _fetch_live_alliance_funds_browser(self) -> Optional[int]:
         """Fetch the live MissionChief alliance funds page through a logged-in browser."""
-        try:
-            from playwright.async_api import async_playwright
-        except Exception:
+        if not playwright_installed():
             raise RuntimeError(PLAYWRIGHT_SETUP_MESSAGE)
 
         cookies = await self._playwright_cookies()
         if not cookies:
             raise RuntimeError("No MissionChief cookies are available from CookieManager.")
 
-        async with async_playwright() as playwright:
-            browser = await playwright.chromium.launch(headless=True)
-            try:
-                context = await browser.new_context(viewport={"width": 1440, "height": 1000})
-                await context.add_cookies(cookies)
-                page = await context.new_page()
-                page.set_default_timeout(30000)
-                await page.goto(MISSIONCHIEF_ALLIANCE_FUNDS_URL, wait_until="domcontentloaded")
-                login_fields = await page.locator("input[type='password']").count()
-                if login_fields:
-                    raise RuntimeError("MissionChief session is not logged in.")
+        async with self._actions.browser_page(cookies) as page:
+            await page.goto(MISSIONCHIEF_ALLIANCE_FUNDS_URL, wait_until="domcontentloaded")
+            login_fields = await page.locator("input[type='password']").count()
+            if login_fields:
+                raise RuntimeError("MissionChief session is not logged in.")
 
-                html_funds = parse_alliance_funds_from_html(await page.content())
-                if html_funds is not None:
-                    return html_funds
+            html_funds = parse_alliance_funds_from_html(await page.content())
+            if html_funds is not None:
+                return html_funds
 
-                body_text = await page.locator("body").inner_text(timeout=5000)
-                return parse_alliance_funds_from_html(body_text)
-            finally:
-                await browser.close()
+            body_text = await page.locator("body").inner_text(timeout=5000)
+            return parse_alliance_funds_from_html(body_text)
 
     async def _get_current_alliance_funds(self) -> Tuple[Optional[int], str]:
         """Return current alliance funds and the source used."""
         errors = []
-        for source, fetcher in (
-            ("live MissionChief", self._fetch_live_alliance_funds),
-            ("live MissionChief browser", self._fetch_live_alliance_funds_browser),
-        ):
+
+        async def replay():
             try:
-                funds = await fetcher()
-                if funds is not None:
-                    return funds, source
-                errors.append(f"{source}: no alliance funds amount found")
+                funds = await self._fetch_live_alliance_funds()
             except Exception as exc:
-                errors.append(f"{source}: {type(exc).__name__}: {_truncate_discord_text(exc, 180)}")
+                errors.append(f"live MissionChief: {type(exc).__name__}: {_truncate_discord_text(exc, 180)}")
+                raise ReplayUnavailable(errors[-1]) from exc
+            if funds is None:
+                errors.append("live MissionChief: no alliance funds amount found")
+                raise ReplayUnavailable(errors[-1])
+            return funds, "live MissionChief"
+
+        async def browser():
+            return await self._fetch_live_alliance_funds_browser(), "live MissionChief browser"
+
+        try:
+            funds, source = await self._actions.run(
+                "alliance_funds",
+                browser,
+                replay=replay,
+                ok=lambda result: result[0] is not None,
+            )
+            if funds is not None:
+                return funds, source
+            errors.append("live MissionChief browser: no alliance funds amount found")
+        except Exception as exc:
+            errors.append(f"live MissionChief browser: {type(exc).__name__}: {_truncate_discord_text(exc, 180)}")
 
         funds = await self._get_alliance_funds_from_contract()
         if funds is not None:
@@ -7138,29 +7796,19 @@ class BuildingManager(commands.Cog):
 
     async def _browser_diagnostics(self, target_url: str) -> str:
         """Inspect a MissionChief page in a logged-in browser without submitting anything."""
-        try:
-            from playwright.async_api import async_playwright
-        except Exception:
+        if not playwright_installed():
             raise RuntimeError(PLAYWRIGHT_SETUP_MESSAGE)
 
         cookies = await self._playwright_cookies()
         if not cookies:
             raise RuntimeError("No MissionChief cookies are available from CookieManager.")
 
-        async with async_playwright() as playwright:
-            browser = await playwright.chromium.launch(headless=True)
-            try:
-                context = await browser.new_context(viewport={"width": 1440, "height": 1000})
-                await context.add_cookies(cookies)
-                page = await context.new_page()
-                page.set_default_timeout(30000)
-                await page.goto(target_url, wait_until="domcontentloaded")
-                login_fields = await page.locator("input[type='password']").count()
-                if login_fields:
-                    raise RuntimeError("MissionChief session is not logged in.")
-                snapshot = await page.evaluate(BUILDING_DIAGNOSTICS_SCRIPT)
-            finally:
-                await browser.close()
+        async with self._actions.browser_page(cookies) as page:
+            await page.goto(target_url, wait_until="domcontentloaded")
+            login_fields = await page.locator("input[type='password']").count()
+            if login_fields:
+                raise RuntimeError("MissionChief session is not logged in.")
+            snapshot = await page.evaluate(BUILDING_DIAGNOSTICS_SCRIPT)
 
         return build_browser_diagnostics_report(snapshot or {})
 
@@ -7179,6 +7827,7 @@ class BuildingManager(commands.Cog):
     ):
         """Mark an approved request as waiting until alliance funds are high enough."""
         self.db.update_request_status(int(req.request_id), "awaiting_funds")
+        self._funds_queue.schedule(int(req.request_id), ts() + BUILDING_FUNDS_RECHECK_SECONDS, needs_funds=int(minimum))
         if record_approval:
             self.db.add_action(
                 request_id=int(req.request_id),
@@ -7254,6 +7903,66 @@ class BuildingManager(commands.Cog):
 
         return message
 
+    async def _find_created_alliance_building(
+        self,
+        req: BuildingRequest,
+        *,
+        reason: str = "Created alliance building was found after lookup.",
+    ) -> BuildingCreateResult:
+        """Find an already-created alliance building, from /api/buildings before the browser."""
+        return await self._actions.run(
+            "building_lookup",
+            lambda: self._find_created_alliance_building_browser(req, reason=reason),
+            replay=lambda: self._find_created_alliance_building_http(req, reason=reason),
+        )
+
+    async def _find_created_alliance_building_http(self, req: BuildingRequest, *, reason: str) -> BuildingCreateResult:
+        """Match the request against /api/buildings over CookieManager's session.
+
+        The alliance building list and alliance log lookups only run in the browser,
+        so a miss here falls back to it.
+        """
+        try:
+            config = build_alliance_building_config(
+                building_type=req.building_type,
+                building_name=req.building_name,
+                coordinates=req.coordinates,
+                address=req.address,
+            )
+        except ValueError as exc:
+            return BuildingCreateResult(False, str(exc))
+
+        status: Optional[int] = None
+        try:
+            session = await self._get_session()
+            async with self._mc_request_slot("interactive"):
+                async with session.get(
+                    f"{BASE_URL}/api/buildings",
+                    headers={"Accept": "application/json"},
+                    timeout=30,
+                ) as response:
+                    status = response.status
+                    buildings = await response.json(content_type=None) if status == 200 else None
+        except Exception as exc:
+            raise ReplayUnavailable(f"/api/buildings request failed: {type(exc).__name__}: {exc}") from exc
+        if not isinstance(buildings, list):
+            raise ReplayUnavailable(f"/api/buildings returned HTTP {status} without a building list")
+
+        detected_id = find_created_alliance_building_id(buildings, config)
+        if not detected_id:
+            raise ReplayUnavailable("building not in /api/buildings; alliance list and logs need the browser")
+        return BuildingCreateResult(
+            True,
+            reason,
+            status=status,
+            post_url=f"{BASE_URL}/buildings/{detected_id}",
+            details={
+                "apiLookup": {"ok": True, "status": status, "count": len(buildings), "matchedBuildingId": detected_id},
+                "buildingId": detected_id,
+                "backend": "http",
+            },
+        )
+
     async def _find_created_alliance_building_browser(
         self,
         req: BuildingRequest,
@@ -7271,9 +7980,7 @@ class BuildingManager(commands.Cog):
         except ValueError as exc:
             return BuildingCreateResult(False, str(exc))
 
-        try:
-            from playwright.async_api import async_playwright
-        except Exception:
+        if not playwright_installed():
             return BuildingCreateResult(False, PLAYWRIGHT_SETUP_MESSAGE)
 
         try:
@@ -7291,70 +7998,62 @@ class BuildingManager(commands.Cog):
             last_status: Optional[int] = None
 
             try:
-                async with async_playwright() as playwright:
-                    browser = await playwright.chromium.launch(headless=True)
-                    try:
-                        context = await browser.new_context(viewport={"width": 1440, "height": 1000})
-                        await context.add_cookies(cookies)
-                        page = await context.new_page()
-                        page.set_default_timeout(30000)
-                        await page.goto(MISSIONCHIEF_HOME_URL, wait_until="domcontentloaded")
-
-                        login_fields = await page.locator("input[type='password']").count()
-                        if login_fields:
-                            return BuildingCreateResult(False, "MissionChief session is not logged in.")
+                async with self._actions.browser_page(cookies) as page:
+                    await page.goto(MISSIONCHIEF_HOME_URL, wait_until="domcontentloaded")
+
+                    login_fields = await page.locator("input[type='password']").count()
+                    if login_fields:
+                        return BuildingCreateResult(False, "MissionChief session is not logged in.")
+
+                    with contextlib.suppress(Exception):
+                        api_lookup = await page.evaluate(BUILDING_FETCH_API_SCRIPT)
+                        if api_lookup.get("ok"):
+                            detected_id = find_created_alliance_building_id(
+                                api_lookup.get("buildings") or [],
+                                config,
+                            )
+                            last_status = _coerce_int(api_lookup.get("status"))
+                            api_lookup = {
+                                "ok": True,
+                                "status": api_lookup.get("status"),
+                                "count": len(api_lookup.get("buildings") or []),
+                                "matchedBuildingId": detected_id,
+                            }
 
+                    if not detected_id:
                         with contextlib.suppress(Exception):
-                            api_lookup = await page.evaluate(BUILDING_FETCH_API_SCRIPT)
-                            if api_lookup.get("ok"):
-                                detected_id = find_created_alliance_building_id(
-                                    api_lookup.get("buildings") or [],
-                                    config,
-                                )
-                                last_status = _coerce_int(api_lookup.get("status"))
-                                api_lookup = {
+                            alliance_list_lookup = await page.evaluate(
+                                BUILDING_FETCH_ALLIANCE_LIST_SCRIPT,
+                                {
+                                    "maxPages": BUILDING_LOOKUP_MAX_ALLIANCE_LIST_PAGES,
+                                    "targetName": config.get("name") or "",
+                                },
+                            )
+                            if alliance_list_lookup.get("ok"):
+                                candidates = alliance_list_lookup.get("candidates") or []
+                                detected_id = find_created_alliance_building_id_from_list(candidates, config)
+                                last_status = _coerce_int(alliance_list_lookup.get("status")) or last_status
+                                alliance_list_lookup = {
                                     "ok": True,
-                                    "status": api_lookup.get("status"),
-                                    "count": len(api_lookup.get("buildings") or []),
+                                    "status": alliance_list_lookup.get("status"),
+                                    "pages": alliance_list_lookup.get("pages") or [],
+                                    "count": len(candidates),
                                     "matchedBuildingId": detected_id,
                                 }
 
-                        if not detected_id:
-                            with contextlib.suppress(Exception):
-                                alliance_list_lookup = await page.evaluate(
-                                    BUILDING_FETCH_ALLIANCE_LIST_SCRIPT,
-                                    {
-                                        "maxPages": BUILDING_LOOKUP_MAX_ALLIANCE_LIST_PAGES,
-                                        "targetName": config.get("name") or "",
-                                    },
-                                )
-                                if alliance_list_lookup.get("ok"):
-                                    candidates = alliance_list_lookup.get("candidates") or []
-                                    detected_id = find_created_alliance_building_id_from_list(candidates, config)
-                                    last_status = _coerce_int(alliance_list_lookup.get("status")) or last_status
-                                    alliance_list_lookup = {
-                                        "ok": True,
-                                        "status": alliance_list_lookup.get("status"),
-                                        "pages": alliance_list_lookup.get("pages") or [],
-                                        "count": len(candidates),
-                                        "matchedBuildingId": detected_id,
-                                    }
-
-                        if not detected_id:
-                            with contextlib.suppress(Exception):
-                                log_lookup = await page.evaluate(BUILDING_FETCH_ALLIANCE_LOGS_SCRIPT)
-                                if log_lookup.get("ok"):
-                                    candidates = log_lookup.get("candidates") or []
-                                    detected_id = find_created_alliance_building_id_from_logs(candidates, config)
-                                    last_status = _coerce_int(log_lookup.get("status")) or last_status
-                                    log_lookup = {
-                                        "ok": True,
-                                        "status": log_lookup.get("status"),
-                                        "count": len(candidates),
-                                        "matchedBuildingId": detected_id,
-                                    }
-                    finally:
-                        await browser.close()
+                    if not detected_id:
+                        with contextlib.suppress(Exception):
+                            log_lookup = await page.evaluate(BUILDING_FETCH_ALLIANCE_LOGS_SCRIPT)
+                            if log_lookup.get("ok"):
+                                candidates = log_lookup.get("candidates") or []
+                                detected_id = find_created_alliance_building_id_from_logs(candidates, config)
+                                last_status = _coerce_int(log_lookup.get("status")) or last_status
+                                log_lookup = {
+                                    "ok": True,
+                                    "status": log_lookup.get("status"),
+                                    "count": len(candidates),
+                                    "matchedBuildingId": detected_id,
+                                }
             except Exception as exc:
                 message = str(exc)
                 if "Executable doesn't exist" in message or "playwright install" in message:
@@ -7384,6 +8083,14 @@ class BuildingManager(commands.Cog):
             details=details,
         )
 
+    async def _create_alliance_building(self, req: BuildingRequest) -> BuildingCreateResult:
+        """Create an approved alliance building.
+
+        There is no HTTP replay here: the alliance build button is picked from the
+        rendered form, and a replayed post that guessed wrong would spend credits.
+        """
+        return await self._actions.run("building_create", lambda: self._create_alliance_building_browser(req))
+
     async def _create_alliance_building_browser(self, req: BuildingRequest) -> BuildingCreateResult:
         """Create an approved Hospital or Prison as an alliance building through the live browser form."""
         try:
@@ -7398,7 +8105,6 @@ class BuildingManager(commands.Cog):
 
         try:
             from playwright.async_api import TimeoutError as PlaywrightTimeoutError
-            from playwright.async_api import async_playwright
         except Exception:
             return BuildingCreateResult(False, PLAYWRIGHT_SETUP_MESSAGE)
 
@@ -7422,129 +8128,121 @@ class BuildingManager(commands.Cog):
             log_lookup: Dict[str, Any] = {}
             before_alliance_candidates: List[Dict[str, Any]] = []
             try:
-                async with async_playwright() as playwright:
-                    browser = await playwright.chromium.launch(headless=True)
-                    try:
-                        context = await browser.new_context(viewport={"width": 1440, "height": 1000})
-                        await context.add_cookies(cookies)
-                        page = await context.new_page()
-                        page.set_default_timeout(30000)
-                        await page.goto(MISSIONCHIEF_NEW_BUILDING_URL, wait_until="domcontentloaded")
+                async with self._actions.browser_page(cookies) as page:
+                    await page.goto(MISSIONCHIEF_NEW_BUILDING_URL, wait_until="domcontentloaded")
+
+                    login_fields = await page.locator("input[type='password']").count()
+                    if login_fields:
+                        return BuildingCreateResult(False, "MissionChief session is not logged in.")
+
+                    with contextlib.suppress(Exception):
+                        before_alliance_list_lookup = await page.evaluate(
+                            BUILDING_FETCH_ALLIANCE_LIST_SCRIPT,
+                            {
+                                "maxPages": BUILDING_LOOKUP_MAX_ALLIANCE_LIST_PAGES,
+                                "targetName": config.get("name") or "",
+                            },
+                        )
+                        if before_alliance_list_lookup.get("ok"):
+                            before_alliance_candidates = before_alliance_list_lookup.get("candidates") or []
+                            before_alliance_list_lookup = {
+                                "ok": True,
+                                "status": before_alliance_list_lookup.get("status"),
+                                "pages": before_alliance_list_lookup.get("pages") or [],
+                                "count": len(before_alliance_candidates),
+                            }
 
-                        login_fields = await page.locator("input[type='password']").count()
-                        if login_fields:
-                            return BuildingCreateResult(False, "MissionChief session is not logged in.")
+                    prepare_result = await page.evaluate(BUILDING_CREATE_SCRIPT, config)
+                    if not prepare_result.get("ok"):
+                        return BuildingCreateResult(
+                            False,
+                            str(prepare_result.get("reason") or "MissionChief building form could not be prepared."),
+                            details=prepare_result.get("snapshot") or {},
+                        )
 
+                    async with page.expect_response(
+                        lambda response: "/buildings" in response.url and response.request.method.upper() == "POST",
+                        timeout=30000,
+                    ) as response_info:
+                        clicked = await page.evaluate(BUILDING_CLICK_CREATE_SCRIPT, prepare_result.get("submitIndex"))
+                        if not clicked:
+                            return BuildingCreateResult(
+                                False,
+                                "Browser could not click the alliance build button.",
+                                details=prepare_result.get("snapshot") or {},
+                            )
+                    response = await response_info.value
+                    status = response.status
+                    response_url = str(response.url or "")
+                    response_headers = response.headers or {}
+                    redirect_location = str(
+                        response_headers.get("location")
+                        or response_headers.get("Location")
+                        or ""
+                    )
+                    with contextlib.suppress(Exception):
+                        response_text = await response.text()
+                    with contextlib.suppress(Exception):
+                        await page.wait_for_load_state("domcontentloaded", timeout=10000)
+                    final_url = str(page.url or "")
+                    detected_id = extract_missionchief_building_id(
+                        response_url,
+                        final_url,
+                        redirect_location,
+                        response_text,
+                    )
+                    if not detected_id and status is not None and int(status) < 400:
                         with contextlib.suppress(Exception):
-                            before_alliance_list_lookup = await page.evaluate(
+                            api_lookup = await page.evaluate(BUILDING_FETCH_API_SCRIPT)
+                            if api_lookup.get("ok"):
+                                detected_id = find_created_alliance_building_id(
+                                    api_lookup.get("buildings") or [],
+                                    config,
+                                )
+                                api_lookup = {
+                                    "ok": True,
+                                    "status": api_lookup.get("status"),
+                                    "count": len(api_lookup.get("buildings") or []),
+                                    "matchedBuildingId": detected_id,
+                                }
+                    if not detected_id and status is not None and int(status) < 400:
+                        with contextlib.suppress(Exception):
+                            alliance_list_lookup = await page.evaluate(
                                 BUILDING_FETCH_ALLIANCE_LIST_SCRIPT,
                                 {
                                     "maxPages": BUILDING_LOOKUP_MAX_ALLIANCE_LIST_PAGES,
                                     "targetName": config.get("name") or "",
                                 },
                             )
-                            if before_alliance_list_lookup.get("ok"):
-                                before_alliance_candidates = before_alliance_list_lookup.get("candidates") or []
-                                before_alliance_list_lookup = {
+                            if alliance_list_lookup.get("ok"):
+                                candidates = alliance_list_lookup.get("candidates") or []
+                                detected_id = find_new_created_alliance_building_id_from_list(
+                                    before_alliance_candidates,
+                                    candidates,
+                                    config,
+                                )
+                                if not detected_id:
+                                    detected_id = find_created_alliance_building_id_from_list(candidates, config)
+                                alliance_list_lookup = {
                                     "ok": True,
-                                    "status": before_alliance_list_lookup.get("status"),
-                                    "pages": before_alliance_list_lookup.get("pages") or [],
-                                    "count": len(before_alliance_candidates),
+                                    "status": alliance_list_lookup.get("status"),
+                                    "pages": alliance_list_lookup.get("pages") or [],
+                                    "count": len(candidates),
+                                    "beforeCount": len(before_alliance_candidates),
+                                    "matchedBuildingId": detected_id,
                                 }
-
-                        prepare_result = await page.evaluate(BUILDING_CREATE_SCRIPT, config)
-                        if not prepare_result.get("ok"):
-                            return BuildingCreateResult(
-                                False,
-                                str(prepare_result.get("reason") or "MissionChief building form could not be prepared."),
-                                details=prepare_result.get("snapshot") or {},
-                            )
-
-                        async with page.expect_response(
-                            lambda response: "/buildings" in response.url and response.request.method.upper() == "POST",
-                            timeout=30000,
-                        ) as response_info:
-                            clicked = await page.evaluate(BUILDING_CLICK_CREATE_SCRIPT, prepare_result.get("submitIndex"))
-                            if not clicked:
-                                return BuildingCreateResult(
-                                    False,
-                                    "Browser could not click the alliance build button.",
-                                    details=prepare_result.get("snapshot") or {},
-                                )
-                        response = await response_info.value
-                        status = response.status
-                        response_url = str(response.url or "")
-                        response_headers = response.headers or {}
-                        redirect_location = str(
-                            response_headers.get("location")
-                            or response_headers.get("Location")
-                            or ""
-                        )
-                        with contextlib.suppress(Exception):
-                            response_text = await response.text()
+                    if not detected_id and status is not None and int(status) < 400:
                         with contextlib.suppress(Exception):
-                            await page.wait_for_load_state("domcontentloaded", timeout=10000)
-                        final_url = str(page.url or "")
-                        detected_id = extract_missionchief_building_id(
-                            response_url,
-                            final_url,
-                            redirect_location,
-                            response_text,
-                        )
-                        if not detected_id and status is not None and int(status) < 400:
-                            with contextlib.suppress(Exception):
-                                api_lookup = await page.evaluate(BUILDING_FETCH_API_SCRIPT)
-                                if api_lookup.get("ok"):
-                                    detected_id = find_created_alliance_building_id(
-                                        api_lookup.get("buildings") or [],
-                                        config,
-                                    )
-                                    api_lookup = {
-                                        "ok": True,
-                                        "status": api_lookup.get("status"),
-                                        "count": len(api_lookup.get("buildings") or []),
-                                        "matchedBuildingId": detected_id,
-                                    }
-                        if not detected_id and status is not None and int(status) < 400:
-                            with contextlib.suppress(Exception):
-                                alliance_list_lookup = await page.evaluate(
-                                    BUILDING_FETCH_ALLIANCE_LIST_SCRIPT,
-                                    {
-                                        "maxPages": BUILDING_LOOKUP_MAX_ALLIANCE_LIST_PAGES,
-                                        "targetName": config.get("name") or "",
-                                    },
-                                )
-                                if alliance_list_lookup.get("ok"):
-                                    candidates = alliance_list_lookup.get("candidates") or []
-                                    detected_id = find_new_created_alliance_building_id_from_list(
-                                        before_alliance_candidates,
-                                        candidates,
-                                        config,
-                                    )
-                                    if not detected_id:
-                                        detected_id = find_created_alliance_building_id_from_list(candidates, config)
-                                    alliance_list_lookup = {
-                                        "ok": True,
-                                        "status": alliance_list_lookup.get("status"),
-                                        "pages": alliance_list_lookup.get("pages") or [],
-                                        "count": len(candidates),
-                                        "beforeCount": len(before_alliance_candidates),
-                                        "matchedBuildingId": detected_id,
-                                    }
-                        if not detected_id and status is not None and int(status) < 400:
-                            with contextlib.suppress(Exception):
-                                log_lookup = await page.evaluate(BUILDING_FETCH_ALLIANCE_LOGS_SCRIPT)
-                                if log_lookup.get("ok"):
-                                    candidates = log_lookup.get("candidates") or []
-                                    detected_id = find_created_alliance_building_id_from_logs(candidates, config)
-                                    log_lookup = {
-                                        "ok": True,
-                                        "status": log_lookup.get("status"),
-                                        "count": len(candidates),
-                                        "matchedBuildingId": detected_id,
-                                    }
-                    finally:
-                        await browser.close()
+                            log_lookup = await page.evaluate(BUILDING_FETCH_ALLIANCE_LOGS_SCRIPT)
+                            if log_lookup.get("ok"):
+                                candidates = log_lookup.get("candidates") or []
+                                detected_id = find_created_alliance_building_id_from_logs(candidates, config)
+                                log_lookup = {
+                                    "ok": True,
+                                    "status": log_lookup.get("status"),
+                                    "count": len(candidates),
+                                    "matchedBuildingId": detected_id,
+                                }
             except PlaywrightTimeoutError as exc:
                 details = dict(prepare_result.get("snapshot") or {})
                 details.update(
@@ -7612,40 +8310,110 @@ class BuildingManager(commands.Cog):
         )
 
     async def _building_automation_loop(self):
-        """Process post-creation automation jobs for alliance buildings."""
+        """Process post-creation automation jobs for alliance buildings as they become due."""
         try:
             await self.bot.wait_until_ready()
             await asyncio.sleep(30)
+            queue = self._automation_queue
+            self._sync_automation_queue()
             while True:
-                try:
-                    due_jobs = self.db.get_due_automation_jobs(limit=5)
-                    for job in due_jobs:
-                        await self._process_building_automation_job(job.job_id)
-                        await asyncio.sleep(5)
-                except asyncio.CancelledError:
-                    raise
-                except Exception:
-                    log.exception("BuildingManager post-creation automation loop failed")
-                await asyncio.sleep(BUILDING_AUTOMATION_LOOP_SECONDS)
+                for job_id in queue.pop_due(limit=5):
+                    try:
+                        await self._process_building_automation_job(job_id)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception:
+                        log.exception("BuildingManager post-creation automation loop failed")
+                        queue.schedule(job_id, ts() + BUILDING_AUTOMATION_LOOP_SECONDS)
+                    await asyncio.sleep(5)
+                if await queue.wait(BUILDING_AUTOMATION_LOOP_SECONDS) == WAKE_FALLBACK:
+                    # Picks up jobs queued by other paths and jobs whose run raised
+                    self._sync_automation_queue()
         except asyncio.CancelledError:
             raise
 
+    def _sync_automation_queue(self) -> None:
+        """Add stored pending automation jobs the in-memory queue does not know yet."""
+        queue = self._automation_queue
+        pending = {job.job_id: job for job in self.db.get_pending_automation_jobs()}
+        for job_id in queue.keys():
+            if job_id not in pending:
+                job = self.db.get_automation_job(job_id)
+                queue.remove(job_id, completed=bool(job and job.status == "completed"))
+        for job_id, job in pending.items():
+            if job_id not in queue:
+                queue.schedule(job_id, job.next_run_at)
+
+    def _schedule_automation_job(self, job_id: int, *, needs_funds: Optional[int] = None) -> None:
+        """Queue a job for its stored next run, or drop it once it is finished."""
+        job = self.db.get_automation_job(job_id)
+        if not job or job.status == "completed":
+            self._automation_queue.remove(job_id, completed=bool(job))
+            return
+        self._automation_queue.schedule(job_id, job.next_run_at, needs_funds=needs_funds)
+
+    def _note_alliance_funds(self, funds: Optional[int]) -> None:
+        """Wake queue entries held for funds that a new alliance balance covers."""
+        for queue in (self._funds_queue, self._automation_queue, self._auto_candidate_queue):
+            queue.note_funds(funds)
+
+    @commands.Cog.listener()
+    async def on_fara_alliance_funds_updated(self, funds: int, source: str = "IncomeScraper"):
+        """Balance signal from the treasury scraper; the live funds rule still applies before building."""
+        log.debug("Alliance funds update from %s: %s credits", source, funds)
+        self._note_alliance_funds(funds)
+
     async def _building_creation_queue_loop(self):
-        """Create approved building requests once live alliance funds are high enough."""
+        """Create approved building requests once alliance funds are high enough.
+
+        Requests wait in the funds queue until a balance signal covers their
+        minimum or the fallback re-check is due; only then are live funds fetched.
+        """
         try:
             await self.bot.wait_until_ready()
             await asyncio.sleep(60)
+            queue = self._funds_queue
             while True:
                 try:
-                    await self._process_waiting_for_funds_queue()
+                    await self._sync_funds_queue()
+                    due = queue.pop_due()
+                    if due:
+                        built = False
+                        try:
+                            built = await self._process_waiting_for_funds_queue()
+                        finally:
+                            # After a build the rest stay due, so the queue drains while funds last
+                            retry_at = ts() if built else ts() + BUILDING_FUNDS_RECHECK_SECONDS
+                            for request_id in due:
+                                queue.requeue(request_id, retry_at)
+                        await self._sync_funds_queue()
                 except asyncio.CancelledError:
                     raise
                 except Exception:
                     log.exception("BuildingManager funds queue loop failed")
-                await asyncio.sleep(BUILDING_CREATION_QUEUE_LOOP_SECONDS)
+                await queue.wait(BUILDING_CREATION_QUEUE_LOOP_SECONDS)
         except asyncio.CancelledError:
             raise
 
+    async def _sync_funds_queue(self) -> None:
+        """Match the funds queue to the stored awaiting_funds requests."""
+        queue = self._funds_queue
+        pending = {int(row["request_id"]): row for row in self.db.get_requests_by_status("awaiting_funds", limit=500)}
+        for request_id in queue.keys():
+            if request_id not in pending:
+                row = self.db.get_request_by_id(int(request_id))
+                queue.remove(request_id, completed=bool(row and row.get("status") == "created"))
+        minimums: Dict[int, int] = {}
+        for request_id, row in pending.items():
+            if request_id in queue:
+                continue
+            guild_id = int(row["guild_id"])
+            if guild_id not in minimums:
+                guild = self.bot.get_guild(guild_id)
+                minimums[guild_id] = await self._get_min_alliance_funds(guild) if guild else ALLIANCE_BUILDING_MIN_FUNDS
+            # Checked once when first seen (startup or a new request), then held for funds
+            queue.schedule(request_id, ts(), needs_funds=minimums[guild_id])
+
     async def _process_waiting_for_funds_queue(self, guild_id: Optional[int] = None) -> bool:
         """Process at most one approved request waiting for sufficient funds."""
         rows = self.db.get_requests_by_status("awaiting_funds", limit=20)
@@ -7667,7 +8435,7 @@ class BuildingManager(commands.Cog):
         req = building_request_from_row(row)
         conf = await self.config.guild(guild).all()
         log_channel = guild.get_channel(conf["log_channel_id"]) if conf.get("log_channel_id") else None
-        create_result = await self._create_alliance_building_browser(req)
+        create_result = await self._create_alliance_building(req)
         final_status = "created" if create_result.ok else "approved_pending_manual"
         self.db.update_request_status(int(req.request_id), final_status)
 
@@ -7749,28 +8517,71 @@ class BuildingManager(commands.Cog):
         return create_result.ok
 
     async def _auto_candidate_build_loop(self):
-        """Run the daily automatic candidate build scheduler."""
+        """Run the daily automatic candidate build scheduler at each guild's configured time."""
         try:
             await self.bot.wait_until_ready()
             await asyncio.sleep(90)
+            queue = self._auto_candidate_queue
+            await self._sync_auto_candidate_queue()
             while True:
-                try:
-                    for guild in self.bot.guilds:
-                        await self._maybe_run_daily_auto_candidates(guild)
-                        await asyncio.sleep(2)
-                except asyncio.CancelledError:
-                    raise
-                except Exception:
-                    log.exception("BuildingManager candidate auto-build loop failed")
-                await asyncio.sleep(AUTO_CANDIDATE_LOOP_SECONDS)
+                for guild_id in queue.pop_due():
+                    guild = self.bot.get_guild(int(guild_id))
+                    if guild is None:
+                        queue.remove(guild_id)
+                        continue
+                    try:
+                        waiting_for = await self._maybe_run_daily_auto_candidates(guild)
+                        await self._schedule_auto_candidates(guild, waiting_for=waiting_for, ran=True)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception:
+                        log.exception("BuildingManager candidate auto-build loop failed")
+                        queue.schedule(guild.id, ts() + AUTO_CANDIDATE_LOOP_SECONDS)
+                    await asyncio.sleep(2)
+                if await queue.wait(AUTO_CANDIDATE_LOOP_SECONDS) == WAKE_FALLBACK:
+                    await self._sync_auto_candidate_queue()
         except asyncio.CancelledError:
             raise
 
-    async def _maybe_run_daily_auto_candidates(self, guild: discord.Guild) -> None:
-        """Run automatic candidate builds when enabled and due for the guild."""
+    async def _sync_auto_candidate_queue(self) -> None:
+        """Schedule guilds the candidate queue does not hold yet."""
+        for guild in self.bot.guilds:
+            if guild.id not in self._auto_candidate_queue:
+                await self._schedule_auto_candidates(guild)
+
+    async def _schedule_auto_candidates(
+        self,
+        guild: discord.Guild,
+        *,
+        waiting_for: Optional[int] = None,
+        ran: bool = False,
+    ) -> None:
+        """Queue the guild's next daily run, or a funds re-check when today's run is held for funds."""
+        queue = self._auto_candidate_queue
         conf = await self.config.guild(guild).all()
         if not conf.get("auto_candidate_build_enabled"):
+            queue.remove(guild.id)
+            return
+        if waiting_for is not None:
+            queue.schedule(guild.id, ts() + BUILDING_FUNDS_RECHECK_SECONDS, needs_funds=waiting_for)
             return
+        now_local, _timezone_name, due_hour, due_minute = self._auto_candidate_clock(conf)
+        due_local = now_local.replace(hour=due_hour, minute=due_minute, second=0, microsecond=0)
+        if due_local <= now_local:
+            if self._auto_candidate_slots_done(guild, now_local.date().isoformat()):
+                due_local = due_local + timedelta(days=1)
+            elif ran:
+                # A slot finished without a result for today; retry on the old loop cadence
+                queue.schedule(guild.id, ts() + AUTO_CANDIDATE_LOOP_SECONDS)
+                return
+        queue.schedule(guild.id, max(ts(), int(due_local.timestamp())))
+
+    def _auto_candidate_slots_done(self, guild: discord.Guild, run_date: str) -> bool:
+        return all(self.db.get_auto_run(guild.id, run_date, building_type) for building_type in ("Hospital", "Prison"))
+
+    @staticmethod
+    def _auto_candidate_clock(conf: Dict[str, Any]) -> Tuple[datetime, str, int, int]:
+        """Local time in the configured zone plus the configured run hour and minute."""
         timezone_name = str(conf.get("auto_candidate_timezone") or AUTO_CANDIDATE_DEFAULT_TIMEZONE)
         time_text = str(conf.get("auto_candidate_time") or AUTO_CANDIDATE_DEFAULT_TIME)
         try:
@@ -7778,29 +8589,42 @@ class BuildingManager(commands.Cog):
         except Exception:
             zone = ZoneInfo(AUTO_CANDIDATE_DEFAULT_TIMEZONE)
             timezone_name = AUTO_CANDIDATE_DEFAULT_TIMEZONE
-        now_local = datetime.now(zone)
         try:
             hour_text, minute_text = time_text.split(":", 1)
             due_hour = int(hour_text)
             due_minute = int(minute_text)
         except (TypeError, ValueError):
             due_hour, due_minute = (7, 0)
-            time_text = AUTO_CANDIDATE_DEFAULT_TIME
+        return datetime.now(zone), timezone_name, due_hour, due_minute
+
+    async def _maybe_run_daily_auto_candidates(self, guild: discord.Guild) -> Optional[int]:
+        """Run automatic candidate builds when enabled and due for the guild.
+
+        Returns the funds minimum when a slot was held by the funds safety rule.
+        """
+        conf = await self.config.guild(guild).all()
+        if not conf.get("auto_candidate_build_enabled"):
+            return None
+        now_local, timezone_name, due_hour, due_minute = self._auto_candidate_clock(conf)
         if now_local.hour < due_hour or (now_local.hour == due_hour and now_local.minute < due_minute):
-            return
+            return None
 
         run_date = now_local.date().isoformat()
+        waiting_for = None
         for building_type in ("Hospital", "Prison"):
             if self.db.get_auto_run(guild.id, run_date, building_type):
                 continue
-            await self._run_auto_candidate_build(
+            result = await self._run_auto_candidate_build(
                 guild,
                 building_type,
                 run_date=run_date,
                 timezone_name=timezone_name,
                 scheduled=True,
             )
+            if result.blocked_on_funds:
+                waiting_for = result.funds_minimum
             await asyncio.sleep(5)
+        return waiting_for
 
     async def _fetch_existing_missionchief_buildings(self) -> Tuple[List[Dict[str, Any]], str]:
         """Fetch current MissionChief buildings for duplicate checks."""
@@ -8002,6 +8826,63 @@ class BuildingManager(commands.Cog):
                 with contextlib.suppress(OSError):
                     os.unlink(temp_path)
 
+    async def _import_overpass_tiles(
+        self,
+        importer: OverpassCandidateImport,
+        tiles: List[Tuple[float, float, float, float]],
+        *,
+        start_tile: int,
+        import_key: str,
+        building_type: str,
+    ) -> Optional[str]:
+        """Stream each remaining tile into the candidate database; return an error message on failure."""
+        timeout = aiohttp.ClientTimeout(total=OVERPASS_REQUEST_TIMEOUT_SECONDS)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            for index in range(start_tile, len(tiles)):
+                if index > start_tile:
+                    await asyncio.sleep(OVERPASS_IMPORT_TILE_PAUSE_SECONDS)
+                failure = None
+                try:
+                    query = build_overpass_candidate_query(*tiles[index], building_type)
+                    async with session.post(OVERPASS_API_URL, data={"data": query}) as response:
+                        if response.status != 200:
+                            text = await response.text()
+                            failure = format_overpass_http_error(response.status, text, building_type=building_type)
+                        else:
+                            stream = await importer.read(response.content.iter_chunked(OVERPASS_STREAM_CHUNK_BYTES))
+                            # Overpass reports a timeout after partial output with HTTP 200 and a remark
+                            if "runtime error" in stream.remark.casefold():
+                                failure = f"Overpass stopped the query early: {_truncate_text(stream.remark, 300)}"
+                except Exception as exc:
+                    failure = f"Overpass import failed: {exc}"
+
+                if failure:
+                    self.db.record_auto_overpass_import(
+                        import_key=import_key,
+                        building_type=building_type,
+                        tile_count=len(tiles),
+                        next_tile=index,
+                        status="failed",
+                        stats=importer.stats,
+                        reason=failure,
+                    )
+                    if len(tiles) > 1:
+                        failure += (
+                            f"\nImported {index:,}/{len(tiles):,} tiles. "
+                            f"Run the same command again to resume at tile {index + 1:,}."
+                        )
+                    return failure
+
+                self.db.record_auto_overpass_import(
+                    import_key=import_key,
+                    building_type=building_type,
+                    tile_count=len(tiles),
+                    next_tile=index + 1,
+                    status="completed" if index + 1 == len(tiles) else "running",
+                    stats=importer.stats,
+                )
+        return None
+
     async def _import_next_geofabrik_extracts(self, guild: discord.Guild, *, max_extracts: int) -> List[str]:
         """Import the next unprocessed Geofabrik extracts into the local candidate database."""
         conf = await self.config.guild(guild).all()
@@ -8106,6 +8987,14 @@ class BuildingManager(commands.Cog):
         )
         return lines
 
+    def _auto_candidate_work_queue(self, building_type: str) -> AutoCandidateWorkQueue:
+        """Return the persistent candidate work queue for one building type."""
+        work = self._auto_candidate_work.get(building_type)
+        if work is None or work.db is not self.db:
+            work = AutoCandidateWorkQueue(self.db, building_type)
+            self._auto_candidate_work[building_type] = work
+        return work
+
     def _select_auto_candidate(
         self,
         building_type: str,
@@ -8115,15 +9004,15 @@ class BuildingManager(commands.Cog):
         duplicate_radius_m: int,
         mark_duplicates: bool = True,
     ) -> AutoBuildPlan:
-        """Choose one available candidate, skipping confirmed local duplicates."""
-        candidates = self.db.get_random_auto_candidates(
-            building_type,
-            limit=AUTO_CANDIDATE_SELECTION_POOL,
-        )
-        if not candidates:
-            return AutoBuildPlan(building_type=building_type, candidate=None, blocked_reason="No available candidates.")
-
-        for candidate in candidates:
+        """Choose one available candidate, skipping confirmed local duplicates.
+
+        Candidates come from the head of the type's work queue. A real run
+        consumes what it marks or picks; a dry run leaves the queue untouched.
+        """
+        work = self._auto_candidate_work_queue(building_type)
+        sampled = False
+        for candidate in work.candidates(AUTO_CANDIDATE_SELECTION_POOL):
+            sampled = True
             duplicate_distance, duplicate_building_id = self._nearest_duplicate_building(
                 candidate,
                 existing_buildings,
@@ -8136,13 +9025,18 @@ class BuildingManager(commands.Cog):
                 )
                 if mark_duplicates:
                     self.db.mark_auto_candidate(candidate.candidate_id, "duplicate", reason=reason)
+                    work.discard(candidate.candidate_id)
                 continue
+            if mark_duplicates:
+                work.discard(candidate.candidate_id)
             return AutoBuildPlan(
                 building_type=building_type,
                 candidate=candidate,
                 duplicate_check_source=duplicate_source,
             )
 
+        if not sampled:
+            return AutoBuildPlan(building_type=building_type, candidate=None, blocked_reason="No available candidates.")
         return AutoBuildPlan(
             building_type=building_type,
             candidate=None,
@@ -8245,7 +9139,7 @@ class BuildingManager(commands.Cog):
         timezone_name: Optional[str] = None,
         scheduled: bool = False,
         force: bool = False,
-    ) -> str:
+    ) -> AutoBuildSlotResult:
         """Run one automatic candidate build slot."""
         timezone_name = timezone_name or AUTO_CANDIDATE_DEFAULT_TIMEZONE
         if run_date is None:
@@ -8255,15 +9149,16 @@ class BuildingManager(commands.Cog):
                 run_date = datetime.now(timezone.utc).date().isoformat()
 
         if not force and self.db.get_auto_run(guild.id, run_date, building_type):
-            return f"{building_type}: already processed for {run_date}."
+            return AutoBuildSlotResult(f"{building_type}: already processed for {run_date}.")
 
         minimum = await self._get_auto_candidate_min_funds(guild)
         funds, funds_source = await self._get_current_alliance_funds()
         if not alliance_funds_allow_auto_build(funds, funds_source, minimum):
             current = f"{funds:,} credits" if funds is not None else "unknown"
-            return (
-                f"{building_type}: blocked by funds safety rule. Current funds: {current}; "
-                f"source: {funds_source}; required: {minimum:,} credits."
+            return AutoBuildSlotResult(
+                f"{building_type}: {AUTO_CANDIDATE_FUNDS_BLOCKED_TEXT}. Current funds: {current}; "
+                f"source: {funds_source}; required: {minimum:,} credits.",
+                funds_minimum=minimum,
             )
 
         refill_lines = await self._refill_auto_candidates_if_needed(guild, (building_type,))
@@ -8298,7 +9193,7 @@ class BuildingManager(commands.Cog):
                 reason=reason,
                 scheduled=scheduled,
             )
-            return f"{building_type}: {reason}"
+            return AutoBuildSlotResult(f"{building_type}: {reason}")
 
         candidate = plan.candidate
         req = self._request_from_auto_candidate(candidate)
@@ -8367,8 +9262,8 @@ class BuildingManager(commands.Cog):
         )
 
         if create_result.ok:
-            return f"{building_type}: created {candidate.name}."
-        return f"{building_type}: failed to create {candidate.name}: {create_result.reason}"
+            return AutoBuildSlotResult(f"{building_type}: created {candidate.name}.")
+        return AutoBuildSlotResult(f"{building_type}: failed to create {candidate.name}: {create_result.reason}")
 
     async def _send_auto_candidate_build_log(
         self,
@@ -8424,6 +9319,7 @@ class BuildingManager(commands.Cog):
         """Run and persist one post-creation automation job."""
         job = self.db.get_automation_job(job_id)
         if not job or job.status == "completed":
+            self._schedule_automation_job(job_id)
             return None
 
         guild = self.bot.get_guild(job.guild_id)
@@ -8436,6 +9332,7 @@ class BuildingManager(commands.Cog):
                 actions=[],
             )
             self.db.update_automation_job(job.job_id, result)
+            self._schedule_automation_job(job.job_id)
             return result
 
         minimum_funds = await self._get_min_alliance_funds(guild)
@@ -8454,6 +9351,7 @@ class BuildingManager(commands.Cog):
                 actions=[],
             )
             self.db.update_automation_job(job.job_id, result)
+            self._schedule_automation_job(job.job_id, needs_funds=minimum_funds)
             self.db.add_action(
                 request_id=job.request_id,
                 guild_id=job.guild_id,
@@ -8464,8 +9362,9 @@ class BuildingManager(commands.Cog):
             )
             return result
 
-        result = await self._upgrade_alliance_building_browser(job)
+        result = await self._upgrade_alliance_building(job)
         self.db.update_automation_job(job.job_id, result)
+        self._schedule_automation_job(job.job_id)
         action_type = "automation_completed" if result.completed else "automation_waiting" if result.wait else "automation_run"
         if not result.ok:
             action_type = "automation_failed"
@@ -8480,8 +9379,8 @@ class BuildingManager(commands.Cog):
         await self._log_building_automation_result(job, result)
         return result
 
-    async def _upgrade_alliance_building_browser(self, job: BuildingAutomationJob) -> BuildingAutomationResult:
-        """Set alliance building tax, level, and extensions through the live browser page."""
+    async def _upgrade_alliance_building(self, job: BuildingAutomationJob) -> BuildingAutomationResult:
+        """Set alliance building tax, level, and extensions, over HTTP when possible."""
         if job.building_type not in ALLIANCE_BUILDING_TYPE_IDS:
             return BuildingAutomationResult(
                 ok=False,
@@ -8490,10 +9389,303 @@ class BuildingManager(commands.Cog):
                 reason=f"Unsupported automation building type: {job.building_type}",
                 actions=[],
             )
+        async with self._browser_lock:
+            return await self._actions.run(
+                "building_automation",
+                lambda: self._upgrade_alliance_building_browser(job),
+                replay=lambda: self._upgrade_alliance_building_http(job),
+            )
+
+    async def _run_building_automation_steps(
+        self,
+        job: BuildingAutomationJob,
+        run_step,
+        actions: List[str],
+        details: Dict[str, Any],
+    ) -> BuildingAutomationResult:
+        """Apply automation steps until nothing is left or the per-run limit is hit.
+
+        ``run_step`` takes the step config and returns the step result shaped like
+        BUILDING_AUTOMATION_DIRECT_SCRIPT's, whether it ran in a page or over HTTP.
+        """
+        tax_complete = job.tax_complete
+        level_complete = job.level_complete
+        extensions_complete = job.extensions_complete
+        extensions_started_this_run = 0
+        last_status: Optional[int] = None
+
+        for _ in range(BUILDING_AUTOMATION_MAX_SCRIPT_STEPS_PER_RUN):
+            prepare_config = {
+                "buildingId": str(job.building_id),
+                "buildingType": str(job.building_type),
+                "targetTax": str(job.target_tax),
+                "maxHospitalLevel": ALLIANCE_BUILDING_TARGET_HOSPITAL_LEVEL,
+                "taxComplete": bool(tax_complete),
+                "levelComplete": bool(level_complete),
+                "extensionsComplete": bool(extensions_complete),
+                "extensionsStartedThisRun": extensions_started_this_run,
+                "maxExtensionStarts": BUILDING_AUTOMATION_MAX_EXTENSION_STARTS_PER_RUN,
+            }
+            last_prepare = await run_step(prepare_config)
+            details["last_prepare"] = last_prepare
+            if last_prepare.get("status") is not None:
+                with contextlib.suppress(TypeError, ValueError):
+                    last_status = int(last_prepare.get("status"))
+                    details["status"] = last_status
+            if not last_prepare.get("ok"):
+                return BuildingAutomationResult(
+                    False,
+                    False,
+                    True,
+                    str(last_prepare.get("reason") or "MissionChief building automation could not prepare an action."),
+                    actions,
+                    details=details,
+                )
+
+            action = str(last_prepare.get("action") or "")
+            label = _truncate_text(last_prepare.get("label") or action or "MissionChief action", 160)
+            if action == "tax_already_set":
+                tax_complete = True
+                if label not in actions:
+                    actions.append(label)
+                continue
+            if action == "level_already_max" or action == "level_not_applicable":
+                level_complete = True
+                if label not in actions:
+                    actions.append(label)
+                continue
+
+            if not action:
+                completed = bool(last_prepare.get("completed")) and tax_complete
+                wait = bool(last_prepare.get("wait")) or not completed
+                reason = str(last_prepare.get("reason") or "No remaining eligible actions were found.")
+                if not tax_complete and last_prepare.get("taxState") == "not_found":
+                    reason = "Tax field was not found on the MissionChief building page; retrying later."
+                if completed:
+                    level_complete = True
+                    extensions_complete = True
+                return BuildingAutomationResult(
+                    True,
+                    completed,
+                    wait,
+                    reason,
+                    actions,
+                    tax_complete=tax_complete,
+                    level_complete=level_complete,
+                    extensions_complete=extensions_complete,
+                    extensions_started=extensions_started_this_run,
+                    status=last_status,
+                    details=details,
+                )
+
+            actions.append(label)
+            if action == "set_tax":
+                tax_complete = True
+            elif action == "start_level_upgrade":
+                level_complete = True
+            elif action == "start_extension":
+                extensions_started_this_run += 1
+
+        return BuildingAutomationResult(
+            True,
+            False,
+            True,
+            "Internal safety limit reached for this run; queued for the next pass.",
+            actions,
+            tax_complete=tax_complete,
+            level_complete=level_complete,
+            extensions_complete=extensions_complete,
+            extensions_started=extensions_started_this_run,
+            status=last_status,
+            details=details,
+        )
+
+    async def _building_automation_step_http(self, session, config: Dict[str, Any], submitted: List[str]) -> Dict[str, Any]:
+        """One BUILDING_AUTOMATION_DIRECT_SCRIPT step replayed over CookieManager's session.
+
+        Raises ReplayUnavailable when the building page cannot be used and nothing
+        has been submitted this run. ``submitted`` collects every state-changing path.
+        """
+        building_id = str(config.get("buildingId") or "").strip()
+        building_type = str(config.get("buildingType") or "").strip().lower()
+        target_tax = _coerce_int(config.get("targetTax"))
+        if target_tax is None:
+            target_tax = ALLIANCE_BUILDING_TARGET_TAX
+        target_tax_id = {0: 0, 10: 1, 20: 2, 30: 3, 40: 4, 50: 5}.get(target_tax)
+        max_hospital_level = int(config.get("maxHospitalLevel") or 20)
+        detail_path = f"/buildings/{building_id}"
+
+        def fail(reason: str, **extra) -> Dict[str, Any]:
+            return {
+                "ok": False,
+                "action": None,
+                "completed": False,
+                "wait": True,
+                "reason": reason,
+                "snapshot": {"url": f"{BASE_URL}{detail_path}", "buildingId": building_id, "buildingType": building_type, **extra},
+            }
+
+        if not building_id.isdigit():
+            return fail("MissionChief building id is missing or invalid.")
+        if building_type not in {"hospital", "prison"}:
+            return fail(f"Unsupported alliance building automation type: {building_type or 'unknown'}.")
+        if target_tax_id is None:
+            return fail("Invalid target tax percentage. Supported values are 0, 10, 20, 30, 40, and 50.")
+
+        async def request(method: str, path: str, **kwargs) -> Tuple[int, str, str]:
+            async with self._mc_request_slot():
+                async with session.request(method, f"{BASE_URL}{path}", timeout=30, **kwargs) as response:
+                    return response.status, str(response.url), await response.text()
+
+        try:
+            status, url, text = await request("GET", detail_path, headers={"Accept": "text/html"})
+        except Exception as exc:
+            if not submitted:
+                raise ReplayUnavailable(f"building page request failed: {type(exc).__name__}: {exc}") from exc
+            raise
+        token = missionchief_csrf_token(text)
+        if status < 400 and (not token or "/users/sign_in" in url):
+            if not submitted:
+                raise ReplayUnavailable("building page did not come back as a logged-in page")
+            return fail("MissionChief session is not logged in.", status=status)
+        if status >= 400:
+            return fail(f"MissionChief returned HTTP {status} for building {building_id}.", status=status, response=text[:500])
+
+        def done(action: Optional[str], label: str = "", **extra) -> Dict[str, Any]:
+            result = {"ok": True, "action": action, "completed": False, "status": extra.pop("status", status)}
+            if label:
+                result["label"] = label
+            result["snapshot"] = {"url": extra.pop("url", url), **extra.pop("snapshot", {})}
+            result.update(extra)
+            return result
+
+        ajax_headers = {"Accept": "text/html", "X-Requested-With": "XMLHttpRequest"}
+        if not config.get("taxComplete"):
+            if building_tax_is_target(text, building_id, target_tax, target_tax_id):
+                return done("tax_already_set", f"Tax already set to {target_tax}%")
+            path = f"/buildings/{building_id}/alliance_costs/{target_tax_id}"
+            submitted.append(path)
+            tax_status, tax_url, tax_text = await request("GET", path, headers=ajax_headers)
+            if tax_status >= 400:
+                return fail(
+                    f"MissionChief returned HTTP {tax_status} while setting tax to {target_tax}%.",
+                    status=tax_status,
+                    response=tax_text[:500],
+                )
+            return done("set_tax", f"Set tax to {target_tax}%", status=tax_status, url=tax_url)
+
+        if building_type == "prison" and not config.get("levelComplete"):
+            return done("level_not_applicable", "Prison level not applicable")
+
+        if building_type == "hospital" and not config.get("levelComplete"):
+            current_level = extract_building_level(text)
+            if current_level is not None and current_level >= max_hospital_level:
+                return done(
+                    "level_already_max",
+                    f"Hospital level already {max_hospital_level}",
+                    snapshot={"currentLevel": current_level},
+                )
+            if current_level is None:
+                return done(
+                    None,
+                    wait=True,
+                    reason="Hospital level could not be read from the MissionChief building page.",
+                )
+            path = f"/buildings/{building_id}/expand_do/credits?level={max(0, max_hospital_level - 1)}"
+            submitted.append(path)
+            level_status, level_url, level_text = await request("GET", path, headers=ajax_headers)
+            if level_status >= 400:
+                return fail(
+                    f"MissionChief returned HTTP {level_status} while setting hospital level.",
+                    status=level_status,
+                    response=level_text[:500],
+                )
+            return done(
+                "start_level_upgrade",
+                f"Set hospital level to {max_hospital_level}",
+                status=level_status,
+                url=level_url,
+                snapshot={"previousLevel": current_level},
+            )
+
+        offers = extract_building_extension_offers(text, building_id)
+        if building_type == "hospital":
+            offers = [offer for offer in offers if offer["extId"] != 9]
+        if building_type == "prison":
+            offers = [offer for offer in offers if offer["extId"] != 30 and offer["price"] != 200000]
+        if not offers:
+            return done(None, completed=True, wait=False, reason="Tax, level, and eligible extensions are complete.")
+
+        started = int(config.get("extensionsStartedThisRun") or 0)
+        if started >= int(config.get("maxExtensionStarts") or 30):
+            return done(
+                None,
+                wait=True,
+                reason=f"Started {started} extension(s) this run; waiting before starting more.",
+                snapshot={"remainingExtensions": [offer["extId"] for offer in offers][:10]},
+            )
+
+        offer = offers[0]
+        submitted.append(offer["href"])
+        extension_status, extension_url, extension_text = await request(
+            "POST",
+            offer["href"],
+            data={"authenticity_token": token},
+            headers={**ajax_headers, "X-CSRF-Token": token},
+        )
+        if extension_status >= 400:
+            return fail(
+                f"MissionChief returned HTTP {extension_status} while starting extension {offer['extId']}.",
+                status=extension_status,
+                extensionId=offer["extId"],
+                response=extension_text[:500],
+            )
+        price = f" ({offer['price']} credits)" if offer["price"] else ""
+        return done(
+            "start_extension",
+            f"Started extension {offer['extId']}{price}",
+            status=extension_status,
+            url=extension_url,
+            snapshot={"extensionId": offer["extId"], "price": offer["price"]},
+        )
+
+    async def _upgrade_alliance_building_http(self, job: BuildingAutomationJob) -> BuildingAutomationResult:
+        """Replay the building automation steps over CookieManager's session."""
+        try:
+            session = await self._get_session()
+        except Exception as exc:
+            raise ReplayUnavailable(f"no MissionChief session: {exc}") from exc
+
+        building_url = f"{BASE_URL}/buildings/{job.building_id}"
+        actions: List[str] = []
+        details: Dict[str, Any] = {"building_url": building_url, "backend": "http"}
+        submitted: List[str] = []
+        try:
+            return await self._run_building_automation_steps(
+                job,
+                lambda config: self._building_automation_step_http(session, config, submitted),
+                actions,
+                details,
+            )
+        except ReplayUnavailable:
+            raise
+        except Exception as exc:
+            if not submitted:
+                raise ReplayUnavailable(f"{type(exc).__name__}: {exc}") from exc
+            return BuildingAutomationResult(
+                False,
+                False,
+                True,
+                f"MissionChief building automation failed: {exc}",
+                actions,
+                status=details.get("status"),
+                details=details,
+            )
 
+    async def _upgrade_alliance_building_browser(self, job: BuildingAutomationJob) -> BuildingAutomationResult:
+        """Set alliance building tax, level, and extensions through a pooled browser page."""
         try:
             from playwright.async_api import TimeoutError as PlaywrightTimeoutError
-            from playwright.async_api import async_playwright
         except Exception:
             return BuildingAutomationResult(False, False, True, PLAYWRIGHT_SETUP_MESSAGE, [])
 
@@ -8506,151 +9698,57 @@ class BuildingManager(commands.Cog):
 
         building_url = f"{BASE_URL}/buildings/{job.building_id}"
         actions: List[str] = []
-        details: Dict[str, Any] = {"building_url": building_url}
-        tax_complete = job.tax_complete
-        level_complete = job.level_complete
-        extensions_complete = job.extensions_complete
-        extensions_started_this_run = 0
-        last_status: Optional[int] = None
-        last_prepare: Dict[str, Any] = {}
+        details: Dict[str, Any] = {"building_url": building_url, "backend": "browser"}
 
-        async with self._browser_lock:
-            try:
-                async with async_playwright() as playwright:
-                    browser = await playwright.chromium.launch(headless=True)
-                    try:
-                        context = await browser.new_context(viewport={"width": 1440, "height": 1000})
-                        await context.add_cookies(cookies)
-                        page = await context.new_page()
-                        page.set_default_timeout(30000)
-
-                        def _accept_dialog(dialog):
-                            self.bot.loop.create_task(dialog.accept())
-
-                        page.on("dialog", _accept_dialog)
+        try:
+            async with self._actions.browser_page(cookies) as page:
 
-                        await page.goto(building_url, wait_until="domcontentloaded")
-                        login_fields = await page.locator("input[type='password']").count()
-                        if login_fields:
-                            return BuildingAutomationResult(
-                                False,
-                                False,
-                                True,
-                                "MissionChief session is not logged in.",
-                                actions,
-                                details=details,
-                            )
+                def _accept_dialog(dialog):
+                    self.bot.loop.create_task(dialog.accept())
 
-                        for _ in range(BUILDING_AUTOMATION_MAX_SCRIPT_STEPS_PER_RUN):
-                            prepare_config = {
-                                "buildingId": str(job.building_id),
-                                "buildingType": str(job.building_type),
-                                "targetTax": str(job.target_tax),
-                                "maxHospitalLevel": ALLIANCE_BUILDING_TARGET_HOSPITAL_LEVEL,
-                                "taxComplete": bool(tax_complete),
-                                "levelComplete": bool(level_complete),
-                                "extensionsComplete": bool(extensions_complete),
-                                "extensionsStartedThisRun": extensions_started_this_run,
-                                "maxExtensionStarts": BUILDING_AUTOMATION_MAX_EXTENSION_STARTS_PER_RUN,
-                            }
-                            last_prepare = await page.evaluate(BUILDING_AUTOMATION_DIRECT_SCRIPT, prepare_config)
-                            details["last_prepare"] = last_prepare
-                            if last_prepare.get("status") is not None:
-                                with contextlib.suppress(TypeError, ValueError):
-                                    last_status = int(last_prepare.get("status"))
-                            if not last_prepare.get("ok"):
-                                return BuildingAutomationResult(
-                                    False,
-                                    False,
-                                    True,
-                                    str(last_prepare.get("reason") or "MissionChief building automation could not prepare an action."),
-                                    actions,
-                                    details=details,
-                                )
+                page.on("dialog", _accept_dialog)
 
-                            action = str(last_prepare.get("action") or "")
-                            label = _truncate_text(last_prepare.get("label") or action or "MissionChief action", 160)
-                            if action == "tax_already_set":
-                                tax_complete = True
-                                if label not in actions:
-                                    actions.append(label)
-                                continue
-                            if action == "level_already_max" or action == "level_not_applicable":
-                                level_complete = True
-                                if label not in actions:
-                                    actions.append(label)
-                                continue
+                await page.goto(building_url, wait_until="domcontentloaded")
+                login_fields = await page.locator("input[type='password']").count()
+                if login_fields:
+                    return BuildingAutomationResult(
+                        False,
+                        False,
+                        True,
+                        "MissionChief session is not logged in.",
+                        actions,
+                        details=details,
+                    )
 
-                            if not action:
-                                completed = bool(last_prepare.get("completed")) and tax_complete
-                                wait = bool(last_prepare.get("wait")) or not completed
-                                reason = str(last_prepare.get("reason") or "No remaining eligible actions were found.")
-                                if not tax_complete and last_prepare.get("taxState") == "not_found":
-                                    reason = "Tax field was not found on the MissionChief building page; retrying later."
-                                if completed:
-                                    level_complete = True
-                                    extensions_complete = True
-                                return BuildingAutomationResult(
-                                    True,
-                                    completed,
-                                    wait,
-                                    reason,
-                                    actions,
-                                    tax_complete=tax_complete,
-                                    level_complete=level_complete,
-                                    extensions_complete=extensions_complete,
-                                    extensions_started=extensions_started_this_run,
-                                    status=last_status,
-                                    details=details,
-                                )
+                async def run_step(config: Dict[str, Any]) -> Dict[str, Any]:
+                    # Each step makes at most two MissionChief requests from the page
+                    async with self._mc_request_slot():
+                        return await page.evaluate(BUILDING_AUTOMATION_DIRECT_SCRIPT, config)
 
-                            actions.append(label)
-                            if action == "set_tax":
-                                tax_complete = True
-                            elif action == "start_level_upgrade":
-                                level_complete = True
-                            elif action == "start_extension":
-                                extensions_started_this_run += 1
-                            await page.wait_for_timeout(1200)
-
-                        return BuildingAutomationResult(
-                            True,
-                            False,
-                            True,
-                            "Internal safety limit reached for this run; queued for the next pass.",
-                            actions,
-                            tax_complete=tax_complete,
-                            level_complete=level_complete,
-                            extensions_complete=extensions_complete,
-                            extensions_started=extensions_started_this_run,
-                            status=last_status,
-                            details=details,
-                        )
-                    finally:
-                        await browser.close()
-            except PlaywrightTimeoutError as exc:
-                return BuildingAutomationResult(
-                    False,
-                    False,
-                    True,
-                    f"MissionChief building automation timed out: {exc}",
-                    actions,
-                    status=last_status,
-                    details=details,
-                )
-            except Exception as exc:
-                message = str(exc)
-                if "Executable doesn't exist" in message or "playwright install" in message:
-                    return BuildingAutomationResult(False, False, True, PLAYWRIGHT_SETUP_MESSAGE, actions, details=details)
-                return BuildingAutomationResult(
-                    False,
-                    False,
-                    True,
-                    f"MissionChief building automation failed: {message}",
-                    actions,
-                    status=last_status,
-                    details=details,
-                )
+                return await self._run_building_automation_steps(job, run_step, actions, details)
+        except PlaywrightTimeoutError as exc:
+            return BuildingAutomationResult(
+                False,
+                False,
+                True,
+                f"MissionChief building automation timed out: {exc}",
+                actions,
+                status=details.get("status"),
+                details=details,
+            )
+        except Exception as exc:
+            message = str(exc)
+            if "Executable doesn't exist" in message or "playwright install" in message:
+                return BuildingAutomationResult(False, False, True, PLAYWRIGHT_SETUP_MESSAGE, actions, details=details)
+            return BuildingAutomationResult(
+                False,
+                False,
+                True,
+                f"MissionChief building automation failed: {message}",
+                actions,
+                status=details.get("status"),
+                details=details,
+            )
 
     async def _log_building_automation_result(self, job: BuildingAutomationJob, result: BuildingAutomationResult):
         """Send a compact admin log for one automation pass when useful."""
@@ -9012,20 +10110,23 @@ class BuildingManager(commands.Cog):
                 state_data.pop("last_seen_post_id", None)
                 state_data["processed_post_ids"] = []
                 states[key] = state_data
+            self._board_watcher.rewind(BOARD_WATCH_OWNER, thread_id)
             await ctx.send("Building board baseline reset. The next poll will baseline the latest post without processing older posts.")
             return
 
         conf = await self.config.guild(ctx.guild).all()
+        thread_id = int(conf.get("board_thread_id") or BOARD_THREAD_ID)
         await ctx.send(
             box(
                 "\n".join(
                     [
                         "Building board polling status",
                         f"Enabled: {bool(conf.get('board_poll_enabled'))}",
-                        f"Thread ID: {conf.get('board_thread_id') or BOARD_THREAD_ID}",
+                        f"Thread ID: {thread_id}",
                         f"Last seen post ID: {conf.get('board_last_seen_post_id') or 'not set'}",
                         f"Pending cleanup posts: {len(conf.get('board_pending_deletions') or [])}",
-                        f"Interval: {BOARD_POLL_SECONDS // 60} minutes",
+                        f"Interval: {int(self._board_watcher.poll_seconds) // 60} minutes",
+                        format_board_watch_stats(self._board_watcher.stats(thread_id).get(thread_id)),
                     ]
                 ),
                 lang="text",
@@ -9039,6 +10140,7 @@ class BuildingManager(commands.Cog):
         """Set the MissionChief alliance thread ID used for board building requests."""
         await self.config.guild(ctx.guild).board_thread_id.set(int(thread_id))
         await self.config.guild(ctx.guild).board_last_seen_post_id.set(None)
+        self._board_watcher.rewind(BOARD_WATCH_OWNER)
         await ctx.send(
             f"Building board thread set to `{int(thread_id)}`. "
             "The next poll will baseline the latest post without processing older posts."
@@ -9111,6 +10213,7 @@ class BuildingManager(commands.Cog):
     async def candidate_autobuild_enable(self, ctx: commands.Context):
         """Enable daily candidate auto-building."""
         await self.config.guild(ctx.guild).auto_candidate_build_enabled.set(True)
+        await self._schedule_auto_candidates(ctx.guild)
         await ctx.send("Daily candidate auto-build enabled.")
 
     @candidate_autobuild.command(name="disable")
@@ -9119,6 +10222,7 @@ class BuildingManager(commands.Cog):
     async def candidate_autobuild_disable(self, ctx: commands.Context):
         """Disable daily candidate auto-building."""
         await self.config.guild(ctx.guild).auto_candidate_build_enabled.set(False)
+        await self._schedule_auto_candidates(ctx.guild)
         await ctx.send("Daily candidate auto-build disabled.")
 
     @candidate_autobuild.command(name="time")
@@ -9145,6 +10249,7 @@ class BuildingManager(commands.Cog):
             return
         await self.config.guild(ctx.guild).auto_candidate_time.set(f"{hour:02d}:{minute:02d}")
         await self.config.guild(ctx.guild).auto_candidate_timezone.set(timezone_name)
+        await self._schedule_auto_candidates(ctx.guild)
         await ctx.send(f"Daily candidate auto-build time set to {hour:02d}:{minute:02d} {timezone_name}.")
 
     @candidate_autobuild.command(name="minfunds")
@@ -9156,6 +10261,7 @@ class BuildingManager(commands.Cog):
             await ctx.send("Minimum funds cannot be negative.")
             return
         await self.config.guild(ctx.guild).auto_candidate_min_funds.set(int(credits))
+        await self._schedule_auto_candidates(ctx.guild)
         await ctx.send(f"Daily candidate auto-build minimum funds set to {int(credits):,} credits.")
 
     @candidate_autobuild.command(name="fundscheck")
@@ -9218,26 +10324,27 @@ class BuildingManager(commands.Cog):
             await ctx.send("Attach an Overpass JSON file to this command.")
             return
         attachment = ctx.message.attachments[0]
+        importer = OverpassCandidateImport(self.db)
         async with ctx.typing():
             try:
                 payload = await attachment.read()
-                data = json.loads(payload.decode("utf-8-sig"))
+                importer.read_bytes(payload)
             except Exception as exc:
                 await ctx.send(f"Could not read JSON attachment: {exc}")
                 return
-            candidates, parse_stats = parse_overpass_auto_build_candidates(data)
-            db_stats = self.db.upsert_auto_candidates(candidates)
+        stats = importer.stats
         await ctx.send(
             box(
                 "\n".join(
                     [
                         "Candidate import complete.",
-                        f"Source elements: {parse_stats['source_elements']:,}",
-                        f"Accepted candidates: {parse_stats['accepted']:,}",
-                        f"Rejected source elements: {parse_stats['rejected']:,}",
-                        f"Inserted: {db_stats['inserted']:,}",
-                        f"Updated: {db_stats['updated']:,}",
-                        f"Skipped: {db_stats['skipped']:,}",
+                        f"Source elements: {stats['source_elements']:,}",
+                        f"Accepted candidates: {stats['accepted']:,}",
+                        f"Rejected source elements: {stats['rejected']:,}",
+                        f"Duplicate source elements: {stats['duplicates']:,}",
+                        f"Inserted: {stats['inserted']:,}",
+                        f"Updated: {stats['updated']:,}",
+                        f"Skipped: {stats['skipped']:,}",
                     ]
                 ),
                 lang="text",
@@ -9256,52 +10363,57 @@ class BuildingManager(commands.Cog):
         east: float,
         building_type: str = "both",
     ):
-        """Download OSM hospital/prison candidates through public Overpass for one bounding box."""
+        """Download OSM hospital/prison candidates through public Overpass for one bounding box.
+
+        Boxes larger than the public server handles well are split into a grid and
+        imported one cell per query. Progress is saved after each cell, so running
+        the same command again after a failure resumes at the cell that failed.
+        """
+        south, west, north, east = float(south), float(west), float(north), float(east)
         try:
-            query = build_overpass_candidate_query(
-                float(south),
-                float(west),
-                float(north),
-                float(east),
-                building_type,
-            )
+            build_overpass_candidate_query(south, west, north, east, building_type)
         except ValueError as exc:
             await ctx.send(str(exc))
             return
 
-        notice = overpass_import_area_notice(float(south), float(west), float(north), float(east))
-        async with ctx.typing():
-            try:
-                timeout = aiohttp.ClientTimeout(total=240)
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.post(OVERPASS_API_URL, data={"data": query}) as response:
-                        if response.status != 200:
-                            text = await response.text()
-                            await ctx.send(format_overpass_http_error(response.status, text, building_type=building_type))
-                            return
-                        data = await response.json(content_type=None)
-            except Exception as exc:
-                await ctx.send(f"Overpass import failed: {exc}")
-                return
+        tiles = overpass_grid_tiles(south, west, north, east, OVERPASS_IMPORT_TILE_DEGREES)
+        import_key = overpass_import_key(south, west, north, east, building_type, OVERPASS_IMPORT_TILE_DEGREES)
+        progress = self.db.get_auto_overpass_import(import_key)
+        start_tile = 0
+        if progress and progress.get("status") != "completed" and int(progress.get("tile_count") or 0) == len(tiles):
+            start_tile = min(max(0, int(progress.get("next_tile") or 0)), len(tiles) - 1)
+        importer = OverpassCandidateImport(self.db, stats=progress if start_tile else None)
 
-            candidates, parse_stats = parse_overpass_auto_build_candidates(data)
-            db_stats = self.db.upsert_auto_candidates(candidates)
+        async with ctx.typing():
+            failure = await self._import_overpass_tiles(
+                importer,
+                tiles,
+                start_tile=start_tile,
+                import_key=import_key,
+                building_type=building_type,
+            )
+        if failure:
+            await ctx.send(failure)
+            return
 
+        stats = importer.stats
         lines = [
             "Overpass candidate import complete.",
             "Network source: public Overpass API",
             "Stored result: local SQLite candidate database",
             "Automatic dry-run/run uses local data first and refills from OSM only when local stock is low.",
-            f"Source elements: {parse_stats['source_elements']:,}",
-            f"Accepted candidates: {parse_stats['accepted']:,}",
-            f"Rejected source elements: {parse_stats['rejected']:,}",
-            f"Inserted: {db_stats['inserted']:,}",
-            f"Updated: {db_stats['updated']:,}",
-            f"Skipped: {db_stats['skipped']:,}",
+            f"Source elements: {stats['source_elements']:,}",
+            f"Accepted candidates: {stats['accepted']:,}",
+            f"Rejected source elements: {stats['rejected']:,}",
+            f"Duplicate source elements: {stats['duplicates']:,}",
+            f"Inserted: {stats['inserted']:,}",
+            f"Updated: {stats['updated']:,}",
+            f"Skipped: {stats['skipped']:,}",
             f"Import type: {building_type}",
         ]
-        if notice:
-            lines.append(f"Note: {notice}")
+        if len(tiles) > 1:
+            resumed = f", resumed at tile {start_tile + 1:,}" if start_tile else ""
+            lines.append(f"Tiles: {len(tiles):,} grid cells of up to {OVERPASS_IMPORT_TILE_DEGREES:g} degrees{resumed}")
         await ctx.send(
             box(
                 "\n".join(lines),
@@ -9428,7 +10540,7 @@ class BuildingManager(commands.Cog):
 
         async with ctx.typing():
             results = [
-                await self._run_auto_candidate_build(ctx.guild, item, scheduled=False, force=bool(force))
+                (await self._run_auto_candidate_build(ctx.guild, item, scheduled=False, force=bool(force))).message
                 for item in building_types
             ]
         await ctx.send(box("\n".join(results), lang="text"))
@@ -9438,22 +10550,27 @@ class BuildingManager(commands.Cog):
     @commands.guild_only()
     async def browsercheck(self, ctx: commands.Context):
         """Check whether BuildingManager browser automation is ready."""
-        try:
-            from playwright.async_api import async_playwright
-        except Exception:
+        if not playwright_installed():
             await ctx.send(PLAYWRIGHT_SETUP_MESSAGE)
             return
 
         try:
-            async with async_playwright() as playwright:
-                browser = await playwright.chromium.launch(headless=True)
-                await browser.close()
+            await self._actions.pool.check()
         except Exception as exc:
             await ctx.send(f"BuildingManager browser backend is not ready: {exc}")
             return
 
         await ctx.send("BuildingManager browser backend is ready.")
 
+    @buildset.command(name="actionstats")
+    @commands.admin()
+    @commands.guild_only()
+    async def actionstats(self, ctx: commands.Context):
+        """Show MissionChief action latency and how often HTTP replay fell back to the browser."""
+        lines = ["MissionChief actions (HTTP replay first, pooled browser as fallback):"]
+        lines.extend(format_action_stats(self._actions))
+        await ctx.send(box("\n".join(lines), lang="text"))
+
     @buildset.command(name="browserinspect")
     @commands.admin()
     @commands.guild_only()
@@ -9467,7 +10584,7 @@ class BuildingManager(commands.Cog):
 
         async with ctx.typing():
             try:
-                report = await self._browser_diagnostics(target_url)
+                report = await self._actions.run("browser_inspect", lambda: self._browser_diagnostics(target_url))
             except Exception as exc:
                 await ctx.send(f"BuildingManager browser diagnostics failed: {exc}")
                 return
@@ -9483,13 +10600,17 @@ class BuildingManager(commands.Cog):
     @commands.admin()
     @commands.guild_only()
     async def automationstatus(self, ctx: commands.Context):
-        """Show recent post-creation building automation jobs."""
+        """Show the automation queues and recent post-creation building automation jobs."""
+        lines = ["BuildingManager automation queues:"]
+        for queue in (self._automation_queue, self._funds_queue, self._auto_candidate_queue):
+            lines.extend(format_queue_metrics(queue))
         jobs = self.db.get_recent_automation_jobs(ctx.guild.id, limit=10)
         if not jobs:
-            await ctx.send("No BuildingManager post-creation automation jobs are stored.")
+            lines.append("No BuildingManager post-creation automation jobs are stored.")
+            await ctx.send(box("\n".join(lines), lang="text"))
             return
 
-        lines = ["BuildingManager post-creation automation:"]
+        lines.extend(["", "BuildingManager post-creation automation:"])
         for job in jobs:
             flags = []
             flags.append("tax" if job.tax_complete else "tax pending")
@@ -9600,7 +10721,7 @@ class BuildingManager(commands.Cog):
     @commands.guild_only()
     async def buildstats(self, ctx: commands.Context):
         """View building request statistics."""
-        stats = self.db.get_stats_overall(ctx.guild.id)
+        stats = await asyncio.to_thread(self.db.get_stats_overall, ctx.guild.id)
         
         status_counts = stats["status_counts"]
         total = sum(status_counts.values())
@@ -9665,8 +10786,39 @@ class BuildingManager(commands.Cog):
             minutes = int((avg_time % 3600) // 60)
             embed.add_field(name="Average Response Time", value=f"{hours}h {minutes}m", inline=False)
         
+        recent = stats["recent_days"]
+        if recent:
+            embed.add_field(
+                name=f"Last {STATS_RECENT_DAYS} Days",
+                value=(
+                    f"{recent.get('requests', 0)} requests, {recent.get('approved', 0)} approved, "
+                    f"{recent.get('denied', 0)} denied"
+                ),
+                inline=False,
+            )
+        
         await ctx.send(embed=embed)
 
+    @buildstats.command(name="rebuild")
+    @commands.admin()
+    @commands.guild_only()
+    async def buildstats_rebuild(self, ctx: commands.Context):
+        """Recount the statistics counters from the request history and verify them."""
+        async with ctx.typing():
+            rebuilt = await asyncio.to_thread(self.db.rebuild_stats)
+            verified = await asyncio.to_thread(self.db.verify_stats)
+        lines = [
+            "Building statistics rebuilt from request history.",
+            f"Counter rows: {rebuilt['rows']:,}",
+            f"Rows that had drifted: {rebuilt['mismatched']:,}",
+            (
+                "Verification: counters match the history."
+                if not verified["mismatched"]
+                else f"Verification: {verified['mismatched']:,} rows differ from the history."
+            ),
+        ]
+        await ctx.send(box("\n".join(lines), lang="text"))
+
     @buildstats.command(name="user")
     @commands.guild_only()
     async def buildstats_user(self, ctx: commands.Context, user: discord.Member = None):
@@ -9674,7 +10826,7 @@ class BuildingManager(commands.Cog):
         if user is None:
             user = ctx.author
         
-        stats = self.db.get_stats_user(ctx.guild.id, user.id)
+        stats = await asyncio.to_thread(self.db.get_stats_user, ctx.guild.id, user.id)
         
         status_counts = stats["status_counts"]
         total = sum(status_counts.values())
@@ -9745,7 +10897,7 @@ class BuildingManager(commands.Cog):
         if admin is None:
             admin = ctx.author
         
-        stats = self.db.get_stats_admin(ctx.guild.id, admin.id)
+        stats = await asyncio.to_thread(self.db.get_stats_admin, ctx.guild.id, admin.id)
         
         action_counts = stats["action_counts"]
         total = sum(action_counts.values())
@@ -9831,7 +10983,7 @@ class BuildingManager(commands.Cog):
         """View statistics for a specific building type."""
         building_type = building_type.capitalize()
         
-        stats = self.db.get_stats_type(ctx.guild.id, building_type)
+        stats = await asyncio.to_thread(self.db.get_stats_type, ctx.guild.id, building_type)
         
         status_counts = stats["status_counts"]
         total = sum(status_counts.values())
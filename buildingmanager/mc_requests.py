@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+# Pause before each request when CookieManager has no request governor
+FALLBACK_REQUEST_DELAY_SECONDS = 1.5
+
+
+@asynccontextmanager
+async def mc_request_slot(bot: Any, caller: str, priority: str = "scraper") -> AsyncIterator[None]:
+    """Pace one MissionChief request through CookieManager's request governor.
+
+    Falls back to a fixed pause when the loaded CookieManager predates the
+    governor, and does not wait at all when CookieManager is not loaded.
+    """
+    cookie_manager = bot.get_cog("CookieManager") if bot is not None else None
+    request_slot = getattr(cookie_manager, "request_slot", None)
+    if request_slot is not None:
+        async with request_slot(caller, priority):
+            yield
+        return
+    if cookie_manager is not None:
+        await asyncio.sleep(FALLBACK_REQUEST_DELAY_SECONDS)
+    yield
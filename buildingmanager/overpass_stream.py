@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import codecs
+import json
+import math
+from json.decoder import WHITESPACE
+from typing import Any, Dict, List, Tuple
+
+# A single element never gets near this; more undecodable text means the body is not Overpass JSON
+MAX_PENDING_CHARS = 8 * 1024 * 1024
+
+_START = "start"
+_KEY = "key"
+_COLON = "colon"
+_VALUE = "value"
+_ELEMENTS = "elements"
+_DONE = "done"
+_DELIMITERS = frozenset(",:]} \t\n\r")
+
+
+class OverpassStreamError(ValueError):
+    """The Overpass response is not a complete JSON object."""
+
+
+class OverpassElementStream:
+    """Incremental parser for an Overpass ``[out:json]`` response.
+
+    ``feed`` takes raw response chunks and returns the members of the top-level
+    ``elements`` array completed so far, so only one partial element is ever
+    buffered instead of the whole document. Every other top-level key, such as
+    ``remark``, ends up in ``header``.
+    """
+
+    def __init__(self, *, encoding: str = "utf-8-sig"):
+        self._text = codecs.getincrementaldecoder(encoding)()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._key = ""
+        self.header: Dict[str, Any] = {}
+        self.elements = 0
+        self.bytes_read = 0
+
+    @property
+    def remark(self) -> str:
+        return str(self.header.get("remark") or "")
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Consume one chunk and return the elements it completed."""
+        self.bytes_read += len(chunk)
+        self._buffer = self._buffer[self._pos:] + self._text.decode(chunk)
+        self._pos = 0
+        elements = self._drain(final=False)
+        if len(self._buffer) - self._pos > MAX_PENDING_CHARS:
+            raise OverpassStreamError("Overpass response contains an element that could not be decoded.")
+        return elements
+
+    def close(self) -> List[Any]:
+        """Consume the end of the response; raises when the document is incomplete."""
+        self._buffer = self._buffer[self._pos:] + self._text.decode(b"", final=True)
+        self._pos = 0
+        elements = self._drain(final=True)
+        if self._state != _DONE:
+            raise OverpassStreamError("Overpass response ended before the JSON document was complete.")
+        if self._buffer[self._pos:].strip():
+            raise OverpassStreamError("Overpass response has data after the JSON document.")
+        return elements
+
+    def _skip(self) -> int:
+        self._pos = WHITESPACE.match(self._buffer, self._pos).end()
+        return self._pos
+
+    def _decode(self, final: bool) -> Tuple[bool, Any]:
+        try:
+            value, end = self._json.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError as exc:
+            if final:
+                raise OverpassStreamError(f"Overpass response is not valid JSON: {exc}") from exc
+            return False, None
+        if end == len(self._buffer) or self._buffer[end] not in _DELIMITERS:
+            # A number cut off by the chunk boundary ("0." of "0.6") still has characters to come
+            if not final:
+                return False, None
+            if end < len(self._buffer):
+                raise OverpassStreamError(f"Overpass response has an unexpected character at {end}.")
+        self._pos = end
+        return True, value
+
+    def _drain(self, *, final: bool) -> List[Any]:
+        elements: List[Any] = []
+        buffer = self._buffer
+        while self._state != _DONE:
+            pos = self._skip()
+            if pos >= len(buffer):
+                break
+            char = buffer[pos]
+            if self._state == _START:
+                if char != "{":
+                    raise OverpassStreamError("Overpass response is not a JSON object.")
+                self._pos += 1
+                self._state = _KEY
+            elif self._state == _KEY:
+                if char == "}":
+                    self._pos += 1
+                    self._state = _DONE
+                elif char == ",":
+                    self._pos += 1
+                else:
+                    complete, key = self._decode(final)
+                    if not complete:
+                        break
+                    self._key = str(key)
+                    self._state = _COLON
+            elif self._state == _COLON:
+                if char != ":":
+                    raise OverpassStreamError(f"Overpass response is missing ':' after `{self._key}`.")
+                self._pos += 1
+                self._state = _VALUE
+            elif self._state == _VALUE:
+                if self._key == "elements" and char == "[":
+                    self._pos += 1
+                    self._state = _ELEMENTS
+                    continue
+                complete, value = self._decode(final)
+                if not complete:
+                    break
+                self.header[self._key] = value
+                self._state = _KEY
+            elif char == "]":
+                self._pos += 1
+                self._state = _KEY
+            elif char == ",":
+                self._pos += 1
+            else:
+                complete, element = self._decode(final)
+                if not complete:
+                    break
+                elements.append(element)
+                self.elements += 1
+        return elements
+
+
+def overpass_grid_tiles(
+    south: float,
+    west: float,
+    north: float,
+    east: float,
+    tile_degrees: float,
+) -> List[Tuple[float, float, float, float]]:
+    """Split a bounding box into equal grid cells no larger than ``tile_degrees``.
+
+    Cells are returned row by row from the south-west corner, so a stored index
+    identifies the same cell on every run over the same box.
+    """
+    if tile_degrees <= 0:
+        raise ValueError("Tile size must be positive.")
+    rows = max(1, math.ceil((north - south) / tile_degrees - 1e-9))
+    columns = max(1, math.ceil((east - west) / tile_degrees - 1e-9))
+    lat_step = (north - south) / rows
+    lon_step = (east - west) / columns
+    tiles = []
+    for row in range(rows):
+        tile_south = south + row * lat_step
+        tile_north = north if row == rows - 1 else south + (row + 1) * lat_step
+        for column in range(columns):
+            tile_west = west + column * lon_step
+            tile_east = east if column == columns - 1 else west + (column + 1) * lon_step
+            tiles.append((tile_south, tile_west, tile_north, tile_east))
+    return tiles
+
+
+def overpass_import_key(
+    south: float,
+    west: float,
+    north: float,
+    east: float,
+    building_type: str,
+    tile_degrees: float,
+) -> str:
+    """Identify one tiled import so a re-run of the same command resumes it."""
+    normalized = str(building_type or "both").casefold().strip()
+    return f"{normalized}:{south:.5f},{west:.5f},{north:.5f},{east:.5f}:{tile_degrees:g}"
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import re
 import time
+from collections import deque
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime
@@ -21,6 +23,10 @@ MAIN_URL = f"{BASE_URL}/"
 ALLIANCE_CHATS_URL = f"{BASE_URL}/alliance_chats"
 DEFAULT_CHANNEL_ID = 1518029674570055720
 DEFAULT_POLL_INTERVAL_SECONDS = 30
+ACTIVE_POLL_INTERVAL_SECONDS = 15
+ACTIVE_FOLLOWUP_POLLS = 3
+MAX_IDLE_POLL_INTERVAL_SECONDS = 300
+LATENCY_SAMPLE_SIZE = 100
 MIN_MC_POST_INTERVAL_SECONDS = 30
 OUTGOING_ECHO_TTL_SECONDS = 30 * 60
 MAX_MC_CHAT_LENGTH = 1000
@@ -78,6 +84,44 @@ def build_chat_payload(form: ChatForm, message: str) -> dict[str, str]:
     return payload
 
 
+CHAT_MESSAGE_ID_RE = re.compile(r"""id=["']chat_message_(\d+)["']""")
+
+
+def chat_fingerprint(html: str) -> str:
+    """Cheap hash of the chat container: the message ids on the page, without parsing it."""
+    ids = CHAT_MESSAGE_ID_RE.findall(html or "")
+    if not ids:
+        return ""
+    return hashlib.blake2b(",".join(ids).encode(), digest_size=16).hexdigest()
+
+
+def next_poll_interval(base_seconds: int, idle_polls: int) -> int:
+    """
+    Delay before the next chat poll.
+
+    Right after activity the bridge polls every ACTIVE_POLL_INTERVAL_SECONDS for a
+    few rounds, then falls back to the configured interval and doubles it for
+    every further idle poll, up to MAX_IDLE_POLL_INTERVAL_SECONDS.
+    """
+    if idle_polls < ACTIVE_FOLLOWUP_POLLS:
+        return min(ACTIVE_POLL_INTERVAL_SECONDS, base_seconds)
+    backoff = base_seconds * (2 ** min(idle_polls - ACTIVE_FOLLOWUP_POLLS, 16))
+    return int(min(max(MAX_IDLE_POLL_INTERVAL_SECONDS, base_seconds), backoff))
+
+
+def message_age_seconds(value: str, now: Optional[float] = None) -> Optional[float]:
+    raw = str(value or "").strip()
+    if not raw:
+        return None
+    try:
+        parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return None
+    return max(0.0, (time.time() if now is None else now) - parsed.timestamp())
+
+
 def parse_chat_history(html: str) -> list[ChatMessage]:
     soup = BeautifulSoup(html or "", "html.parser")
     messages = []
@@ -158,6 +202,18 @@ class ChatManager(commands.Cog):
         self._sync_task: Optional[asyncio.Task] = None
         self._post_lock = asyncio.Lock()
         self._last_mc_post_at = 0.0
+        self._poll_wake = asyncio.Event()
+        self._idle_polls = ACTIVE_FOLLOWUP_POLLS
+        self._last_chat_fingerprint = ""
+        self._delivery_latencies: deque[float] = deque(maxlen=LATENCY_SAMPLE_SIZE)
+        self.poll_metrics = {
+            "polls": 0,
+            "parsed": 0,
+            "unchanged": 0,
+            "parse_seconds": 0.0,
+            "last_parse_ms": 0.0,
+            "next_interval": DEFAULT_POLL_INTERVAL_SECONDS,
+        }
 
     async def cog_load(self):
         self._sync_task = asyncio.create_task(self._sync_loop())
@@ -198,14 +254,17 @@ class ChatManager(commands.Cog):
             raise RuntimeError(f"MissionChief main page returned HTTP {status}.")
         return parse_chat_form(html, MAIN_URL)
 
-    async def _fetch_chat_history(self) -> list[ChatMessage]:
+    async def _fetch_chat_page(self) -> str:
         session = await self._get_session()
         async with session.get(ALLIANCE_CHATS_URL, allow_redirects=True) as response:
             status = getattr(response, "status", None)
             html = await response.text()
         if status is not None and int(status) >= 400:
             raise RuntimeError(f"MissionChief alliance chat history returned HTTP {status}.")
-        return parse_chat_history(html)
+        return html
+
+    async def _fetch_chat_history(self) -> list[ChatMessage]:
+        return parse_chat_history(await self._fetch_chat_page())
 
     async def _send_to_missionchief(self, message: str) -> None:
         async with self._post_lock:
@@ -282,22 +341,45 @@ class ChatManager(commands.Cog):
             embed=self._build_chat_embed(chat),
             allowed_mentions=discord.AllowedMentions.none(),
         )
+        age = message_age_seconds(chat.timestamp)
+        if age is not None:
+            self._delivery_latencies.append(age)
         return True
 
+    def _note_activity(self) -> None:
+        """Poll at the short interval again, starting now."""
+        self._idle_polls = 0
+        self._poll_wake.set()
+
     async def _sync_once(self) -> dict[str, int]:
-        messages = await self._fetch_chat_history()
+        self.poll_metrics["polls"] += 1
+        html = await self._fetch_chat_page()
+        fingerprint = chat_fingerprint(html)
+        if fingerprint and fingerprint == self._last_chat_fingerprint:
+            self.poll_metrics["unchanged"] += 1
+            return {"seen": 0, "posted": 0, "skipped_echoes": 0}
+
+        started = time.perf_counter()
+        messages = parse_chat_history(html)
+        elapsed = time.perf_counter() - started
+        self.poll_metrics["parsed"] += 1
+        self.poll_metrics["parse_seconds"] += elapsed
+        self.poll_metrics["last_parse_ms"] = elapsed * 1000
         if not messages:
             return {"seen": 0, "posted": 0, "skipped_echoes": 0}
 
-        last_seen = int(await self.config.last_seen_chat_id() or 0)
+        stored_last_seen = int(await self.config.last_seen_chat_id() or 0)
         newest_id = max(item.chat_id for item in messages)
-        if last_seen <= 0:
+        if stored_last_seen <= 0:
             await self.config.last_seen_chat_id.set(newest_id)
+            self._last_chat_fingerprint = fingerprint
             return {"seen": len(messages), "posted": 0, "skipped_echoes": 0}
 
+        last_seen = stored_last_seen
         new_messages = [item for item in messages if item.chat_id > last_seen]
         posted = 0
         skipped_echoes = 0
+        delivered_all = True
         for chat in new_messages:
             if await self._consume_outgoing_echo(chat.message):
                 skipped_echoes += 1
@@ -305,19 +387,30 @@ class ChatManager(commands.Cog):
                 if await self._post_game_chat_to_discord(chat):
                     posted += 1
                 else:
+                    delivered_all = False
                     break
             last_seen = max(last_seen, chat.chat_id)
 
-        await self.config.last_seen_chat_id.set(last_seen)
+        if last_seen != stored_last_seen:
+            await self.config.last_seen_chat_id.set(last_seen)
+        if delivered_all:
+            # Only skip this page next time once everything on it has been handled
+            self._last_chat_fingerprint = fingerprint
         return {"seen": len(new_messages), "posted": posted, "skipped_echoes": skipped_echoes}
 
     async def _sync_loop(self):
         await self.bot.wait_until_ready()
         await asyncio.sleep(15)
         while True:
+            # Clear before the sync so activity noted while it runs still cuts the wait short
+            self._poll_wake.clear()
             try:
                 if await self.config.enabled():
                     result = await self._sync_once()
+                    if result["seen"]:
+                        self._idle_polls = 0
+                    else:
+                        self._idle_polls += 1
                     if result["posted"] or result["skipped_echoes"]:
                         log.info(
                             "ChatManager sync posted=%s skipped_echoes=%s",
@@ -327,8 +420,31 @@ class ChatManager(commands.Cog):
             except asyncio.CancelledError:
                 raise
             except Exception as exc:
+                self._idle_polls += 1
                 log.exception("ChatManager sync failed: %s", exc)
-            await asyncio.sleep(max(DEFAULT_POLL_INTERVAL_SECONDS, int(await self.config.poll_interval_seconds())))
+            base_interval = max(DEFAULT_POLL_INTERVAL_SECONDS, int(await self.config.poll_interval_seconds()))
+            delay = next_poll_interval(base_interval, self._idle_polls)
+            self.poll_metrics["next_interval"] = delay
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._poll_wake.wait(), timeout=delay)
+
+    def _metrics_lines(self) -> list[str]:
+        metrics = self.poll_metrics
+        parsed = metrics["parsed"]
+        average_parse_ms = (metrics["parse_seconds"] / parsed * 1000) if parsed else 0.0
+        lines = [
+            f"- Polls: `{metrics['polls']}` (parsed `{parsed}`, unchanged `{metrics['unchanged']}`)",
+            f"- Parse time: last `{metrics['last_parse_ms']:.1f}` ms, average `{average_parse_ms:.1f}` ms",
+            f"- Next poll in: `{metrics['next_interval']}` seconds",
+        ]
+        if self._delivery_latencies:
+            latencies = sorted(self._delivery_latencies)
+            median = latencies[len(latencies) // 2]
+            lines.append(
+                f"- MissionChief → Discord latency: median `{median:.0f}` s, "
+                f"max `{latencies[-1]:.0f}` s over `{len(latencies)}` messages"
+            )
+        return lines
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
@@ -351,6 +467,7 @@ class ChatManager(commands.Cog):
         try:
             await self._send_to_missionchief(mc_message)
             await self._remember_outgoing_echo(mc_message)
+            self._note_activity()
         except Exception as exc:
             log.exception("Could not send Discord chat message to MissionChief: %s", exc)
             with suppress(discord.HTTPException, discord.Forbidden, discord.NotFound):
@@ -368,8 +485,9 @@ class ChatManager(commands.Cog):
             "ChatManager status:\n"
             f"- Enabled: `{enabled}`\n"
             f"- Discord channel: <#{channel_id}> (`{channel_id}`)\n"
-            f"- Poll interval: `{poll_interval}` seconds\n"
-            f"- Last seen MissionChief chat ID: `{last_seen}`"
+            f"- Poll interval: `{poll_interval}` seconds (idle backoff up to `{MAX_IDLE_POLL_INTERVAL_SECONDS}`)\n"
+            f"- Last seen MissionChief chat ID: `{last_seen}`\n"
+            + "\n".join(self._metrics_lines())
         )
 
     @chatmanager.command(name="enable")
@@ -394,6 +512,7 @@ class ChatManager(commands.Cog):
             await ctx.send("Interval must be between 30 and 3600 seconds.")
             return
         await self.config.poll_interval_seconds.set(int(seconds))
+        self._poll_wake.set()
         await ctx.send(f"ChatManager poll interval set to `{seconds}` seconds.")
 
     @chatmanager.command(name="syncnow")
@@ -418,4 +537,5 @@ class ChatManager(commands.Cog):
     async def chatmanager_reset(self, ctx: commands.Context):
         """Reset the last seen MissionChief chat ID. The next sync marks current history as seen."""
         await self.config.last_seen_chat_id.set(0)
+        self._last_chat_fingerprint = ""
         await ctx.send("ChatManager last seen ID reset. Next sync will mark current history as seen.")
@@ -19,6 +19,27 @@ from cryptography.fernet import Fernet
 from redbot.core import commands, Config, checks
 from redbot.core.data_manager import cog_data_path
 
+try:
+    from .request_governor import (
+        DEFAULT_BURST,
+        DEFAULT_MAX_CONCURRENCY,
+        DEFAULT_PRIORITY,
+        DEFAULT_RATE_PER_SECOND,
+        RequestGovernor,
+        format_governor_stats,
+    )
+    from .session_monitor import SessionMonitor, SessionRules, format_session_monitor
+except ImportError:  # pragma: no cover - direct module loading in local tooling
+    from request_governor import (
+        DEFAULT_BURST,
+        DEFAULT_MAX_CONCURRENCY,
+        DEFAULT_PRIORITY,
+        DEFAULT_RATE_PER_SECOND,
+        RequestGovernor,
+        format_governor_stats,
+    )
+    from session_monitor import SessionMonitor, SessionRules, format_session_monitor
+
 log = logging.getLogger("red.FARA.CookieManager")
 
 DEFAULTS = {
@@ -35,9 +56,18 @@ DEFAULTS = {
     "success_markers": ["Logout", "/logout", "Sign out", "My profile"],
     "success_url_contains": ["/buildings", "/dashboard", "/missions"],
     "login_failure_url_contains": ["/users/sign_in", "/login"],
-    "validation_mode": "url_or_markers"  # url_or_markers | url_only | markers_only
+    "validation_mode": "url_or_markers",  # url_or_markers | url_only | markers_only
+    "request_rate_per_second": DEFAULT_RATE_PER_SECOND,
+    "request_burst": DEFAULT_BURST,
+    "max_concurrent_requests": DEFAULT_MAX_CONCURRENCY,
 }
 
+# Shared-session connector: keep MissionChief connections alive between requests
+# and cache DNS so paced scrapes do not pay a handshake and lookup every page.
+CONNECTOR_LIMIT = 10
+CONNECTOR_KEEPALIVE_SECONDS = 60
+CONNECTOR_DNS_CACHE_SECONDS = 300
+
 class CookieManager(commands.Cog):
     """Cookie/session manager for MissionChief (login, store, expose session)."""
 
@@ -61,6 +91,11 @@ class CookieManager(commands.Cog):
         self._shared_session: Optional[ClientSession] = None
         self._session_invalidated = False
 
+        # Global pacing for MissionChief requests from every cog
+        self.governor = RequestGovernor()
+        # Classifies shared-session responses and re-logs in when one shows the login page
+        self.session_monitor = SessionMonitor(self._perform_login)
+
         self._init_key()
         self.bot.loop.create_task(self._maybe_start_background())
 
@@ -179,7 +214,19 @@ class CookieManager(commands.Cog):
         stored = await self._load_cookies()
         timeout = ClientTimeout(total=40)
         headers = {"User-Agent": await self.config.user_agent()}
-        session = aiohttp.ClientSession(cookie_jar=jar, timeout=timeout, headers=headers)
+        connector = aiohttp.TCPConnector(
+            limit=CONNECTOR_LIMIT,
+            keepalive_timeout=CONNECTOR_KEEPALIVE_SECONDS,
+            use_dns_cache=True,
+            ttl_dns_cache=CONNECTOR_DNS_CACHE_SECONDS,
+        )
+        session = aiohttp.ClientSession(
+            cookie_jar=jar,
+            timeout=timeout,
+            headers=headers,
+            connector=connector,
+            response_class=self.session_monitor.response_class(self.session_monitor.new_generation()),
+        )
 
         if stored and "cookies" in stored and stored["cookies"]:
             simple = self._cookie_dicts_to_simplecookie(stored["cookies"])
@@ -215,6 +262,31 @@ class CookieManager(commands.Cog):
             
             return self._shared_session
 
+    def request_slot(self, caller: str, priority: str = DEFAULT_PRIORITY):
+        """Async context manager pacing one MissionChief request through the governor.
+
+        For callers that already hold the shared session; ``priority`` is one of
+        interactive, board, scraper or backfill.
+        """
+        return self.governor.slot(caller, priority)
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, *, caller: str, priority: str = DEFAULT_PRIORITY, **kwargs):
+        """Governed request on the shared session; yields the aiohttp response."""
+        session = await self.get_session()
+        async with self.governor.slot(caller, priority):
+            async with session.request(method, url, **kwargs) as response:
+                yield response
+
+    async def _apply_runtime_config(self):
+        cfg = await self.config.all()
+        self.session_monitor.rules = SessionRules.from_config(cfg)
+        self.governor.configure(
+            rate_per_second=cfg.get("request_rate_per_second", DEFAULT_RATE_PER_SECOND),
+            burst=cfg.get("request_burst", DEFAULT_BURST),
+            max_concurrency=cfg.get("max_concurrent_requests", DEFAULT_MAX_CONCURRENCY),
+        )
+
     # Login
     def _parse_login_form(self, html: str, login_url: str) -> Tuple[str, Dict[str, str]]:
         soup = BeautifulSoup(html, "lxml")
@@ -298,21 +370,7 @@ class CookieManager(commands.Cog):
                 step["final_url"] = final_url
                 out["steps"].append(step)
 
-                failure_frags: List[str] = cfg.get("login_failure_url_contains", DEFAULTS["login_failure_url_contains"])
-                success_frags: List[str] = cfg.get("success_url_contains", DEFAULTS["success_url_contains"])
-                markers: List[str] = cfg.get("success_markers", DEFAULTS["success_markers"])
-                mode: str = cfg.get("validation_mode", DEFAULTS["validation_mode"])
-
-                fail = any(frag in final_url for frag in failure_frags)
-                ok_by_url = any(frag in final_url for frag in success_frags) and not fail
-                ok_by_markers = any(m in chk_text for m in markers)
-
-                if mode == "url_only":
-                    success = ok_by_url
-                elif mode == "markers_only":
-                    success = ok_by_markers and not fail
-                else:
-                    success = (ok_by_url or ok_by_markers) and not fail
+                success = SessionRules.from_config(cfg).page_is_authenticated(final_url, chk_text)
 
                 if success:
                     cookies_list = []
@@ -404,7 +462,7 @@ class CookieManager(commands.Cog):
     async def login(self, ctx: commands.Context):
         """Force a login/refresh now."""
         await ctx.send("Attempting login...")
-        ok = await self._perform_login()
+        ok = await self.session_monitor.relogin("manual login")
         await ctx.send("Login successful." if ok else "Login failed. See `!cookie debug trace`.")
 
     @cookie.command(name="logout")
@@ -438,6 +496,8 @@ class CookieManager(commands.Cog):
         lines.append(f"User-Agent: {cfg['user_agent']}")
         lines.append(f"Auto refresh minutes: {cfg['auto_refresh_minutes']}")
         lines.append(f"Warn before minutes: {cfg['cookie_warn_before_minutes']}")
+        lines.extend(format_session_monitor(self.session_monitor))
+        lines.extend(format_governor_stats(self.governor))
         await ctx.send("```\n" + "\n".join(lines) + "\n```")
 
     @cookie.group(name="config")
@@ -449,6 +509,7 @@ class CookieManager(commands.Cog):
         """
         Set a config value.
         Keys: login_url, check_url, user_agent, auto_refresh_minutes, cookie_warn_before_minutes, username_field, password_field
+        Governor: request_rate_per_second, request_burst, max_concurrent_requests
         List keys: csrf_field_names, success_markers, success_url_contains, login_failure_url_contains
         Special: extra_form_fields (JSON), validation_mode (url_or_markers|url_only|markers_only)
         """
@@ -457,6 +518,7 @@ class CookieManager(commands.Cog):
         if key in listy:
             arr = [x.strip() for x in value.split(",") if x.strip()]
             await getattr(self.config, key).set(arr)
+            await self._apply_runtime_config()
             await ctx.send(f"Set {key} to: {arr}")
             return
         if key == "extra_form_fields":
@@ -478,8 +540,22 @@ class CookieManager(commands.Cog):
             await getattr(self.config, key).set(value_int)
             await ctx.send(f"Set {key}.")
             return
+        if key in ["request_rate_per_second", "request_burst", "max_concurrent_requests"]:
+            try:
+                number = float(value) if key == "request_rate_per_second" else int(value)
+            except Exception:
+                await ctx.send("Value must be a number.")
+                return
+            if number <= 0:
+                await ctx.send("Value must be greater than zero.")
+                return
+            await getattr(self.config, key).set(number)
+            await self._apply_runtime_config()
+            await ctx.send(f"Set {key}.")
+            return
         if key in ["login_url", "check_url", "user_agent", "username_field", "password_field", "validation_mode"]:
             await getattr(self.config, key).set(value)
+            await self._apply_runtime_config()
             await ctx.send(f"Set {key}.")
             return
         await ctx.send("Unknown key.")
@@ -487,26 +563,14 @@ class CookieManager(commands.Cog):
     @cookie.command(name="testrequest")
     async def testrequest(self, ctx: commands.Context):
         """Make a test request using stored cookies and report success/failure."""
-        session = await self.get_session()
         try:
             url = await self.config.check_url()
-            r = await session.get(url, allow_redirects=True)
-            text = await r.text()
-            final_url = str(r.url)
-            failure = any(f in final_url for f in (await self.config.login_failure_url_contains()))
-            success_frags = await self.config.success_url_contains()
-            markers = await self.config.success_markers()
-            mode = await self.config.validation_mode()
-
-            ok_by_url = any(s in final_url for s in success_frags) and not failure
-            ok_by_markers = any(m in text for m in markers)
-
-            if mode == "url_only":
-                ok = ok_by_url
-            elif mode == "markers_only":
-                ok = ok_by_markers and not failure
-            else:
-                ok = (ok_by_url or ok_by_markers) and not failure
+            async with self.request("GET", url, caller="CookieManager", priority="interactive", allow_redirects=True) as r:
+                text = await r.text()
+                final_url = str(r.url)
+            rules = SessionRules.from_config(await self.config.all())
+            failure = rules.is_login_redirect(final_url)
+            ok = rules.page_is_authenticated(final_url, text)
 
             if failure:
                 await ctx.send(f"Test request indicates NOT logged in (final url: {final_url}).")
@@ -549,6 +613,10 @@ class CookieManager(commands.Cog):
             await self.bot.wait_until_red_ready()
         except Exception:
             pass
+        try:
+            await self._apply_runtime_config()
+        except Exception as e:
+            log.warning(f"Could not apply runtime config: {e}")
         if self._bg_task is None:
             self._bg_task = asyncio.create_task(self._background_worker())
 
@@ -568,7 +636,10 @@ class CookieManager(commands.Cog):
                             saved_dt = datetime.fromisoformat(saved_at)
                         except Exception:
                             saved_dt = datetime.utcnow() - timedelta(days=365)
-                        if datetime.utcnow() - saved_dt > timedelta(minutes=warn_before):
+                        stale = datetime.utcnow() - saved_dt > timedelta(minutes=warn_before)
+                        # Traffic through the shared session confirms the cookies as a side
+                        # effect, so the probe only runs when nothing did so recently
+                        if stale and not self.session_monitor.confirmed_within(refresh_minutes * 60):
                             # Before attempting re-login, verify if cookies still work
                             ok = await self._quick_session_check()
                             if ok:
@@ -578,14 +649,14 @@ class CookieManager(commands.Cog):
                                 await self._log_admin("Cookie older than warn threshold but session still valid. Timestamp refreshed.")
                             else:
                                 await self._log_admin("Cookie older than warn threshold. Attempting automatic refresh...")
-                                ok2 = await self._perform_login()
+                                ok2 = await self.session_monitor.relogin("background check failed")
                                 if not ok2:
                                     await self._log_admin("Automatic refresh FAILED.")
                 else:
                     creds = await self._load_credentials()
                     if creds:
                         await self._log_admin("No cookies found but credentials present. Attempting login...")
-                        await self._perform_login()
+                        await self.session_monitor.relogin("no cookies stored")
             except Exception as e:
                 await self._log_admin(f"Background worker error: {e}")
             await asyncio.sleep(max(60, 60 * int((await self.config.auto_refresh_minutes()))))
@@ -593,24 +664,14 @@ class CookieManager(commands.Cog):
     async def _quick_session_check(self) -> bool:
         """Lightweight check if current cookies still pass the check_url validation."""
         async with self._bot_status("checking MissionChief session", priority=75):
-            session = await self.get_session()
             try:
-                url = await self.config.check_url()
-                r = await session.get(url, allow_redirects=True)
-                text = await r.text()
-                final_url = str(r.url)
-                failure = any(f in final_url for f in (await self.config.login_failure_url_contains()))
-                success_frags = await self.config.success_url_contains()
-                markers = await self.config.success_markers()
-                mode = await self.config.validation_mode()
-                ok_by_url = any(s in final_url for s in success_frags) and not failure
-                ok_by_markers = any(m in text for m in markers)
-                if mode == "url_only":
-                    ok = ok_by_url
-                elif mode == "markers_only":
-                    ok = ok_by_markers and not failure
-                else:
-                    ok = (ok_by_url or ok_by_markers) and not failure
+                cfg = await self.config.all()
+                async with self.request("GET", cfg["check_url"], caller="CookieManager", allow_redirects=True) as r:
+                    text = await r.text()
+                    final_url = str(r.url)
+                ok = SessionRules.from_config(cfg).page_is_authenticated(final_url, text)
+                if ok:
+                    self.session_monitor.confirm(final_url)
                 return ok
             except Exception:
                 return False
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+# Lower rank is served first when requests queue up
+PRIORITIES = {
+    "interactive": 0,
+    "board": 1,
+    "scraper": 2,
+    "backfill": 3,
+}
+DEFAULT_PRIORITY = "scraper"
+
+# About one scraper's old pace (a fixed 1.5 s sleep plus the request), now shared by all callers
+DEFAULT_RATE_PER_SECOND = 1.0
+DEFAULT_BURST = 3
+DEFAULT_MAX_CONCURRENCY = 3
+# Slots only interactive requests may take, so a long scrape never blocks a command
+INTERACTIVE_RESERVED_SLOTS = 1
+
+
+@dataclass
+class CallerStats:
+    requests: int = 0
+    errors: int = 0
+    queue_wait_seconds: float = 0.0
+    max_queue_wait_seconds: float = 0.0
+    latency_seconds: float = 0.0
+    max_latency_seconds: float = 0.0
+    priority: str = DEFAULT_PRIORITY
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "priority": self.priority,
+            "requests": self.requests,
+            "errors": self.errors,
+            "avg_wait_ms": round(self.queue_wait_seconds / self.requests * 1000, 1) if self.requests else 0.0,
+            "max_wait_ms": round(self.max_queue_wait_seconds * 1000, 1),
+            "avg_latency_ms": round(self.latency_seconds / self.requests * 1000, 1) if self.requests else 0.0,
+            "max_latency_ms": round(self.max_latency_seconds * 1000, 1),
+        }
+
+
+class RequestGovernor:
+    """Token bucket plus concurrency cap in front of every MissionChief request.
+
+    Callers wait in one priority queue (see ``PRIORITIES``); the head of the queue
+    leaves once a token is available and a concurrency slot is free. The last
+    ``INTERACTIVE_RESERVED_SLOTS`` slots are kept for interactive requests.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._clock = clock
+        self._condition = asyncio.Condition()
+        self._waiting: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._active = 0
+        self._stats: Dict[str, CallerStats] = {}
+        self.configure(rate_per_second=rate_per_second, burst=burst, max_concurrency=max_concurrency)
+        self._tokens = float(self.burst)
+        self._refilled_at = clock()
+
+    def configure(
+        self,
+        *,
+        rate_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> None:
+        if rate_per_second is not None:
+            self.rate_per_second = max(0.01, float(rate_per_second))
+        if burst is not None:
+            self.burst = max(1, int(burst))
+        if max_concurrency is not None:
+            self.max_concurrency = max(1, int(max_concurrency))
+        if hasattr(self, "_tokens"):
+            self._tokens = min(self._tokens, float(self.burst))
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiting)
+
+    def _limit_for(self, rank: int) -> int:
+        if rank == PRIORITIES["interactive"]:
+            return self.max_concurrency
+        return max(1, self.max_concurrency - INTERACTIVE_RESERVED_SLOTS)
+
+    def _token_delay(self) -> float:
+        """Refill the bucket and return how long until one token is available."""
+        now = self._clock()
+        elapsed = max(0.0, now - self._refilled_at)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate_per_second)
+        self._refilled_at = now
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate_per_second
+
+    async def _acquire(self, rank: int) -> None:
+        entry = (rank, next(self._sequence))
+        async with self._condition:
+            heapq.heappush(self._waiting, entry)
+            try:
+                while True:
+                    if self._waiting[0] != entry or self._active >= self._limit_for(rank):
+                        await self._condition.wait()
+                        continue
+                    delay = self._token_delay()
+                    if delay <= 0:
+                        break
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                self._condition.notify_all()
+                raise
+            heapq.heappop(self._waiting)
+            self._tokens -= 1
+            self._active += 1
+            # The next waiter may now be at the head
+            self._condition.notify_all()
+
+    async def _release(self) -> None:
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self, caller: str, priority: str = DEFAULT_PRIORITY) -> AsyncIterator[None]:
+        """Hold one request slot for ``caller``; time spent inside counts as latency."""
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown request priority {priority!r}; expected one of {', '.join(PRIORITIES)}")
+        stats = self._stats.setdefault(caller, CallerStats())
+        stats.priority = priority
+        queued_at = self._clock()
+        await self._acquire(PRIORITIES[priority])
+        started = self._clock()
+        wait = started - queued_at
+        stats.queue_wait_seconds += wait
+        stats.max_queue_wait_seconds = max(stats.max_queue_wait_seconds, wait)
+        try:
+            yield
+        except BaseException:
+            stats.errors += 1
+            raise
+        finally:
+            latency = self._clock() - started
+            stats.requests += 1
+            stats.latency_seconds += latency
+            stats.max_latency_seconds = max(stats.max_latency_seconds, latency)
+            await self._release()
+
+    def stats(self, caller: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Per-caller queue wait and request latency."""
+        if caller is not None:
+            stats = self._stats.get(caller)
+            return {caller: stats.as_dict()} if stats else {}
+        return {name: value.as_dict() for name, value in sorted(self._stats.items())}
+
+
+def format_governor_stats(governor: RequestGovernor) -> List[str]:
+    """Status lines: the limiter settings, then one line per caller."""
+    lines = [
+        f"Request governor: {governor.rate_per_second:g}/s, burst {governor.burst}, "
+        f"max {governor.max_concurrency} concurrent ({governor.active} active, {governor.queued} queued)"
+    ]
+    for caller, stats in governor.stats().items():
+        lines.append(
+            f"  {caller} [{stats['priority']}]: {stats['requests']} requests, {stats['errors']} errors, "
+            f"wait avg {stats['avg_wait_ms']} / max {stats['max_wait_ms']} ms, "
+            f"latency avg {stats['avg_latency_ms']} / max {stats['max_latency_ms']} ms"
+        )
+    return lines
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Mapping, Optional, Sequence, Type
+
+from aiohttp import ClientResponse
+
+log = logging.getLogger("red.FARA.CookieManager")
+
+AUTHENTICATED = "authenticated"
+LOGGED_OUT = "logged_out"
+
+# After a failed passive re-login, ignore further logout signals for this long
+RELOGIN_RETRY_SECONDS = 10 * 60
+
+
+@dataclass(frozen=True)
+class SessionRules:
+    """How to tell an authenticated MissionChief page from the login page."""
+
+    failure_url_contains: Sequence[str] = ("/users/sign_in", "/login")
+    success_url_contains: Sequence[str] = ("/buildings", "/dashboard", "/missions")
+    success_markers: Sequence[str] = ("Logout", "/logout", "Sign out", "My profile")
+    validation_mode: str = "url_or_markers"
+    host: str = "www.missionchief.com"
+
+    @classmethod
+    def from_config(cls, cfg: Mapping[str, Any]) -> "SessionRules":
+        defaults = cls()
+        check_url = str(cfg.get("check_url") or "")
+        host = check_url.split("://", 1)[-1].split("/", 1)[0] or defaults.host
+        return cls(
+            failure_url_contains=tuple(cfg.get("login_failure_url_contains") or defaults.failure_url_contains),
+            success_url_contains=tuple(cfg.get("success_url_contains") or defaults.success_url_contains),
+            success_markers=tuple(cfg.get("success_markers") or defaults.success_markers),
+            validation_mode=cfg.get("validation_mode") or defaults.validation_mode,
+            host=host,
+        )
+
+    def is_login_redirect(self, final_url: str) -> bool:
+        return any(frag in final_url for frag in self.failure_url_contains)
+
+    def page_is_authenticated(self, final_url: str, text: str) -> bool:
+        """The check_url validation the login flow and probes have always used."""
+        failure = self.is_login_redirect(final_url)
+        ok_by_url = any(frag in final_url for frag in self.success_url_contains) and not failure
+        ok_by_markers = any(marker in text for marker in self.success_markers)
+        if self.validation_mode == "url_only":
+            return ok_by_url
+        if self.validation_mode == "markers_only":
+            return ok_by_markers and not failure
+        return (ok_by_url or ok_by_markers) and not failure
+
+    def classify(self, final_url: str, status: int, body: bytes) -> Optional[str]:
+        """AUTHENTICATED, LOGGED_OUT, or None when the response says nothing either way.
+
+        Any MissionChief page can confirm the session, so only the markers count as
+        proof here; a success URL alone is too weak for pages other than check_url.
+        """
+        if self.host not in final_url:
+            return None
+        if self.is_login_redirect(final_url) or status == 401:
+            return LOGGED_OUT
+        if status >= 400:
+            return None
+        # Markers are ASCII, so the raw body can be searched without decoding it
+        if self.validation_mode != "url_only" and any(marker.encode() in body for marker in self.success_markers):
+            return AUTHENTICATED
+        return None
+
+
+@dataclass
+class SessionMonitorStats:
+    authenticated: int = 0
+    logged_out: int = 0
+    unclassified: int = 0
+    stale_logged_out: int = 0
+    relogins: int = 0
+    relogin_failures: int = 0
+    last_relogin_reason: Optional[str] = None
+    last_confirmed_url: Optional[str] = None
+
+
+class SessionMonitor:
+    """Watch shared-session responses to know whether the cookies still work.
+
+    Every response body read through a session built with ``response_class``
+    is classified with ``SessionRules``. An authenticated page records the time;
+    a login redirect starts one re-login that concurrent callers share. Responses
+    from a session older than the current ``generation`` are ignored, since the
+    cookies they carry were already replaced.
+    """
+
+    def __init__(
+        self,
+        relogin: Callable[[], Awaitable[bool]],
+        *,
+        rules: Optional[SessionRules] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._relogin = relogin
+        self.rules = rules or SessionRules()
+        self._clock = clock
+        self.generation = 0
+        self.last_confirmed_at: Optional[float] = None
+        self.last_logged_out_at: Optional[float] = None
+        self._relogin_task: Optional[asyncio.Task] = None
+        self._retry_after: Optional[float] = None
+        self.stats = SessionMonitorStats()
+
+    def new_generation(self) -> int:
+        """Called when the shared session is rebuilt with fresh cookies."""
+        self.generation += 1
+        return self.generation
+
+    def confirmed_within(self, seconds: float) -> bool:
+        return self.last_confirmed_at is not None and self._clock() - self.last_confirmed_at <= seconds
+
+    def confirmed_age(self) -> Optional[float]:
+        return None if self.last_confirmed_at is None else self._clock() - self.last_confirmed_at
+
+    def confirm(self, url: Optional[str] = None) -> None:
+        self.last_confirmed_at = self._clock()
+        self.stats.last_confirmed_url = url
+
+    def observe(self, final_url: str, status: int, body: bytes, *, generation: Optional[int] = None) -> Optional[str]:
+        state = self.rules.classify(final_url, status, body)
+        if state == AUTHENTICATED:
+            self.stats.authenticated += 1
+            self.confirm(final_url)
+        elif state == LOGGED_OUT:
+            if generation is not None and generation != self.generation:
+                self.stats.stale_logged_out += 1
+                return state
+            self.stats.logged_out += 1
+            self.last_logged_out_at = self._clock()
+            self.last_confirmed_at = None
+            self._start_relogin(f"logged-out response from {final_url}")
+        else:
+            self.stats.unclassified += 1
+        return state
+
+    @property
+    def relogin_running(self) -> bool:
+        return self._relogin_task is not None and not self._relogin_task.done()
+
+    def _start_relogin(self, reason: str) -> Optional[asyncio.Task]:
+        if self.relogin_running:
+            return self._relogin_task
+        if self._retry_after is not None and self._clock() < self._retry_after:
+            return None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        self.stats.last_relogin_reason = reason
+        self._relogin_task = loop.create_task(self._run_relogin())
+        return self._relogin_task
+
+    async def _run_relogin(self) -> bool:
+        self.stats.relogins += 1
+        try:
+            ok = await self._relogin()
+        except Exception as exc:
+            log.warning("Session re-login failed: %s", exc)
+            ok = False
+        if ok:
+            self._retry_after = None
+            self.confirm()
+        else:
+            self.stats.relogin_failures += 1
+            self._retry_after = self._clock() + RELOGIN_RETRY_SECONDS
+        return ok
+
+    async def relogin(self, reason: str = "requested") -> bool:
+        """Run a re-login, or join the one already in flight."""
+        task = self._relogin_task if self.relogin_running else None
+        if task is None:
+            self._retry_after = None
+            task = self._start_relogin(reason)
+        return bool(await task) if task is not None else False
+
+    def response_class(self, generation: Optional[int] = None) -> Type[ClientResponse]:
+        """``ClientResponse`` subclass that reports each body it reads to this monitor."""
+        monitor = self
+        generation = self.generation if generation is None else generation
+
+        class MonitoredResponse(ClientResponse):
+            _fara_observed = False
+
+            async def read(self) -> bytes:
+                body = await super().read()
+                if not self._fara_observed:
+                    self._fara_observed = True
+                    try:
+                        monitor.observe(str(self.url), self.status, body, generation=generation)
+                    except Exception as exc:
+                        log.debug("Session monitor could not classify %s: %s", self.url, exc)
+                return body
+
+        return MonitoredResponse
+
+
+def format_session_monitor(monitor: SessionMonitor) -> List[str]:
+    """Status lines for ``cookie status``."""
+    age = monitor.confirmed_age()
+    stats = monitor.stats
+    lines = [
+        "Session confirmed by traffic: "
+        + ("never" if age is None else f"{age:.0f}s ago"),
+        f"Responses seen: {stats.authenticated} authenticated, {stats.logged_out} logged out, "
+        f"{stats.unclassified} unclassified",
+        f"Monitor re-logins: {stats.relogins} ({stats.relogin_failures} failed)"
+        + (" - running" if monitor.relogin_running else ""),
+    ]
+    if stats.last_relogin_reason:
+        lines.append(f"Last re-login reason: {stats.last_relogin_reason}")
+    return lines
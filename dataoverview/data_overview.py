@@ -1,3 +1,5 @@
+import asyncio
+import time
 import discord
 from redbot.core import commands
 import sqlite3
@@ -5,6 +7,239 @@ from pathlib import Path
 from datetime import datetime
 from redbot.core.data_manager import cog_data_path
 
+# Checked in order; the first one backed by an index wins, otherwise the first present
+TIMESTAMP_COLUMNS = ('timestamp', 'event_timestamp', 'log_timestamp', 'scraped_at', 'created_at')
+# COUNT(*) and dbstat scan the whole file; without ANALYZE data their results are reused this long
+FALLBACK_REFRESH_SECONDS = 15 * 60
+
+
+def _quote(identifier):
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _file_signature(db_path):
+    """mtime/size of the database and its WAL; WAL-mode writes leave the main file untouched"""
+    signature = []
+    for path in (db_path, db_path.with_name(db_path.name + '-wal')):
+        try:
+            stat = path.stat()
+        except OSError:
+            signature.append(None)
+            continue
+        signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _connect_readonly(db_path):
+    conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True, timeout=30)
+    conn.execute('PRAGMA busy_timeout = 30000')
+    return conn
+
+
+def _discover_timestamp_column(conn, table):
+    """Return (column, indexed) for the table's timestamp column, or (None, False)"""
+    columns = {row[1] for row in conn.execute(f'PRAGMA table_info({_quote(table)})')}
+    present = [col for col in TIMESTAMP_COLUMNS if col in columns]
+    if not present:
+        return None, False
+
+    leading = set()
+    for index in conn.execute(f'PRAGMA index_list({_quote(table)})').fetchall():
+        first = conn.execute(f'PRAGMA index_info({_quote(index[1])})').fetchone()
+        if first and first[2]:
+            leading.add(first[2])
+
+    for col in present:
+        if col in leading:
+            return col, True
+    return present[0], False
+
+
+def _time_range(conn, table, column, indexed):
+    """MIN/MAX without a scan: via the index, or via rowid order for append-only tables"""
+    if indexed:
+        # Two separate queries so each is a single index seek; NULLs sort first in an index
+        first = conn.execute(
+            f'SELECT MIN({_quote(column)}) FROM {_quote(table)} WHERE {_quote(column)} IS NOT NULL'
+        ).fetchone()[0]
+        last = conn.execute(f'SELECT MAX({_quote(column)}) FROM {_quote(table)}').fetchone()[0]
+        return first, last, False
+
+    try:
+        first = conn.execute(
+            f'SELECT {_quote(column)} FROM {_quote(table)} ORDER BY rowid LIMIT 1'
+        ).fetchone()
+        last = conn.execute(
+            f'SELECT {_quote(column)} FROM {_quote(table)} ORDER BY rowid DESC LIMIT 1'
+        ).fetchone()
+    except sqlite3.OperationalError:
+        # WITHOUT ROWID table; not worth a full scan
+        return None, None, True
+    return (first[0] if first else None), (last[0] if last else None), True
+
+
+def _row_estimates(conn):
+    """Row counts recorded by ANALYZE, keyed by table"""
+    try:
+        rows = conn.execute('SELECT tbl, stat FROM sqlite_stat1').fetchall()
+    except sqlite3.OperationalError:
+        return {}
+    estimates = {}
+    for table, stat in rows:
+        try:
+            estimates[table] = max(estimates.get(table, 0), int(str(stat).split()[0]))
+        except (ValueError, IndexError):
+            continue
+    return estimates
+
+
+def _table_storage(conn):
+    """Pages and bytes per table (indexes included) from the dbstat virtual table"""
+    try:
+        rows = conn.execute(
+            """
+            SELECT COALESCE(m.tbl_name, s.name), SUM(s.pgsize), COUNT(*)
+            FROM dbstat AS s
+            LEFT JOIN sqlite_master AS m ON m.name = s.name
+            GROUP BY 1
+            """
+        ).fetchall()
+    except sqlite3.OperationalError:
+        # SQLite built without SQLITE_ENABLE_DBSTAT_VTAB
+        return {}
+    return {table: {'bytes': size or 0, 'pages': pages or 0} for table, size, pages in rows}
+
+
+def _reuse_fallback(fallback_cache, key, compute):
+    """Return (value, reused): a scan result younger than FALLBACK_REFRESH_SECONDS, or a fresh one"""
+    now = time.monotonic()
+    cached = fallback_cache.get(key)
+    if cached and now - cached[0] < FALLBACK_REFRESH_SECONDS:
+        return cached[1], True
+    value = compute()
+    fallback_cache[key] = (now, value)
+    return value, False
+
+
+def collect_db_stats(db_path, schema_cache=None, fallback_cache=None):
+    """Blocking; run through asyncio.to_thread.
+
+    ``schema_cache`` maps (path, schema_version, table) to the discovered
+    timestamp column so PRAGMA table_info only runs once per schema.
+    ``fallback_cache`` keeps the full-scan COUNT(*) and dbstat results for
+    FALLBACK_REFRESH_SECONDS; a reused count is reported as an estimate.
+    """
+    schema_cache = {} if schema_cache is None else schema_cache
+    fallback_cache = {} if fallback_cache is None else fallback_cache
+    conn = _connect_readonly(db_path)
+    try:
+        schema_version = conn.execute('PRAGMA schema_version').fetchone()[0]
+        page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+        page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+        freelist_count = conn.execute('PRAGMA freelist_count').fetchone()[0]
+        tables = [
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+            )
+        ]
+        estimates = _row_estimates(conn)
+        storage, _ = _reuse_fallback(fallback_cache, (str(db_path), 'storage'), lambda: _table_storage(conn))
+
+        stats = {}
+        for table in tables:
+            key = (str(db_path), schema_version, table)
+            if key not in schema_cache:
+                schema_cache[key] = _discover_timestamp_column(conn, table)
+            column, indexed = schema_cache[key]
+
+            if table in estimates:
+                count, estimated = estimates[table], True
+            else:
+                count, estimated = _reuse_fallback(
+                    fallback_cache,
+                    (str(db_path), 'count', table),
+                    lambda: conn.execute(f'SELECT COUNT(*) FROM {_quote(table)}').fetchone()[0],
+                )
+
+            min_time, max_time, approximate = None, None, False
+            if column:
+                min_time, max_time, approximate = _time_range(conn, table, column, indexed)
+
+            table_storage = storage.get(table, {})
+            stats[table] = {
+                'count': count,
+                'count_estimated': estimated,
+                'min_time': min_time,
+                'max_time': max_time,
+                'time_column': column,
+                'time_approximate': approximate,
+                'bytes': table_storage.get('bytes'),
+                'pages': table_storage.get('pages'),
+            }
+
+        return {
+            'tables': stats,
+            'page_size': page_size,
+            'page_count': page_count,
+            'freelist_count': freelist_count,
+            'file_size': Path(db_path).stat().st_size,
+        }
+    finally:
+        conn.close()
+
+
+def collect_income_breakdown(db_path):
+    """Blocking; entry type and period counts for income_v2.db"""
+    conn = _connect_readonly(db_path)
+    try:
+        breakdown = dict(conn.execute("SELECT entry_type, COUNT(*) FROM income GROUP BY entry_type").fetchall())
+        periods = dict(conn.execute("SELECT period, COUNT(*) FROM income GROUP BY period").fetchall())
+        return {'breakdown': breakdown, 'periods': periods}
+    finally:
+        conn.close()
+
+
+def collect_building_totals(db_path):
+    """Blocking; distinct counts and latest classroom total for buildings_v2.db"""
+    conn = _connect_readonly(db_path)
+    try:
+        unique_buildings = conn.execute("SELECT COUNT(DISTINCT building_id) FROM buildings").fetchone()[0]
+        unique_owners = conn.execute("SELECT COUNT(DISTINCT owner_name) FROM buildings").fetchone()[0]
+        total_classrooms = conn.execute(
+            "SELECT SUM(classrooms) FROM buildings WHERE timestamp = (SELECT MAX(timestamp) FROM buildings)"
+        ).fetchone()[0] or 0
+        return {
+            'unique_buildings': unique_buildings,
+            'unique_owners': unique_owners,
+            'total_classrooms': total_classrooms,
+        }
+    finally:
+        conn.close()
+
+
+def _format_size(num_bytes):
+    if num_bytes is None:
+        return 'N/A'
+    if num_bytes >= 1024 * 1024:
+        return f"{num_bytes / (1024 * 1024):.2f} MB"
+    return f"{num_bytes / 1024:.1f} KB"
+
+
+def _format_count(data):
+    prefix = '~' if data.get('count_estimated') else ''
+    return f"{prefix}{data['count']:,}"
+
+
+def _format_time(data, key):
+    """Date part of a first/last time; ``~`` when it came from insert order rather than the column"""
+    value = data.get(key)
+    if not value:
+        return 'N/A'
+    prefix = '~' if data.get('time_approximate') else ''
+    return f"{prefix}{str(value)[:10]}"
+
+
 class DataOverview(commands.Cog):
     """Shows overview of all scraped data"""
     
@@ -14,130 +249,145 @@ class DataOverview(commands.Cog):
         # Get database paths
         base_path = cog_data_path(self.bot.get_cog("CookieManager"))
         self.db_dir = base_path.parent / "scraper_databases"
+        
+        # (db_name, kind) -> (file signature, result); recomputed only when the file changes
+        self._stats_cache = {}
+        self._schema_cache = {}
+        self._fallback_cache = {}
     
-    def _get_db_stats(self, db_name):
-        """Get statistics from a database"""
+    async def _cached(self, db_name, kind, func, *args):
         db_path = self.db_dir / db_name
         if not db_path.exists():
             return None
         
+        cache = getattr(self, '_stats_cache', None)
+        if cache is None:
+            cache = self._stats_cache = {}
+        signature = _file_signature(db_path)
+        cached = cache.get((db_name, kind))
+        if cached and cached[0] == signature:
+            return cached[1]
+        
+        result = await asyncio.to_thread(func, db_path, *args)
+        cache[(db_name, kind)] = (signature, result)
+        return result
+    
+    async def _get_db_stats(self, db_name):
+        """Get statistics from a database, computed off the event loop and cached per file mtime"""
+        if getattr(self, '_schema_cache', None) is None:
+            self._schema_cache = {}
+        if getattr(self, '_fallback_cache', None) is None:
+            self._fallback_cache = {}
         try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            # Get all tables
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row[0] for row in cursor.fetchall()]
-            
-            stats = {}
-            for table in tables:
-                cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                count = cursor.fetchone()[0]
-                
-                # Get date range - try different timestamp column names
-                min_time, max_time = None, None
-                for col in ['timestamp', 'log_timestamp', 'scraped_at', 'created_at']:
-                    try:
-                        cursor.execute(f"SELECT MIN({col}), MAX({col}) FROM {table}")
-                        min_time, max_time = cursor.fetchone()
-                        if min_time:
-                            break
-                    except:
-                        continue
-                
-                stats[table] = {
-                    'count': count,
-                    'min_time': min_time,
-                    'max_time': max_time
-                }
-            
-            conn.close()
-            return stats
-        except Exception as e:
+            return await self._cached(db_name, 'stats', collect_db_stats, self._schema_cache, self._fallback_cache)
+        except sqlite3.Error as e:
             return {'error': str(e)}
     
+    @staticmethod
+    def _storage_lines(stats):
+        """Per-table size/page lines plus the file-level page and free-list totals"""
+        lines = []
+        for table, data in sorted(
+            stats['tables'].items(), key=lambda item: item[1].get('bytes') or 0, reverse=True
+        ):
+            if data.get('pages') is None:
+                lines.append(f"`{table}`: {_format_count(data)} rows")
+            else:
+                lines.append(
+                    f"`{table}`: {_format_count(data)} rows, "
+                    f"{_format_size(data['bytes'])} ({data['pages']:,} pages)"
+                )
+        free_bytes = stats['freelist_count'] * stats['page_size']
+        lines.append(
+            f"**File:** {_format_size(stats['file_size'])}, {stats['page_count']:,} pages "
+            f"of {stats['page_size']:,} B, {stats['freelist_count']:,} free ({_format_size(free_bytes)})"
+        )
+        value = "\n".join(lines)
+        return value if len(value) <= 1024 else value[:1021] + "..."
+    
+    @staticmethod
+    def _add_storage_field(embed, stats):
+        if stats and 'tables' in stats:
+            embed.add_field(name="💾 Storage", value=DataOverview._storage_lines(stats), inline=False)
+    
     @commands.command(name="dataoverview")
     @commands.is_owner()
     async def data_overview(self, ctx):
         """Show overview of all scraped data"""
         
         # 1. Members Database
-        members_stats = self._get_db_stats("members_v2.db")
+        members_stats = await self._get_db_stats("members_v2.db")
         embed1 = discord.Embed(title="📊 Data Overview - Members", color=discord.Color.blue())
         
-        if members_stats and 'members' in members_stats:
-            m = members_stats['members']
+        if members_stats and 'members' in members_stats.get('tables', {}):
+            m = members_stats['tables']['members']
             embed1.add_field(
                 name="👥 Members Data",
-                value=f"**Records:** {m['count']:,}\n"
-                      f"**First:** {m['min_time'][:10] if m['min_time'] else 'N/A'}\n"
-                      f"**Last:** {m['max_time'][:10] if m['max_time'] else 'N/A'}",
+                value=f"**Records:** {_format_count(m)}\n"
+                      f"**First:** {_format_time(m, 'min_time')}\n"
+                      f"**Last:** {_format_time(m, 'max_time')}",
                 inline=False
             )
             
-            if 'suspicious_members' in members_stats:
-                s = members_stats['suspicious_members']
+            if 'suspicious_members' in members_stats['tables']:
+                s = members_stats['tables']['suspicious_members']
                 embed1.add_field(
                     name="⚠️ Suspicious Entries",
-                    value=f"**Records:** {s['count']:,}",
+                    value=f"**Records:** {_format_count(s)}",
                     inline=False
                 )
         else:
             embed1.add_field(name="❌ Status", value="No data or database not found", inline=False)
         
+        self._add_storage_field(embed1, members_stats)
+        
         embed1.set_footer(text="Database: members_v2.db")
         
         # 2. Logs Database
-        logs_stats = self._get_db_stats("logs_v2.db")
+        logs_stats = await self._get_db_stats("logs_v2.db")
         embed2 = discord.Embed(title="📊 Data Overview - Logs", color=discord.Color.green())
         
-        if logs_stats and 'logs' in logs_stats:
-            l = logs_stats['logs']
+        if logs_stats and 'logs' in logs_stats.get('tables', {}):
+            l = logs_stats['tables']['logs']
             embed2.add_field(
                 name="📜 Alliance Logs",
-                value=f"**Records:** {l['count']:,}\n"
-                      f"**First:** {l['min_time'][:10] if l['min_time'] else 'N/A'}\n"
-                      f"**Last:** {l['max_time'][:10] if l['max_time'] else 'N/A'}",
+                value=f"**Records:** {_format_count(l)}\n"
+                      f"**First:** {_format_time(l, 'min_time')}\n"
+                      f"**Last:** {_format_time(l, 'max_time')}",
                 inline=False
             )
             
-            if 'training_courses' in logs_stats:
-                t = logs_stats['training_courses']
+            if 'training_courses' in logs_stats['tables']:
+                t = logs_stats['tables']['training_courses']
                 embed2.add_field(
                     name="🎓 Training Courses",
-                    value=f"**Records:** {t['count']:,}\n"
-                          f"**First:** {t['min_time'][:10] if t['min_time'] else 'N/A'}\n"
-                          f"**Last:** {t['max_time'][:10] if t['max_time'] else 'N/A'}",
+                    value=f"**Records:** {_format_count(t)}\n"
+                          f"**First:** {_format_time(t, 'min_time')}\n"
+                          f"**Last:** {_format_time(t, 'max_time')}",
                     inline=False
                 )
         else:
             embed2.add_field(name="❌ Status", value="No data or database not found", inline=False)
         
+        self._add_storage_field(embed2, logs_stats)
+        
         embed2.set_footer(text="Database: logs_v2.db")
         
         # 3. Income Database
-        income_stats = self._get_db_stats("income_v2.db")
+        income_stats = await self._get_db_stats("income_v2.db")
         embed3 = discord.Embed(title="📊 Data Overview - Income/Expenses", color=discord.Color.gold())
         
-        if income_stats and 'income' in income_stats:
-            i = income_stats['income']
+        if income_stats and 'income' in income_stats.get('tables', {}):
+            i = income_stats['tables']['income']
             
             # Get breakdown by type
-            db_path = self.db_dir / "income_v2.db"
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT entry_type, COUNT(*) FROM income GROUP BY entry_type")
-            breakdown = dict(cursor.fetchall())
-            
-            cursor.execute("SELECT period, COUNT(*) FROM income GROUP BY period")
-            periods = dict(cursor.fetchall())
-            
-            conn.close()
+            income_extra = await self._cached("income_v2.db", 'breakdown', collect_income_breakdown)
+            breakdown = income_extra['breakdown']
+            periods = income_extra['periods']
             
             embed3.add_field(
                 name="💰 Income/Expense Records",
-                value=f"**Total Records:** {i['count']:,}\n"
+                value=f"**Total Records:** {_format_count(i)}\n"
                       f"**Income:** {breakdown.get('income', 0):,}\n"
                       f"**Expenses:** {breakdown.get('expense', 0):,}",
                 inline=False
@@ -153,41 +403,33 @@ class DataOverview(commands.Cog):
             
             embed3.add_field(
                 name="🗓️ Date Range",
-                value=f"**First:** {i['min_time'][:10] if i['min_time'] else 'N/A'}\n"
-                      f"**Last:** {i['max_time'][:10] if i['max_time'] else 'N/A'}",
+                value=f"**First:** {_format_time(i, 'min_time')}\n"
+                      f"**Last:** {_format_time(i, 'max_time')}",
                 inline=False
             )
         else:
             embed3.add_field(name="❌ Status", value="No data or database not found", inline=False)
         
+        self._add_storage_field(embed3, income_stats)
+        
         embed3.set_footer(text="Database: income_v2.db")
         
         # 4. Buildings Database
-        buildings_stats = self._get_db_stats("buildings_v2.db")
+        buildings_stats = await self._get_db_stats("buildings_v2.db")
         embed4 = discord.Embed(title="📊 Data Overview - Buildings", color=discord.Color.purple())
         
-        if buildings_stats and 'buildings' in buildings_stats:
-            b = buildings_stats['buildings']
+        if buildings_stats and 'buildings' in buildings_stats.get('tables', {}):
+            b = buildings_stats['tables']['buildings']
             
             # Get unique counts
-            db_path = self.db_dir / "buildings_v2.db"
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT COUNT(DISTINCT building_id) FROM buildings")
-            unique_buildings = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(DISTINCT owner_name) FROM buildings")
-            unique_owners = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT SUM(classrooms) FROM buildings WHERE timestamp = (SELECT MAX(timestamp) FROM buildings)")
-            total_classrooms = cursor.fetchone()[0] or 0
-            
-            conn.close()
+            totals = await self._cached("buildings_v2.db", 'totals', collect_building_totals)
+            unique_buildings = totals['unique_buildings']
+            unique_owners = totals['unique_owners']
+            total_classrooms = totals['total_classrooms']
             
             embed4.add_field(
                 name="🏢 Buildings Data",
-                value=f"**Total Records:** {b['count']:,}\n"
+                value=f"**Total Records:** {_format_count(b)}\n"
                       f"**Unique Buildings:** {unique_buildings:,}\n"
                       f"**Unique Owners:** {unique_owners:,}\n"
                       f"**Total Classrooms:** {total_classrooms:,}",
@@ -196,13 +438,15 @@ class DataOverview(commands.Cog):
             
             embed4.add_field(
                 name="🗓️ Date Range",
-                value=f"**First:** {b['min_time'][:10] if b['min_time'] else 'N/A'}\n"
-                      f"**Last:** {b['max_time'][:10] if b['max_time'] else 'N/A'}",
+                value=f"**First:** {_format_time(b, 'min_time')}\n"
+                      f"**Last:** {_format_time(b, 'max_time')}",
                 inline=False
             )
         else:
             embed4.add_field(name="❌ Status", value="No data or database not found", inline=False)
         
+        self._add_storage_field(embed4, buildings_stats)
+        
         embed4.set_footer(text="Database: buildings_v2.db")
         
         # 5. Summary
@@ -212,11 +456,10 @@ class DataOverview(commands.Cog):
         databases_found = 0
         
         for stats in [members_stats, logs_stats, income_stats, buildings_stats]:
-            if stats:
+            if stats and 'tables' in stats:
                 databases_found += 1
-                for table, data in stats.items():
-                    if isinstance(data, dict) and 'count' in data:
-                        total_records += data['count']
+                for data in stats['tables'].values():
+                    total_records += data['count']
         
         embed5.add_field(
             name="📈 Overall Statistics",
@@ -228,11 +471,18 @@ class DataOverview(commands.Cog):
         
         # Database file sizes
         size_info = []
-        for db_name in ["members_v2.db", "logs_v2.db", "income_v2.db", "buildings_v2.db"]:
-            db_path = self.db_dir / db_name
-            if db_path.exists():
-                size_mb = db_path.stat().st_size / (1024 * 1024)
-                size_info.append(f"**{db_name}:** {size_mb:.2f} MB")
+        for db_name, stats in [
+            ("members_v2.db", members_stats),
+            ("logs_v2.db", logs_stats),
+            ("income_v2.db", income_stats),
+            ("buildings_v2.db", buildings_stats),
+        ]:
+            if stats and 'tables' in stats:
+                free_bytes = stats['freelist_count'] * stats['page_size']
+                size_info.append(
+                    f"**{db_name}:** {_format_size(stats['file_size'])} "
+                    f"({_format_size(free_bytes)} free)"
+                )
         
         if size_info:
             embed5.add_field(
@@ -11,7 +11,6 @@ from contextlib import suppress
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from difflib import SequenceMatcher
-from html.parser import HTMLParser
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 from zoneinfo import ZoneInfo
@@ -22,6 +21,41 @@ import discord
 from redbot.core import Config, commands
 from redbot.core.utils.chat_formatting import box
 
+try:
+    from .board_watcher import (
+        BoardPage,
+        BoardPageParser,
+        BoardPost,
+        BoardUpdate,
+        fetch_latest_board_page,
+        parse_board_page,
+        shared_board_watcher,
+    )
+    from .geocode_cache import MAPSCO_SEARCH_NAMESPACE, shared_geocode_cache
+    from .mc_actions import (
+        ReplayUnavailable,
+        format_action_stats,
+        playwright_installed,
+        shared_action_engine,
+    )
+except ImportError:  # pragma: no cover - direct module loading in local tooling
+    from board_watcher import (
+        BoardPage,
+        BoardPageParser,
+        BoardPost,
+        BoardUpdate,
+        fetch_latest_board_page,
+        parse_board_page,
+        shared_board_watcher,
+    )
+    from geocode_cache import MAPSCO_SEARCH_NAMESPACE, shared_geocode_cache
+    from mc_actions import (
+        ReplayUnavailable,
+        format_action_stats,
+        playwright_installed,
+        shared_action_engine,
+    )
+
 log = logging.getLogger("red.cog.eventmanager")
 
 BASE_URL = "https://www.missionchief.com"
@@ -51,7 +85,8 @@ PANEL_TITLE = "EventManager Control Panel"
 REQUEST_PANEL_TITLE = "Event Requests"
 LEGACY_EVENT_REQUEST_BOARD_THREAD_ID = 15292
 EVENT_REQUEST_BOARD_THREAD_ID = 15293
-EVENT_REQUEST_BOARD_POLL_SECONDS = 5 * 60
+EVENT_REQUEST_BOARD_GUIDE_SYNC_SECONDS = 5 * 60
+EVENT_REQUEST_BOARD_WATCH_OWNER = "EventManager"
 EVENT_REQUEST_BOARD_DELETE_AFTER_SECONDS = 12 * 60 * 60
 EVENT_REQUEST_BOARD_CLEANUP_SECONDS = 10 * 60
 EVENT_REQUEST_BOARD_GUIDE_MAX_SCAN_PAGES = 25
@@ -505,22 +540,9 @@ class EventStartResult:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
-class EventBoardPost:
-    post_id: int
-    author_id: Optional[str]
-    author_name: str
-    created_at: str
-    content: str
-
-
-@dataclass
-class EventBoardPage:
-    posts: List[EventBoardPost]
-    last_page: int = 1
-    current_user_id: Optional[str] = None
-    reply_action: Optional[str] = None
-    reply_token: Optional[str] = None
+# Board pages are parsed by the shared watcher into one post model for every cog
+EventBoardPost = BoardPost
+EventBoardPage = BoardPage
 
 
 Payload = List[Tuple[str, str]]
@@ -945,160 +967,8 @@ def parse_location_add_request(value: str) -> Tuple[str, str, str]:
     return kind, location_text, type_search
 
 
-class EventBoardPageParser(HTMLParser):
-    """Parse MissionChief alliance board pages for EventManager location requests."""
-
-    def __init__(self):
-        super().__init__(convert_charrefs=True)
-        self.posts: List[EventBoardPost] = []
-        self.page_numbers: List[int] = []
-        self.current_user_id: Optional[str] = None
-        self.reply_action: Optional[str] = None
-        self.reply_token: Optional[str] = None
-        self._post: Optional[dict] = None
-        self._post_depth = 0
-        self._content_depth = 0
-        self._capture_author = False
-        self._capture_content = False
-        self._capture_page_number = False
-        self._capture_active_page = False
-
-    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
-        attr = {key: value for key, value in attrs}
-
-        if tag == "div" and str(attr.get("id") or "").startswith("post-on-page-"):
-            self._post = {
-                "post_id": None,
-                "author_id": None,
-                "author_name": "",
-                "created_at": "",
-                "content": [],
-            }
-            self._post_depth = 1
-            return
-
-        if self._post is not None and tag == "div":
-            self._post_depth += 1
-            classes = str(attr.get("class") or "")
-            if "col-md-11" in classes:
-                self._content_depth = self._post_depth
-                self._capture_content = True
-
-        if self._post is not None and tag == "a":
-            href = str(attr.get("href") or "")
-            profile_match = re.search(r"/profile/(\d+)", href)
-            if profile_match and not self._post.get("author_id"):
-                self._post["author_id"] = profile_match.group(1)
-                self._capture_author = True
-
-            post_match = re.search(r"/alliance_posts/(\d+)", href)
-            if post_match:
-                self._post["post_id"] = int(post_match.group(1))
-
-        if self._post is not None and tag == "span":
-            title = attr.get("title")
-            if title and not self._post.get("created_at"):
-                self._post["created_at"] = str(title)
-
-        if self._post is not None and self._capture_content and tag == "br":
-            self._post["content"].append("\n")
-
-        if tag == "a":
-            href = str(attr.get("href") or "")
-            page_match = re.search(r"[?&]page=(\d+)", href)
-            if page_match:
-                self.page_numbers.append(int(page_match.group(1)))
-            self._capture_page_number = bool(page_match)
-
-        if tag == "li" and "active" in str(attr.get("class") or ""):
-            self._capture_active_page = True
-
-        if tag == "form" and str(attr.get("id") or "") == "new_alliance_post":
-            self.reply_action = attr.get("action")
-
-        if tag == "input" and attr.get("name") == "authenticity_token":
-            token = attr.get("value")
-            if token:
-                self.reply_token = token
-
-    def handle_data(self, data: str):
-        if "user_id =" in data:
-            match = re.search(r"user_id\s*=\s*(\d+)", data)
-            if match:
-                self.current_user_id = match.group(1)
-
-        if self._post is not None and self._capture_author:
-            text = re.sub(r"\s+", " ", data).strip()
-            if text:
-                self._post["author_name"] = text
-
-        if self._post is not None and self._capture_content:
-            self._post["content"].append(data)
-
-        if self._capture_page_number:
-            with suppress(ValueError):
-                self.page_numbers.append(int(data.strip()))
-
-        if self._capture_active_page:
-            with suppress(ValueError):
-                self.page_numbers.append(int(data.strip()))
-
-    def handle_endtag(self, tag: str):
-        if self._capture_author and tag == "a":
-            self._capture_author = False
-
-        if self._capture_page_number and tag == "a":
-            self._capture_page_number = False
-
-        if self._capture_active_page and tag == "li":
-            self._capture_active_page = False
-
-        if self._post is not None and tag == "div":
-            if self._capture_content and self._post_depth == self._content_depth:
-                self._capture_content = False
-                self._content_depth = 0
-
-            self._post_depth -= 1
-            if self._post_depth <= 0:
-                self._finish_post()
-
-    def _finish_post(self) -> None:
-        if self._post is None:
-            return
-
-        post_id = self._post.get("post_id")
-        if post_id is None:
-            self._post = None
-            return
-
-        content = "".join(self._post.get("content") or [])
-        content = re.sub(r"\n\s*\n+", "\n", content)
-        content = re.sub(r"[ \t]+", " ", content).strip()
-        self.posts.append(
-            EventBoardPost(
-                post_id=int(post_id),
-                author_id=self._post.get("author_id"),
-                author_name=str(self._post.get("author_name") or "Unknown"),
-                created_at=str(self._post.get("created_at") or ""),
-                content=content,
-            )
-        )
-        self._post = None
-
-    def page(self) -> EventBoardPage:
-        return EventBoardPage(
-            posts=self.posts,
-            last_page=max(self.page_numbers or [1]),
-            current_user_id=self.current_user_id,
-            reply_action=self.reply_action,
-            reply_token=self.reply_token,
-        )
-
-
-def parse_event_board_page(html: str) -> EventBoardPage:
-    parser = EventBoardPageParser()
-    parser.feed(html or "")
-    return parser.page()
+EventBoardPageParser = BoardPageParser
+parse_event_board_page = parse_board_page
 
 
 def event_board_marker_section(text: str) -> Optional[str]:
@@ -2747,9 +2617,11 @@ class EventManager(commands.Cog):
         )
         self._task: Optional[asyncio.Task] = None
         self._panel_task: Optional[asyncio.Task] = None
-        self._board_poll_task: Optional[asyncio.Task] = None
+        self._board_guide_task: Optional[asyncio.Task] = None
+        self._board_watcher = shared_board_watcher(self.bot)
         self._board_cleanup_task: Optional[asyncio.Task] = None
         self._start_lock = asyncio.Lock()
+        self._actions = shared_action_engine(self.bot)
         self._notification_contexts: Dict[str, Dict[str, Any]] = {}
 
     async def cog_load(self):
@@ -2760,7 +2632,12 @@ class EventManager(commands.Cog):
         await self._migrate_route_profiles()
         self._task = asyncio.create_task(self._scheduler_loop())
         self._panel_task = asyncio.create_task(self._ensure_panels_after_ready())
-        self._board_poll_task = asyncio.create_task(self._event_request_board_poll_loop())
+        self._board_guide_task = asyncio.create_task(self._event_request_board_guide_loop())
+        self._board_watcher.subscribe(
+            EVENT_REQUEST_BOARD_WATCH_OWNER,
+            self._event_request_board_watch_threads,
+            self._process_event_request_board_update,
+        )
         self._board_cleanup_task = asyncio.create_task(self._event_request_board_cleanup_loop())
 
     async def cog_unload(self):
@@ -2768,8 +2645,9 @@ class EventManager(commands.Cog):
             self._task.cancel()
         if self._panel_task:
             self._panel_task.cancel()
-        if self._board_poll_task:
-            self._board_poll_task.cancel()
+        if self._board_guide_task:
+            self._board_guide_task.cancel()
+        self._board_watcher.unsubscribe(EVENT_REQUEST_BOARD_WATCH_OWNER)
         if self._board_cleanup_task:
             self._board_cleanup_task.cancel()
 
@@ -2887,10 +2765,19 @@ class EventManager(commands.Cog):
 
         eventpinger = self.bot.get_cog("EventPinger")
         fetcher = getattr(eventpinger, "_fetch_geocode_results", None)
-        if callable(fetcher):
-            results = await fetcher(location_text, api_key)
-            return geocoded_location_from_results(location_text, results)
+        if not callable(fetcher):
+            fetcher = self._fetch_geocode_results
+        # Same request shape as EventPinger, so both cogs share cached results
+        results, _cached = await shared_geocode_cache(self.bot).lookup(
+            MAPSCO_SEARCH_NAMESPACE,
+            location_text,
+            lambda: fetcher(location_text, api_key),
+        )
+        return geocoded_location_from_results(location_text, results)
 
+    async def _fetch_geocode_results(self, location_text: str, api_key: str) -> Any:
+        """Run one geocode.maps.co search when EventPinger is not loaded."""
+        await shared_geocode_cache(self.bot).throttle("geocode.maps.co")
         params = geocode_search_params(location_text, api_key)
         timeout = aiohttp.ClientTimeout(total=GEOCODE_TIMEOUT_SECONDS)
         async with aiohttp.ClientSession(timeout=timeout) as session:
@@ -2902,8 +2789,7 @@ class EventManager(commands.Cog):
                             "Set a valid key with `eventmanager geocodekey <key>`."
                         )
                     raise RuntimeError(f"Geocode API returned HTTP {response.status}")
-                results = await response.json(content_type=None)
-        return geocoded_location_from_results(location_text, results)
+                return await response.json(content_type=None)
 
     async def _fetch_form(self, kind: str, fields: Optional[Dict[str, str]] = None, *, ajax: bool = False) -> EventForm:
         kind = normalize_kind(kind)
@@ -3086,7 +2972,6 @@ class EventManager(commands.Cog):
 
         try:
             from playwright.async_api import TimeoutError as PlaywrightTimeoutError
-            from playwright.async_api import async_playwright
         except Exception:
             return EventStartResult(False, PLAYWRIGHT_SETUP_MESSAGE)
 
@@ -3104,50 +2989,42 @@ class EventManager(commands.Cog):
             response_text = ""
             prepare_result: Dict[str, Any] = {}
             try:
-                async with async_playwright() as playwright:
-                    browser = await playwright.chromium.launch(headless=True)
-                    try:
-                        context = await browser.new_context(viewport={"width": 1440, "height": 1000})
-                        await context.add_cookies(cookies)
-                        page = await context.new_page()
-                        page.set_default_timeout(30000)
-                        await page.goto(MISSIONCHIEF_HOME_URL, wait_until="domcontentloaded")
-
-                        open_button = page.locator(open_selector)
-                        if await open_button.count() == 0:
-                            login_fields = await page.locator("input[type='password']").count()
-                            if login_fields:
-                                return EventStartResult(False, "MissionChief session is not logged in.")
-                            return EventStartResult(False, f"MissionChief start button `{open_selector}` was not found.")
-
-                        await open_button.nth(0).click()
-                        await page.wait_for_selector("#new_mission_position", state="attached")
-                        with suppress(Exception):
-                            await page.wait_for_function(
-                                "typeof mission_position_new_marker !== 'undefined' || typeof map !== 'undefined'",
-                                timeout=15000,
-                            )
-
-                        prepare_result = await page.evaluate(BROWSER_PREPARE_START_SCRIPT, config)
-                        if not prepare_result.get("ok"):
-                            snapshot = summarize_browser_snapshot(prepare_result.get("snapshot"))
-                            suffix = f" Snapshot: {snapshot}" if snapshot else ""
+                async with self._actions.browser_page(cookies) as page:
+                    await page.goto(MISSIONCHIEF_HOME_URL, wait_until="domcontentloaded")
+
+                    open_button = page.locator(open_selector)
+                    if await open_button.count() == 0:
+                        login_fields = await page.locator("input[type='password']").count()
+                        if login_fields:
+                            return EventStartResult(False, "MissionChief session is not logged in.")
+                        return EventStartResult(False, f"MissionChief start button `{open_selector}` was not found.")
+
+                    await open_button.nth(0).click()
+                    await page.wait_for_selector("#new_mission_position", state="attached")
+                    with suppress(Exception):
+                        await page.wait_for_function(
+                            "typeof mission_position_new_marker !== 'undefined' || typeof map !== 'undefined'",
+                            timeout=15000,
+                        )
+
+                    prepare_result = await page.evaluate(BROWSER_PREPARE_START_SCRIPT, config)
+                    if not prepare_result.get("ok"):
+                        snapshot = summarize_browser_snapshot(prepare_result.get("snapshot"))
+                        suffix = f" Snapshot: {snapshot}" if snapshot else ""
+                        details = browser_result_details(kind, profile_name, prepare_result, post_url=f"{BASE_URL}/{create_path}")
+                        return EventStartResult(False, f"{prepare_result.get('reason')}{suffix}", details=details)
+
+                    await self._remember_notification_context(kind, profile_name, profile)
+                    async with page.expect_response(lambda response: create_path in response.url, timeout=30000) as response_info:
+                        clicked = await page.evaluate(BROWSER_CLICK_START_SCRIPT, prepare_result.get("submitIndex"))
+                        if not clicked:
+                            self._clear_notification_context(kind)
                             details = browser_result_details(kind, profile_name, prepare_result, post_url=f"{BASE_URL}/{create_path}")
-                            return EventStartResult(False, f"{prepare_result.get('reason')}{suffix}", details=details)
-
-                        await self._remember_notification_context(kind, profile_name, profile)
-                        async with page.expect_response(lambda response: create_path in response.url, timeout=30000) as response_info:
-                            clicked = await page.evaluate(BROWSER_CLICK_START_SCRIPT, prepare_result.get("submitIndex"))
-                            if not clicked:
-                                self._clear_notification_context(kind)
-                                details = browser_result_details(kind, profile_name, prepare_result, post_url=f"{BASE_URL}/{create_path}")
-                                return EventStartResult(False, "Browser could not click the MissionChief start button.", details=details)
-                        response = await response_info.value
-                        status = response.status
-                        with suppress(Exception):
-                            response_text = await response.text()
-                    finally:
-                        await browser.close()
+                            return EventStartResult(False, "Browser could not click the MissionChief start button.", details=details)
+                    response = await response_info.value
+                    status = response.status
+                    with suppress(Exception):
+                        response_text = await response.text()
             except PlaywrightTimeoutError as exc:
                 self._clear_notification_context(kind)
                 snapshot = summarize_browser_snapshot(prepare_result.get("snapshot"))
@@ -3186,6 +3063,11 @@ class EventManager(commands.Cog):
         )
 
     async def _start_profile_data_http(self, kind: str, profile_name: str, profile: dict) -> EventStartResult:
+        """Replay the free start form over CookieManager's session.
+
+        Raises ReplayUnavailable, having posted nothing, when the form cannot be
+        fetched or the payload would not be a free start.
+        """
         kind = normalize_kind(kind)
         async with self._start_lock:
             try:
@@ -3193,18 +3075,22 @@ class EventManager(commands.Cog):
                 start_fields = profile_fields_for_start(profile)
                 form = await self._fetch_form(kind, start_fields)
             except Exception as exc:
-                return EventStartResult(False, f"Could not fetch form: {exc}")
+                raise ReplayUnavailable(f"Could not fetch form: {exc}") from exc
 
             if form.method != "post":
-                return EventStartResult(False, f"Unexpected form method `{form.method}`.")
+                raise ReplayUnavailable(f"Unexpected form method `{form.method}`.")
 
-            session = await self._get_session()
-            payload = build_payload(form, start_fields)
-            payload = await self._resolve_reverse_address(session, kind, payload)
+            try:
+                session = await self._get_session()
+                payload = build_payload(form, start_fields)
+                payload = await self._resolve_reverse_address(session, kind, payload)
+            except Exception as exc:
+                raise ReplayUnavailable(f"Could not build the start payload: {exc}") from exc
             validation_error = _validate_free_submit(form, payload)
             if validation_error:
-                return EventStartResult(False, validation_error, post_url=form.action)
+                raise ReplayUnavailable(validation_error)
 
+            await self._remember_notification_context(kind, profile_name, profile)
             try:
                 async with session.post(
                     form.action,
@@ -3215,9 +3101,11 @@ class EventManager(commands.Cog):
                     status = getattr(response, "status", None)
                     response_text = await response.text()
             except Exception as exc:
+                self._clear_notification_context(kind)
                 return EventStartResult(False, f"MissionChief POST failed: {exc}", post_url=form.action)
 
         if status is None or int(status) >= 400:
+            self._clear_notification_context(kind)
             debug = summarize_payload_for_debug(payload)
             response_debug = summarize_response_for_debug(response_text)
             log.warning(
@@ -3240,7 +3128,13 @@ class EventManager(commands.Cog):
         return EventStartResult(True, "Started successfully.", status=status, post_url=form.action, details=details)
 
     async def _start_profile_data(self, kind: str, profile_name: str, profile: dict) -> EventStartResult:
-        return await self._start_profile_data_browser(kind, profile_name, profile)
+        """Start a free item by form replay, or in the browser when the replay is unavailable."""
+        kind = normalize_kind(kind)
+        return await self._actions.run(
+            f"start_{kind}",
+            lambda: self._start_profile_data_browser(kind, profile_name, profile),
+            replay=lambda: self._start_profile_data_http(kind, profile_name, profile),
+        )
 
     async def _start_from_profile(self, kind: str, profile_name: str, *, allow_coins: bool = False) -> EventStartResult:
         kind = normalize_kind(kind)
@@ -3250,7 +3144,11 @@ class EventManager(commands.Cog):
         if not profile:
             return EventStartResult(False, f"Profile `{profile_name}` was not found.")
         if allow_coins:
-            return await self._start_profile_data_browser(kind, profile_name, profile, allow_coins=True)
+            # Coin starts are never replayed: the free-submit check is what makes a replay safe
+            return await self._actions.run(
+                f"start_{kind}_coins",
+                lambda: self._start_profile_data_browser(kind, profile_name, profile, allow_coins=True),
+            )
         return await self._start_profile_data(kind, profile_name, profile)
 
     async def start_one_off(self, kind: str, profile: dict, label: str) -> EventStartResult:
@@ -3386,7 +3284,11 @@ class EventManager(commands.Cog):
             ),
             color=discord.Color.orange(),
         )
-        embed.add_field(name="Safety", value="Default starts use the browser backend and refuse coin actions.", inline=False)
+        embed.add_field(
+            name="Safety",
+            value="Default starts replay the free start form, fall back to the browser, and refuse coin actions.",
+            inline=False,
+        )
         embed.add_field(name="Visibility", value="Button actions are private to the admin using them.", inline=False)
         return embed
 
@@ -3900,20 +3802,7 @@ class EventManager(commands.Cog):
         )
 
     async def _fetch_event_request_board_latest_page(self, session, thread_id: int) -> Tuple[EventBoardPage, Optional[int]]:
-        base_url = f"{BASE_URL}/alliance_threads/{int(thread_id)}"
-        async with session.get(base_url, allow_redirects=True) as response:
-            status = getattr(response, "status", None)
-            html = await response.text()
-        page = parse_event_board_page(html)
-        if status is not None and int(status) >= 400:
-            return page, status
-
-        if page.last_page > 1:
-            async with session.get(f"{base_url}?page={page.last_page}", allow_redirects=True) as response:
-                status = getattr(response, "status", None)
-                html = await response.text()
-            page = parse_event_board_page(html)
-        return page, status
+        return await fetch_latest_board_page(session, thread_id, base_url=BASE_URL)
 
     async def _post_event_request_board_reply(
         self,
@@ -4209,28 +4098,27 @@ class EventManager(commands.Cog):
             return False, f"delete returned HTTP {delete_status}"
         return True, "deleted"
 
-    async def _event_request_board_poll_loop(self) -> None:
+    async def _event_request_board_guide_loop(self) -> None:
         await self._wait_until_ready_for_background_task()
         while True:
             try:
                 await self._sync_event_request_board_posts()
-                await self._process_event_request_board_once()
             except asyncio.CancelledError:
                 break
             except RuntimeError as exc:
-                log.info("EventManager board poll skipped: %s", exc)
+                log.info("EventManager board guide sync skipped: %s", exc)
             except Exception as exc:
-                log.exception("EventManager board poll loop error: %s", exc)
-            await asyncio.sleep(EVENT_REQUEST_BOARD_POLL_SECONDS)
+                log.exception("EventManager board guide loop error: %s", exc)
+            await asyncio.sleep(EVENT_REQUEST_BOARD_GUIDE_SYNC_SECONDS)
 
-    async def _process_event_request_board_once(self) -> None:
-        thread_id = await self._event_request_board_thread_id()
-        session = await self._get_session()
-        page, status = await self._fetch_event_request_board_latest_page(session, thread_id)
-        if status is not None and int(status) >= 400:
-            log.warning("EventManager request board returned HTTP %s", status)
-            return
+    async def _event_request_board_watch_threads(self) -> List[int]:
+        return [await self._event_request_board_thread_id()]
 
+    async def _process_event_request_board_update(self, update: BoardUpdate) -> None:
+        """Handle new posts the shared board watcher found in the request thread."""
+        thread_id = update.thread_id
+        session = update.session
+        page = update.page
         latest_post_id = max((post.post_id for post in page.posts), default=0)
         last_seen_raw = await self.config.board_last_seen_post_id()
         try:
@@ -4249,7 +4137,7 @@ class EventManager(commands.Cog):
 
         new_posts = [
             post
-            for post in page.posts
+            for post in update.new_posts
             if int(post.post_id) > last_seen and int(post.post_id) not in processed
         ]
         if not new_posts:
@@ -4762,16 +4650,12 @@ class EventManager(commands.Cog):
     @commands.admin()
     async def browser_backend_check(self, ctx: commands.Context):
         """Check whether Playwright browser automation is installed and launchable."""
-        try:
-            from playwright.async_api import async_playwright
-        except Exception:
+        if not playwright_installed():
             await ctx.send(PLAYWRIGHT_SETUP_MESSAGE)
             return
 
         try:
-            async with async_playwright() as playwright:
-                browser = await playwright.chromium.launch(headless=True)
-                await browser.close()
+            await self._actions.pool.check()
         except Exception as exc:
             message = str(exc)
             if "Executable doesn't exist" in message or "playwright install" in message:
@@ -4782,6 +4666,14 @@ class EventManager(commands.Cog):
 
         await ctx.send("EventManager browser backend is ready.")
 
+    @eventmanager.command(name="actionstats")
+    @commands.admin()
+    async def action_stats(self, ctx: commands.Context):
+        """Show MissionChief start latency and how often form replay fell back to the browser."""
+        lines = ["MissionChief actions (HTTP replay first, pooled browser as fallback):"]
+        lines.extend(format_action_stats(self._actions))
+        await ctx.send(box("\n".join(lines), lang="text"))
+
     @eventmanager.command(name="panel")
     @commands.admin()
     @commands.guild_only()
@@ -3,8 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
-import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from typing import Any, Callable
 
@@ -12,6 +11,11 @@ import aiohttp
 import discord
 from redbot.core import Config, commands
 
+try:
+    from .geocode_cache import MAPSCO_SEARCH_NAMESPACE, shared_geocode_cache
+except ImportError:  # pragma: no cover - direct module loading in local tooling
+    from geocode_cache import MAPSCO_SEARCH_NAMESPACE, shared_geocode_cache
+
 log = logging.getLogger("red.fara.eventpinger")
 
 SOURCE_CHANNEL_ID = 544461383358480385
@@ -22,8 +26,6 @@ MISSION_PREFIX = "start alliance mission!"
 EVENT_PREFIX = "alliance event started!"
 GEOCODE_SEARCH_URL = "https://geocode.maps.co/search"
 GEOCODE_TIMEOUT_SECONDS = 5
-GEOCODE_CACHE_TTL_SECONDS = 90 * 24 * 60 * 60
-GEOCODE_MIN_INTERVAL_SECONDS = 1.1
 
 
 def normalize_geocode_api_key(api_key: str) -> str:
@@ -246,10 +248,6 @@ def normalize_text(value: str) -> str:
     return " ".join(str(value or "").replace("\n", " ").split())
 
 
-def cache_key_for_address(address: str) -> str:
-    return normalize_text(address).casefold()
-
-
 def extract_announcement_from_message(message: Any) -> EventAnnouncement | None:
     for title, body in iter_message_blocks(message):
         announcement = extract_announcement(title, body)
@@ -609,9 +607,11 @@ class EventPinger(commands.Cog):
                 geocode_cache={},
             )
         self._session: aiohttp.ClientSession | None = None
-        self._memory_cache: dict[str, dict[str, Any]] = {}
-        self._geocode_lock = asyncio.Lock()
-        self._last_geocode_at = 0.0
+
+    async def cog_load(self) -> None:
+        # Results moved to the shared geocode cache; drop the legacy Config blob
+        if self.config is not None and await self.config.geocode_cache():
+            await self.config.geocode_cache.clear()
 
     async def cog_unload(self) -> None:
         if self._session and not self._session.closed:
@@ -729,21 +729,26 @@ class EventPinger(commands.Cog):
         if not api_key or not await self._geocode_enabled():
             return None
 
-        cached = await self._get_cached_geocode_outcome(text)
-        if cached:
-            return cached
-
         try:
-            results = await self._fetch_geocode_results(text, api_key)
+            results, cached = await self._geocode_cache().lookup(
+                MAPSCO_SEARCH_NAMESPACE,
+                text,
+                lambda: self._fetch_geocode_results(text, api_key),
+            )
         except Exception:
             log.exception("Geocode lookup failed for event address")
             return None
 
         outcome = geocode_outcome_from_results(results)
-        if outcome.match:
-            await self._set_cached_geocode_outcome(text, outcome)
+        if cached and outcome.match:
+            match = replace(outcome.match, source=f"{outcome.match.source}_cache")
+            return GeocodeOutcome(match, authoritative=outcome.authoritative)
         return outcome
 
+    def _geocode_cache(self):
+        """Geocode cache shared with EventManager and BuildingManager."""
+        return shared_geocode_cache(self.bot)
+
     async def _get_geocode_api_key(self) -> str:
         if self.config is None:
             return ""
@@ -754,78 +759,21 @@ class EventPinger(commands.Cog):
             return False
         return bool(await self.config.geocode_enabled())
 
-    async def _get_cached_geocode_outcome(self, address: str) -> GeocodeOutcome | None:
-        key = cache_key_for_address(address)
-        now = int(time.time())
-        cache = await self._read_cache()
-        entry = cache.get(key)
-        if not isinstance(entry, dict):
-            return None
-
-        if int(entry.get("expires_at", 0) or 0) <= now:
-            await self._delete_cached_region(key)
-            return None
-
-        code = str(entry.get("code") or "")
-        name = str(entry.get("name") or REGION_ROLE_NAMES.get(code, ""))
-        source = str(entry.get("source") or "geocode_cache")
-        role_names = tuple(str(name) for name in entry.get("role_names", []) or [] if str(name))
-        if not code or not name:
-            return None
-        return GeocodeOutcome(RegionMatch(code, name, source, role_names), authoritative=True)
-
-    async def _set_cached_geocode_outcome(self, address: str, outcome: GeocodeOutcome) -> None:
-        key = cache_key_for_address(address)
-        if outcome.match:
-            entry = {
-                "code": outcome.match.code,
-                "name": outcome.match.name,
-                "source": f"{outcome.match.source}_cache",
-                "role_names": list(outcome.match.role_names),
-                "expires_at": int(time.time()) + GEOCODE_CACHE_TTL_SECONDS,
-            }
-        else:
-            return
-        if self.config is None:
-            self._memory_cache[key] = entry
-            return
-
-        async with self.config.geocode_cache() as cache:
-            cache[key] = entry
-
-    async def _delete_cached_region(self, key: str) -> None:
-        if self.config is None:
-            self._memory_cache.pop(key, None)
-            return
-
-        async with self.config.geocode_cache() as cache:
-            cache.pop(key, None)
-
-    async def _read_cache(self) -> dict[str, Any]:
-        if self.config is None:
-            return dict(self._memory_cache)
-        return dict(await self.config.geocode_cache() or {})
-
     async def _fetch_geocode_results(self, address: str, api_key: str) -> Any:
-        async with self._geocode_lock:
-            elapsed = time.monotonic() - self._last_geocode_at
-            if elapsed < GEOCODE_MIN_INTERVAL_SECONDS:
-                await asyncio.sleep(GEOCODE_MIN_INTERVAL_SECONDS - elapsed)
-
-            session = await self._get_session()
-            params = geocode_search_params(address, api_key)
-            timeout = aiohttp.ClientTimeout(total=GEOCODE_TIMEOUT_SECONDS)
-            async with session.get(
-                GEOCODE_SEARCH_URL,
-                params=params,
-                timeout=timeout,
-            ) as response:
-                self._last_geocode_at = time.monotonic()
-                if int(response.status) >= 400:
-                    if int(response.status) == 401:
-                        raise RuntimeError("Geocode API rejected the configured API key (HTTP 401).")
-                    raise RuntimeError(f"Geocode API returned HTTP {response.status}")
-                return await response.json(content_type=None)
+        await self._geocode_cache().throttle("geocode.maps.co")
+        session = await self._get_session()
+        params = geocode_search_params(address, api_key)
+        timeout = aiohttp.ClientTimeout(total=GEOCODE_TIMEOUT_SECONDS)
+        async with session.get(
+            GEOCODE_SEARCH_URL,
+            params=params,
+            timeout=timeout,
+        ) as response:
+            if int(response.status) >= 400:
+                if int(response.status) == 401:
+                    raise RuntimeError("Geocode API rejected the configured API key (HTTP 401).")
+                raise RuntimeError(f"Geocode API returned HTTP {response.status}")
+            return await response.json(content_type=None)
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
@@ -844,7 +792,7 @@ class EventPinger(commands.Cog):
         """Show the hardcoded listener configuration."""
         geocode_enabled = await self._geocode_enabled()
         geocode_key = await self._get_geocode_api_key()
-        cache_size = len(await self._read_cache())
+        cache_stats = await self._geocode_cache().stats()
         await ctx.send(
             "eventpinger status\n"
             f"Source channel: {SOURCE_CHANNEL_ID}\n"
@@ -853,7 +801,10 @@ class EventPinger(commands.Cog):
             f"Known region roles: {len(REGION_ROLE_NAMES)}\n"
             f"Geocode enabled: {geocode_enabled}\n"
             f"Geocode API key: {'set' if geocode_key else 'not set'}\n"
-            f"Geocode cache entries: {cache_size}"
+            f"Geocode cache entries: {cache_stats['entries']} "
+            f"({cache_stats['negative_entries']} negative, shared)\n"
+            f"Geocode cache hits/misses: {cache_stats['hits'] + cache_stats['negative_hits']}"
+            f"/{cache_stats['misses']}, shared in-flight: {cache_stats['shared']}"
         )
 
     @eventpinger.command(name="resolve")
@@ -907,9 +858,6 @@ class EventPinger(commands.Cog):
     @eventpinger.command(name="clearcache")
     @commands.is_owner()
     async def eventpinger_clearcache(self, ctx: commands.Context) -> None:
-        """Clear cached geocode results. Owner only."""
-        if self.config is None:
-            self._memory_cache.clear()
-        else:
-            await self.config.geocode_cache.set({})
-        await ctx.send("Geocode cache cleared.")
+        """Clear cached geocode.maps.co results. Owner only."""
+        removed = await self._geocode_cache().clear(MAPSCO_SEARCH_NAMESPACE)
+        await ctx.send(f"Geocode cache cleared ({removed} entries).")
@@ -3,9 +3,185 @@ from redbot.core import commands, Config
 from redbot.core.bot import Red
 from redbot.core.utils.chat_formatting import box, humanize_list
 import asyncio
-from typing import Optional, List, Union
+from typing import Dict, Optional, List, Tuple, Union
 from datetime import datetime
+import contextlib
 import io
+import tempfile
+import time
+
+import aiohttp
+
+# Discord's upload limit for most servers; larger attachments are linked instead
+MAX_ATTACHMENT_BYTES = 25 * 1024 * 1024
+# Attachment downloads running at once while earlier messages are being posted
+PREFETCH_CONCURRENCY = 4
+# Bytes of prefetched attachments held in memory while waiting to be posted
+PREFETCH_MEMORY_BUDGET = 64 * 1024 * 1024
+# Attachments of at least this size are streamed to a temporary file instead of memory
+SPOOL_THRESHOLD = 8 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+# Minimum seconds between progress embed edits; edits share the channel rate limit with posts
+PROGRESS_EDIT_INTERVAL = 3.0
+
+
+def _link_note(attachment, reason: str) -> str:
+    return f"📎 [{attachment.filename}]({attachment.url}) ({reason}, see original)"
+
+
+class AttachmentPrefetcher:
+    """Download attachments ahead of posting, in message order.
+
+    Downloads run concurrently under a semaphore. In-memory bytes are reserved per
+    message, in order, against a budget and released once that message is posted,
+    so a long thread never holds more than the budget in RAM. Attachments at or
+    above ``spool_threshold`` are streamed to temporary files instead.
+    """
+
+    def __init__(
+        self,
+        messages,
+        *,
+        concurrency: int = PREFETCH_CONCURRENCY,
+        memory_budget: int = PREFETCH_MEMORY_BUDGET,
+        spool_threshold: int = SPOOL_THRESHOLD,
+    ):
+        self.messages = list(messages)
+        self.memory_budget = memory_budget
+        self.spool_threshold = spool_threshold
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._budget = asyncio.Condition()
+        self._reserved = 0
+        self._reservations: Dict[int, int] = {}
+        self._results: Dict[int, asyncio.Future] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._producer: Optional[asyncio.Task] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.started_at = time.monotonic()
+        self.bytes_downloaded = 0
+        self.files_downloaded = 0
+        self.files_spooled = 0
+        self.peak_reserved = 0
+
+    def start(self) -> "AttachmentPrefetcher":
+        loop = asyncio.get_running_loop()
+        self._results = {message.id: loop.create_future() for message in self.messages}
+        self._producer = asyncio.create_task(self._produce())
+        return self
+
+    def _in_memory_bytes(self, message) -> int:
+        return sum(
+            attachment.size
+            for attachment in message.attachments
+            if attachment.size < self.spool_threshold and attachment.size <= MAX_ATTACHMENT_BYTES
+        )
+
+    async def _produce(self):
+        # Reserving strictly in message order means the message being posted always
+        # holds its reservation, so waiting on the budget cannot deadlock the poster.
+        for message in self.messages:
+            needed = self._in_memory_bytes(message)
+            async with self._budget:
+                await self._budget.wait_for(
+                    lambda: self._reserved == 0 or self._reserved + needed <= self.memory_budget
+                )
+                self._reserved += needed
+                self.peak_reserved = max(self.peak_reserved, self._reserved)
+            self._reservations[message.id] = needed
+            self._tasks.append(asyncio.create_task(self._download_message(message)))
+
+    async def fetch(self, message) -> Tuple[List[discord.File], List[str]]:
+        """Download ``message``'s attachments now; returns ``(files, link notes)``."""
+        outcomes = await asyncio.gather(*(self._download(attachment) for attachment in message.attachments))
+        files = [file for file, _ in outcomes if file is not None]
+        notes = [note for _, note in outcomes if note is not None]
+        return files, notes
+
+    async def _download_message(self, message):
+        future = self._results[message.id]
+        try:
+            files, notes = await self.fetch(message)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if future.done():
+            self._close_files(files)
+        else:
+            future.set_result((files, notes))
+
+    async def _download(self, attachment) -> Tuple[Optional[discord.File], Optional[str]]:
+        if attachment.size > MAX_ATTACHMENT_BYTES:
+            return None, _link_note(attachment, "File too large")
+        async with self._semaphore:
+            try:
+                if attachment.size >= self.spool_threshold:
+                    fp = await self._spool(attachment)
+                    self.files_spooled += 1
+                else:
+                    fp = io.BytesIO(await attachment.read())
+            except (discord.HTTPException, aiohttp.ClientError, asyncio.TimeoutError, OSError):
+                return None, _link_note(attachment, "Download failed")
+        self.bytes_downloaded += attachment.size
+        self.files_downloaded += 1
+        return discord.File(fp, filename=attachment.filename), None
+
+    async def _spool(self, attachment):
+        if self._session is None:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=300))
+        fp = tempfile.TemporaryFile()
+        try:
+            async with self._session.get(attachment.url) as response:
+                response.raise_for_status()
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    fp.write(chunk)
+            fp.seek(0)
+        except BaseException:
+            fp.close()
+            raise
+        return fp
+
+    async def get(self, message) -> Tuple[List[discord.File], List[str]]:
+        """Wait for ``message``'s attachments; returns ``(files, link notes)``."""
+        return await asyncio.shield(self._results[message.id])
+
+    async def release(self, message, files=()):
+        """Close ``files`` and return ``message``'s memory reservation to the budget."""
+        self._close_files(files)
+        needed = self._reservations.pop(message.id, 0)
+        async with self._budget:
+            self._reserved -= needed
+            self._budget.notify_all()
+
+    @staticmethod
+    def _close_files(files):
+        for file in files:
+            # discord.File does not close file objects it did not open itself
+            with contextlib.suppress(Exception):
+                file.fp.close()
+
+    def throughput(self, posted: int, total: int) -> str:
+        elapsed = max(time.monotonic() - self.started_at, 0.001)
+        megabytes = self.bytes_downloaded / (1024 * 1024)
+        return (
+            f"{posted}/{total} messages • {posted / elapsed:.1f} msg/s • "
+            f"{megabytes:.1f} MB in {self.files_downloaded} files ({megabytes / elapsed:.1f} MB/s)"
+        )
+
+    async def aclose(self):
+        """Cancel outstanding downloads and close anything that was never posted."""
+        pending = [task for task in [self._producer, *self._tasks] if task is not None]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for future in self._results.values():
+            if future.done() and not future.cancelled() and future.exception() is None:
+                self._close_files(future.result()[0])
+            elif not future.done():
+                future.cancel()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
 
 class ForumThreadMover(commands.Cog):
@@ -17,8 +193,9 @@ class ForumThreadMover(commands.Cog):
         self.admin_role_id = 544117282167586836
         self.log_channel_id = 668874839012016170
         
-        # Throttle delay between posts (in seconds)
-        self.throttle_delay = 1.5
+        # Minimum seconds between progress embed edits; posting itself is paced by
+        # discord.py's rate-limit buckets, which follow Discord's X-RateLimit headers
+        self.progress_interval = PROGRESS_EDIT_INTERVAL
         
         # Retry settings
         self.max_retries = 3
@@ -51,6 +228,16 @@ class ForumThreadMover(commands.Cog):
                 return tag
         return None
 
+    def _retry_after(self, error: discord.HTTPException) -> float:
+        """Seconds to wait before retrying, from Discord's rate-limit headers when present."""
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        for header in ("Retry-After", "X-RateLimit-Reset-After"):
+            try:
+                return max(0.0, float(headers[header]))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return self.retry_delay
+
     async def _fetch_messages_safely(self, channel: discord.TextChannel, start_message_id: int, count: int) -> List[discord.Message]:
         """Fetch messages with retry logic."""
         for attempt in range(self.max_retries):
@@ -81,7 +268,8 @@ class ForumThreadMover(commands.Cog):
                 return thread_with_message
             except discord.HTTPException as e:
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay)
+                    self._reset_files(kwargs.get("files"))
+                    await asyncio.sleep(self._retry_after(e))
                 else:
                     raise
 
@@ -92,28 +280,71 @@ class ForumThreadMover(commands.Cog):
                 return await target.send(content=content, **kwargs)
             except discord.HTTPException as e:
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay)
+                    self._reset_files(kwargs.get("files"))
+                    await asyncio.sleep(self._retry_after(e))
                 else:
                     raise
 
-    async def _handle_attachments(self, message: discord.Message) -> List[discord.File]:
+    @staticmethod
+    def _reset_files(files):
+        """Rewind files so a retried upload sends them from the start."""
+        for file in files or ():
+            with contextlib.suppress(Exception):
+                file.reset()
+
+    async def _handle_attachments(self, message: discord.Message) -> Tuple[List[discord.File], List[str]]:
         """Download and prepare attachments for re-upload."""
-        files = []
-        cdn_urls = []
-        
-        for attachment in message.attachments:
-            # Check size limit (25MB for most servers, 8MB for non-boosted)
-            if attachment.size > 25 * 1024 * 1024:
-                cdn_urls.append(f"📎 [{attachment.filename}]({attachment.url}) (File too large, see original)")
-                continue
-            
+        prefetcher = AttachmentPrefetcher([message])
+        try:
+            return await prefetcher.fetch(message)
+        finally:
+            await prefetcher.aclose()
+
+    async def _update_progress(self, progress_msg, progress_embed, prefetcher, posted: int, total: int, state: dict, force: bool = False):
+        """Edit the progress embed with throughput, at most once per progress interval."""
+        now = time.monotonic()
+        if not force and now - state.get("last_edit", 0.0) < self.progress_interval:
+            return
+        state["last_edit"] = now
+        progress_embed.set_field_at(
+            0,
+            name="Status",
+            value=f"🔄 Posting messages: {prefetcher.throughput(posted, total)}",
+            inline=False
+        )
+        with contextlib.suppress(discord.HTTPException):
+            await progress_msg.edit(embed=progress_embed)
+
+    async def _post_messages(
+        self,
+        thread: discord.Thread,
+        messages: List[discord.Message],
+        source_channel: discord.TextChannel,
+        prefetcher: AttachmentPrefetcher,
+        progress_msg,
+        progress_embed,
+        posted: int,
+        total: int
+    ):
+        """Post messages in order while the prefetcher downloads later attachments."""
+        state = {}
+        for message in messages:
+            attachments = await prefetcher.get(message)
             try:
-                file_data = await attachment.read()
-                files.append(discord.File(io.BytesIO(file_data), filename=attachment.filename))
-            except discord.HTTPException:
-                cdn_urls.append(f"📎 [{attachment.filename}]({attachment.url}) (Download failed, see original)")
-        
-        return files, cdn_urls
+                msg_content, msg_embeds, msg_files = await self._format_message_content(
+                    message, source_channel, attachments=attachments
+                )
+                await self._send_message_safely(
+                    thread,
+                    content=msg_content,
+                    files=msg_files,
+                    embeds=msg_embeds,
+                    allowed_mentions=discord.AllowedMentions.none()
+                )
+            finally:
+                await prefetcher.release(message, attachments[0])
+            posted += 1
+            await self._update_progress(progress_msg, progress_embed, prefetcher, posted, total, state)
 
     def _recreate_embed(self, embed: discord.Embed) -> Optional[discord.Embed]:
         """Recreate a rich embed, or return None if it's a special embed type."""
@@ -150,8 +381,17 @@ class ForumThreadMover(commands.Cog):
         
         return new_embed
 
-    async def _format_message_content(self, message: discord.Message, source_channel: discord.TextChannel) -> tuple[str, List[discord.Embed], List[discord.File]]:
-        """Format a message for posting in forum thread."""
+    async def _format_message_content(
+        self,
+        message: discord.Message,
+        source_channel: discord.TextChannel,
+        attachments: Optional[Tuple[List[discord.File], List[str]]] = None
+    ) -> tuple[str, List[discord.Embed], List[discord.File]]:
+        """Format a message for posting in forum thread.
+
+        ``attachments`` is the prefetched ``(files, link notes)`` pair; without it the
+        attachments are downloaded here.
+        """
         # Build header with author and timestamp (use display_name for server nickname)
         header = f"**@{message.author.display_name}** • <t:{int(message.created_at.timestamp())}:f>\n"
         
@@ -166,7 +406,7 @@ class ForumThreadMover(commands.Cog):
         content = message.content if message.content else ""
         
         # Handle attachments
-        files, cdn_urls = await self._handle_attachments(message)
+        files, cdn_urls = attachments if attachments is not None else await self._handle_attachments(message)
         
         # Add CDN URLs for large files
         if cdn_urls:
@@ -371,48 +611,40 @@ class ForumThreadMover(commands.Cog):
             progress_embed.set_field_at(0, name="Status", value=f"🔄 Creating forum post: '{title}'...", inline=False)
             await progress_msg.edit(embed=progress_embed)
             
-            # Format first message (the question)
-            first_content, first_embeds, first_files = await self._format_message_content(messages[0], source_channel)
-            
-            # Create the forum thread
-            thread_with_message = await self._create_forum_post_safely(
-                forum_channel,
-                title=title,
-                content=first_content,
-                files=first_files,
-                embeds=first_embeds,
-                allowed_mentions=discord.AllowedMentions.none(),
-                applied_tags=[tag_to_apply] if tag_to_apply else []
-            )
-            
-            # Extract the actual thread from ThreadWithMessage
-            thread = thread_with_message.thread if hasattr(thread_with_message, 'thread') else thread_with_message
-            
-            # Post remaining messages
+            # Start downloading attachments for the whole conversation
             total_messages = len(messages)
-            for idx, message in enumerate(messages[1:], start=2):
-                progress_embed.set_field_at(
-                    0,
-                    name="Status",
-                    value=f"🔄 Posting message {idx}/{total_messages}...",
-                    inline=False
-                )
-                await progress_msg.edit(embed=progress_embed)
+            prefetcher = AttachmentPrefetcher(messages).start()
+            try:
+                # Format first message (the question)
+                first_attachments = await prefetcher.get(messages[0])
+                try:
+                    first_content, first_embeds, first_files = await self._format_message_content(
+                        messages[0], source_channel, attachments=first_attachments
+                    )
+                    
+                    # Create the forum thread
+                    thread_with_message = await self._create_forum_post_safely(
+                        forum_channel,
+                        title=title,
+                        content=first_content,
+                        files=first_files,
+                        embeds=first_embeds,
+                        allowed_mentions=discord.AllowedMentions.none(),
+                        applied_tags=[tag_to_apply] if tag_to_apply else []
+                    )
+                finally:
+                    await prefetcher.release(messages[0], first_attachments[0])
                 
-                # Format message
-                msg_content, msg_embeds, msg_files = await self._format_message_content(message, source_channel)
+                # Extract the actual thread from ThreadWithMessage
+                thread = thread_with_message.thread if hasattr(thread_with_message, 'thread') else thread_with_message
                 
-                # Post to thread
-                await self._send_message_safely(
-                    thread,
-                    content=msg_content,
-                    files=msg_files,
-                    embeds=msg_embeds,
-                    allowed_mentions=discord.AllowedMentions.none()
+                # Post remaining messages
+                await self._post_messages(
+                    thread, messages[1:], source_channel, prefetcher,
+                    progress_msg, progress_embed, posted=1, total=total_messages
                 )
-                
-                # Throttle to avoid rate limits
-                await asyncio.sleep(self.throttle_delay)
+            finally:
+                await prefetcher.aclose()
             
             # Success!
             success_embed = discord.Embed(
@@ -423,6 +655,7 @@ class ForumThreadMover(commands.Cog):
             success_embed.add_field(name="Messages Moved", value=str(total_messages), inline=True)
             if tag_to_apply:
                 success_embed.add_field(name="Tag Applied", value=tag_to_apply.name, inline=True)
+            success_embed.add_field(name="Throughput", value=prefetcher.throughput(total_messages, total_messages), inline=False)
             success_embed.add_field(name="Forum Post", value=f"[{title}]({thread.jump_url})", inline=False)
             await progress_msg.edit(embed=success_embed)
             
@@ -589,31 +822,16 @@ class ForumThreadMover(commands.Cog):
                 await progress_msg.edit(content="❌ No messages found.")
                 return
             
-            # Post messages to thread
+            # Post messages to thread, downloading attachments ahead of posting
             total_messages = len(messages)
-            for idx, message in enumerate(messages, start=1):
-                progress_embed.set_field_at(
-                    0,
-                    name="Status",
-                    value=f"🔄 Posting message {idx}/{total_messages}...",
-                    inline=False
-                )
-                await progress_msg.edit(embed=progress_embed)
-                
-                # Format message
-                msg_content, msg_embeds, msg_files = await self._format_message_content(message, source_channel)
-                
-                # Post to thread
-                await self._send_message_safely(
-                    thread,
-                    content=msg_content,
-                    files=msg_files,
-                    embeds=msg_embeds,
-                    allowed_mentions=discord.AllowedMentions.none()
+            prefetcher = AttachmentPrefetcher(messages).start()
+            try:
+                await self._post_messages(
+                    thread, messages, source_channel, prefetcher,
+                    progress_msg, progress_embed, posted=0, total=total_messages
                 )
-                
-                # Throttle
-                await asyncio.sleep(self.throttle_delay)
+            finally:
+                await prefetcher.aclose()
             
             # Success!
             success_embed = discord.Embed(
@@ -622,6 +840,7 @@ class ForumThreadMover(commands.Cog):
                 color=discord.Color.green()
             )
             success_embed.add_field(name="Messages Added", value=str(total_messages), inline=True)
+            success_embed.add_field(name="Throughput", value=prefetcher.throughput(total_messages, total_messages), inline=False)
             await progress_msg.edit(embed=success_embed)
             
             # Log the action
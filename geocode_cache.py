@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+DEFAULT_TTL_SECONDS = 90 * 24 * 60 * 60
+# Misses are cached briefly: long enough to absorb retries of an unresolvable query,
+# short enough that a provider outage reported as "no result" does not stick
+NEGATIVE_TTL_SECONDS = 6 * 60 * 60
+DEFAULT_MAX_ENTRIES = 10_000
+# Prune down to this fraction of max_entries so a full cache does not prune on every insert
+PRUNE_TARGET_RATIO = 0.9
+
+PROVIDER_MIN_INTERVALS = {
+    "nominatim": 1.0,
+    "geocode.maps.co": 1.1,
+    "google": 0.1,
+}
+
+# geocode.maps.co /search with format=json, addressdetails=1, limit=3, accept-language=en
+MAPSCO_SEARCH_NAMESPACE = "geocode.maps.co:search"
+
+# Attribute on the bot that holds the process-wide cache shared by every cog copy of this module
+SHARED_ATTRIBUTE = "_fara_geocode_cache"
+
+_MISSING = object()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS geocode_cache (
+    namespace TEXT NOT NULL,
+    query_key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    negative INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (namespace, query_key)
+);
+CREATE INDEX IF NOT EXISTS idx_geocode_cache_last_used ON geocode_cache(last_used_at);
+CREATE INDEX IF NOT EXISTS idx_geocode_cache_expires ON geocode_cache(expires_at);
+"""
+
+
+def normalize_geocode_query(value: Any) -> str:
+    """Collapse whitespace and case so equivalent addresses share one cache entry."""
+    return " ".join(str(value or "").split()).casefold()
+
+
+def geocode_cache_path() -> Optional[Path]:
+    """Return the shared cache database path, or None outside a Red runtime."""
+    try:
+        from redbot.core.data_manager import cog_data_path
+    except ImportError:  # pragma: no cover - local tooling without Red installed
+        return None
+    try:
+        base_path = cog_data_path(raw_name="geocode_cache")
+    except Exception:
+        return None
+    if base_path is None:
+        return None
+    return Path(base_path) / "geocode_cache.db"
+
+
+class ProviderRateLimiter:
+    """Space out requests per provider; Nominatim allows one request per second per application."""
+
+    def __init__(
+        self,
+        intervals: Optional[Dict[str, float]] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        self.intervals = dict(PROVIDER_MIN_INTERVALS if intervals is None else intervals)
+        self._clock = clock
+        self._sleep = sleep
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._last_call: Dict[str, float] = {}
+        self.waits: Dict[str, int] = {}
+
+    async def wait(self, provider: str) -> None:
+        """Block until ``provider`` may be called again, then reserve the slot."""
+        interval = float(self.intervals.get(provider, 0) or 0)
+        if interval <= 0:
+            return
+        lock = self._locks.setdefault(provider, asyncio.Lock())
+        async with lock:
+            last_call = self._last_call.get(provider)
+            if last_call is not None:
+                remaining = interval - (self._clock() - last_call)
+                if remaining > 0:
+                    self.waits[provider] = self.waits.get(provider, 0) + 1
+                    await self._sleep(remaining)
+            self._last_call[provider] = self._clock()
+
+
+class GeocodeCache:
+    """SQLite-backed geocode cache with TTL, LRU eviction, negative entries and in-flight sharing.
+
+    Entries are keyed by ``(namespace, normalized query)``. A namespace names the
+    request shape (provider and parameters), so cogs issuing the same request share
+    entries while differently shaped results never mix. Without a ``db_path`` the
+    cache lives in an in-memory database.
+    """
+
+    def __init__(
+        self,
+        db_path=None,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        negative_ttl: float = NEGATIVE_TTL_SECONDS,
+        rate_limiter: Optional[ProviderRateLimiter] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.db_path = str(db_path) if db_path else ":memory:"
+        self.max_entries = max(1, int(max_entries))
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.rate_limiter = rate_limiter or ProviderRateLimiter()
+        self._clock = clock
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.Lock()
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self.metrics = {"hits": 0, "negative_hits": 0, "misses": 0, "shared": 0, "errors": 0, "evicted": 0}
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.db_path != ":memory:":
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout = 30000")
+            if self.db_path != ":memory:":
+                conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_sync(self, namespace: str, query_key: str) -> Any:
+        """Return the cached value, or ``_MISSING``; a hit refreshes the entry's LRU position."""
+        now = self._clock()
+        with self._conn_lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT payload, negative, expires_at FROM geocode_cache WHERE namespace = ? AND query_key = ?",
+                (namespace, query_key),
+            ).fetchone()
+            if row is None:
+                return _MISSING
+            payload, negative, expires_at = row
+            if expires_at <= now:
+                conn.execute(
+                    "DELETE FROM geocode_cache WHERE namespace = ? AND query_key = ?",
+                    (namespace, query_key),
+                )
+                conn.commit()
+                return _MISSING
+            conn.execute(
+                "UPDATE geocode_cache SET last_used_at = ?, hits = hits + 1 WHERE namespace = ? AND query_key = ?",
+                (now, namespace, query_key),
+            )
+            conn.commit()
+        if negative:
+            self.metrics["negative_hits"] += 1
+        else:
+            self.metrics["hits"] += 1
+        return json.loads(payload)
+
+    def put_sync(self, namespace: str, query_key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value``; empty values (None, [], {}) are stored as negative entries."""
+        negative = not value
+        if ttl is None:
+            ttl = self.negative_ttl if negative else self.ttl
+        now = self._clock()
+        payload = json.dumps(value, separators=(",", ":"))
+        with self._conn_lock:
+            conn = self._connection()
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO geocode_cache
+                    (namespace, query_key, payload, negative, created_at, expires_at, last_used_at, hits)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+                """,
+                (namespace, query_key, payload, int(negative), now, now + ttl, now),
+            )
+            count = conn.execute("SELECT COUNT(*) FROM geocode_cache").fetchone()[0]
+            if count > self.max_entries:
+                self.metrics["evicted"] += self._prune(conn, now, count)
+            conn.commit()
+
+    def _prune(self, conn: sqlite3.Connection, now: float, count: int) -> int:
+        removed = conn.execute("DELETE FROM geocode_cache WHERE expires_at <= ?", (now,)).rowcount
+        excess = count - removed - int(self.max_entries * PRUNE_TARGET_RATIO)
+        if excess > 0:
+            removed += conn.execute(
+                """
+                DELETE FROM geocode_cache WHERE rowid IN (
+                    SELECT rowid FROM geocode_cache ORDER BY last_used_at LIMIT ?
+                )
+                """,
+                (excess,),
+            ).rowcount
+        return removed
+
+    def clear_sync(self, namespace: Optional[str] = None) -> int:
+        with self._conn_lock:
+            conn = self._connection()
+            if namespace is None:
+                removed = conn.execute("DELETE FROM geocode_cache").rowcount
+            else:
+                removed = conn.execute("DELETE FROM geocode_cache WHERE namespace = ?", (namespace,)).rowcount
+            conn.commit()
+        return removed
+
+    def stats_sync(self) -> Dict[str, Any]:
+        with self._conn_lock:
+            conn = self._connection()
+            entries, negatives = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(negative), 0) FROM geocode_cache"
+            ).fetchone()
+        return {"entries": entries, "negative_entries": negatives, **self.metrics}
+
+    async def get(self, namespace: str, query: str) -> Any:
+        """Return the cached value for ``query`` or None."""
+        value = await asyncio.to_thread(self.get_sync, namespace, normalize_geocode_query(query))
+        return None if value is _MISSING else value
+
+    async def put(self, namespace: str, query: str, value: Any, *, ttl: Optional[float] = None) -> None:
+        await asyncio.to_thread(self.put_sync, namespace, normalize_geocode_query(query), value, ttl)
+
+    async def clear(self, namespace: Optional[str] = None) -> int:
+        return await asyncio.to_thread(self.clear_sync, namespace)
+
+    async def stats(self) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.stats_sync)
+
+    async def lookup(
+        self,
+        namespace: str,
+        query: str,
+        fetch: Callable[[], Awaitable[Any]],
+        *,
+        ttl: Optional[float] = None,
+    ) -> Tuple[Any, bool]:
+        """Return ``(value, from_cache)``, calling ``fetch`` only on a miss.
+
+        Concurrent lookups of the same key share one ``fetch``. Exceptions raised by
+        ``fetch`` propagate to every waiter and are not cached.
+        """
+        query_key = normalize_geocode_query(query)
+        if not query_key:
+            return await fetch(), False
+
+        inflight_key = (namespace, query_key)
+        pending = self._inflight.get(inflight_key)
+        if pending is not None:
+            self.metrics["shared"] += 1
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[inflight_key] = future
+        try:
+            cached = await asyncio.to_thread(self.get_sync, namespace, query_key)
+            if cached is not _MISSING:
+                result = (cached, True)
+            else:
+                self.metrics["misses"] += 1
+                value = await fetch()
+                await asyncio.to_thread(self.put_sync, namespace, query_key, value, ttl)
+                result = (value, False)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            self.metrics["errors"] += 1
+            future.set_exception(exc)
+            # Mark retrieved so an unawaited future does not log "exception was never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(inflight_key, None)
+
+    async def throttle(self, provider: str) -> None:
+        """Wait for the shared per-provider rate limit before an outgoing request."""
+        await self.rate_limiter.wait(provider)
+
+
+def shared_geocode_cache(bot: Any, db_path=_MISSING) -> GeocodeCache:
+    """Return the bot-wide cache, creating it on first use.
+
+    Each cog packages its own copy of this module, so the instance lives on the bot
+    rather than in a module global; that keeps in-flight sharing and provider rate
+    limits process-wide.
+    """
+    cache = getattr(bot, SHARED_ATTRIBUTE, None)
+    if cache is None:
+        cache = GeocodeCache(geocode_cache_path() if db_path is _MISSING else db_path)
+        try:
+            setattr(bot, SHARED_ATTRIBUTE, cache)
+        except AttributeError:
+            pass
+    return cache
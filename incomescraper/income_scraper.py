@@ -11,23 +11,47 @@ from zoneinfo import ZoneInfo
 
 try:
     from .fara_db import (
+        add_column_if_missing,
         connect_database,
         ensure_scrape_runs_table,
         finish_scrape_run_for_path,
+        latest_high_water_mark,
         start_scrape_run_for_path,
     )
+    from .mc_requests import mc_request_slot
 except ImportError:  # pragma: no cover - direct module loading in local tooling
     from fara_db import (
+        add_column_if_missing,
         connect_database,
         ensure_scrape_runs_table,
         finish_scrape_run_for_path,
+        latest_high_water_mark,
         start_scrape_run_for_path,
     )
+    from mc_requests import mc_request_slot
 
 # SQLite INTEGER limits
 INT64_MAX = 9223372036854775807
 INT64_MIN = -9223372036854775808
 
+# Page budget for routine expense refreshes; they normally stop at the first page
+# that is already stored, so this only bounds a refresh after a long outage
+EXPENSE_REFRESH_MAX_PAGES = 100
+# The treasury page shows the current balance near this label
+ALLIANCE_FUNDS_PATTERN = re.compile(
+    r"Alliance\s+(?:Funds|Treasury)\D{0,40}?(\d[\d,.\s]*?)\s*Credits",
+    re.IGNORECASE,
+)
+
+
+def parse_alliance_funds(text):
+    """Current alliance balance from the treasury page text, or None."""
+    match = ALLIANCE_FUNDS_PATTERN.search(text or "")
+    if not match:
+        return None
+    digits = re.sub(r"\D", "", match.group(1))
+    return int(digits) if digits else None
+
 class IncomeScraper(commands.Cog):
     """Scrapes alliance income/expenses from MissionChief"""
     
@@ -44,6 +68,7 @@ class IncomeScraper(commands.Cog):
         self.income_url = "https://www.missionchief.com/verband/kasse"
         self.debug_mode = False
         self._scrape_lock = asyncio.Lock()
+        self.last_alliance_funds = None
         
         self._init_database()
         self.scrape_task = self.bot.loop.create_task(self._background_scraper())
@@ -89,6 +114,13 @@ class IncomeScraper(commands.Cog):
                     "ON expenses(event_timestamp)"
                 )
                 ensure_scrape_runs_table(cursor)
+                add_column_if_missing(
+                    conn,
+                    self.db_path,
+                    "scrape_runs",
+                    "high_water_mark",
+                    "ALTER TABLE scrape_runs ADD COLUMN high_water_mark TEXT",
+                )
                 conn.commit()
                 conn.close()
                 return
@@ -126,6 +158,23 @@ class IncomeScraper(commands.Cog):
                 ttl_seconds=ttl_seconds,
             )
 
+    def _mc_request_slot(self, priority="scraper"):
+        """Pace one MissionChief request through CookieManager's request governor."""
+        return mc_request_slot(getattr(self, "bot", None), "IncomeScraper", priority)
+
+    def _note_alliance_funds(self, funds):
+        """Remember the treasury balance and signal it to cogs waiting for funds."""
+        if funds is None:
+            return
+        changed = funds != self.last_alliance_funds
+        self.last_alliance_funds = funds
+        if changed:
+            self.bot.dispatch("fara_alliance_funds_updated", funds, "IncomeScraper")
+
+    def get_current_alliance_funds(self):
+        """Last alliance balance seen on the treasury page (None before the first scrape)."""
+        return self.last_alliance_funds
+
     @staticmethod
     def _next_pre_reset_snapshot(now):
         """Return the next 23:55 America/New_York snapshot time."""
@@ -155,6 +204,11 @@ class IncomeScraper(commands.Cog):
                 print(f"[IncomeScraper] Pre-reset snapshot error: {e}")
                 await asyncio.sleep(60)
 
+    @staticmethod
+    def _utcnow():
+        """Scrape time; expense dates without a year are resolved against it."""
+        return datetime.now(ZoneInfo("UTC"))
+
     @staticmethod
     def _normalize_expense_timestamp(source_date, scraped_at):
         """Normalize only recent, unambiguous yearless expense dates."""
@@ -173,9 +227,14 @@ class IncomeScraper(commands.Cog):
         return candidate.astimezone(ZoneInfo("UTC")).isoformat()
 
     @staticmethod
-    def _assign_expense_occurrences(entries, scraped_at):
-        """Assign stable occurrence indexes to identical visible expenses."""
-        occurrences = {}
+    def _assign_expense_occurrences(entries, scraped_at, occurrences=None):
+        """Assign stable occurrence indexes to identical visible expenses.
+
+        Pass the same ``occurrences`` dict for consecutive pages to number them as
+        one list, matching a later call over all entries of the run.
+        """
+        if occurrences is None:
+            occurrences = {}
         for entry in entries:
             event_timestamp = IncomeScraper._normalize_expense_timestamp(
                 entry["source_date"],
@@ -203,8 +262,12 @@ class IncomeScraper(commands.Cog):
         
         while not self.bot.is_closed():
             try:
-                # Run scrape
-                await self._scrape_all_income(ctx=None, include_expenses=False, max_expense_pages=5)
+                # Run scrape; the expense refresh stops at the first already-stored page
+                await self._scrape_all_income(
+                    ctx=None,
+                    include_expenses=True,
+                    max_expense_pages=EXPENSE_REFRESH_MAX_PAGES,
+                )
                 
                 # Wait 1 hour
                 await asyncio.sleep(3600)
@@ -280,7 +343,7 @@ class IncomeScraper(commands.Cog):
         await self._debug_log(f"🌐 Scraping {tab_type} income: {url}", ctx)
         
         try:
-            async with session.get(url) as resp:
+            async with self._mc_request_slot(), session.get(url) as resp:
                 await self._debug_log(f"📡 Response status: {resp.status}", ctx)
                 
                 if resp.status != 200:
@@ -297,6 +360,7 @@ class IncomeScraper(commands.Cog):
                 
                 # Parse HTML
                 soup = BeautifulSoup(html_content, 'html.parser')
+                self._note_alliance_funds(parse_alliance_funds(soup.get_text(" ", strip=True)))
                 
                 # Look for tab links to understand structure
                 tab_links = soup.find_all('a', href=True)
@@ -426,13 +490,67 @@ class IncomeScraper(commands.Cog):
             await self._debug_log(f"Traceback: {traceback.format_exc()}", ctx)
             return []
     
-    async def _scrape_expenses_pages(self, session, ctx=None, max_pages=100):
-        """Scrape expenses with pagination - page param changes the expense table only"""
-        await self._debug_log(f"💸 Starting EXPENSES scrape (max {max_pages} pages)", ctx)
-        if ctx and max_pages > 50:
+    def _known_expense_keys(self, entries):
+        """Return the (signature, occurrence_index) pairs of ``entries`` already stored."""
+        signatures = sorted({entry["signature"] for entry in entries})
+        if not signatures:
+            return set()
+        conn = connect_database(self.db_path)
+        try:
+            rows = conn.execute(
+                "SELECT signature, occurrence_index FROM expenses "
+                f"WHERE signature IN ({', '.join('?' for _ in signatures)})",
+                signatures,
+            ).fetchall()
+        finally:
+            conn.close()
+        return {(signature, occurrence) for signature, occurrence in rows}
+
+    async def _page_already_stored(self, page_entries, high_water_mark=None):
+        """True when every entry on an expense page is already in the database."""
+        if high_water_mark and any(
+            (entry.get("event_timestamp") or "") > high_water_mark for entry in page_entries
+        ):
+            return False  # Newer than anything a previous run stored
+        known = await asyncio.to_thread(self._known_expense_keys, page_entries)
+        return all((entry["signature"], entry["occurrence_index"]) in known for entry in page_entries)
+
+    def _read_high_water_mark(self):
+        conn = connect_database(self.db_path)
+        try:
+            return latest_high_water_mark(conn, "income")
+        finally:
+            conn.close()
+
+    async def _scrape_expenses_pages(
+        self,
+        session,
+        ctx=None,
+        max_pages=100,
+        *,
+        incremental=False,
+        scraped_at=None,
+        high_water_mark=None,
+        report=None,
+    ):
+        """Scrape expenses with pagination - page param changes the expense table only
+
+        With ``incremental`` the walk stops at the first page whose entries are all
+        stored already. ``report`` (a dict) receives pages and rows fetched and why
+        the walk stopped.
+        """
+        report = {} if report is None else report
+        report.update(pages_fetched=0, pages_succeeded=0, rows_fetched=0, stopped_at_known_page=None)
+        await self._debug_log(
+            f"💸 Starting EXPENSES scrape (max {max_pages} pages{', incremental' if incremental else ''})",
+            ctx,
+        )
+        if ctx and max_pages > 50 and not incremental:
             est_minutes = (max_pages * 1.5) / 60
             await ctx.send(f"⏱️ Estimated time: ~{est_minutes:.0f} minutes")
         
+        scraped_at = scraped_at or self._utcnow()
+        occurrences = {}
         all_entries = []
         page = 1
         empty_count = 0
@@ -449,7 +567,8 @@ class IncomeScraper(commands.Cog):
             await self._debug_log(f"🌐 Page {page}: {url}", ctx)
             
             try:
-                async with session.get(url) as resp:
+                report["pages_fetched"] += 1
+                async with self._mc_request_slot(), session.get(url) as resp:
                     if resp.status != 200:
                         empty_count += 1
                         if empty_count >= 3: 
@@ -512,18 +631,24 @@ class IncomeScraper(commands.Cog):
                                 'source_date': date_col,
                             })
                     
+                    report["pages_succeeded"] += 1
                     if not page_entries:
                         empty_count += 1
                         if empty_count >= 3:
                             await self._debug_log("⛔ Stopped after 3 empty pages", ctx)
                             break
                     else:
+                        report["rows_fetched"] += len(page_entries)
+                        self._assign_expense_occurrences(page_entries, scraped_at, occurrences)
+                        if incremental and await self._page_already_stored(page_entries, high_water_mark):
+                            report["stopped_at_known_page"] = page
+                            await self._debug_log(f"⏹️ Page {page} is already stored - stopping", ctx)
+                            break
                         await self._debug_log(f"✅ Page {page}: {len(page_entries)} expenses", ctx)
                         all_entries.extend(page_entries)
                         empty_count = 0
                     
                     page += 1
-                    await asyncio.sleep(1.5)
                     
             except Exception as e:
                 await self._debug_log(f"❌ Error page {page}: {str(e)}", ctx)
@@ -532,16 +657,17 @@ class IncomeScraper(commands.Cog):
         await self._debug_log(f"📊 Total: {len(all_entries)} expenses", ctx)
         return all_entries
     
-    async def _scrape_all_income(self, ctx=None, include_expenses=True, max_expense_pages=100):
+    async def _scrape_all_income(self, ctx=None, include_expenses=True, max_expense_pages=100, incremental=True):
         """Serialize income scrapes so scheduled tasks cannot overlap."""
         async with self._scrape_lock:
             return await self._scrape_all_income_unlocked(
                 ctx,
                 include_expenses,
                 max_expense_pages,
+                incremental,
             )
 
-    async def _scrape_all_income_unlocked(self, ctx=None, include_expenses=True, max_expense_pages=100):
+    async def _scrape_all_income_unlocked(self, ctx=None, include_expenses=True, max_expense_pages=100, incremental=True):
         if not include_expenses and max_expense_pages == 0:
             detail = "capturing pre-reset treasury snapshot"
         elif include_expenses:
@@ -553,11 +679,12 @@ class IncomeScraper(commands.Cog):
                 ctx,
                 include_expenses,
                 max_expense_pages,
+                incremental,
             )
 
-    async def _scrape_all_income_unlocked_impl(self, ctx=None, include_expenses=True, max_expense_pages=100):
+    async def _scrape_all_income_unlocked_impl(self, ctx=None, include_expenses=True, max_expense_pages=100, incremental=True):
         """Scrape daily income, monthly income, and expenses from the treasury page"""
-        scraped_at_dt = datetime.now(ZoneInfo("UTC"))
+        scraped_at_dt = self._utcnow()
         timestamp = scraped_at_dt.isoformat()
         source = "live" if include_expenses else "snapshot"
         run_id = start_scrape_run_for_path(
@@ -583,24 +710,30 @@ class IncomeScraper(commands.Cog):
         
         income_data = []
         expenses_data = []
+        expense_report = {}
         
         # 1. Scrape daily income/expense tab
         await self._debug_log("📅 Scraping DAILY income tab...", ctx)
         daily_data = await self._scrape_income_tab(session, 'daily', ctx)
         income_data.extend(daily_data)
         
-        await asyncio.sleep(1.5)
-        
         # 2. Scrape monthly income/expense tab
         await self._debug_log("📆 Scraping MONTHLY income tab...", ctx)
         monthly_data = await self._scrape_income_tab(session, 'monthly', ctx)
         income_data.extend(monthly_data)
         
-        await asyncio.sleep(1.5)
-        
         # 3. Scrape expenses with pagination
         if include_expenses:
-            expenses_data = await self._scrape_expenses_pages(session, ctx, max_expense_pages)
+            high_water_mark = await asyncio.to_thread(self._read_high_water_mark)
+            expenses_data = await self._scrape_expenses_pages(
+                session,
+                ctx,
+                max_expense_pages,
+                incremental=incremental,
+                scraped_at=scraped_at_dt,
+                high_water_mark=high_water_mark,
+                report=expense_report,
+            )
         
         # Store in database
         if not income_data and not expenses_data:
@@ -620,6 +753,7 @@ class IncomeScraper(commands.Cog):
         
         inserted = 0
         duplicates = 0
+        new_expenses = 0
         
         for entry in income_data:
             try:
@@ -677,27 +811,50 @@ class IncomeScraper(commands.Cog):
                     ),
                 )
                 inserted += 1
+                new_expenses += 1
             except sqlite3.IntegrityError:
                 duplicates += 1
         
         conn.commit()
         conn.close()
+
+        expense_summary = ""
+        new_high_water_mark = None
+        if include_expenses:
+            new_high_water_mark = max(
+                [entry["event_timestamp"] for entry in expenses_data if entry.get("event_timestamp")]
+                + ([high_water_mark] if high_water_mark else []),
+                default=None,
+            )
+            pages_fetched = expense_report.get("pages_fetched", 0)
+            expense_summary = (
+                f"expenses: {pages_fetched} pages, "
+                f"{expense_report.get('rows_fetched', len(expenses_data))} rows fetched, {new_expenses} new"
+            )
+            if expense_report.get("stopped_at_known_page"):
+                expense_summary += f", stopped at stored page {expense_report['stopped_at_known_page']}"
         finish_scrape_run_for_path(
             self.db_path,
             run_id,
             "success",
-            pages_attempted=max_expense_pages if include_expenses else 0,
+            pages_attempted=expense_report.get("pages_fetched", 0),
+            pages_succeeded=expense_report.get("pages_succeeded", 0),
             rows_parsed=len(income_data) + len(expenses_data),
             rows_inserted=inserted,
             duplicates=duplicates,
-            message=f"{len(income_data)} income rows and {len(expenses_data)} expense rows scraped",
+            message=(
+                f"{len(income_data)} income rows and {len(expenses_data)} expense rows scraped"
+                + (f"; {expense_summary}" if expense_summary else "")
+            ),
+            high_water_mark=new_high_water_mark,
         )
         
         await self._debug_log(f"💾 Database: {inserted} inserted, {duplicates} duplicates", ctx)
         
         if ctx:
             await ctx.send(f"✅ Scraped {len(income_data) + len(expenses_data)} income/expense entries\n"
-                          f"💾 Database: {inserted} new records, {duplicates} duplicates")
+                          f"💾 Database: {inserted} new records, {duplicates} duplicates"
+                          + (f"\n💸 {expense_summary.capitalize()}" if expense_summary else ""))
         
         return True
     
@@ -739,8 +896,13 @@ class IncomeScraper(commands.Cog):
         await ctx.send(f"🔄 Starting back-fill of expenses (up to {max_pages} pages)...")
         await ctx.send("⏳ This may take several minutes...")
         
-        # Just scrape expenses with high page count
-        success = await self._scrape_all_income(ctx, include_expenses=True, max_expense_pages=max_pages)
+        # Walk the full page range instead of stopping at the first stored page
+        success = await self._scrape_all_income(
+            ctx,
+            include_expenses=True,
+            max_expense_pages=max_pages,
+            incremental=False,
+        )
         
         if success:
             await ctx.send("✅ Expense back-fill completed!")
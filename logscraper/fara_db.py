@@ -89,7 +89,8 @@ def ensure_scrape_runs_table(cursor: sqlite3.Cursor) -> None:
             rows_inserted INTEGER NOT NULL DEFAULT 0,
             duplicates INTEGER NOT NULL DEFAULT 0,
             errors INTEGER NOT NULL DEFAULT 0,
-            message TEXT
+            message TEXT,
+            high_water_mark TEXT
         )
         """
     )
@@ -141,6 +142,7 @@ def finish_scrape_run(
     duplicates: int = 0,
     errors: int = 0,
     message: Optional[str] = None,
+    high_water_mark: Optional[str] = None,
 ) -> None:
     if run_id is None:
         return
@@ -171,6 +173,12 @@ def finish_scrape_run(
             int(run_id),
         ),
     )
+    if high_water_mark is not None:
+        # Only written by scrapers that migrated the column in; older databases lack it
+        conn.execute(
+            "UPDATE scrape_runs SET high_water_mark = ? WHERE run_id = ?",
+            (high_water_mark, int(run_id)),
+        )
     conn.commit()
 
 
@@ -196,6 +204,31 @@ def latest_successful_source_timestamp(
     return row[0] if row else None
 
 
+def latest_high_water_mark(
+    conn: sqlite3.Connection,
+    scraper: str,
+    *,
+    source: str = "live",
+) -> Optional[str]:
+    """Return the newest source position recorded by a successful run, if any."""
+    if "high_water_mark" not in table_columns(conn.cursor(), "scrape_runs"):
+        return None
+    row = conn.execute(
+        """
+        SELECT high_water_mark
+        FROM scrape_runs
+        WHERE scraper = ?
+          AND source = ?
+          AND status = 'success'
+          AND high_water_mark IS NOT NULL
+        ORDER BY finished_at DESC, run_id DESC
+        LIMIT 1
+        """,
+        (scraper, source),
+    ).fetchone()
+    return row[0] if row else None
+
+
 def start_scrape_run_for_path(
     db_path,
     scraper: str,
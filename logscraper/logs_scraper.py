@@ -18,6 +18,7 @@ try:
         finish_scrape_run_for_path,
         start_scrape_run_for_path,
     )
+    from .mc_requests import mc_request_slot
 except ImportError:  # pragma: no cover - direct module loading in local tooling
     from fara_db import (
         backup_database,
@@ -26,6 +27,9 @@ except ImportError:  # pragma: no cover - direct module loading in local tooling
         finish_scrape_run_for_path,
         start_scrape_run_for_path,
     )
+    from mc_requests import mc_request_slot
+
+
 
 
 class LogsScrapePageError(RuntimeError):
@@ -151,6 +155,10 @@ class LogsScraper(commands.Cog):
                 ttl_seconds=ttl_seconds,
             )
 
+    def _mc_request_slot(self, priority="scraper"):
+        """Pace one MissionChief request through CookieManager's request governor."""
+        return mc_request_slot(getattr(self, "bot", None), "LogsScraper", priority)
+
     @staticmethod
     def _build_member_identity_filter(
         *,
@@ -366,7 +374,7 @@ class LogsScraper(commands.Cog):
             await self._debug_log(f"❌ Failed to get session: {e}", ctx)
             return None
     
-    async def _scrape_logs_page(self, session, page_num, ctx=None):
+    async def _scrape_logs_page(self, session, page_num, ctx=None, priority="scraper"):
         """Scrape a single page of logs with COMPLETE data extraction"""
         if page_num == 1 or page_num % 10 == 0:
             await self._report_bot_status(f"scraping alliance logs page {page_num}")
@@ -374,7 +382,7 @@ class LogsScraper(commands.Cog):
         await self._debug_log(f"🌐 Page {page_num}: {url}", ctx)
         
         try:
-            async with session.get(url) as response:
+            async with self._mc_request_slot(priority), session.get(url) as response:
                 html = await response.text()
                 soup = BeautifulSoup(html, 'html.parser')
                 
@@ -578,12 +586,12 @@ class LogsScraper(commands.Cog):
             await self._debug_log(f"❌ Page {page_num} error: {e}", ctx)
             return []
     
-    async def _scrape_all_logs(self, ctx, max_pages=5):
+    async def _scrape_all_logs(self, ctx, max_pages=5, priority="scraper"):
         detail = f"scraping alliance logs ({max_pages} pages)"
         async with self._bot_status(detail):
-            return await self._scrape_all_logs_impl(ctx, max_pages)
+            return await self._scrape_all_logs_impl(ctx, max_pages, priority)
 
-    async def _scrape_all_logs_impl(self, ctx, max_pages=5):
+    async def _scrape_all_logs_impl(self, ctx, max_pages=5, priority="scraper"):
         """Scrape multiple pages of logs"""
         scraped_at_dt = datetime.now(ZoneInfo("UTC"))
         scraped_at = scraped_at_dt.isoformat()
@@ -610,14 +618,12 @@ class LogsScraper(commands.Cog):
         all_logs = []
         try:
             for page in range(1, max_pages + 1):
-                logs = await self._scrape_logs_page(session, page, ctx)
+                logs = await self._scrape_logs_page(session, page, ctx, priority=priority)
                 all_logs.extend(logs)
 
                 # Progress update every 10 pages
                 if page % 10 == 0:
                     await self._debug_log(f"Progress: {page}/{max_pages} pages, {len(all_logs)} logs collected", ctx)
-
-                await asyncio.sleep(1.5)  # Rate limiting
         except LogsScrapePageError as exc:
             await self._debug_log(f"Logs scrape failed: {exc}", ctx)
             if ctx:
@@ -802,7 +808,7 @@ class LogsScraper(commands.Cog):
             return
         
         await ctx.send(f"⚠️ Starting backfill of {max_pages} pages (~{max_pages * 1.5 / 60:.1f} minutes)...")
-        success = await self._scrape_all_logs(ctx, max_pages)
+        success = await self._scrape_all_logs(ctx, max_pages, priority="backfill")
         
         if success:
             await ctx.send("✅ Backfill completed!")
@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib.util
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+# Close the pooled browser after this long without an action
+BROWSER_IDLE_SECONDS = 5 * 60
+DEFAULT_VIEWPORT = {"width": 1440, "height": 1000}
+DEFAULT_PAGE_TIMEOUT_MS = 30000
+LATENCY_SAMPLES = 100
+
+PATH_REPLAY = "replay"
+PATH_BROWSER = "browser"
+
+# Attribute on the bot that holds the process-wide engine shared by every cog copy of this module
+SHARED_ATTRIBUTE = "_fara_mc_actions"
+
+
+class ReplayUnavailable(Exception):
+    """The HTTP replay could not run this action and submitted nothing; use the browser."""
+
+    # The shared engine may come from another cog's copy of this module, so it
+    # recognizes the exception by this marker rather than by class
+    replay_unavailable = True
+
+
+class BrowserUnavailable(RuntimeError):
+    """Playwright or its Chromium build is not installed."""
+
+
+def playwright_installed() -> bool:
+    """Whether the optional Playwright package can be imported."""
+    return importlib.util.find_spec("playwright") is not None
+
+
+def _is_missing_browser(exc: BaseException) -> bool:
+    message = str(exc)
+    return "Executable doesn't exist" in message or "playwright install" in message
+
+
+def _cookie_signature(cookies: Iterable[Dict[str, str]]) -> Tuple[Tuple[str, str, str], ...]:
+    return tuple(sorted((str(c.get("name")), str(c.get("value")), str(c.get("url") or c.get("domain") or "")) for c in cookies))
+
+
+class BrowserPool:
+    """One Chromium process and one authenticated context per cookie set.
+
+    Actions used to launch and tear down a browser each; the pool keeps the
+    process warm between actions and closes it after ``idle_seconds`` without
+    use. Each action still gets its own page. A context is rebuilt when
+    CookieManager's cookies change, once no page is using the old one.
+    """
+
+    def __init__(
+        self,
+        *,
+        idle_seconds: float = BROWSER_IDLE_SECONDS,
+        launcher: Optional[Callable[[], Awaitable[Tuple[Any, Any]]]] = None,
+    ):
+        self.idle_seconds = idle_seconds
+        self._launcher = launcher or self._launch_playwright
+        self._playwright = None
+        self._browser = None
+        self._contexts: Dict[Tuple, Any] = {}
+        self._context_users: Dict[Tuple, int] = {}
+        self._current_signature: Optional[Tuple] = None
+        self._lock = asyncio.Lock()
+        self._active = 0
+        self._idle_task: Optional[asyncio.Task] = None
+        self.launches = 0
+        self.contexts_created = 0
+
+    @staticmethod
+    async def _launch_playwright() -> Tuple[Any, Any]:
+        try:
+            from playwright.async_api import async_playwright
+        except Exception as exc:
+            raise BrowserUnavailable(str(exc)) from exc
+        playwright = await async_playwright().start()
+        try:
+            browser = await playwright.chromium.launch(headless=True)
+        except Exception as exc:
+            await playwright.stop()
+            if _is_missing_browser(exc):
+                raise BrowserUnavailable(str(exc)) from exc
+            raise
+        return playwright, browser
+
+    @property
+    def running(self) -> bool:
+        return self._browser is not None
+
+    async def _ensure_browser(self):
+        if self._browser is not None:
+            is_connected = getattr(self._browser, "is_connected", None)
+            if is_connected is None or is_connected():
+                return self._browser
+            await self._close_locked()
+        self._playwright, self._browser = await self._launcher()
+        self.launches += 1
+        return self._browser
+
+    async def _context_for(self, cookies: List[Dict[str, str]], viewport: Dict[str, int]):
+        signature = (_cookie_signature(cookies), tuple(sorted(viewport.items())))
+        context = self._contexts.get(signature)
+        if context is None:
+            browser = await self._ensure_browser()
+            context = await browser.new_context(viewport=dict(viewport))
+            if cookies:
+                await context.add_cookies(list(cookies))
+            self._contexts[signature] = context
+            self.contexts_created += 1
+        self._current_signature = signature
+        self._context_users[signature] = self._context_users.get(signature, 0) + 1
+        return signature, context
+
+    async def _release_context(self, signature: Tuple) -> None:
+        users = self._context_users.get(signature)
+        if users is None:
+            # Closed with the browser while the page was in use
+            return
+        self._context_users[signature] = users - 1
+        if users > 1 or signature == self._current_signature:
+            return
+        # Stale cookies: nobody uses this context any more
+        context = self._contexts.pop(signature, None)
+        self._context_users.pop(signature, None)
+        if context is not None:
+            with contextlib.suppress(Exception):
+                await context.close()
+
+    @contextlib.asynccontextmanager
+    async def page(
+        self,
+        cookies: List[Dict[str, str]],
+        *,
+        viewport: Optional[Dict[str, int]] = None,
+        timeout_ms: int = DEFAULT_PAGE_TIMEOUT_MS,
+    ) -> AsyncIterator[Any]:
+        """Yield a fresh page in the pooled context for ``cookies``."""
+        self._cancel_idle_close()
+        self._active += 1
+        try:
+            async with self._lock:
+                signature, context = await self._context_for(cookies, viewport or DEFAULT_VIEWPORT)
+            page = None
+            try:
+                page = await context.new_page()
+                page.set_default_timeout(timeout_ms)
+                yield page
+            finally:
+                if page is not None:
+                    with contextlib.suppress(Exception):
+                        await page.close()
+                async with self._lock:
+                    await self._release_context(signature)
+        finally:
+            self._active -= 1
+            if not self._active:
+                self._schedule_idle_close()
+
+    async def check(self) -> None:
+        """Start the pooled browser if needed; raises when Chromium cannot launch."""
+        async with self._lock:
+            await self._ensure_browser()
+        if not self._active:
+            self._schedule_idle_close()
+
+    def _cancel_idle_close(self) -> None:
+        if self._idle_task is not None and not self._idle_task.done():
+            self._idle_task.cancel()
+        self._idle_task = None
+
+    def _schedule_idle_close(self) -> None:
+        self._cancel_idle_close()
+        if self._browser is None:
+            return
+        with contextlib.suppress(RuntimeError):
+            self._idle_task = asyncio.get_running_loop().create_task(self._close_when_idle())
+
+    async def _close_when_idle(self) -> None:
+        await asyncio.sleep(self.idle_seconds)
+        if not self._active:
+            await self.close()
+
+    async def close(self) -> None:
+        async with self._lock:
+            await self._close_locked()
+
+    async def _close_locked(self) -> None:
+        contexts = list(self._contexts.values())
+        self._contexts.clear()
+        self._context_users.clear()
+        self._current_signature = None
+        browser, playwright = self._browser, self._playwright
+        self._browser = self._playwright = None
+        for context in contexts:
+            with contextlib.suppress(Exception):
+                await context.close()
+        if browser is not None:
+            with contextlib.suppress(Exception):
+                await browser.close()
+        if playwright is not None:
+            with contextlib.suppress(Exception):
+                await playwright.stop()
+
+
+@dataclass
+class ActionStats:
+    replay_ok: int = 0
+    replay_failed: int = 0
+    fallbacks: int = 0
+    browser_ok: int = 0
+    browser_failed: int = 0
+    last_fallback_reason: str = ""
+    latencies: Dict[str, Deque[float]] = field(
+        default_factory=lambda: {PATH_REPLAY: deque(maxlen=LATENCY_SAMPLES), PATH_BROWSER: deque(maxlen=LATENCY_SAMPLES)}
+    )
+
+    @property
+    def replay_attempts(self) -> int:
+        return self.replay_ok + self.replay_failed + self.fallbacks
+
+    @property
+    def fallback_rate(self) -> Optional[float]:
+        attempts = self.replay_attempts
+        return self.fallbacks / attempts if attempts else None
+
+
+def _result_ok(result: Any) -> bool:
+    ok = getattr(result, "ok", None)
+    return bool(result) if ok is None else bool(ok)
+
+
+class MissionChiefActionEngine:
+    """Run MissionChief actions as an HTTP form replay first, the browser second.
+
+    ``replay`` posts the recorded form over CookieManager's session and raises
+    ``ReplayUnavailable`` before submitting anything when it cannot; only then
+    does ``browser`` drive a page from the pool. Once a replay has submitted,
+    its result stands, so an action never runs twice.
+    """
+
+    def __init__(self, pool: Optional[BrowserPool] = None, *, clock: Callable[[], float] = time.perf_counter):
+        self.pool = pool or BrowserPool()
+        self._clock = clock
+        self.stats: Dict[str, ActionStats] = {}
+
+    def _record(self, action: str, path: str, started: float, ok: bool) -> None:
+        stats = self.stats.setdefault(action, ActionStats())
+        stats.latencies[path].append(self._clock() - started)
+        if path == PATH_REPLAY:
+            if ok:
+                stats.replay_ok += 1
+            else:
+                stats.replay_failed += 1
+        elif ok:
+            stats.browser_ok += 1
+        else:
+            stats.browser_failed += 1
+
+    async def run(
+        self,
+        action: str,
+        browser: Callable[[], Awaitable[Any]],
+        *,
+        replay: Optional[Callable[[], Awaitable[Any]]] = None,
+        ok: Callable[[Any], bool] = _result_ok,
+    ) -> Any:
+        """Return the replay's result, or the browser's when the replay is unavailable."""
+        stats = self.stats.setdefault(action, ActionStats())
+        if replay is not None:
+            started = self._clock()
+            try:
+                result = await replay()
+            except Exception as exc:
+                if not getattr(exc, "replay_unavailable", False):
+                    self._record(action, PATH_REPLAY, started, False)
+                    raise
+                stats.fallbacks += 1
+                stats.last_fallback_reason = str(exc)
+            else:
+                self._record(action, PATH_REPLAY, started, ok(result))
+                return result
+
+        started = self._clock()
+        try:
+            result = await browser()
+        except Exception:
+            self._record(action, PATH_BROWSER, started, False)
+            raise
+        self._record(action, PATH_BROWSER, started, ok(result))
+        return result
+
+    def browser_page(self, cookies: List[Dict[str, str]], **kwargs):
+        """Async context manager yielding a pooled page; see ``BrowserPool.page``."""
+        return self.pool.page(cookies, **kwargs)
+
+
+def _format_latency(samples: Deque[float]) -> str:
+    if not samples:
+        return "-"
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return f"p50 {statistics.median(ordered):.2f}s / p95 {p95:.2f}s"
+
+
+def format_action_stats(engine: MissionChiefActionEngine, actions: Optional[Iterable[str]] = None) -> List[str]:
+    """Status lines per action: runs by path, fallback rate and latency."""
+    names = sorted(engine.stats) if actions is None else [name for name in actions if name in engine.stats]
+    pool = engine.pool
+    lines = [
+        f"Browser pool: {'running' if pool.running else 'stopped'}, "
+        f"{pool.launches} launches, {pool.contexts_created} contexts"
+    ]
+    if not names:
+        lines.append("No MissionChief actions have run since the bot started.")
+        return lines
+    for name in names:
+        stats = engine.stats[name]
+        rate = stats.fallback_rate
+        rate_text = "n/a" if rate is None else f"{rate:.0%}"
+        lines.append(
+            f"{name}: replay {stats.replay_ok} ok / {stats.replay_failed} failed, "
+            f"browser {stats.browser_ok} ok / {stats.browser_failed} failed, fallback rate {rate_text}"
+        )
+        lines.append(
+            f"  latency replay {_format_latency(stats.latencies[PATH_REPLAY])}, "
+            f"browser {_format_latency(stats.latencies[PATH_BROWSER])}"
+        )
+        if stats.last_fallback_reason:
+            lines.append(f"  last fallback: {stats.last_fallback_reason[:160]}")
+    return lines
+
+
+def shared_action_engine(bot: Any) -> MissionChiefActionEngine:
+    """Return the bot-wide engine, creating it on first use.
+
+    Each cog packages its own copy of this module, so the engine lives on the bot;
+    that keeps one browser process and one set of action stats per bot.
+    """
+    engine = getattr(bot, SHARED_ATTRIBUTE, None)
+    if engine is None:
+        engine = MissionChiefActionEngine()
+        try:
+            setattr(bot, SHARED_ATTRIBUTE, engine)
+        except AttributeError:
+            pass
+    return engine
@@ -422,6 +422,45 @@ class MembersScraper(commands.Cog):
             log.error(f"Failed to query first seen for {mc_user_id}: {e}", exc_info=True)
             return None
 
+    def _query_members_contribution_overview_sync(self, limit: int = 12) -> Dict[str, Dict[str, Any]]:
+        """Return first-seen and recent contribution rates for every stored member in one query."""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            try:
+                rows = conn.execute(
+                    """
+                    SELECT member_id, contribution_rate, first_seen
+                    FROM (
+                        SELECT member_id,
+                               contribution_rate,
+                               MIN(timestamp) OVER (PARTITION BY member_id) AS first_seen,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY member_id ORDER BY timestamp DESC
+                               ) AS row_num
+                        FROM members
+                    )
+                    WHERE row_num <= ?
+                    ORDER BY member_id, row_num
+                    """,
+                    (int(limit),),
+                ).fetchall()
+            finally:
+                conn.close()
+        except Exception as e:
+            log.error(f"Failed to query contribution overview: {e}", exc_info=True)
+            return {}
+
+        overview: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            entry = overview.setdefault(
+                str(row["member_id"]),
+                {"first_seen": row["first_seen"], "history": []},
+            )
+            if row["contribution_rate"] is not None:
+                entry["history"].append(row["contribution_rate"])
+        return overview
+
     async def get_member_snapshot(self, mc_user_id: str) -> Optional[Dict[str, Any]]:
         """Public API: return the latest stored snapshot for a MissionChief user."""
         return await asyncio.to_thread(self._query_member_snapshot_sync, str(mc_user_id))
@@ -438,6 +477,13 @@ class MembersScraper(commands.Cog):
         """Public API: return when a member was first seen by MembersScraper."""
         return await asyncio.to_thread(self._query_member_first_seen_sync, str(mc_user_id))
 
+    async def get_members_contribution_overview(self, limit: int = 12) -> Dict[str, Dict[str, Any]]:
+        """Public API: return ``{mc_user_id: {"first_seen", "history"}}`` for all members.
+
+        ``history`` holds up to ``limit`` contribution rates, newest first.
+        """
+        return await asyncio.to_thread(self._query_members_contribution_overview_sync, int(limit))
+
     def _query_current_members_sync(self) -> List[Dict[str, Any]]:
         """Return the latest stored MissionChief alliance member snapshot."""
         try:
@@ -567,6 +567,10 @@ class MemberSync(commands.Cog):
         rows = await self._query_alliance("SELECT MAX(scraped_at) AS s FROM members_current")
         return rows[0]["s"] if rows and rows[0]["s"] else None
 
+    async def get_approved_links_by_mc(self) -> Dict[str, Dict[str, Any]]:
+        """Public API: all approved links keyed by MC ID, read with one query."""
+        return {str(link["mc_user_id"]): link for link in await self._get_approved_links()}
+
     async def get_link_for_mc(self, mc_user_id: str) -> Optional[Dict[str, Any]]:
         """Public API: returns approved link for given MC ID or None."""
         mc_user_id = str(mc_user_id)
@@ -26,6 +26,9 @@ DEFAULTS = {
     "bewerbungen_url": "https://www.missionchief.com/verband/bewerbungen",
 }
 
+# How often to confirm the ApplicationsScraper subscription is still current
+FEED_RECHECK_SECONDS = 60
+
 
 class AcceptDenyView(View):
     """Discord UI View with Accept and Deny buttons."""
@@ -119,6 +122,8 @@ class NewMemberNotify(commands.Cog):
         self._check_task: Optional[asyncio.Task] = None
         self._seen_applications: Set[str] = set()
         self._first_run = True
+        # ApplicationsScraper instance we receive the application feed from, if any
+        self._feed_source = None
         
         # Start background task
         self.bot.loop.create_task(self._start_background_task())
@@ -127,6 +132,10 @@ class NewMemberNotify(commands.Cog):
         """Cleanup on unload."""
         if self._check_task:
             self._check_task.cancel()
+        source = getattr(self, "_feed_source", None)
+        if source is not None:
+            source.unsubscribe_applications(self._on_application_events)
+            self._feed_source = None
 
     @asynccontextmanager
     async def _bot_status(self, detail: str, *, priority: int = 70):
@@ -150,16 +159,62 @@ class NewMemberNotify(commands.Cog):
             log.info("NewMemberNotify background task started")
     
     async def _background_checker(self):
-        """Background task that checks for new applications."""
+        """Background task that checks for new applications.
+
+        While ApplicationsScraper is loaded it is the only cog fetching the
+        applications page and pushes new applications to us; this loop then
+        just keeps the subscription current and falls back to polling itself
+        when the scraper is unloaded.
+        """
         while True:
             try:
-                await self._check_for_new_applications()
+                if not self._ensure_feed_subscription():
+                    await self._check_for_new_applications()
             except Exception as e:
                 log.error(f"Error in background checker: {e}", exc_info=True)
             
             # Wait for next check
-            interval_minutes = await self.config.check_interval_minutes()
-            await asyncio.sleep(interval_minutes * 60)
+            if getattr(self, "_feed_source", None) is not None:
+                await asyncio.sleep(FEED_RECHECK_SECONDS)
+            else:
+                interval_minutes = await self.config.check_interval_minutes()
+                await asyncio.sleep(interval_minutes * 60)
+
+    def _application_feed(self):
+        """Return ApplicationsScraper when it exposes the application feed."""
+        scraper = self.bot.get_cog("ApplicationsScraper")
+        if scraper is None or not hasattr(scraper, "subscribe_applications"):
+            return None
+        return scraper
+
+    def _ensure_feed_subscription(self) -> bool:
+        """Subscribe to the scraper's feed, following reloads; returns True while subscribed."""
+        scraper = self._application_feed()
+        source = getattr(self, "_feed_source", None)
+        if scraper is source:
+            return scraper is not None
+        if source is not None:
+            source.unsubscribe_applications(self._on_application_events)
+        self._feed_source = scraper
+        if scraper is None:
+            log.info("ApplicationsScraper unavailable, polling the applications page directly")
+            return False
+        scraper.subscribe_applications(self._on_application_events)
+        log.info("Subscribed to the ApplicationsScraper application feed")
+        return True
+
+    async def _on_application_events(self, events: List[Dict[str, Any]]):
+        """Handle applications the scraper reports as newly listed."""
+        new_apps = [event for event in events if event.get("event") == "new"]
+        if not new_apps:
+            return
+        auto_accept = await self.config.auto_accept_enabled()
+        async with self._bot_status("handling new alliance applications"):
+            for app in new_apps:
+                if app["id"] in self._seen_applications:
+                    continue
+                self._seen_applications.add(app["id"])
+                await self._handle_application(app, auto_accept)
     
     async def _get_cookie_session(self):
         """Get authenticated session from CookieManager cog."""
@@ -293,7 +348,13 @@ class NewMemberNotify(commands.Cog):
         Args:
             skip_first_run_check: If True, process applications even on first run (for manual checks)
         """
-        applications = await self._fetch_applications()
+        scraper = self._application_feed()
+        if scraper is not None:
+            # Refresh through the scraper so the page is still fetched by one cog only
+            await scraper.refresh_applications()
+            applications = await scraper.current_applications()
+        else:
+            applications = await self._fetch_applications()
         
         if not applications:
             log.debug("No applications found or error fetching")
@@ -320,23 +381,27 @@ class NewMemberNotify(commands.Cog):
                 log.debug(f"First run: skipping notification for {app['username']} ({app_id})")
                 continue
             
-            # Auto-accept if enabled
-            if auto_accept:
-                success, message = await self._process_application(app_id, "accept")
-                if success:
-                    log.info(f"Auto-accepted application: {app['username']} ({app_id})")
-                    await self._log_action("auto_accept", app["username"], app["profile_url"])
-                else:
-                    log.error(f"Failed to auto-accept {app['username']}: {message}")
-                    await self._log_action("auto_accept_failed", app["username"], app["profile_url"], error=message)
-            else:
-                # Send notification to admins
-                await self._send_notification(app)
+            await self._handle_application(app, auto_accept)
         
         # Mark first run as complete
         if self._first_run:
             self._first_run = False
             log.info("First run complete, will now process new applications")
+
+    async def _handle_application(self, app: Dict[str, str], auto_accept: bool):
+        """Auto-accept an application or notify admins about it."""
+        app_id = app["id"]
+        if auto_accept:
+            success, message = await self._process_application(app_id, "accept")
+            if success:
+                log.info(f"Auto-accepted application: {app['username']} ({app_id})")
+                await self._log_action("auto_accept", app["username"], app["profile_url"])
+            else:
+                log.error(f"Failed to auto-accept {app['username']}: {message}")
+                await self._log_action("auto_accept_failed", app["username"], app["profile_url"], error=message)
+        else:
+            # Send notification to admins
+            await self._send_notification(app)
     
     async def _send_notification(self, app: Dict[str, str]):
         """Send notification embed with accept/deny buttons to admin channel."""
@@ -450,7 +515,8 @@ class NewMemberNotify(commands.Cog):
             f"**Log Channel:** {log_channel.mention if log_channel else 'Not set'}",
             f"**Admin Role ID:** {cfg['admin_role_id'] or 'Not set (anyone can use buttons)'}",
             f"**Auto-Accept:** {'✅ Enabled' if cfg['auto_accept_enabled'] else '❌ Disabled'}",
-            f"**Check Interval:** {cfg['check_interval_minutes']} minutes",
+            f"**Source:** {'ApplicationsScraper feed' if self._feed_source is not None else 'Direct polling'}",
+            f"**Check Interval:** {cfg['check_interval_minutes']} minutes (direct polling only)",
             f"**Applications Seen:** {len(self._seen_applications)}",
             f"**Background Task:** {'Running' if self._check_task and not self._check_task.done() else 'Not running'}",
         ]
@@ -567,7 +633,11 @@ class NewMemberNotify(commands.Cog):
         """List all current pending applications."""
         await ctx.send("🔍 Fetching applications...")
         
-        applications = await self._fetch_applications()
+        scraper = self._application_feed()
+        if scraper is not None:
+            applications = await scraper.current_applications()
+        else:
+            applications = await self._fetch_applications()
         
         if not applications:
             await ctx.send("No pending applications found.")
@@ -4,7 +4,7 @@ import asyncio
 import logging
 import sqlite3
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
@@ -23,6 +23,32 @@ class CreditRank:
     min_credits: int
 
 
+@dataclass
+class RankChange:
+    member: Any
+    target_rank: CreditRank
+    previous_rank_key: Optional[str]
+    roles_to_add: list = field(default_factory=list)
+    roles_to_remove: list = field(default_factory=list)
+    announce: bool = False
+
+    @property
+    def api_calls(self) -> int:
+        # add_roles/remove_roles issue one request per role
+        return len(self.roles_to_add) + len(self.roles_to_remove) + (1 if self.announce else 0)
+
+    def describe(self) -> str:
+        previous = RANKS_BY_KEY[self.previous_rank_key].name if self.previous_rank_key in RANKS_BY_KEY else "none"
+        parts = [f"{self.member.display_name}: {previous} → {self.target_rank.name}"]
+        if self.roles_to_add:
+            parts.append("+" + ", +".join(role.name for role in self.roles_to_add))
+        if self.roles_to_remove:
+            parts.append("-" + ", -".join(role.name for role in self.roles_to_remove))
+        if self.announce:
+            parts.append("announce")
+        return " | ".join(parts)
+
+
 CREDIT_RANKS: tuple[CreditRank, ...] = (
     CreditRank("probie", "Probie", 0),
     CreditRank("firefighter", "Firefighter", 200),
@@ -39,6 +65,9 @@ CREDIT_RANKS: tuple[CreditRank, ...] = (
 )
 
 RANKS_BY_KEY = {rank.key: rank for rank in CREDIT_RANKS}
+# Pause between role edit API calls; discord.py still handles any 429 on top of this
+ROLE_EDIT_INTERVAL_SECONDS = 0.5
+DRY_RUN_REPORT_LINES = 25
 VERIFIED_MEMBER_ROLE_ID = 565988933113085952
 
 DEFAULT_RANK_ROLE_IDS = {
@@ -231,150 +260,219 @@ class RoleBasedCredits(commands.Cog):
                 log.exception("RoleBasedCredits sync loop failed")
                 await asyncio.sleep(300)
 
-    async def sync_guild(self, guild: discord.Guild, *, dry_run: bool) -> dict[str, int]:
+    async def sync_guild(self, guild: discord.Guild, *, dry_run: bool) -> dict[str, Any]:
         detail = f"syncing credit rank roles in {guild.name}"
         if dry_run:
             detail = f"checking credit rank roles in {guild.name}"
         async with self._bot_status(detail):
             return await self.sync_guild_impl(guild, dry_run=dry_run)
 
-    async def sync_guild_impl(self, guild: discord.Guild, *, dry_run: bool) -> dict[str, int]:
-        members_scraper, member_sync = self.dependencies()
-        if not members_scraper or not member_sync:
-            return {
-                "updated": 0,
-                "skipped": 0,
-                "missing_dependencies": 1,
-                "promotions": 0,
-                "departures": 0,
-                "departure_roles_removed": 0,
-            }
-
-        rank_role_ids = await self.config.guild(guild).rank_role_ids()
-        configured_role_ids = {
-            int(role_id)
-            for role_id in rank_role_ids.values()
-            if str(role_id).isdigit() and guild.get_role(int(role_id))
+    @staticmethod
+    def _empty_result(*, missing_dependencies: int = 0) -> dict[str, Any]:
+        return {
+            "updated": 0,
+            "skipped": 0,
+            "missing_dependencies": missing_dependencies,
+            "promotions": 0,
+            "departures": 0,
+            "departure_roles_removed": 0,
+            "api_calls": 0,
+            "plan": [],
         }
-        if not configured_role_ids:
-            return {
-                "updated": 0,
-                "skipped": 0,
-                "missing_dependencies": 0,
-                "promotions": 0,
-                "departures": 0,
-                "departure_roles_removed": 0,
-            }
 
-        current_members = await members_scraper.get_members()
-        updated = 0
+    async def approved_links_by_mc(self, member_sync: Any, mc_ids: list[str]) -> dict[str, dict[str, Any]]:
+        bulk = getattr(member_sync, "get_approved_links_by_mc", None)
+        if bulk is not None:
+            return await bulk()
+
+        # Older MemberSync without the bulk API
+        links: dict[str, dict[str, Any]] = {}
+        for mc_id in mc_ids:
+            link = await member_sync.get_link_for_mc(mc_id)
+            if link:
+                links[mc_id] = link
+        return links
+
+    def plan_rank_changes(
+        self,
+        guild: discord.Guild,
+        current_members: list[dict[str, Any]],
+        links: dict[str, dict[str, Any]],
+        rank_role_ids: dict[str, Any],
+        configured_role_ids: set[int],
+        last_ranks: dict[str, Any],
+        *,
+        baseline_initialized: bool,
+        announce_first_assignment: bool,
+    ) -> tuple[list[RankChange], dict[str, str], int]:
+        """
+        Work out every member's target rank without touching Discord.
+
+        Returns the changes that need API calls, the new rank per Discord ID
+        for everyone that was checked, and the number of skipped MC members.
+        """
+        changes: list[RankChange] = []
+        ranks: dict[str, str] = {}
         skipped = 0
-        promotions = 0
-        departures = 0
-        departure_roles_removed = 0
-        baseline_initialized = await self.config.guild(guild).baseline_initialized()
-        announce_first_assignment = await self.config.guild(guild).announce_first_assignment()
+        for mc_member in current_members:
+            mc_id = mc_member.get("user_id") or mc_member.get("mc_user_id")
+            if not mc_id:
+                skipped += 1
+                continue
 
-        async with self.config.guild(guild).last_rank_by_discord_id() as last_ranks:
-            departure_result = await self.cleanup_departed_members(
-                guild,
-                member_sync,
-                configured_role_ids,
-                dry_run=dry_run,
-                last_ranks=last_ranks,
-            )
-            departures = departure_result["departures"]
-            departure_roles_removed = departure_result["departure_roles_removed"]
-
-            for mc_member in current_members:
-                mc_id = mc_member.get("user_id") or mc_member.get("mc_user_id")
-                if not mc_id:
-                    skipped += 1
-                    continue
-
-                link = await member_sync.get_link_for_mc(str(mc_id))
-                if not link or link.get("status") != "approved":
-                    skipped += 1
-                    continue
-
-                discord_id = link.get("discord_id")
-                member = guild.get_member(int(discord_id)) if discord_id else None
-                if not member or member.bot:
-                    skipped += 1
-                    continue
-
-                try:
-                    credits = int(mc_member.get("earned_credits") or 0)
-                except (TypeError, ValueError):
-                    skipped += 1
-                    continue
-                if credits < 0:
-                    skipped += 1
-                    continue
-
-                target_rank = rank_for_credits(credits)
-                target_role_id = rank_role_ids.get(target_rank.key)
-                target_role = guild.get_role(int(target_role_id)) if target_role_id else None
-                if not target_role:
-                    skipped += 1
-                    continue
-
-                current_rank_key = self.current_configured_rank_key(member, configured_role_ids, rank_role_ids)
-                previous_rank_key = last_ranks.get(str(member.id)) or current_rank_key
-                roles_to_remove = [
+            link = links.get(str(mc_id))
+            if not link or link.get("status") != "approved":
+                skipped += 1
+                continue
+
+            discord_id = link.get("discord_id")
+            member = guild.get_member(int(discord_id)) if discord_id else None
+            if not member or member.bot:
+                skipped += 1
+                continue
+
+            try:
+                credits = int(mc_member.get("earned_credits") or 0)
+            except (TypeError, ValueError):
+                skipped += 1
+                continue
+            if credits < 0:
+                skipped += 1
+                continue
+
+            target_rank = rank_for_credits(credits)
+            target_role_id = rank_role_ids.get(target_rank.key)
+            target_role = guild.get_role(int(target_role_id)) if target_role_id else None
+            if not target_role:
+                skipped += 1
+                continue
+
+            current_rank_key = self.current_configured_rank_key(member, configured_role_ids, rank_role_ids)
+            previous_rank_key = last_ranks.get(str(member.id)) or current_rank_key
+            first_assignment = previous_rank_key is None and current_rank_key is None
+            change = RankChange(
+                member=member,
+                target_rank=target_rank,
+                previous_rank_key=previous_rank_key,
+                roles_to_add=[] if target_role in member.roles else [target_role],
+                roles_to_remove=[
                     role
                     for role in member.roles
                     if role.id in configured_role_ids and role.id != target_role.id
-                ]
-                roles_to_add = [] if target_role in member.roles else [target_role]
-                first_assignment = previous_rank_key is None and current_rank_key is None
-                should_announce = has_verified_member_role(member) and should_announce_rank_change(
+                ],
+                announce=has_verified_member_role(member)
+                and should_announce_rank_change(
                     previous_key=previous_rank_key,
                     next_key=target_rank.key,
                     baseline_initialized=baseline_initialized,
                     first_assignment=first_assignment,
                     announce_first_assignment=announce_first_assignment,
-                )
-
-                if dry_run:
-                    if roles_to_add or roles_to_remove:
-                        updated += 1
-                    if should_announce:
-                        promotions += 1
-                    continue
-
-                try:
-                    if roles_to_remove:
-                        await member.remove_roles(
-                            *roles_to_remove,
-                            reason="RoleBasedCredits: rank changed from MissionChief credits",
-                        )
-                    if roles_to_add:
-                        await member.add_roles(
-                            *roles_to_add,
-                            reason="RoleBasedCredits: rank reached from MissionChief credits",
-                        )
-                    if roles_to_add or roles_to_remove:
-                        updated += 1
-                    if should_announce:
-                        await self.send_promotion_message(guild, member, target_rank)
-                        promotions += 1
-                    last_ranks[str(member.id)] = target_rank.key
-                except (discord.Forbidden, discord.HTTPException):
-                    log.exception("Failed to update credit rank role for member %s", member.id)
-                    skipped += 1
-
-        if not dry_run and current_members and not baseline_initialized:
-            await self.config.guild(guild).baseline_initialized.set(True)
+                ),
+            )
+            ranks[str(member.id)] = target_rank.key
+            if change.api_calls:
+                changes.append(change)
+        return changes, ranks, skipped
+
+    async def apply_rank_change(self, guild: discord.Guild, change: RankChange) -> None:
+        member = change.member
+        if change.roles_to_remove:
+            await member.remove_roles(
+                *change.roles_to_remove,
+                reason="RoleBasedCredits: rank changed from MissionChief credits",
+            )
+        if change.roles_to_add:
+            await member.add_roles(
+                *change.roles_to_add,
+                reason="RoleBasedCredits: rank reached from MissionChief credits",
+            )
+        if change.announce:
+            await self.send_promotion_message(guild, member, change.target_rank)
 
-        return {
-            "updated": updated,
-            "skipped": skipped,
-            "missing_dependencies": 0,
-            "promotions": promotions,
-            "departures": departures,
-            "departure_roles_removed": departure_roles_removed,
+    async def sync_guild_impl(self, guild: discord.Guild, *, dry_run: bool) -> dict[str, Any]:
+        members_scraper, member_sync = self.dependencies()
+        if not members_scraper or not member_sync:
+            return self._empty_result(missing_dependencies=1)
+
+        guild_config = self.config.guild(guild)
+        rank_role_ids = await guild_config.rank_role_ids()
+        configured_role_ids = {
+            int(role_id)
+            for role_id in rank_role_ids.values()
+            if str(role_id).isdigit() and guild.get_role(int(role_id))
         }
+        if not configured_role_ids:
+            return self._empty_result()
+
+        current_members = await members_scraper.get_members()
+        baseline_initialized = await guild_config.baseline_initialized()
+        announce_first_assignment = await guild_config.announce_first_assignment()
+        stored_ranks = await guild_config.last_rank_by_discord_id()
+        last_ranks = dict(stored_ranks)
+
+        departure_result = await self.cleanup_departed_members(
+            guild,
+            member_sync,
+            configured_role_ids,
+            dry_run=dry_run,
+            last_ranks=last_ranks,
+        )
+
+        mc_ids = [
+            str(mc_member.get("user_id") or mc_member.get("mc_user_id"))
+            for mc_member in current_members
+            if mc_member.get("user_id") or mc_member.get("mc_user_id")
+        ]
+        links = await self.approved_links_by_mc(member_sync, mc_ids)
+        changes, ranks, skipped = self.plan_rank_changes(
+            guild,
+            current_members,
+            links,
+            rank_role_ids,
+            configured_role_ids,
+            last_ranks,
+            baseline_initialized=baseline_initialized,
+            announce_first_assignment=announce_first_assignment,
+        )
+
+        result = self._empty_result()
+        result["departures"] = departure_result["departures"]
+        result["departure_roles_removed"] = departure_result["departure_roles_removed"]
+        result["skipped"] = skipped
+        result["plan"] = [change.describe() for change in changes]
+        result["api_calls"] = sum(change.api_calls for change in changes)
+        if dry_run:
+            result["updated"] = sum(1 for change in changes if change.roles_to_add or change.roles_to_remove)
+            result["promotions"] = sum(1 for change in changes if change.announce)
+            return result
+
+        failed_ids: set[str] = set()
+        for index, change in enumerate(changes):
+            if index:
+                await asyncio.sleep(ROLE_EDIT_INTERVAL_SECONDS)
+            try:
+                await self.apply_rank_change(guild, change)
+            except (discord.Forbidden, discord.HTTPException):
+                log.exception("Failed to update credit rank role for member %s", change.member.id)
+                failed_ids.add(str(change.member.id))
+                result["skipped"] += 1
+                continue
+            if change.roles_to_add or change.roles_to_remove:
+                result["updated"] += 1
+            if change.announce:
+                result["promotions"] += 1
+
+        # Members whose roles already matched still get their stored rank refreshed
+        for discord_id, rank_key in ranks.items():
+            if discord_id not in failed_ids:
+                last_ranks[discord_id] = rank_key
+        if last_ranks != stored_ranks:
+            await guild_config.last_rank_by_discord_id.set(last_ranks)
+
+        if current_members and not baseline_initialized:
+            await guild_config.baseline_initialized.set(True)
+
+        return result
 
     async def cleanup_departed_members(
         self,
@@ -584,13 +682,24 @@ class RoleBasedCredits(commands.Cog):
         if result["missing_dependencies"]:
             await ctx.send("MembersScraper and MemberSync must be loaded before syncing.")
             return
-        await ctx.send(
+        lines = [
             f"Dry-run complete. Would update: {result['updated']}, "
             f"promotions: {result['promotions']}, "
             f"departures: {result['departures']}, "
             f"rank removals: {result['departure_roles_removed']}, "
-            f"skipped: {result['skipped']}."
-        )
+            f"skipped: {result['skipped']}.",
+            f"Estimated API calls: {result['api_calls'] + result['departure_roles_removed']} "
+            f"(about {int(result['api_calls'] * ROLE_EDIT_INTERVAL_SECONDS)}s at the edit pacing).",
+        ]
+        if result["plan"]:
+            lines.append("")
+            lines.append("Planned changes:")
+            lines.extend(f"- {line}" for line in result["plan"][:DRY_RUN_REPORT_LINES])
+            remaining = len(result["plan"]) - DRY_RUN_REPORT_LINES
+            if remaining > 0:
+                lines.append(f"...and {remaining} more.")
+        for page in pagify("\n".join(lines), page_length=1800):
+            await ctx.send(page)
 
     @creditranks.command(name="sync")
     async def creditranks_sync(self, ctx: commands.Context):
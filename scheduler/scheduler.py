@@ -0,0 +1,417 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+import discord
+from redbot.core import commands
+from redbot.core.bot import Red
+from redbot.core.data_manager import cog_data_path
+
+log = logging.getLogger("red.FARA.Scheduler")
+
+HANDLER_METHOD = "handle_scheduled_job"
+IDLE_RECHECK_SECONDS = 300.0
+DUE_BATCH_SIZE = 50
+MAX_ATTEMPTS = 5
+RETRY_BASE_SECONDS = 30.0
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+DueAt = Union[int, float, datetime]
+
+
+def due_timestamp(value: DueAt) -> float:
+    """Normalise a due time (unix seconds or datetime) to unix seconds."""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return float(value)
+
+
+class SchedulerStore:
+    """SQLite table of pending jobs, ordered by ``due_at``."""
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = str(db_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        conn.execute("PRAGMA busy_timeout = 30000")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def initialize(self) -> None:
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS scheduled_jobs (
+                    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    owner TEXT NOT NULL,
+                    job_key TEXT,
+                    due_at REAL NOT NULL,
+                    payload TEXT NOT NULL DEFAULT '{}',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    created_at REAL NOT NULL,
+                    UNIQUE(owner, job_key)
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_scheduled_jobs_due ON scheduled_jobs(due_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_scheduled_jobs_owner_due "
+                "ON scheduled_jobs(owner, due_at)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def add(
+        self,
+        owner: str,
+        due_at: float,
+        payload: Dict[str, Any],
+        key: Optional[str] = None,
+    ) -> int:
+        """Insert a job. A job with the same owner and key is replaced."""
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                """
+                INSERT INTO scheduled_jobs (owner, job_key, due_at, payload, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(owner, job_key) DO UPDATE SET
+                    due_at=excluded.due_at,
+                    payload=excluded.payload,
+                    attempts=0,
+                    last_error=NULL
+                """,
+                (owner, key, float(due_at), json.dumps(payload), time.time()),
+            )
+            job_id = cursor.lastrowid
+            if key is not None:
+                row = conn.execute(
+                    "SELECT job_id FROM scheduled_jobs WHERE owner=? AND job_key=?",
+                    (owner, key),
+                ).fetchone()
+                job_id = row[0]
+            conn.commit()
+            return int(job_id)
+        finally:
+            conn.close()
+
+    def cancel(self, owner: str, *, key: Optional[str] = None, job_id: Optional[int] = None) -> int:
+        conn = self._connect()
+        try:
+            if job_id is not None:
+                cursor = conn.execute(
+                    "DELETE FROM scheduled_jobs WHERE owner=? AND job_id=?",
+                    (owner, int(job_id)),
+                )
+            elif key is not None:
+                cursor = conn.execute(
+                    "DELETE FROM scheduled_jobs WHERE owner=? AND job_key=?",
+                    (owner, key),
+                )
+            else:
+                cursor = conn.execute("DELETE FROM scheduled_jobs WHERE owner=?", (owner,))
+            conn.commit()
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+    def next_due_at(self, owners: List[str]) -> Optional[float]:
+        """Earliest due time among jobs whose owner can currently run them."""
+        if not owners:
+            return None
+        placeholders = ",".join("?" for _ in owners)
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                f"SELECT MIN(due_at) FROM scheduled_jobs WHERE owner IN ({placeholders})",
+                owners,
+            ).fetchone()
+            return float(row[0]) if row and row[0] is not None else None
+        finally:
+            conn.close()
+
+    def due_jobs(self, owners: List[str], now: float, limit: int = DUE_BATCH_SIZE) -> List[Dict[str, Any]]:
+        if not owners:
+            return []
+        placeholders = ",".join("?" for _ in owners)
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"""
+                SELECT job_id, owner, job_key, due_at, payload, attempts
+                FROM scheduled_jobs
+                WHERE due_at <= ? AND owner IN ({placeholders})
+                ORDER BY due_at
+                LIMIT ?
+                """,
+                [now, *owners, int(limit)],
+            ).fetchall()
+        finally:
+            conn.close()
+
+        jobs = []
+        for row in rows:
+            try:
+                payload = json.loads(row["payload"] or "{}")
+            except json.JSONDecodeError:
+                payload = {}
+            jobs.append(
+                {
+                    "job_id": row["job_id"],
+                    "owner": row["owner"],
+                    "key": row["job_key"],
+                    "due_at": row["due_at"],
+                    "payload": payload,
+                    "attempts": row["attempts"],
+                    "late_seconds": max(0.0, now - row["due_at"]),
+                }
+            )
+        return jobs
+
+    def complete(self, job_id: int, due_at: float) -> None:
+        """Delete a fired job unless its handler rescheduled it meanwhile."""
+        conn = self._connect()
+        try:
+            conn.execute(
+                "DELETE FROM scheduled_jobs WHERE job_id=? AND due_at=?",
+                (int(job_id), float(due_at)),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def retry(self, job_id: int, due_at: float, error: str) -> None:
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                UPDATE scheduled_jobs
+                SET due_at=?, attempts=attempts + 1, last_error=?
+                WHERE job_id=?
+                """,
+                (float(due_at), error[:500], int(job_id)),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def counts_by_owner(self) -> Dict[str, Dict[str, Any]]:
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                """
+                SELECT owner, COUNT(*) AS pending, MIN(due_at) AS next_due
+                FROM scheduled_jobs
+                GROUP BY owner
+                ORDER BY owner
+                """
+            ).fetchall()
+            return {
+                row["owner"]: {"pending": row["pending"], "next_due": row["next_due"]}
+                for row in rows
+            }
+        finally:
+            conn.close()
+
+
+class Scheduler(commands.Cog):
+    """Durable timers shared by the other cogs.
+
+    Jobs live in SQLite indexed on ``due_at``. The runner sleeps until the
+    next due job, survives reloads and fires overdue jobs as soon as their
+    owner is loaded again. A job is delivered to the owner cog's
+    ``handle_scheduled_job(job)`` coroutine, or to a handler registered with
+    ``register_handler``.
+    """
+
+    def __init__(self, bot: Red):
+        self.bot = bot
+        self.store = SchedulerStore(cog_data_path(self) / "scheduler.db")
+        self._handlers: Dict[str, JobHandler] = {}
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.stats: Dict[str, int] = {"wakeups": 0, "fired": 0, "failed": 0, "dropped": 0}
+
+    async def cog_load(self):
+        await asyncio.to_thread(self.store.initialize)
+        self._task = asyncio.create_task(self._run())
+
+    def cog_unload(self):
+        if self._task:
+            self._task.cancel()
+
+    # ---------- Public API ----------
+
+    def register_handler(self, owner: str, handler: JobHandler) -> None:
+        """Deliver ``owner`` jobs to ``handler`` instead of the cog method."""
+        self._handlers[owner] = handler
+        self._wake.set()
+
+    def unregister_handler(self, owner: str) -> None:
+        self._handlers.pop(owner, None)
+
+    async def schedule(
+        self,
+        owner: str,
+        due_at: DueAt,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        key: Optional[str] = None,
+    ) -> int:
+        """Persist a job for ``owner``. Reusing ``key`` reschedules the existing job."""
+        job_id = await asyncio.to_thread(
+            self.store.add,
+            owner,
+            due_timestamp(due_at),
+            payload or {},
+            key,
+        )
+        self._wake.set()
+        return job_id
+
+    async def cancel(
+        self,
+        owner: str,
+        *,
+        key: Optional[str] = None,
+        job_id: Optional[int] = None,
+    ) -> int:
+        """Remove one job by key or id, or every job of ``owner``."""
+        removed = await asyncio.to_thread(self.store.cancel, owner, key=key, job_id=job_id)
+        self._wake.set()
+        return removed
+
+    # ---------- Runner ----------
+
+    def _resolve_handler(self, owner: str) -> Optional[JobHandler]:
+        handler = self._handlers.get(owner)
+        if handler:
+            return handler
+        cog = self.bot.get_cog(owner)
+        return getattr(cog, HANDLER_METHOD, None) if cog else None
+
+    def _ready_owners(self) -> List[str]:
+        owners = set(self._handlers)
+        for name, cog in self.bot.cogs.items():
+            if hasattr(cog, HANDLER_METHOD):
+                owners.add(name)
+        return sorted(owners)
+
+    @commands.Cog.listener()
+    async def on_cog_add(self, cog):
+        del cog
+        self._wake.set()
+
+    async def _run(self):
+        wait_ready = getattr(self.bot, "wait_until_red_ready", None) or self.bot.wait_until_ready
+        await wait_ready()
+        while True:
+            try:
+                # Clear before the work so a schedule() made while it runs still wakes the wait
+                self._wake.clear()
+                await self.run_due_jobs()
+                owners = self._ready_owners()
+                next_due = await asyncio.to_thread(self.store.next_due_at, owners)
+                timeout = IDLE_RECHECK_SECONDS
+                if next_due is not None:
+                    timeout = min(timeout, max(0.0, next_due - time.time()))
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                log.exception("Scheduler loop failed")
+                await asyncio.sleep(5)
+
+    async def run_due_jobs(self) -> int:
+        """Fire every due job whose owner is loaded. Returns the number fired."""
+        self.stats["wakeups"] += 1
+        fired = 0
+        while True:
+            owners = self._ready_owners()
+            jobs = await asyncio.to_thread(self.store.due_jobs, owners, time.time())
+            if not jobs:
+                return fired
+            results = await asyncio.gather(*(self._fire(job) for job in jobs))
+            if not any(results):
+                return fired
+            fired += sum(1 for result in results if result)
+
+    async def _fire(self, job: Dict[str, Any]) -> bool:
+        handler = self._resolve_handler(job["owner"])
+        if handler is None:
+            return False
+        try:
+            await handler(job)
+        except Exception as exc:
+            attempts = int(job["attempts"]) + 1
+            if attempts >= MAX_ATTEMPTS:
+                self.stats["dropped"] += 1
+                log.exception(
+                    "Dropping %s job %s after %s failed attempts",
+                    job["owner"],
+                    job["job_id"],
+                    attempts,
+                )
+                await asyncio.to_thread(self.store.complete, job["job_id"], job["due_at"])
+                return True
+            self.stats["failed"] += 1
+            log.warning("%s job %s failed (attempt %s): %r", job["owner"], job["job_id"], attempts, exc)
+            retry_at = time.time() + RETRY_BASE_SECONDS * (2 ** (attempts - 1))
+            await asyncio.to_thread(self.store.retry, job["job_id"], retry_at, repr(exc))
+            return True
+
+        self.stats["fired"] += 1
+        await asyncio.to_thread(self.store.complete, job["job_id"], job["due_at"])
+        return True
+
+    # ---------- Commands ----------
+
+    @commands.group(name="scheduler")
+    @commands.is_owner()
+    async def scheduler_group(self, ctx: commands.Context):
+        """Inspect the shared job scheduler."""
+
+    @scheduler_group.command(name="status")
+    async def scheduler_status(self, ctx: commands.Context):
+        """Show pending jobs per cog and runner counters."""
+        counts = await asyncio.to_thread(self.store.counts_by_owner)
+        ready = set(self._ready_owners())
+        lines = []
+        for owner, info in counts.items():
+            next_due = int(info["next_due"]) if info["next_due"] is not None else None
+            state = "" if owner in ready else " (not loaded)"
+            due_text = f"<t:{next_due}:R>" if next_due else "-"
+            lines.append(f"**{owner}**{state}: {info['pending']} pending, next {due_text}")
+        if not lines:
+            lines.append("No pending jobs.")
+        lines.append(
+            "Wakeups: {wakeups} | Fired: {fired} | Retries: {failed} | Dropped: {dropped}".format(
+                **self.stats
+            )
+        )
+        embed = discord.Embed(
+            title="Scheduler",
+            description="\n".join(lines)[:4000],
+            color=discord.Color.blue(),
+        )
+        await ctx.send(embed=embed)
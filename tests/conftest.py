@@ -131,6 +131,9 @@ def pytest_configure():
     discord.Member = object
     discord.Guild = object
     discord.Message = object
+    discord.Thread = object
+    discord.ForumChannel = object
+    discord.ForumTag = object
     discord.Interaction = object
     discord.Object = _Object
     discord.SelectOption = _SelectOption
@@ -211,6 +214,7 @@ def pytest_configure():
     redbot_core_data_manager.cog_data_path = lambda *args, **kwargs: None
     chat_formatting.box = lambda value, **kwargs: value
     chat_formatting.pagify = lambda value, **kwargs: [value]
+    chat_formatting.humanize_list = lambda items, **kwargs: ", ".join(items)
     redbot.core = redbot_core
 
     sys.modules.setdefault("discord", discord)
@@ -1,5 +1,7 @@
 import asyncio
+import types
 from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -29,6 +31,7 @@ from announcementpanel.announcementpanel import (
     unique_button_key,
 )
 from botstatus.botstatus import (
+    BotStatus,
     StatusActivity,
     choose_activity,
     clean_activity_type,
@@ -37,6 +40,7 @@ from botstatus.botstatus import (
 )
 from rolebasedcredits.rolebasedcredits import (
     CREDIT_RANKS,
+    RoleBasedCredits,
     DEFAULT_GUILD,
     DEFAULT_RANK_ROLE_IDS,
     VERIFIED_MEMBER_ROLE_ID,
@@ -355,6 +359,42 @@ def test_botstatus_formats_and_prioritizes_background_activity():
     assert len(compact_activity_text("Source", "x" * 200, max_length=32)) == 32
 
 
+def test_botstatus_coalesces_bursts_and_skips_unchanged_presence(monkeypatch):
+    monkeypatch.setattr("botstatus.botstatus.PRESENCE_DEBOUNCE_SECONDS", 0)
+    monkeypatch.setattr("botstatus.botstatus.PRESENCE_MIN_INTERVAL_SECONDS", 0)
+    cog = BotStatus.__new__(BotStatus)
+    cog._activities = {}
+    cog._report_tokens = {}
+    cog._presence_lock = asyncio.Lock()
+    cog._settings = None
+    cog._publish_task = None
+    cog._last_presence = None
+    cog._last_sent_at = 0.0
+    cog.presence_stats = {"requested": 0, "coalesced": 0, "sent": 0, "unchanged": 0}
+    config_reads = []
+
+    async def config_all():
+        config_reads.append(1)
+        return {"enabled": True, "idle_type": "watching", "idle_text": "dispatch", "presence_max_length": 42}
+
+    cog.config = types.SimpleNamespace(all=config_all)
+    cog.set_presence = AsyncMock()
+
+    async def run_test():
+        await cog.report_activity("MembersScraper", "scraping alliance members page 1")
+        await cog.report_activity("MembersScraper", "scraping alliance members page 2")
+        await cog.report_activity("MembersScraper", "scraping alliance members page 3")
+        await cog._publish_task
+        await cog.report_activity("MembersScraper", "scraping alliance members page 3")
+        await cog._publish_task
+
+    asyncio.run(run_test())
+
+    cog.set_presence.assert_awaited_once_with("watching", "Members: page 3")
+    assert cog.presence_stats == {"requested": 4, "coalesced": 2, "sent": 1, "unchanged": 1}
+    assert len(config_reads) == 1
+
+
 def test_credit_rank_table_matches_requested_thresholds():
     assert [(rank.name, rank.min_credits) for rank in CREDIT_RANKS] == [
         ("Probie", 0),
@@ -492,3 +532,82 @@ def test_credit_rank_exit_cleanup_reads_and_marks_membersync_rows(tmp_path):
     mark_rank_exit_rows_processed(db_path, [1])
 
     assert pending_rank_exit_rows(db_path) == []
+
+
+class _RankValue:
+    def __init__(self, value):
+        self.value = value
+        self.set_calls = 0
+
+    async def __call__(self):
+        return self.value
+
+    async def set(self, value):
+        self.set_calls += 1
+        self.value = value
+
+
+def test_credit_rank_sync_bulk_loads_links_and_only_edits_changed_members(monkeypatch):
+    monkeypatch.setattr("rolebasedcredits.rolebasedcredits.ROLE_EDIT_INTERVAL_SECONDS", 0)
+    probie = types.SimpleNamespace(id=1, name="Probie")
+    firefighter = types.SimpleNamespace(id=2, name="Firefighter")
+    roles = {1: probie, 2: firefighter}
+
+    def make_member(member_id, member_roles):
+        member = types.SimpleNamespace(
+            id=member_id,
+            bot=False,
+            display_name=f"Member {member_id}",
+            roles=list(member_roles),
+            add_roles=AsyncMock(),
+            remove_roles=AsyncMock(),
+        )
+        return member
+
+    unchanged = make_member(10, [probie])
+    promoted = make_member(11, [probie])
+    members = {10: unchanged, 11: promoted}
+    guild = types.SimpleNamespace(name="FARA", get_role=roles.get, get_member=members.get)
+    member_sync = types.SimpleNamespace(
+        get_approved_links_by_mc=AsyncMock(
+            return_value={
+                "100": {"mc_user_id": "100", "discord_id": 10, "status": "approved"},
+                "101": {"mc_user_id": "101", "discord_id": 11, "status": "approved"},
+            }
+        ),
+        get_link_for_mc=AsyncMock(),
+    )
+    members_scraper = types.SimpleNamespace(
+        get_members=AsyncMock(
+            return_value=[
+                {"user_id": "100", "earned_credits": 50},
+                {"user_id": "101", "earned_credits": 500},
+                {"user_id": "102", "earned_credits": 900},
+            ]
+        )
+    )
+    last_ranks = _RankValue({})
+    guild_config = types.SimpleNamespace(
+        rank_role_ids=_RankValue({"probie": 1, "firefighter": 2}),
+        baseline_initialized=_RankValue(True),
+        announce_first_assignment=_RankValue(False),
+        last_rank_by_discord_id=last_ranks,
+    )
+    cog = RoleBasedCredits.__new__(RoleBasedCredits)
+    cog.bot = None
+    cog.config = types.SimpleNamespace(guild=lambda _guild: guild_config)
+    cog.dependencies = lambda: (members_scraper, member_sync)
+
+    dry_run = asyncio.run(cog.sync_guild_impl(guild, dry_run=True))
+    result = asyncio.run(cog.sync_guild_impl(guild, dry_run=False))
+
+    assert dry_run["plan"] == ["Member 11: Probie → Firefighter | +Firefighter | -Probie"]
+    assert dry_run["api_calls"] == 2
+    assert promoted.add_roles.await_count == 1
+    assert unchanged.add_roles.await_count == 0
+    assert unchanged.remove_roles.await_count == 0
+    member_sync.get_link_for_mc.assert_not_awaited()
+    assert result["updated"] == 1
+    assert result["skipped"] == 1
+    assert last_ranks.value == {"10": "probie", "11": "firefighter"}
+    assert last_ranks.set_calls == 1
@@ -0,0 +1,92 @@
+import asyncio
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from applicationscraper.applications_scraper import ApplicationsScraper, parse_pending_applications
+
+
+def applications_page(*rows):
+    body = "".join(
+        f"""
+        <tr>
+          <td><a href="/profile/{profile_id}">{name}</a></td>
+          <td><a href="/verband/bewerbungen/annehmen/{app_id}">Accept</a></td>
+          <td><a href="/verband/bewerbungen/ablehnen/{app_id}">Deny</a></td>
+        </tr>
+        """
+        for app_id, profile_id, name in rows
+    )
+    return f"<html><a href='/users/sign_out'>Sign out</a><table class='table'><tbody>{body}</tbody></table></html>"
+
+
+class ApplicationFeedTests(unittest.TestCase):
+    def test_parse_pending_applications_reads_accept_ids_and_profiles(self):
+        pending = parse_pending_applications(applications_page(("901", "123", "Applicant One")))
+
+        self.assertEqual(
+            pending,
+            [
+                {
+                    "id": "901",
+                    "username": "Applicant One",
+                    "profile_url": "https://www.missionchief.com/profile/123",
+                    "applicant_id": 123,
+                }
+            ],
+        )
+
+    def test_feed_records_baseline_then_publishes_new_and_changed_applications(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            scraper = ApplicationsScraper.__new__(ApplicationsScraper)
+            scraper.db_path = str(Path(temp_dir) / "applications.db")
+            scraper.applications_url = "https://www.missionchief.com/verband/bewerbungen"
+            scraper._init_database()
+            scraper._report_bot_status = AsyncMock()
+            scraper._get_session = AsyncMock(return_value=object())
+            received = []
+
+            async def subscriber(events):
+                received.append([(event["event"], event["id"]) for event in events])
+
+            scraper.subscribe_applications(subscriber)
+            scraper.subscribe_applications(subscriber)
+            pages = [
+                applications_page(("901", "123", "Waiting Before Load")),
+                applications_page(("901", "123", "Waiting Before Load"), ("902", "456", "New Applicant")),
+                applications_page(("902", "456", "Renamed Applicant")),
+            ]
+            scraper._fetch_applications_page = AsyncMock(side_effect=pages)
+
+            async def run():
+                for _ in pages:
+                    await scraper._scrape_all_applications_impl()
+                return await scraper.current_applications()
+
+            with patch("applicationscraper.applications_scraper.asyncio.sleep", new=AsyncMock()):
+                current = asyncio.run(run())
+
+        self.assertEqual(received, [[("new", "902")], [("changed", "902")]])
+        self.assertEqual([(app["id"], app["username"]) for app in current], [("902", "Renamed Applicant")])
+
+    def test_unreadable_page_marks_the_run_failed_without_touching_the_feed(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            scraper = ApplicationsScraper.__new__(ApplicationsScraper)
+            scraper.db_path = str(Path(temp_dir) / "applications.db")
+            scraper._init_database()
+            scraper._get_session = AsyncMock(return_value=object())
+            scraper._fetch_applications_page = AsyncMock(return_value=None)
+            ctx = types.SimpleNamespace(send=AsyncMock())
+
+            result = asyncio.run(scraper._scrape_all_applications_impl(ctx))
+            current = asyncio.run(scraper.current_applications())
+
+        self.assertFalse(result)
+        self.assertEqual(current, [])
+        self.assertIn("Could not read", ctx.send.await_args.args[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from assetmanager import catalog as catalog_module
+from assetmanager.asset_sync import apply_full_sync
+from assetmanager.catalog import AssetCatalog
+from assetmanager.database import AssetDatabase
+from assetmanager.github_sync import GitHubSync
+
+RAW_DATA = {
+    "educations": GitHubSync().flatten_educations(
+        {"Fire Station": [{"caption": "HazMat", "duration": "3 Days", "key": "hazmat"}]}
+    ),
+    "buildings": {0: {"caption": "Fire station"}, 18: {"caption": "Small station"}},
+    "vehicles": {
+        0: {
+            "caption": "Type 1 fire engine",
+            "credits": 5000,
+            "staff": {"min": 1, "max": 6, "training": {"Fire Station": {"hazmat": {"all": True}}}},
+            "possibleBuildings": [18, 0],
+        },
+        1: {"caption": "Type 2 fire engine", "credits": 4000, "possibleBuildings": [0]},
+        2: {"caption": "Ambulance", "staff": {"min": 1, "max": 2}, "possibleBuildings": [0]},
+    },
+    "equipment": {"hose": {"caption": "Hose", "size": 1}},
+}
+
+
+class AssetCatalogTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db = AssetDatabase(Path(self.temp_dir.name) / "assets.db")
+        self.db.connect()
+        self.db.initialize_tables()
+        apply_full_sync(self.db, GitHubSync(), RAW_DATA)
+
+    def tearDown(self):
+        self.db.close()
+        self.temp_dir.cleanup()
+
+    def test_catalog_prejoins_relations_and_matches_database_reads(self):
+        catalog = AssetCatalog.load(self.db)
+
+        self.assertEqual([dict(row) for row in catalog.vehicles.items], self.db.get_all_vehicles())
+        engine = catalog.vehicles.get("TYPE 1 FIRE ENGINE ")
+        self.assertEqual(
+            [dict(row) for row in catalog.buildings_for(engine["id"])],
+            self.db.get_vehicle_buildings(engine["id"]),
+        )
+        self.assertEqual([row["name"] for row in catalog.educations_for(engine["id"])], ["HazMat"])
+        self.assertEqual(catalog.educations_for(catalog.vehicles.get("Ambulance")["id"]), ())
+        self.assertIs(catalog.vehicles_by_id[engine["id"]], engine)
+        with self.assertRaises(TypeError):
+            engine["name"] = "Renamed"
+
+    def test_lookups_resolve_exact_fuzzy_and_substring_without_rapidfuzz(self):
+        for fuzzy_backend in (catalog_module.process, None):
+            with self.subTest(rapidfuzz=fuzzy_backend is not None), patch.object(catalog_module, "process", fuzzy_backend):
+                catalog = AssetCatalog.load(self.db)
+
+                self.assertEqual([row["name"] for row in catalog.vehicles.resolve("ambulance")], ["Ambulance"])
+                self.assertEqual([row["name"] for row in catalog.vehicles.resolve("Ambulanse")], ["Ambulance"])
+                self.assertEqual(
+                    sorted(row["name"] for row in catalog.vehicles.resolve("Type fire engine")),
+                    ["Type 1 fire engine", "Type 2 fire engine"],
+                )
+                self.assertEqual(catalog.vehicles.resolve("Helicopter"), [])
+                self.assertEqual(
+                    [row["name"] for row in catalog.vehicles.search("FIRE")],
+                    [row["name"] for row in self.db.search_vehicles("fire")],
+                )
+                self.assertEqual([row["name"] for row in catalog.equipment.resolve("hose")], ["Hose"])
+
+    def test_empty_catalog_answers_every_lookup(self):
+        catalog = AssetCatalog()
+
+        self.assertEqual(catalog.vehicles.resolve("anything"), [])
+        self.assertEqual(catalog.buildings.search("station"), [])
+        self.assertEqual(catalog.buildings_for(1), ())
+
+
+if __name__ == "__main__":
+    unittest.main()
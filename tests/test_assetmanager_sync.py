@@ -0,0 +1,155 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from assetmanager.asset_sync import apply_full_sync
+from assetmanager.database import AssetDatabase
+from assetmanager.github_sync import GITHUB_URLS, GitHubSync, parse_ts_export
+
+VEHICLES_TS = """
+import type { InternalVehicle } from 'typings/Vehicle';
+
+/* Vehicles */
+export default {
+    0: {
+        caption: 'Type 1 fire engine', // engine
+        credits: 5_000,
+        staff: { min: 1, max: 6, training: { 'Fire Station': { hazmat: { all: true } } } },
+        possibleBuildings: [0, 18,],
+        special: "Driver's \\"seat\\"",
+        iconFunction: (vehicle) => { return vehicle.icon ?? 'x'; },
+        wtank: [...Array(2).fill(500), 750],
+        seconds: 60 * 60,
+        describe(vehicle) { return vehicle.caption; },
+    },
+    1: { caption: 'Ambulance', staff: { min: 1, max: 2 }, possibleBuildings: [0] },
+} as Record<number, InternalVehicle>;
+"""
+BUILDINGS_TS = "const buildings = { 0: { caption: 'Fire station' }, 18: { caption: 'Small station' } };\nexport default buildings;\n"
+EDUCATIONS_TS = "export default { 'Fire Station': [{ caption: 'HazMat', duration: '3 Days', key: 'hazmat' }] };"
+EQUIPMENT_TS = "export default registerEquipment({ hose: { caption: 'Hose', size: 1, staff: { min: 1, max: 2 } } });"
+
+
+class FakeResponse:
+    def __init__(self, status, body="", headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def text(self):
+        return self.body
+
+
+class FakeSession:
+    closed = False
+
+    def __init__(self, files):
+        self.files = files
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.requests.append((url, dict(headers or {})))
+        if headers and headers.get("If-None-Match") == f"etag-{url}":
+            return FakeResponse(304)
+        return FakeResponse(200, self.files[url], {"ETag": f"etag-{url}"})
+
+    async def close(self):
+        pass
+
+
+class AssetSyncTests(unittest.TestCase):
+    def test_tokenizer_keeps_literals_and_drops_code(self):
+        with self.assertLogs("red.assetmanager.github", level="WARNING") as logs:
+            vehicles = parse_ts_export(VEHICLES_TS)
+        # Functions are dropped quietly; the computed literal is reported by path
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("Dropped 1 computed value(s) that are not literals: 0.seconds", logs.output[0])
+
+        engine = vehicles["0"]
+        self.assertEqual(engine["caption"], "Type 1 fire engine")
+        self.assertEqual(engine["credits"], 5000)
+        self.assertEqual(engine["possibleBuildings"], [0, 18])
+        self.assertEqual(engine["special"], 'Driver\'s "seat"')
+        self.assertEqual(engine["wtank"], [500, 500, 750])
+        self.assertNotIn("iconFunction", engine)
+        self.assertNotIn("seconds", engine)
+        self.assertNotIn("describe", engine)
+        self.assertEqual(parse_ts_export(BUILDINGS_TS)["18"], {"caption": "Small station"})
+        self.assertEqual(parse_ts_export(EQUIPMENT_TS)["hose"]["staff"], {"min": 1, "max": 2})
+        self.assertIsNone(GitHubSync().parse_typescript_export("export default { 0: { caption: [1, } };"))
+
+    def test_full_sync_writes_once_links_by_game_id_and_skips_not_modified_files(self):
+        files = {
+            GITHUB_URLS["vehicles"]: VEHICLES_TS,
+            GITHUB_URLS["buildings"]: BUILDINGS_TS,
+            GITHUB_URLS["educations"]: EDUCATIONS_TS,
+            GITHUB_URLS["equipment"]: EQUIPMENT_TS,
+        }
+        github = GitHubSync()
+        github.session = FakeSession(files)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db = AssetDatabase(Path(temp_dir) / "assets.db")
+            db.connect()
+            db.initialize_tables()
+
+            data = asyncio.run(github.fetch_all())
+            results = apply_full_sync(db, github, data)
+            engine = db.get_vehicle_by_name("Type 1 fire engine")
+            buildings = [building["game_id"] for building in db.get_vehicle_buildings(engine["id"])]
+            educations = [education["key"] for education in db.get_vehicle_educations(engine["id"])]
+
+            second = asyncio.run(github.fetch_all())
+            unchanged = github.unchanged_sources()
+            rerun = apply_full_sync(db, github, second, unchanged)
+            engine_again = db.get_vehicle_by_name("Type 1 fire engine")
+            history = db.conn.execute("SELECT COUNT(*) FROM sync_history").fetchone()[0]
+            db.close()
+
+        self.assertTrue(all(result["success"] for result in results.values()))
+        self.assertEqual(results["vehicles"]["changes"]["added"], [0, 1])
+        self.assertEqual(sorted(buildings), [0, 18])
+        self.assertEqual(educations, ["hazmat"])
+        self.assertEqual(unchanged, {"vehicles", "buildings", "equipment", "educations"})
+        self.assertTrue(all(result.get("unchanged") for result in rerun.values()))
+        self.assertEqual(engine_again["id"], engine["id"])
+        self.assertEqual(history, 4)
+        self.assertEqual(
+            {url: headers.get("If-None-Match") for url, headers in github.session.requests[4:]},
+            {url: f"etag-{url}" for url in files},
+        )
+
+    def test_failing_source_rolls_back_alone(self):
+        github = GitHubSync()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db = AssetDatabase(Path(temp_dir) / "assets.db")
+            db.connect()
+            db.initialize_tables()
+            data = {
+                "educations": github.flatten_educations(parse_ts_export(EDUCATIONS_TS)),
+                "buildings": {0: {"caption": None}},
+                "vehicles": None,
+                "equipment": None,
+            }
+
+            results = apply_full_sync(db, github, data)
+            buildings = db.get_all_buildings()
+            educations = db.get_all_educations()
+            db.close()
+
+        self.assertTrue(results["educations"]["success"])
+        self.assertFalse(results["buildings"]["success"])
+        self.assertEqual(buildings, [])
+        self.assertEqual([education["key"] for education in educations], ["hazmat"])
+
+
+if __name__ == "__main__":
+    unittest.main()
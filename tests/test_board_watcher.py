@@ -0,0 +1,202 @@
+import asyncio
+import types
+import unittest
+from pathlib import Path
+
+from board_watcher import BoardWatcher, fetch_board_thread, parse_board_page, shared_board_watcher
+
+
+def board_page(page, last_page, *posts):
+    pagination = "".join(
+        f'<li class="active"><span>{number}</span></li>' if number == page else f'<li><a href="/alliance_threads/7?page={number}">{number}</a></li>'
+        for number in range(1, last_page + 1)
+    )
+    body = "".join(
+        f"""
+        <div class="panel" id="post-on-page-{index}">
+          <div class="row">
+            <div class="col-md-1"><a href="/profile/{post_id}0">User {post_id}</a><span title="today">today</span></div>
+            <div class="col-md-11"><p>{content}</p></div>
+          </div>
+          <a href="/alliance_posts/{post_id}/edit">Edit</a>
+        </div>
+        """
+        for index, (post_id, content) in enumerate(posts)
+    )
+    form = '<form id="new_alliance_post" action="/alliance_posts?alliance_thread_id=7"><input name="authenticity_token" value="t"></form>'
+    return f"<script>user_id = 1;</script><ul class='pagination'>{pagination}</ul>{body}{form}"
+
+
+class FakeResponse:
+    def __init__(self, body, status=200):
+        self.body = body
+        self.status = status
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def text(self):
+        return self.body
+
+
+class FakeBoard:
+    """A thread of pages; ``pages[n]`` is the HTML of page n."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
+
+    def get(self, url, **kwargs):
+        self.requests.append(url)
+        number = int(url.rsplit("page=", 1)[1]) if "page=" in url else 1
+        return FakeResponse(self.pages.get(number, board_page(number, max(self.pages))))
+
+
+class BoardWatcherTests(unittest.TestCase):
+    def test_board_cogs_package_the_shared_watcher_locally(self):
+        repo_root = Path(__file__).resolve().parents[1]
+        shared_source = (repo_root / "board_watcher.py").read_text(encoding="utf-8")
+        cog_sources = {
+            "trainings_manager": "trainings_manager.py",
+            "eventmanager": "event_manager.py",
+            "buildingmanager": "buildingmanager.py",
+        }
+
+        for cog_folder, source_name in cog_sources.items():
+            with self.subTest(cog_folder=cog_folder):
+                helper_path = repo_root / cog_folder / "board_watcher.py"
+                self.assertEqual(helper_path.read_text(encoding="utf-8"), shared_source)
+                self.assertIn(
+                    "from .board_watcher import",
+                    (repo_root / cog_folder / source_name).read_text(encoding="utf-8"),
+                )
+
+    def test_page_hint_saves_the_first_page_request_and_follows_growth(self):
+        board = FakeBoard({1: board_page(1, 2, (1, "a")), 2: board_page(2, 2, (2, "b"), (3, "c"))})
+
+        cold = asyncio.run(fetch_board_thread(board, 7, base_url=""))
+        self.assertEqual((cold.page_number, cold.requests), (2, 2))
+
+        warm = asyncio.run(fetch_board_thread(board, 7, page_hint=2, base_url=""))
+        self.assertEqual((warm.page_number, warm.requests), (2, 1))
+        self.assertEqual([post.post_id for post in warm.page.posts], [2, 3])
+
+        board.pages = {**board.pages, 2: board_page(2, 3, (2, "b"), (3, "c")), 3: board_page(3, 3, (4, "d"))}
+        grown = asyncio.run(fetch_board_thread(board, 7, page_hint=2, base_url=""))
+        self.assertEqual((grown.page_number, grown.requests), (3, 2))
+        self.assertEqual([post.post_id for post in grown.earlier_posts], [2, 3])
+        self.assertEqual([post.post_id for post in grown.page.posts], [4])
+
+        # Growing by two pages between polls reads the page in between as well
+        board.pages = {
+            **board.pages,
+            3: board_page(3, 5, (4, "d"), (5, "e")),
+            4: board_page(4, 5, (6, "f")),
+            5: board_page(5, 5, (7, "g")),
+        }
+        board.requests.clear()
+        jumped = asyncio.run(fetch_board_thread(board, 7, page_hint=3, base_url=""))
+        self.assertEqual(board.requests, ["/alliance_threads/7?page=3", "/alliance_threads/7?page=4", "/alliance_threads/7?page=5"])
+        self.assertEqual((jumped.page_number, jumped.requests), (5, 3))
+        self.assertEqual([post.post_id for post in jumped.earlier_posts], [4, 5, 6])
+        self.assertEqual([post.post_id for post in jumped.page.posts], [7])
+
+    def test_subscribers_share_one_fetch_get_new_and_edited_posts_and_retry_failures(self):
+        board = FakeBoard({1: board_page(1, 1, (10, "first"), (11, "second"))})
+        clock = types.SimpleNamespace(now=0.0)
+        watcher = BoardWatcher(lambda: asyncio.sleep(0, result=board), base_url="", clock=lambda: clock.now)
+        received = {"a": [], "b": []}
+        failing = {"b": True}
+
+        def subscriber(name):
+            async def threads():
+                return [7]
+
+            async def callback(update):
+                received[name].append(
+                    (update.first_poll, [post.post_id for post in update.new_posts], [post.post_id for post in update.edited_posts])
+                )
+                if name == "b" and failing["b"]:
+                    failing["b"] = False
+                    raise RuntimeError("handler down")
+
+            return threads, callback
+
+        # Subscribed outside a running loop, so no background poll task starts
+        watcher.subscribe("a", *subscriber("a"))
+        watcher.subscribe("b", *subscriber("b"))
+        watcher.unsubscribe("missing")
+
+        async def run():
+            await watcher.poll_once()
+            clock.now = 300.0
+            await watcher.poll_once()
+            board.pages[1] = board_page(1, 1, (10, "first"), (11, "second, edited"), (12, "third"))
+            clock.now = 600.0
+            await watcher.poll_once()
+            clock.now = 900.0
+            await watcher.poll_once()
+
+        asyncio.run(run())
+
+        self.assertEqual(received["a"], [(True, [10, 11], []), (False, [12], [11])])
+        # b raised on the first delivery, so the same posts came again on the next poll
+        self.assertEqual(received["b"], [(True, [10, 11], []), (True, [10, 11], []), (False, [12], [11])])
+        self.assertEqual(len(board.requests), 4)
+        stats = watcher.stats(7)[7]
+        self.assertEqual((stats["polls"], stats["requests_per_poll"], stats["errors"]), (4, 1.0, 0))
+        self.assertEqual(stats["last_detection_seconds"], 300.0)
+
+    def test_each_page_request_takes_its_own_request_slot(self):
+        board = FakeBoard({1: board_page(1, 2, (1, "a")), 2: board_page(2, 2, (2, "b"))})
+        held = []
+        slots = []
+
+        class Slot:
+            async def __aenter__(self):
+                slots.append(len(board.requests))
+                held.append(True)
+
+            async def __aexit__(self, *exc_info):
+                held.pop()
+                return False
+
+        get = board.get
+        board.get = lambda url, **kwargs: self.assertEqual(held, [True]) or get(url, **kwargs)
+        watcher = BoardWatcher(lambda: asyncio.sleep(0, result=board), base_url="", request_slot=Slot)
+
+        async def threads():
+            return [7]
+
+        async def callback(update):
+            return None
+
+        watcher.subscribe("a", threads, callback)
+
+        async def run():
+            await watcher.poll_once()
+            board.pages = {**board.pages, 3: board_page(3, 4, (3, "c")), 4: board_page(4, 4, (4, "d"))}
+            board.pages[2] = board_page(2, 4, (2, "b"))
+            await watcher.poll_once()
+
+        asyncio.run(run())
+
+        # Cold poll: page 1 and 2; grown poll: pages 2, 3 and 4, one slot each
+        self.assertEqual(len(board.requests), 5)
+        self.assertEqual(slots, [0, 1, 2, 3, 4])
+
+    def test_shared_watcher_lives_on_the_bot_and_parser_reads_posts(self):
+        bot = types.SimpleNamespace()
+        self.assertIs(shared_board_watcher(bot), shared_board_watcher(bot))
+
+        page = parse_board_page(board_page(2, 3, (5, "Hello<br>there")))
+        self.assertEqual(page.last_page, 3)
+        self.assertEqual([(post.post_id, post.content) for post in page.posts], [(5, "Hello\nthere")])
+        self.assertEqual((page.current_user_id, page.reply_token), ("1", "t"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+import asyncio
+import tempfile
+import types
+import unittest
+from unittest.mock import AsyncMock
+
+from buildingmanager.automation_queue import (
+    WAKE_DEADLINE,
+    WAKE_FALLBACK,
+    WAKE_SIGNAL,
+    DeadlineQueue,
+    format_queue_metrics,
+)
+from buildingmanager.buildingmanager import BuildingDatabase, BuildingManager
+from incomescraper.income_scraper import IncomeScraper, parse_alliance_funds
+
+
+class DeadlineQueueTests(unittest.TestCase):
+    def test_due_items_leave_in_deadline_order_and_funds_release_held_items(self):
+        clock = types.SimpleNamespace(now=1000.0)
+        queue = DeadlineQueue("Waiting for funds", clock=lambda: clock.now)
+        queue.schedule("cooldown", 1300)
+        queue.schedule("funds-small", 4600, needs_funds=2_000_000)
+        queue.schedule("funds-large", 4600, needs_funds=9_000_000)
+        queue.schedule("now", 1000)
+
+        self.assertEqual(queue.pop_due(), ["now"])
+        self.assertEqual(queue.next_due_at(), 1300)
+        self.assertEqual(queue.waiting_for_funds(), 2)
+
+        # A balance below every need wakes nothing; one covering the small need releases it
+        self.assertEqual(queue.note_funds(1_000_000), 0)
+        self.assertEqual(queue.note_funds(3_000_000), 1)
+        self.assertEqual(queue.pop_due(), ["funds-small"])
+        queue.requeue("funds-small", 4600)
+        self.assertEqual(queue.note_funds(3_000_000), 1)
+
+        clock.now = 1300.0
+        self.assertEqual(queue.pop_due(), ["funds-small", "cooldown"])
+        clock.now = 1900.0
+        queue.remove("funds-small", completed=True)
+        queue.remove("now")
+
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(queue.metrics.funds_releases, 2)
+        self.assertEqual((queue.metrics.completed, queue.metrics.max_completion_seconds), (1, 900.0))
+        lines = format_queue_metrics(queue)
+        self.assertIn("Waiting for funds: 2 queued (1 waiting for funds)", lines[0])
+        self.assertIn("time to build avg 15m / max 15m", lines[2])
+        self.assertIn("last known alliance funds: 3,000,000 credits", lines[3])
+
+    def test_wait_ends_at_the_deadline_a_signal_or_the_fallback(self):
+        async def run():
+            queue = DeadlineQueue("Post-creation automation")
+            reasons = [await queue.wait(0.01)]
+            queue.schedule(1, 0)
+            queue.pop_due()
+            queue.schedule(2, queue._clock() + 0.01)
+            reasons.append(await queue.wait(60))
+            queue.pop_due()
+
+            waiter = asyncio.create_task(queue.wait(60))
+            await asyncio.sleep(0)
+            queue.schedule(3, queue._clock() + 3600, needs_funds=5)
+            reasons.append(await waiter)
+            return queue, reasons
+
+        queue, reasons = asyncio.run(run())
+
+        # Scheduling an earlier deadline signals a sleeping worker so it recomputes its timeout
+        self.assertEqual(reasons[0], WAKE_FALLBACK)
+        self.assertEqual(reasons[1:], [WAKE_SIGNAL, WAKE_SIGNAL])
+        self.assertEqual(queue.metrics.fallback_wakeups, 1)
+
+    def test_deadline_wakeup_is_counted_when_nothing_signals(self):
+        async def run():
+            queue = DeadlineQueue("Daily candidate builds")
+            queue.schedule(1, queue._clock() + 0.01)
+            await queue.wait(0)
+            return await queue.wait(60), queue
+
+        reason, queue = asyncio.run(run())
+
+        self.assertEqual(reason, WAKE_DEADLINE)
+        self.assertEqual(queue.pop_due(), [1])
+
+
+class BuildingManagerFundsQueueTests(unittest.TestCase):
+    def _manager(self, temp_dir):
+        manager = BuildingManager.__new__(BuildingManager)
+        manager.db = BuildingDatabase(f"{temp_dir}/building_manager.db")
+        manager._automation_queue = DeadlineQueue("Post-creation automation")
+        manager._funds_queue = DeadlineQueue("Waiting for funds")
+        manager._auto_candidate_queue = DeadlineQueue("Daily candidate builds")
+        guild = types.SimpleNamespace(id=100)
+        manager.bot = types.SimpleNamespace(get_guild=lambda guild_id: guild if guild_id == 100 else None)
+        manager._get_min_alliance_funds = AsyncMock(return_value=2_000_000)
+        return manager
+
+    def _store_awaiting_request(self, manager):
+        request_id = manager.db.add_request(
+            guild_id=100,
+            user_id=1,
+            username="Requester",
+            building_type="Hospital",
+            building_name="Example Hospital",
+            location_input="52.0, 5.0",
+            coordinates="52.0, 5.0",
+            address=None,
+            notes=None,
+        )
+        manager.db.update_request_status(request_id, "awaiting_funds")
+        return request_id
+
+    def test_waiting_requests_are_held_until_a_balance_signal_covers_them(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = self._manager(temp_dir)
+            request_id = self._store_awaiting_request(manager)
+
+            async def run():
+                await manager._sync_funds_queue()
+                self.assertEqual(manager._funds_queue.pop_due(), [request_id])
+                # The live check said no: held for an hour unless funds arrive
+                manager._funds_queue.requeue(request_id, manager._funds_queue._clock() + 3600)
+                self.assertEqual(manager._funds_queue.pop_due(), [])
+                await manager.on_fara_alliance_funds_updated(1_500_000)
+                self.assertEqual(manager._funds_queue.pop_due(), [])
+                await manager.on_fara_alliance_funds_updated(2_500_000)
+                self.assertEqual(manager._funds_queue.pop_due(), [request_id])
+
+                manager.db.update_request_status(request_id, "created")
+                await manager._sync_funds_queue()
+
+            asyncio.run(run())
+
+            self.assertEqual(len(manager._funds_queue), 0)
+            self.assertEqual(manager._funds_queue.metrics.completed, 1)
+
+    def test_automation_jobs_are_scheduled_from_their_stored_next_run(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = self._manager(temp_dir)
+            job_id = manager.db.add_or_update_automation_job(
+                request_id=42,
+                guild_id=100,
+                building_id=555,
+                building_type="Hospital",
+                building_name="Example Hospital",
+                next_run_at=5_000,
+            )
+
+            manager._sync_automation_queue()
+            self.assertEqual(manager._automation_queue.next_due_at(), 5_000)
+            manager._schedule_automation_job(job_id, needs_funds=2_000_000)
+            manager._note_alliance_funds(2_000_000)
+
+            self.assertEqual(manager._automation_queue.pop_due(), [job_id])
+
+
+class IncomeScraperFundsSignalTests(unittest.TestCase):
+    def test_treasury_balance_is_parsed_and_dispatched_once_per_change(self):
+        events = []
+        scraper = IncomeScraper.__new__(IncomeScraper)
+        scraper.bot = types.SimpleNamespace(dispatch=lambda *args: events.append(args))
+        scraper.last_alliance_funds = None
+
+        for text in (
+            "Alliance Funds 12,345,678 Credits Daily income",
+            "Alliance Funds 12,345,678 Credits",
+            "Alliance treasury: 9.000.000 Credits",
+        ):
+            scraper._note_alliance_funds(parse_alliance_funds(text))
+
+        self.assertIsNone(parse_alliance_funds("Daily income 5,000 Credits"))
+        self.assertEqual(
+            events,
+            [
+                ("fara_alliance_funds_updated", 12_345_678, "IncomeScraper"),
+                ("fara_alliance_funds_updated", 9_000_000, "IncomeScraper"),
+            ],
+        )
+        self.assertEqual(scraper.get_current_alliance_funds(), 9_000_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
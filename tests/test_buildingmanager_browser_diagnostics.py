@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import struct
 import tempfile
 import types
@@ -7,6 +8,8 @@ import zipfile
 from pathlib import Path
 from unittest.mock import AsyncMock
 
+from buildingmanager.automation_queue import DeadlineQueue
+from buildingmanager.mc_actions import MissionChiefActionEngine
 from buildingmanager.buildingmanager import (
     ALLIANCE_BUILDING_TARGET_HOSPITAL_LEVEL,
     BOARD_REPLY_MARKER,
@@ -20,6 +23,8 @@ from buildingmanager.buildingmanager import (
     BUILDING_FETCH_ALLIANCE_LIST_SCRIPT,
     BUILDING_FETCH_ALLIANCE_LOGS_SCRIPT,
     AUTO_CANDIDATE_DUPLICATE_RADIUS_METERS,
+    AutoCandidateWorkQueue,
+    BuildingAutomationJob,
     BuildingAutomationResult,
     BoardBuildingPost,
     BoardPage,
@@ -41,6 +46,7 @@ from buildingmanager.buildingmanager import (
     build_building_board_guide_content,
     build_overpass_candidate_query,
     build_browser_diagnostics_report,
+    extract_building_extension_offers,
     extract_missionchief_building_id,
     extract_building_board_request,
     find_created_alliance_building_id,
@@ -56,6 +62,78 @@ from buildingmanager.buildingmanager import (
 )
 
 
+class FakeMissionChiefBuilding:
+    """Serves one alliance hospital's page and applies the automation links it is sent."""
+
+    def __init__(self, *, logged_in=True):
+        self.logged_in = logged_in
+        self.tax_set = False
+        self.level = 5
+        self.extensions = {1: "200,000 Credits", 9: "Large hospital 1,000,000 Credits"}
+        self.requests = []
+
+    def page(self):
+        if not self.logged_in:
+            return '<form action="/users/sign_in"><input type="password" name="user[password]"></form>'
+        tax_class = "btn-success" if self.tax_set else "btn-default"
+        links = "".join(
+            f'<a href="/buildings/555/extension/credits/{extension_id}"> {label}</a>'
+            for extension_id, label in sorted(self.extensions.items())
+        )
+        return (
+            '<meta name="csrf-token" content="token-123">'
+            "<dl><dt><strong>Level:</strong></dt><dd>%d</dd></dl>"
+            '<a class="btn btn-xs btn-alliance_costs %s" href="/buildings/555/alliance_costs/2">20%%</a>%s'
+        ) % (self.level, tax_class, links)
+
+    @contextlib.asynccontextmanager
+    async def request(self, method, url, **kwargs):
+        path = url.replace("https://www.missionchief.com", "")
+        self.requests.append((method, path, kwargs.get("data")))
+        if path == "/buildings/555/alliance_costs/2":
+            self.tax_set = True
+        elif path.startswith("/buildings/555/expand_do/credits"):
+            self.level = 20
+        elif path.startswith("/buildings/555/extension/credits/"):
+            self.extensions.pop(int(path.rsplit("/", 1)[1]))
+
+        async def text():
+            return self.page()
+
+        yield types.SimpleNamespace(status=200, url=url, text=text)
+
+
+def automation_job():
+    return BuildingAutomationJob(
+        job_id=1,
+        request_id=42,
+        guild_id=100,
+        building_id=555,
+        building_type="Hospital",
+        building_name="Example Hospital",
+        status="pending",
+        target_tax=20,
+        tax_complete=False,
+        level_complete=False,
+        extensions_complete=False,
+        extensions_started=0,
+        attempts=0,
+        next_run_at=0,
+    )
+
+
+def automation_manager(site):
+    manager = BuildingManager.__new__(BuildingManager)
+    manager.bot = types.SimpleNamespace(get_cog=lambda name: None)
+    manager._actions = MissionChiefActionEngine()
+    manager._browser_lock = asyncio.Lock()
+    manager._get_session = AsyncMock(return_value=site)
+    manager._upgrade_alliance_building_browser = AsyncMock(
+        return_value=BuildingAutomationResult(False, False, True, "browser fallback", [])
+    )
+    return manager
+
+
 BUILDING_BOARD_HTML = """
 <script>
   user_id = 88649;
@@ -312,6 +390,7 @@ class BuildingManagerBrowserDiagnosticsTests(unittest.TestCase):
         async def fail_browser():
             raise RuntimeError("browser unavailable")
 
+        manager._actions = MissionChiefActionEngine()
         manager._fetch_live_alliance_funds = fail_aiohttp
         manager._fetch_live_alliance_funds_browser = fail_browser
         manager._get_alliance_funds_from_contract = AsyncMock(return_value=None)
@@ -337,6 +416,7 @@ class BuildingManagerBrowserDiagnosticsTests(unittest.TestCase):
 
         manager = BuildingManager.__new__(BuildingManager)
         manager.db = FakeDb()
+        manager._funds_queue = DeadlineQueue("Waiting for funds")
         manager._send_building_request_game_update = AsyncMock(return_value={"ok": True})
 
         req = BuildingRequest(
@@ -368,6 +448,8 @@ class BuildingManagerBrowserDiagnosticsTests(unittest.TestCase):
         self.assertIn("No building was created yet", message)
         manager._send_building_request_game_update.assert_awaited_once()
         self.assertEqual(manager._send_building_request_game_update.await_args.kwargs["subject"], "Building request queued")
+        # Held until a balance signal or the fallback re-check, not polled
+        self.assertEqual(manager._funds_queue.waiting_for_funds(), 1)
 
     def test_discord_request_contribution_uses_membersync_and_membersscraper(self):
         member_sync = types.SimpleNamespace(
@@ -883,6 +965,56 @@ class BuildingManagerBrowserDiagnosticsTests(unittest.TestCase):
         self.assertIn("offer.price !== 200000", BUILDING_AUTOMATION_DIRECT_SCRIPT)
         self.assertIn("maxExtensionStarts", BUILDING_AUTOMATION_DIRECT_SCRIPT)
 
+    def test_automation_replays_the_direct_script_steps_over_http(self):
+        site = FakeMissionChiefBuilding()
+        manager = automation_manager(site)
+
+        result = asyncio.run(manager._upgrade_alliance_building(automation_job()))
+
+        self.assertTrue(result.ok and result.completed)
+        self.assertEqual(
+            result.actions,
+            ["Set tax to 20%", f"Set hospital level to {ALLIANCE_BUILDING_TARGET_HOSPITAL_LEVEL}", "Started extension 1 (200000 credits)"],
+        )
+        self.assertEqual(result.extensions_started, 1)
+        changes = [request for request in site.requests if request[1] != "/buildings/555"]
+        self.assertEqual(
+            changes,
+            [
+                ("GET", "/buildings/555/alliance_costs/2", None),
+                ("GET", "/buildings/555/expand_do/credits?level=19", None),
+                ("POST", "/buildings/555/extension/credits/1", {"authenticity_token": "token-123"}),
+            ],
+        )
+        # The large hospital extension is never bought
+        self.assertIn(9, site.extensions)
+        manager._upgrade_alliance_building_browser.assert_not_awaited()
+        self.assertEqual(manager._actions.stats["building_automation"].replay_ok, 1)
+
+    def test_automation_falls_back_to_the_browser_when_the_replay_is_logged_out(self):
+        site = FakeMissionChiefBuilding(logged_in=False)
+        manager = automation_manager(site)
+
+        result = asyncio.run(manager._upgrade_alliance_building(automation_job()))
+
+        self.assertEqual(result.reason, "browser fallback")
+        self.assertEqual(site.requests, [("GET", "/buildings/555", None)])
+        stats = manager._actions.stats["building_automation"]
+        self.assertEqual((stats.fallbacks, stats.browser_failed), (1, 1))
+        self.assertIn("logged-in", stats.last_fallback_reason)
+
+    def test_extension_offers_match_the_direct_script_parsing(self):
+        html = (
+            '<a href="/buildings/7/extension/credits/3">100,000 Credits</a>'
+            '<a href="/buildings/7/extension/credits/3">duplicate</a>'
+            '<a href="/buildings/7/extension/credits/1"> Ambulance extension</a>'
+            '<a href="/buildings/8/extension/credits/2">other building</a>'
+        )
+
+        offers = extract_building_extension_offers(html, "7")
+
+        self.assertEqual([(offer["extId"], offer["price"]) for offer in offers], [(1, None), (3, 100000)])
+
     def test_automation_queue_tracks_waiting_and_completion(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             db = BuildingDatabase(f"{temp_dir}/building_manager.db")
@@ -1211,6 +1343,7 @@ class BuildingManagerBrowserDiagnosticsTests(unittest.TestCase):
         with tempfile.TemporaryDirectory() as temp_dir:
             manager = BuildingManager.__new__(BuildingManager)
             manager.db = BuildingDatabase(f"{temp_dir}/building_manager.db")
+            manager._auto_candidate_work = {}
             manager.db.upsert_auto_candidates(
                 [
                     {
@@ -1238,7 +1371,14 @@ class BuildingManagerBrowserDiagnosticsTests(unittest.TestCase):
                 key=lambda candidate: candidate.name,
                 reverse=True,
             )
-            manager.db.get_random_auto_candidates = lambda *_args, **_kwargs: candidates
+            manager.db.sample_auto_candidate_ids = lambda *_args, **_kwargs: [
+                candidate.candidate_id for candidate in candidates
+            ]
+            manager._auto_candidate_work["Hospital"] = AutoCandidateWorkQueue(
+                manager.db,
+                "Hospital",
+                rng=types.SimpleNamespace(shuffle=lambda _items: None),
+            )
             existing = [
                 {
                     "id": 555,
@@ -1279,6 +1419,7 @@ class BuildingManagerBrowserDiagnosticsTests(unittest.TestCase):
         with tempfile.TemporaryDirectory() as temp_dir:
             manager = BuildingManager.__new__(BuildingManager)
             manager.db = BuildingDatabase(f"{temp_dir}/building_manager.db")
+            manager._auto_candidate_work = {}
             manager.config = FakeConfig()
             manager.bot = types.SimpleNamespace()
             manager._get_current_alliance_funds = AsyncMock(return_value=(6_000_000, "live MissionChief"))
@@ -1317,7 +1458,8 @@ class BuildingManagerBrowserDiagnosticsTests(unittest.TestCase):
                 )
             )
 
-            self.assertIn("created Example Hospital", result)
+            self.assertIn("created Example Hospital", result.message)
+            self.assertFalse(result.blocked_on_funds)
             run = manager.db.get_auto_run(1, "2026-06-27", "Hospital")
             self.assertEqual(run["result"], "created")
             self.assertEqual(run["missionchief_building_id"], 12345)
@@ -1346,6 +1488,7 @@ class BuildingManagerBrowserDiagnosticsTests(unittest.TestCase):
         with tempfile.TemporaryDirectory() as temp_dir:
             manager = BuildingManager.__new__(BuildingManager)
             manager.db = BuildingDatabase(f"{temp_dir}/building_manager.db")
+            manager._auto_candidate_work = {}
             manager.config = FakeConfig()
             manager._get_current_alliance_funds = AsyncMock(return_value=(6_000_000, "live MissionChief"))
             manager._candidate_duplicate_context = AsyncMock(return_value=([], "test duplicate check", 250))
@@ -1401,6 +1544,7 @@ class BuildingManagerBrowserDiagnosticsTests(unittest.TestCase):
         with tempfile.TemporaryDirectory() as temp_dir:
             manager = BuildingManager.__new__(BuildingManager)
             manager.db = BuildingDatabase(f"{temp_dir}/building_manager.db")
+            manager._auto_candidate_work = {}
             manager.config = FakeConfig()
             manager._get_current_alliance_funds = AsyncMock(return_value=(4_999_999, "live MissionChief"))
             manager._candidate_duplicate_context = AsyncMock()
@@ -1415,8 +1559,9 @@ class BuildingManagerBrowserDiagnosticsTests(unittest.TestCase):
                 )
             )
 
-            self.assertIn("blocked by funds safety rule", result)
-            self.assertIn("5,000,000 credits", result)
+            self.assertTrue(result.blocked_on_funds)
+            self.assertEqual(result.funds_minimum, 5_000_000)
+            self.assertIn("5,000,000 credits", result.message)
             manager._candidate_duplicate_context.assert_not_awaited()
             manager._create_and_queue_approved_building.assert_not_awaited()
 
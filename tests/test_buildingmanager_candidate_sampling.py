@@ -0,0 +1,98 @@
+import random
+import sqlite3
+import tempfile
+import unittest
+
+from buildingmanager.buildingmanager import AutoCandidateWorkQueue, BuildingDatabase, BuildingManager
+
+
+def candidate(index, building_type="Hospital"):
+    return {
+        "source": "openstreetmap",
+        "source_id": f"node/{index}",
+        "building_type": building_type,
+        "name": f"{building_type} {index}",
+        "lat": 40.0 + index / 1000,
+        "lon": -74.0,
+        "raw_tags_json": "{}",
+    }
+
+
+class AutoCandidateSamplingTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.db_path = f"{self.temp_dir.name}/building_manager.db"
+        self.db = BuildingDatabase(self.db_path)
+        self.db.upsert_auto_candidates(
+            [candidate(index) for index in range(40)] + [candidate(index, "Prison") for index in range(40, 60)]
+        )
+        self.hospital_ids = [
+            row[0]
+            for row in sqlite3.connect(self.db_path).execute(
+                "SELECT candidate_id FROM building_auto_candidates WHERE building_type = 'Hospital' ORDER BY candidate_id"
+            )
+        ]
+        for candidate_id in self.hospital_ids[:30]:
+            self.db.mark_auto_candidate(candidate_id, "used", reason="Built.")
+
+    def test_sample_returns_distinct_eligible_ids_through_the_index(self):
+        eligible = set(self.hospital_ids[30:])
+
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                sampled = self.db.sample_auto_candidate_ids("Hospital", limit=6, rng=random.Random(seed))
+                self.assertEqual(len(sampled), 6)
+                self.assertEqual(len(set(sampled)), 6)
+                self.assertLessEqual(set(sampled), eligible)
+        self.assertEqual(set(self.db.sample_auto_candidate_ids("Hospital", limit=50)), eligible)
+        self.assertEqual(self.db.sample_auto_candidate_ids("Fire Station", limit=5), [])
+
+        plan = sqlite3.connect(self.db_path).execute(
+            "EXPLAIN QUERY PLAN SELECT candidate_id FROM building_auto_candidates "
+            "WHERE building_type = ? AND status = 'available' AND candidate_id >= ? ORDER BY candidate_id LIMIT 1",
+            ("Hospital", 0),
+        ).fetchall()
+        self.assertIn("COVERING INDEX idx_building_auto_candidates_eligible", str(plan))
+
+    def test_work_queue_keeps_its_order_and_drops_stale_entries(self):
+        work = AutoCandidateWorkQueue(self.db, "Hospital", batch_size=4)
+        reads = []
+        load = self.db.get_auto_candidates
+        self.db.get_auto_candidates = lambda ids: reads.append(list(ids)) or load(ids)
+        first = [item.candidate_id for item in work.candidates(4)]
+        # The whole head is re-validated in one query, not one connection per id
+        self.assertEqual(reads, [first])
+        # A dry run leaves the queue as it was, so the next look sees the same head
+        self.assertEqual([item.candidate_id for item in work.candidates(4)], first)
+
+        self.db.mark_auto_candidate(first[0], "duplicate", reason="Too close.")
+        work.discard(first[1])
+        self.assertEqual([item.candidate_id for item in work.candidates(2)], first[2:4])
+
+        for candidate_id in self.hospital_ids[30:]:
+            if candidate_id not in first[:2]:
+                self.db.mark_auto_candidate(candidate_id, "used", reason="Built.")
+        self.assertEqual([item.candidate_id for item in work.candidates(4)], [first[1]])
+
+    def test_real_runs_consume_the_queue_and_dry_runs_preview_it(self):
+        manager = BuildingManager.__new__(BuildingManager)
+        manager.db = self.db
+        manager._auto_candidate_work = {}
+
+        def select(mark_duplicates):
+            return manager._select_auto_candidate(
+                "Prison",
+                existing_buildings=[],
+                duplicate_source="test",
+                duplicate_radius_m=250,
+                mark_duplicates=mark_duplicates,
+            ).candidate.candidate_id
+
+        preview = select(False)
+        self.assertEqual(select(True), preview)
+        self.assertNotEqual(select(False), preview)
+
+
+if __name__ == "__main__":
+    unittest.main()
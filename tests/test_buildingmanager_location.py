@@ -1,7 +1,9 @@
 import asyncio
+import tempfile
 import unittest
 
-from buildingmanager.buildingmanager import LocationDetails, LocationParser
+from buildingmanager.buildingmanager import GeocodeProviderError, LocationDetails, LocationParser
+from buildingmanager.geocode_cache import GeocodeCache
 
 
 class BuildingManagerLocationTests(unittest.TestCase):
@@ -218,6 +220,47 @@ class BuildingManagerLocationTests(unittest.TestCase):
         self.assertEqual(details.coordinates, "27.257895, 33.811607")
         self.assertEqual(details.country, "Egypt")
 
+    def test_provider_failures_are_not_cached_and_new_keys_bypass_old_misses(self):
+        original_nominatim = LocationParser.forward_geocode_nominatim_details
+        original_mapsco = LocationParser.forward_geocode_mapsco_details
+        original_cache = LocationParser.geocode_cache
+        answers = [GeocodeProviderError("HTTP 504"), None]
+        calls = []
+
+        async def fake_nominatim(query):
+            calls.append("nominatim")
+            answer = answers.pop(0)
+            if isinstance(answer, Exception):
+                raise answer
+            return answer
+
+        async def fake_mapsco(query, api_key):
+            calls.append("mapsco")
+            return {"coordinates": "40.1, -74.2", "provider": "geocode.maps.co"}
+
+        async def resolve(**keys):
+            return await LocationParser.resolve_location("Example General Hospital", **keys)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            try:
+                LocationParser.forward_geocode_nominatim_details = fake_nominatim
+                LocationParser.forward_geocode_mapsco_details = fake_mapsco
+                LocationParser.geocode_cache = GeocodeCache(f"{temp_dir}/geocode.db")
+                timed_out = asyncio.run(resolve())
+                no_result = asyncio.run(resolve())
+                cached_miss = asyncio.run(resolve())
+                with_key = asyncio.run(resolve(mapsco_key="key"))
+            finally:
+                LocationParser.forward_geocode_nominatim_details = original_nominatim
+                LocationParser.forward_geocode_mapsco_details = original_mapsco
+                LocationParser.geocode_cache = original_cache
+
+        self.assertIsNone(timed_out.coordinates)
+        self.assertIsNone(no_result.coordinates)
+        self.assertIsNone(cached_miss.coordinates)
+        self.assertEqual(with_key.coordinates, "40.1, -74.2")
+        self.assertEqual(calls, ["nominatim", "nominatim", "mapsco"])
+
 
 if __name__ == "__main__":
     unittest.main()
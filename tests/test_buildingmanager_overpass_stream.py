@@ -0,0 +1,182 @@
+import asyncio
+import contextlib
+import json
+import tempfile
+import types
+import unittest
+from unittest import mock
+from unittest.mock import AsyncMock
+
+import buildingmanager.buildingmanager as buildingmanager_module
+from buildingmanager.buildingmanager import BuildingDatabase, BuildingManager, OverpassCandidateImport
+from buildingmanager.overpass_stream import (
+    OverpassElementStream,
+    OverpassStreamError,
+    overpass_grid_tiles,
+    overpass_import_key,
+)
+
+
+def hospital(element_id, lat=0.1, lon=0.1, *, element_type="node"):
+    return {
+        "type": element_type,
+        "id": element_id,
+        "lat": lat,
+        "lon": lon,
+        "tags": {"amenity": "hospital", "name": f"Example General Hospital {element_id}", "addr:country": "US"},
+    }
+
+
+def overpass_body(elements, **header):
+    return json.dumps({"version": 0.6, "generator": "Overpass API", "elements": elements, **header}, indent=1).encode()
+
+
+class FakeOverpassResponse:
+    def __init__(self, status, body):
+        self.status = status
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def text(self):
+        return self.body.decode()
+
+    @property
+    def content(self):
+        return self
+
+    async def iter_chunked(self, size):
+        for start in range(0, len(self.body), 7):
+            yield self.body[start:start + 7]
+
+
+class FakeOverpassSession:
+    def __init__(self, responses, queries):
+        self.responses = responses
+        self.queries = queries
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def post(self, url, data):
+        self.queries.append(data["data"])
+        return self.responses.pop(0)
+
+
+class OverpassElementStreamTests(unittest.TestCase):
+    def test_elements_are_returned_as_chunks_complete_them(self):
+        body = overpass_body([hospital(index) for index in range(20)], remark="runtime error: Query timed out")
+
+        for size in (1, 5, 64, len(body)):
+            with self.subTest(size=size):
+                stream = OverpassElementStream()
+                elements = []
+                for start in range(0, len(body), size):
+                    elements.extend(stream.feed(body[start:start + size]))
+                elements.extend(stream.close())
+
+                self.assertEqual([element["id"] for element in elements], list(range(20)))
+                self.assertEqual(stream.header["version"], 0.6)
+                self.assertIn("runtime error", stream.remark)
+
+    def test_truncated_and_non_object_responses_are_rejected(self):
+        stream = OverpassElementStream()
+        self.assertEqual(len(stream.feed(b'\xef\xbb\xbf{"elements": [{"id": 1}, {"id"')), 1)
+        with self.assertRaises(OverpassStreamError):
+            stream.close()
+        with self.assertRaises(OverpassStreamError):
+            OverpassElementStream().feed(b"<html>504 Gateway Timeout</html>")
+
+    def test_grid_tiles_cover_the_box_in_a_stable_order(self):
+        tiles = overpass_grid_tiles(40.0, -75.0, 41.0, -74.5, 0.35)
+
+        self.assertEqual(len(tiles), 6)
+        self.assertEqual(tiles[0][:2], (40.0, -75.0))
+        self.assertEqual(tiles[-1][2:], (41.0, -74.5))
+        self.assertTrue(all(north - south <= 0.35 and east - west <= 0.35 for south, west, north, east in tiles))
+        self.assertEqual(overpass_grid_tiles(40.0, -75.0, 40.2, -74.9, 0.35), [(40.0, -75.0, 40.2, -74.9)])
+        self.assertNotEqual(
+            overpass_import_key(40.0, -75.0, 41.0, -74.5, "hospital", 0.35),
+            overpass_import_key(40.0, -75.0, 41.0, -74.5, "prison", 0.35),
+        )
+
+
+class OverpassCandidateImportTests(unittest.TestCase):
+    def test_elements_are_deduplicated_and_written_in_batches(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db = BuildingDatabase(f"{temp_dir}/building_manager.db")
+            batches = []
+            upsert = db.upsert_auto_candidates
+            db.upsert_auto_candidates = lambda records: batches.append(len(records)) or upsert(records)
+            importer = OverpassCandidateImport(db, batch_size=2)
+
+            importer.read_bytes(overpass_body([hospital(1), hospital(2), hospital(3, element_type="way")]))
+            # The way crosses into the next tile and comes back a second time
+            asyncio.run(importer.read(FakeOverpassResponse(200, overpass_body([hospital(3, element_type="way"), {"id": 9}])).iter_chunked(7)))
+
+            self.assertEqual(batches, [2, 1])
+            self.assertEqual(
+                importer.stats,
+                {"source_elements": 5, "accepted": 3, "rejected": 1, "duplicates": 1, "inserted": 3, "updated": 0, "skipped": 0},
+            )
+            self.assertEqual(db.get_auto_candidate_stats()["Hospital:available"], 3)
+
+
+class OverpassTiledImportTests(unittest.TestCase):
+    def _manager(self, temp_dir):
+        manager = BuildingManager.__new__(BuildingManager)
+        manager.db = BuildingDatabase(f"{temp_dir}/building_manager.db")
+        return manager
+
+    def _run(self, manager, responses, queries):
+        ctx = types.SimpleNamespace(send=AsyncMock(), typing=contextlib.nullcontext)
+        with mock.patch.object(
+            buildingmanager_module.aiohttp,
+            "ClientSession",
+            lambda **kwargs: FakeOverpassSession(responses, queries),
+        ), mock.patch.object(buildingmanager_module, "OVERPASS_IMPORT_TILE_PAUSE_SECONDS", 0):
+            asyncio.run(manager.candidate_autobuild_import_overpass(ctx, 40.0, -75.0, 40.7, -74.8, "hospital"))
+        return ctx.send.await_args.args[0]
+
+    def test_failed_tile_is_resumed_by_running_the_same_command_again(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = self._manager(temp_dir)
+            queries = []
+            first = self._run(
+                manager,
+                [
+                    FakeOverpassResponse(200, overpass_body([hospital(1, 40.1, -74.9)])),
+                    FakeOverpassResponse(504, b"<html>Gateway Timeout</html>"),
+                ],
+                queries,
+            )
+            key = overpass_import_key(40.0, -75.0, 40.7, -74.8, "hospital", 0.35)
+            progress = manager.db.get_auto_overpass_import(key)
+
+            self.assertIn("HTTP 504", first)
+            self.assertIn("resume at tile 2", first)
+            self.assertEqual((progress["status"], progress["next_tile"], progress["inserted"]), ("failed", 1, 1))
+
+            second = self._run(
+                manager,
+                [FakeOverpassResponse(200, overpass_body([hospital(2, 40.5, -74.9)]))],
+                queries,
+            )
+            progress = manager.db.get_auto_overpass_import(key)
+
+            self.assertEqual(len(queries), 3)
+            self.assertIn("(40.3500000,-75.0000000,40.7000000,-74.8000000)", queries[-1])
+            self.assertEqual((progress["status"], progress["next_tile"], progress["inserted"]), ("completed", 2, 2))
+            self.assertIn("Inserted: 2", second)
+            self.assertIn("resumed at tile 2", second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+import buildingmanager.buildingmanager as buildingmanager_module
+from buildingmanager.buildingmanager import BuildingDatabase
+
+T0 = 1_700_000_000
+
+
+class BuildingStatsCounterTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.db_path = f"{self.temp_dir.name}/building_manager.db"
+        self.now = T0
+        patcher = mock.patch.object(buildingmanager_module, "ts", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.db = BuildingDatabase(self.db_path)
+
+    def _request(self, at, user_id, username, building_type):
+        self.now = at
+        return self.db.add_request(100, user_id, username, building_type, f"{username} {building_type}", "52.0, 5.0", None, None, None)
+
+    def _decide(self, at, request_id, admin_user_id, admin_username, action_type, reason=None):
+        self.now = at
+        self.db.add_action(request_id, 100, admin_user_id, admin_username, action_type, denial_reason=reason)
+        self.db.update_request_status(request_id, action_type)
+
+    def _seed(self):
+        first = self._request(T0, 1, "Alice", "Hospital")
+        self._decide(T0 + 3600, first, 10, "Admin A", "approved")
+        second = self._request(T0 + 100, 1, "Alice", "Prison")
+        self._decide(T0 + 700, second, 11, "Admin B", "denied", "Too close")
+        third = self._request(T0 + 200, 2, "Bob", "Hospital")
+        self._decide(T0 + 7400, third, 10, "Admin A", "denied", "Too close")
+        fourth = self._request(T0 + 300, 2, "Bob", "Hospital")
+        self.now = T0 + 400
+        self.db.add_action(fourth, 100, None, None, "automation_queued")
+        self.db.update_request_status(fourth, "cancelled")
+        self._request(T0 + 500, 2, "Bob", "Prison")
+        self.now = T0 + 8000
+
+    def _all_stats(self):
+        return (
+            self.db.get_stats_overall(100),
+            self.db.get_stats_user(100, 1),
+            self.db.get_stats_admin(100, 10),
+            self.db.get_stats_type(100, "Hospital"),
+        )
+
+    def test_embeds_read_counters_kept_in_step_with_each_state_change(self):
+        self._seed()
+
+        overall, user, admin, hospital = self._all_stats()
+
+        self.assertEqual(overall["status_counts"], {"approved": 1, "denied": 2, "cancelled": 1, "pending": 1})
+        self.assertEqual(overall["top_requesters"], [("Bob", 3), ("Alice", 2)])
+        self.assertEqual(overall["top_admins"], [("Admin A", 2), ("Admin B", 1)])
+        self.assertEqual(overall["avg_response_time"], (3600 + 600 + 7200) / 3)
+        self.assertEqual(overall["recent_days"], {"requests": 5, "approved": 1, "denied": 2})
+        self.assertIn(("Hospital", "cancelled", 1), overall["type_stats"])
+        self.assertEqual(user["status_counts"], {"approved": 1, "denied": 1})
+        self.assertEqual(user["type_stats"], [("Hospital", "approved", 1), ("Prison", "denied", 1)])
+        self.assertEqual(user["denial_reasons"], [("Too close", 1)])
+        self.assertEqual(admin["action_counts"], {"approved": 1, "denied": 1})
+        self.assertEqual(admin["response_times"], (5400, 3600, 7200))
+        self.assertEqual(admin["denial_breakdown"], [("Too close", 1)])
+        self.assertEqual(hospital["status_counts"], {"approved": 1, "denied": 1, "cancelled": 1})
+        self.assertEqual(hospital["top_requesters"], [("Bob", 2), ("Alice", 1)])
+        self.assertEqual(hospital["common_denial"], ("Too close", 1))
+        self.assertEqual(hospital["admin_rates"], [("Admin A", 1, 2)])
+        self.assertEqual(self.db.verify_stats()["mismatched"], 0)
+
+    def test_rebuild_recounts_drifted_counters_and_old_databases_are_backfilled(self):
+        self._seed()
+        before = self._all_stats()
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("UPDATE building_stats SET count = count + 5 WHERE scope = 'requests' AND subject_id = 2 AND bucket = ''")
+        conn.commit()
+
+        self.assertEqual(self.db.verify_stats()["mismatched"], 3)
+        self.assertEqual(self.db.rebuild_stats()["mismatched"], 3)
+        self.assertEqual(self.db.verify_stats()["mismatched"], 0)
+        self.assertEqual(self._all_stats(), before)
+
+        conn.execute("DELETE FROM building_stats")
+        conn.commit()
+        conn.close()
+        self.db = BuildingDatabase(self.db_path)
+
+        self.assertEqual(self._all_stats(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
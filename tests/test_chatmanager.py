@@ -1,12 +1,17 @@
+import asyncio
+import types
 import unittest
+from unittest.mock import AsyncMock
 
 from chatmanager.chat_manager import (
     ChatManager,
     DEFAULT_POLL_INTERVAL_SECONDS,
     MIN_MC_POST_INTERVAL_SECONDS,
     build_chat_payload,
+    chat_fingerprint,
     discord_timestamp,
     format_discord_message_for_mc,
+    next_poll_interval,
     parse_chat_form,
     parse_chat_history,
     truncate_embed_value,
@@ -106,5 +111,46 @@ class ChatManagerParsingTests(unittest.TestCase):
         self.assertEqual(fields["Message"], "Yep 3 more missions to add to the Bermuda mess")
 
 
+class _Value:
+    def __init__(self, value):
+        self.value = value
+        self.set_calls = 0
+
+    async def __call__(self):
+        return self.value
+
+    async def set(self, value):
+        self.set_calls += 1
+        self.value = value
+
+
+class ChatManagerPollingTests(unittest.TestCase):
+    def test_poll_interval_shortens_after_activity_and_backs_off_when_idle(self):
+        intervals = [next_poll_interval(DEFAULT_POLL_INTERVAL_SECONDS, idle) for idle in range(9)]
+
+        self.assertEqual(intervals, [15, 15, 15, 30, 60, 120, 240, 300, 300])
+        self.assertEqual(next_poll_interval(600, 3), 600)
+
+    def test_unchanged_chat_page_skips_parsing_and_config_writes(self):
+        manager = ChatManager.__new__(ChatManager)
+        manager.poll_metrics = {"polls": 0, "parsed": 0, "unchanged": 0, "parse_seconds": 0.0, "last_parse_ms": 0.0}
+        manager._last_chat_fingerprint = ""
+        manager.config = types.SimpleNamespace(last_seen_chat_id=_Value(6941627))
+        manager._fetch_chat_page = AsyncMock(return_value=CHAT_HISTORY_HTML)
+        manager._consume_outgoing_echo = AsyncMock(return_value=False)
+        manager._post_game_chat_to_discord = AsyncMock(return_value=True)
+
+        first = asyncio.run(manager._sync_once())
+        second = asyncio.run(manager._sync_once())
+
+        self.assertEqual(first["posted"], 1)
+        self.assertEqual(second, {"seen": 0, "posted": 0, "skipped_echoes": 0})
+        self.assertEqual(manager.poll_metrics["parsed"], 1)
+        self.assertEqual(manager.poll_metrics["unchanged"], 1)
+        self.assertEqual(manager.config.last_seen_chat_id.value, 6941664)
+        self.assertEqual(manager.config.last_seen_chat_id.set_calls, 1)
+        self.assertEqual(chat_fingerprint("<p>no chat</p>"), "")
+
+
 if __name__ == "__main__":
     unittest.main()
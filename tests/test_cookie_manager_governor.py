@@ -0,0 +1,176 @@
+import asyncio
+import importlib.util
+import sys
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from incomescraper.income_scraper import IncomeScraper
+
+# Loaded by path: the cookie_manager package imports cryptography on import
+_spec = importlib.util.spec_from_file_location(
+    "cookie_manager_request_governor",
+    Path(__file__).resolve().parents[1] / "cookie_manager" / "request_governor.py",
+)
+request_governor = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = request_governor
+_spec.loader.exec_module(request_governor)
+RequestGovernor = request_governor.RequestGovernor
+
+
+class RequestGovernorTests(unittest.TestCase):
+    def test_queued_requests_leave_in_priority_order(self):
+        order = []
+
+        async def run():
+            governor = RequestGovernor(rate_per_second=1000, burst=10, max_concurrency=1)
+            release = asyncio.Event()
+
+            async def holder():
+                async with governor.slot("LogsScraper", "scraper"):
+                    await release.wait()
+
+            async def request(caller, priority):
+                async with governor.slot(caller, priority):
+                    order.append(caller)
+
+            held = asyncio.create_task(holder())
+            await asyncio.sleep(0)
+            waiting = [
+                asyncio.create_task(request("LogsScraper backfill", "backfill")),
+                asyncio.create_task(request("IncomeScraper", "scraper")),
+                asyncio.create_task(request("BoardWatcher", "board")),
+                asyncio.create_task(request("Command", "interactive")),
+            ]
+            await asyncio.sleep(0)
+            self.assertEqual((governor.active, governor.queued), (1, 4))
+            release.set()
+            await asyncio.gather(held, *waiting)
+            return governor
+
+        governor = asyncio.run(run())
+
+        self.assertEqual(order, ["Command", "BoardWatcher", "IncomeScraper", "LogsScraper backfill"])
+        self.assertEqual((governor.active, governor.queued), (0, 0))
+
+    def test_interactive_requests_keep_a_reserved_slot_and_stats_are_per_caller(self):
+        clock = types.SimpleNamespace(now=0.0)
+
+        async def run():
+            governor = RequestGovernor(rate_per_second=1000, burst=10, max_concurrency=2, clock=lambda: clock.now)
+            release = asyncio.Event()
+
+            async def scrape():
+                async with governor.slot("IncomeScraper", "scraper"):
+                    await release.wait()
+                    clock.now += 2.0
+
+            first = asyncio.create_task(scrape())
+            second = asyncio.create_task(scrape())
+            await asyncio.sleep(0)
+            self.assertEqual((governor.active, governor.queued), (1, 1))
+
+            async with governor.slot("CookieManager", "interactive"):
+                clock.now += 0.25
+            with self.assertRaises(RuntimeError):
+                async with governor.slot("CookieManager", "interactive"):
+                    raise RuntimeError("request failed")
+
+            release.set()
+            await asyncio.gather(first, second)
+            with self.assertRaises(ValueError):
+                async with governor.slot("CookieManager", "urgent"):
+                    pass
+            return governor
+
+        governor = asyncio.run(run())
+
+        stats = governor.stats()
+        self.assertEqual(
+            (stats["CookieManager"]["requests"], stats["CookieManager"]["errors"], stats["CookieManager"]["max_latency_ms"]),
+            (2, 1, 250.0),
+        )
+        self.assertEqual(stats["IncomeScraper"]["requests"], 2)
+        # The second scrape stayed queued while the interactive requests and the first scrape ran
+        self.assertEqual(stats["IncomeScraper"]["max_wait_ms"], 2250.0)
+        lines = request_governor.format_governor_stats(governor)
+        self.assertIn("max 2 concurrent (0 active, 0 queued)", lines[0])
+        self.assertEqual(len(lines), 3)
+
+    def test_token_bucket_refills_at_the_configured_rate(self):
+        clock = types.SimpleNamespace(now=0.0)
+
+        async def run():
+            governor = RequestGovernor(rate_per_second=2, burst=2, max_concurrency=3, clock=lambda: clock.now)
+            for _ in range(2):
+                async with governor.slot("LogsScraper"):
+                    pass
+            delays = [governor._token_delay()]
+            clock.now += 0.25
+            delays.append(governor._token_delay())
+            clock.now += 5.0
+            delays.append(governor._token_delay())
+            governor.configure(burst=1)
+            return delays, governor._tokens
+
+        delays, tokens = asyncio.run(run())
+
+        self.assertEqual(delays, [0.5, 0.25, 0.0])
+        self.assertEqual(tokens, 1.0)
+
+    def test_scrapers_use_the_governor_instead_of_a_fixed_sleep(self):
+        slots = []
+
+        class Slot:
+            async def __aenter__(self):
+                return None
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+        def request_slot(caller, priority):
+            slots.append((caller, priority))
+            return Slot()
+
+        scraper = IncomeScraper.__new__(IncomeScraper)
+        governed = types.SimpleNamespace(request_slot=request_slot)
+        legacy = types.SimpleNamespace(get_session=AsyncMock())
+
+        async def use_slot():
+            async with scraper._mc_request_slot():
+                pass
+
+        with patch("incomescraper.mc_requests.asyncio.sleep", new=AsyncMock()) as sleep:
+            scraper.bot = types.SimpleNamespace(get_cog=lambda name: governed)
+            asyncio.run(use_slot())
+            sleep.assert_not_awaited()
+
+            scraper.bot = types.SimpleNamespace(get_cog=lambda name: legacy)
+            asyncio.run(use_slot())
+            sleep.assert_awaited_once_with(1.5)
+
+        self.assertEqual(slots, [("IncomeScraper", "scraper")])
+
+    def test_governed_cogs_package_the_shared_request_slot_locally(self):
+        repo_root = Path(__file__).resolve().parents[1]
+        shared_source = (repo_root / "mc_requests.py").read_text(encoding="utf-8")
+        cog_sources = {
+            "applicationscraper": "applications_scraper.py",
+            "buildingmanager": "buildingmanager.py",
+            "incomescraper": "income_scraper.py",
+            "logscraper": "logs_scraper.py",
+            "trainings_manager": "trainings_manager.py",
+        }
+
+        for cog_folder, source_name in cog_sources.items():
+            with self.subTest(cog_folder=cog_folder):
+                helper_path = repo_root / cog_folder / "mc_requests.py"
+                source = (repo_root / cog_folder / source_name).read_text(encoding="utf-8")
+                self.assertEqual(helper_path.read_text(encoding="utf-8"), shared_source)
+                self.assertIn("from .mc_requests import mc_request_slot", source)
+                self.assertNotIn("FALLBACK_REQUEST_DELAY_SECONDS", source)
+
+
+if __name__ == "__main__":
+    unittest.main()
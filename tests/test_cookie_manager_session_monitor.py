@@ -0,0 +1,144 @@
+import asyncio
+import importlib.util
+import sys
+import types
+import unittest
+from pathlib import Path
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+
+# Loaded by path: the cookie_manager package imports cryptography on import
+_spec = importlib.util.spec_from_file_location(
+    "cookie_manager_session_monitor",
+    Path(__file__).resolve().parents[1] / "cookie_manager" / "session_monitor.py",
+)
+session_monitor = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = session_monitor
+_spec.loader.exec_module(session_monitor)
+SessionMonitor = session_monitor.SessionMonitor
+SessionRules = session_monitor.SessionRules
+
+
+def missionchief_app():
+    async def buildings(request):
+        return web.Response(text='<a href="/users/sign_out">Logout</a><table></table>', content_type="text/html")
+
+    async def api(request):
+        return web.json_response({"credits": 5})
+
+    async def alliance(request):
+        raise web.HTTPFound("/users/sign_in")
+
+    async def sign_in(request):
+        return web.Response(text="<form>Sign in</form>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/buildings", buildings)
+    app.router.add_get("/api/credits", api)
+    app.router.add_get("/verband/kasse", alliance)
+    app.router.add_get("/users/sign_in", sign_in)
+    return app
+
+
+class SessionMonitorTests(unittest.TestCase):
+    def test_shared_session_responses_confirm_the_session_or_start_one_relogin(self):
+        logins = []
+
+        async def run():
+            release = asyncio.Event()
+
+            async def relogin():
+                logins.append("login")
+                await release.wait()
+                return True
+
+            monitor = SessionMonitor(relogin, rules=SessionRules(host="127.0.0.1"))
+            async with TestServer(missionchief_app()) as server:
+                async with ClientSession(response_class=monitor.response_class(monitor.new_generation())) as session:
+
+                    async def get(path):
+                        async with session.get(server.make_url(path)) as response:
+                            return await response.text()
+
+                    await get("/buildings")
+                    self.assertTrue(monitor.confirmed_within(60))
+                    await get("/api/credits")
+                    await asyncio.gather(get("/verband/kasse"), get("/verband/kasse"), get("/verband/kasse"))
+                    self.assertFalse(monitor.confirmed_within(60))
+                    self.assertTrue(monitor.relogin_running)
+                    # A manual login joins the passive one instead of starting another
+                    joined = asyncio.create_task(monitor.relogin("manual login"))
+                    await asyncio.sleep(0)
+                    release.set()
+                    self.assertTrue(await joined)
+            return monitor
+
+        monitor = asyncio.run(run())
+
+        self.assertEqual(logins, ["login"])
+        self.assertTrue(monitor.confirmed_within(60))
+        stats = monitor.stats
+        self.assertEqual((stats.authenticated, stats.logged_out, stats.unclassified), (1, 3, 1))
+        self.assertEqual(stats.relogins, 1)
+        self.assertIn("/users/sign_in", stats.last_relogin_reason)
+        self.assertIn("Monitor re-logins: 1 (0 failed)", session_monitor.format_session_monitor(monitor))
+
+    def test_stale_sessions_and_failed_relogins_do_not_cause_login_storms(self):
+        clock = types.SimpleNamespace(now=0.0)
+        attempts = []
+
+        async def relogin():
+            attempts.append(clock.now)
+            return False
+
+        async def run():
+            monitor = SessionMonitor(relogin, clock=lambda: clock.now)
+            old = monitor.new_generation()
+            monitor.new_generation()
+            sign_in = "https://www.missionchief.com/users/sign_in"
+
+            monitor.observe(sign_in, 200, b"", generation=old)
+            await asyncio.sleep(0)
+            self.assertEqual(attempts, [])
+
+            monitor.observe(sign_in, 200, b"", generation=monitor.generation)
+            await monitor._relogin_task
+            clock.now = 60.0
+            monitor.observe(sign_in, 200, b"", generation=monitor.generation)
+            self.assertFalse(monitor.relogin_running)
+            clock.now = 60.0 + session_monitor.RELOGIN_RETRY_SECONDS
+            monitor.observe(sign_in, 200, b"", generation=monitor.generation)
+            await monitor._relogin_task
+            # An explicit request ignores the back-off
+            self.assertFalse(await monitor.relogin("manual login"))
+            return monitor
+
+        monitor = asyncio.run(run())
+
+        retry_at = 60.0 + session_monitor.RELOGIN_RETRY_SECONDS
+        self.assertEqual(attempts, [0.0, retry_at, retry_at])
+        self.assertEqual((monitor.stats.stale_logged_out, monitor.stats.relogin_failures), (1, 3))
+
+    def test_rules_follow_the_configured_validation(self):
+        rules = SessionRules.from_config(
+            {
+                "check_url": "https://www.missionchief.com/buildings",
+                "success_markers": ["Logout"],
+                "validation_mode": "markers_only",
+            }
+        )
+
+        self.assertEqual(rules.host, "www.missionchief.com")
+        self.assertTrue(rules.page_is_authenticated("https://www.missionchief.com/alliance", "Logout"))
+        self.assertFalse(rules.page_is_authenticated("https://www.missionchief.com/buildings", "no marker"))
+        self.assertEqual(rules.classify("https://www.missionchief.com/api", 401, b""), session_monitor.LOGGED_OUT)
+        self.assertIsNone(rules.classify("https://www.missionchief.com/api", 500, b"Logout"))
+        self.assertIsNone(rules.classify("https://overpass-api.de/users/sign_in", 200, b""))
+        url_only = SessionRules(validation_mode="url_only")
+        self.assertTrue(url_only.page_is_authenticated("https://www.missionchief.com/buildings", ""))
+        self.assertIsNone(url_only.classify("https://www.missionchief.com/buildings", 200, b"Logout"))
+
+
+if __name__ == "__main__":
+    unittest.main()
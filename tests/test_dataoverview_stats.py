@@ -0,0 +1,93 @@
+import asyncio
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from dataoverview.data_overview import DataOverview, _format_time, collect_db_stats
+
+
+def build_database(path):
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE members (member_id INTEGER, timestamp TEXT, scraped_at TEXT)")
+    connection.execute("CREATE INDEX idx_timestamp ON members(timestamp)")
+    connection.execute("CREATE TABLE notes (body TEXT, created_at TEXT)")
+    connection.executemany(
+        "INSERT INTO members VALUES (?, ?, ?)",
+        [(index, f"2026-06-{index:02d}T00:00:00", None) for index in range(20, 0, -1)],
+    )
+    connection.executemany(
+        "INSERT INTO notes VALUES (?, ?)",
+        [("first", "2026-01-01"), ("second", "2026-02-01")],
+    )
+    connection.commit()
+    connection.close()
+
+
+class DataOverviewStatsTests(unittest.TestCase):
+    def test_stats_use_indexes_estimates_and_report_storage(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "members_v2.db"
+            build_database(db_path)
+
+            stats = collect_db_stats(db_path)
+            members = stats["tables"]["members"]
+            self.assertEqual(members["count"], 20)
+            self.assertFalse(members["count_estimated"])
+            self.assertEqual(members["time_column"], "timestamp")
+            self.assertFalse(members["time_approximate"])
+            self.assertEqual(members["min_time"], "2026-06-01T00:00:00")
+            self.assertEqual(members["max_time"], "2026-06-20T00:00:00")
+            self.assertGreaterEqual(members["pages"], 2)
+
+            notes = stats["tables"]["notes"]
+            self.assertTrue(notes["time_approximate"])
+            self.assertEqual((notes["min_time"], notes["max_time"]), ("2026-01-01", "2026-02-01"))
+            self.assertEqual((_format_time(members, "min_time"), _format_time(notes, "max_time")), ("2026-06-01", "~2026-02-01"))
+            self.assertEqual(stats["freelist_count"], 0)
+            self.assertEqual(stats["file_size"], stats["page_count"] * stats["page_size"])
+
+            connection = sqlite3.connect(db_path)
+            connection.execute("ANALYZE")
+            connection.commit()
+            connection.close()
+
+            analyzed = collect_db_stats(db_path)["tables"]["members"]
+            self.assertEqual(analyzed["count"], 20)
+            self.assertTrue(analyzed["count_estimated"])
+
+    def test_stats_are_cached_until_the_file_changes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            build_database(Path(temp_dir) / "members_v2.db")
+            overview = DataOverview.__new__(DataOverview)
+            overview.db_dir = Path(temp_dir)
+
+            first = asyncio.run(overview._get_db_stats("members_v2.db"))
+            second = asyncio.run(overview._get_db_stats("members_v2.db"))
+            self.assertIs(first, second)
+
+            connection = sqlite3.connect(overview.db_dir / "members_v2.db")
+            connection.execute("INSERT INTO notes VALUES ('third', '2026-03-01')")
+            connection.commit()
+            connection.close()
+
+            # Without ANALYZE data the full-scan count is reused for a while and shown as an estimate
+            third = asyncio.run(overview._get_db_stats("members_v2.db"))
+            self.assertIsNot(first, third)
+            self.assertEqual(third["tables"]["notes"]["max_time"], "2026-03-01")
+            self.assertEqual(third["tables"]["notes"]["count"], 2)
+            self.assertTrue(third["tables"]["notes"]["count_estimated"])
+
+            overview._fallback_cache.clear()
+            connection = sqlite3.connect(overview.db_dir / "members_v2.db")
+            connection.execute("INSERT INTO notes VALUES ('fourth', '2026-04-01')")
+            connection.commit()
+            connection.close()
+            fourth = asyncio.run(overview._get_db_stats("members_v2.db"))
+            self.assertEqual(fourth["tables"]["notes"]["count"], 4)
+            self.assertFalse(fourth["tables"]["notes"]["count_estimated"])
+            self.assertIsNone(asyncio.run(overview._get_db_stats("missing.db")))
+
+
+if __name__ == "__main__":
+    unittest.main()
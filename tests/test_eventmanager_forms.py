@@ -1,6 +1,7 @@
+import asyncio
 import unittest
 from datetime import datetime, timezone
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 from zoneinfo import ZoneInfo
 
 from eventmanager.event_manager import (
@@ -82,6 +83,7 @@ from eventmanager.event_manager import (
     parse_location_add_request,
     remove_profile_from_schedule_rotation,
 )
+from eventmanager.mc_actions import MissionChiefActionEngine
 
 
 FORM_HTML = """
@@ -984,6 +986,26 @@ class EventManagerAddressTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(await fake.config.board_guide_post_ids(), {})
         self.assertIsNone(await fake.config.board_last_seen_post_id())
 
+    async def test_start_falls_back_to_the_browser_without_posting_a_non_free_form(self):
+        manager = EventManager.__new__(EventManager)
+        manager._start_lock = asyncio.Lock()
+        manager._actions = MissionChiefActionEngine()
+        manager._resolve_profile_runtime_options = AsyncMock(side_effect=lambda kind, profile: profile)
+        manager._fetch_form = AsyncMock(
+            return_value=parse_event_form(DISABLED_FREE_SUBMIT_HTML, "https://www.missionchief.com/missionAllianceNew")
+        )
+        # FakeSession has no post(): a replayed submit would fail the test
+        manager._get_session = AsyncMock(return_value=FakeSession(FakeResponse("")))
+        manager._resolve_reverse_address = AsyncMock(side_effect=lambda session, kind, payload: payload)
+        manager._start_profile_data_browser = AsyncMock(return_value=EventStartResult(True, "Started in the browser."))
+
+        result = await manager._start_profile_data("large", "home", {})
+
+        self.assertEqual(result.reason, "Started in the browser.")
+        stats = manager._actions.stats["start_large"]
+        self.assertEqual((stats.fallbacks, stats.browser_ok), (1, 1))
+        self.assertIn("non-free", stats.last_fallback_reason)
+
     async def test_next_scheduled_profile_summary_uses_profile_after_current(self):
         profile_names = route_profile_names("event")
         event_locations = route_locations_for_kind("event")
@@ -795,6 +795,54 @@ def test_random_incident_selection_prefers_current_level_ready_missions(monkeypa
     assert incident["id"] == "small_bin_fire"
 
 
+def test_incident_index_only_scores_reachable_tiers_and_caches_per_fleet(monkeypatch):
+    cog = _cog_with_game_data(
+        {
+            "vehicles": {
+                "vehicles": [
+                    {"id": "engine_basic", "required_staff": 4, "capabilities": {"fire_suppression": 40}},
+                ]
+            }
+        }
+    )
+    cog.INCIDENTS = [
+        {
+            "id": "bin_fire",
+            "required_staff": 4,
+            "required_vehicles": ["engine_basic"],
+            "unlock_level": 1,
+            "capabilities": {"fire_suppression": 20},
+        },
+        {
+            "id": "refinery_fire",
+            "required_staff": 30,
+            "required_vehicles": ["engine_basic"],
+            "unlock_level": 8,
+            "capabilities": {"fire_suppression": 400},
+        },
+    ]
+    scored = []
+    compiled_readiness = FireStationCommand._compiled_readiness
+
+    def counting_readiness(compiled, profile):
+        scored.append(compiled["incident"]["id"])
+        return compiled_readiness(compiled, profile)
+
+    cog._compiled_readiness = counting_readiness
+    monkeypatch.setattr("FireStationCommand.fire_station_command.random.random", lambda: 0.9)
+    data = {"command_level": 1, "staff_total": 4, "vehicles": []}
+
+    FireStationCommand._pick_random_incident(cog, data)
+    FireStationCommand._pick_random_incident(cog, data)
+    data["vehicles"] = [{"id": 1, "catalog_id": "engine_basic"}]
+    picked = FireStationCommand._pick_random_incident(cog, data)
+
+    # Refinery is above the challenge limit; the repeat pick reuses the cached profile
+    assert scored == ["bin_fire", "bin_fire"]
+    assert picked["id"] == "bin_fire"
+    assert cog._capability_profile(data)["readiness"] == {0: 100}
+
+
 def test_default_global_config_keeps_manual_gameplay_timers_short():
     cog = _cog_with_game_data(
         {
@@ -0,0 +1,169 @@
+import asyncio
+import types
+
+import pytest
+
+import FireStationCommand.fire_station_command as fsc_module
+
+from FireStationCommand.fire_station_command import FireStationCommand
+from FireStationCommand.player_store import PlayerStore
+
+
+_DEFAULTS = {
+    "started": False,
+    "credits": 0,
+    "vehicles": [],
+    "next_vehicle_id": 1,
+    "equipment": [],
+    "trainings": [],
+    "expansions": [],
+    "command_level": 1,
+    "xp": 0,
+    "reputation": 0,
+    "missions_completed": 0,
+    "station_type": "volunteer",
+    "staff_total": 6,
+    "active_mission": {},
+    "developer_mode": False,
+    "last_daily_at": None,
+}
+
+
+def _store(tmp_path):
+    store = PlayerStore(tmp_path / "fsc_players.db", _DEFAULTS)
+    store.initialize()
+    return store
+
+
+def _fleet(size):
+    return [{"id": index, "catalog_id": "engine_basic", "condition": 100} for index in range(1, size + 1)]
+
+
+def test_config_migration_round_trips_player_blobs_once(tmp_path):
+    store = _store(tmp_path)
+    config_users = {
+        111: {
+            "started": True,
+            "xp": 420,
+            "vehicles": _fleet(2),
+            "equipment": [{"catalog_id": "hose", "quantity": 2}, "basic_tools"],
+            "active_mission": {"stage": "TRAVEL", "incident_id": "bin_fire"},
+            "last_daily_at": "2026-06-12T12:00:00+00:00",
+        },
+        222: {"started": True, "xp": 900, "missions_completed": 3},
+    }
+
+    assert store.import_players(config_users) == 2
+    assert store.import_players({333: {"started": True}}) == 0
+
+    loaded = store.load_player(111)
+    assert loaded == {**_DEFAULTS, **config_users[111]}
+    assert store.load_player(333) == _DEFAULTS
+    assert store.leaderboard("xp") == [(222, 900), (111, 420)]
+    assert store.leaderboard("vehicles", user_ids=[111]) == [(111, 2)]
+    stats = store.stats()
+    assert (stats["players"], stats["xp"], stats["active_missions"], stats["vehicles"]) == (2, 1320, 1, 2)
+    assert stats["top_vehicles"] == [("engine_basic", 2)]
+
+
+def test_vehicle_updates_only_write_changed_rows(tmp_path):
+    store = _store(tmp_path)
+    store.set_field(1, "vehicles", _fleet(50))
+    statements = []
+    connect = store._connect
+
+    def traced_connect():
+        conn = connect()
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    store._connect = traced_connect
+    fleet = _fleet(50)
+    fleet[10]["condition"] = 80
+    del fleet[49]
+    store.set_field(1, "vehicles", fleet)
+
+    upserts = [sql for sql in statements if "INSERT INTO fsc_vehicles" in sql]
+    deletes = [sql for sql in statements if sql.startswith("DELETE FROM fsc_vehicles")]
+    assert len(upserts) == 1
+    assert len(deletes) == 1
+    assert store.load_player(1)["vehicles"] == fleet
+
+
+def test_cog_reads_and_writes_player_state_through_store(tmp_path):
+    cog = object.__new__(FireStationCommand)
+    cog.player_store = _store(tmp_path)
+    user = types.SimpleNamespace(id=55)
+
+    async def run_test():
+        user_conf = cog._player_config(user)
+        await user_conf.started.set(True)
+        await user_conf.active_mission.set({"stage": "SCENE_WORK"})
+        return await user_conf.all(), await user_conf.xp()
+
+    data, xp = asyncio.run(run_test())
+
+    assert data["started"] is True
+    assert data["active_mission"] == {"stage": "SCENE_WORK"}
+    assert xp == 0
+
+
+def test_transaction_commits_an_actions_fields_together(tmp_path):
+    store = _store(tmp_path)
+    store.import_players({111: {"started": True, "xp": 100}})
+    commits = []
+    set_fields = store.set_fields
+    store.set_fields = lambda user_id, values: commits.append(sorted(values)) or set_fields(user_id, values)
+
+    async def award(fail):
+        async with store.transaction(111) as scope:
+            await scope.xp.set(150)
+            await scope.active_mission.set({"stage": "TRAVEL"})
+            assert (await scope.all())["xp"] == 150
+            assert store.load_player(111)["xp"] == 100
+            if fail:
+                raise RuntimeError("action failed")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(award(True))
+    assert store.load_player(111)["active_mission"] == {}
+
+    asyncio.run(award(False))
+    assert commits == [["active_mission", "xp"]]
+    loaded = store.load_player(111)
+    assert (loaded["xp"], loaded["active_mission"]) == (150, {"stage": "TRAVEL"})
+
+
+class _Flag:
+    def __init__(self, value):
+        self.value = value
+
+    async def __call__(self):
+        return self.value
+
+    async def set(self, value):
+        self.value = value
+
+
+def _loading_cog(tmp_path, monkeypatch, *, migrated):
+    cog = object.__new__(FireStationCommand)
+    cog._default_user = _DEFAULTS
+    cog.player_store = None
+    cog.config = types.SimpleNamespace(player_store_migrated=_Flag(migrated))
+    monkeypatch.setattr(fsc_module, "cog_data_path", lambda _cog: tmp_path)
+
+    def broken_initialize(self):
+        raise OSError("disk I/O error")
+
+    monkeypatch.setattr(PlayerStore, "initialize", broken_initialize)
+    return cog
+
+
+def test_broken_store_falls_back_to_config_only_before_migration(tmp_path, monkeypatch):
+    cog = _loading_cog(tmp_path, monkeypatch, migrated=False)
+    asyncio.run(cog.cog_load())
+    assert cog.player_store is None
+
+    cog = _loading_cog(tmp_path, monkeypatch, migrated=True)
+    with pytest.raises(OSError):
+        asyncio.run(cog.cog_load())
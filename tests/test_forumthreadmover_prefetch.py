@@ -0,0 +1,71 @@
+import asyncio
+import types
+import unittest
+
+from forumthreadmover.forumthreadmover import MAX_ATTACHMENT_BYTES, AttachmentPrefetcher
+
+
+class FakeAttachment:
+    def __init__(self, filename, size, events):
+        self.filename = filename
+        self.size = size
+        self.url = f"https://cdn.example/{filename}"
+        self.events = events
+
+    async def read(self):
+        self.events.append(("start", self.filename))
+        await asyncio.sleep(0.01)
+        self.events.append(("done", self.filename))
+        return b"x" * self.size
+
+
+def message(message_id, *attachments):
+    return types.SimpleNamespace(id=message_id, attachments=list(attachments))
+
+
+class AttachmentPrefetcherTests(unittest.TestCase):
+    def test_downloads_overlap_within_the_memory_budget_and_keep_order(self):
+        async def run():
+            events = []
+            messages = [
+                message(index, FakeAttachment(f"{index}-a.png", 40, events), FakeAttachment(f"{index}-b.png", 40, events))
+                for index in range(4)
+            ]
+            prefetcher = AttachmentPrefetcher(messages, concurrency=4, memory_budget=160, spool_threshold=1000).start()
+            posted = []
+            try:
+                for current in messages:
+                    files, notes = await prefetcher.get(current)
+                    posted.append([file.filename for file in files])
+                    self.assertLessEqual(prefetcher._reserved, 160)
+                    await prefetcher.release(current)
+            finally:
+                await prefetcher.aclose()
+            return events, posted, prefetcher
+
+        events, posted, prefetcher = asyncio.run(run())
+        self.assertEqual(posted, [[f"{index}-a.png", f"{index}-b.png"] for index in range(4)])
+        # Two messages fit in the budget, so the second message downloads alongside the first
+        self.assertLess(events.index(("start", "1-a.png")), events.index(("done", "0-a.png")))
+        self.assertEqual(prefetcher.peak_reserved, 160)
+        self.assertEqual(prefetcher.bytes_downloaded, 320)
+        self.assertIn("8 files", prefetcher.throughput(4, 4))
+
+    def test_oversized_attachments_become_links_and_a_large_message_still_proceeds(self):
+        async def run():
+            events = []
+            too_large = FakeAttachment("video.mp4", MAX_ATTACHMENT_BYTES + 1, events)
+            big = message(1, FakeAttachment("big.png", 500, events), too_large)
+            prefetcher = AttachmentPrefetcher([big], memory_budget=100, spool_threshold=1000).start()
+            try:
+                return await asyncio.wait_for(prefetcher.get(big), timeout=1)
+            finally:
+                await prefetcher.aclose()
+
+        files, notes = asyncio.run(run())
+        self.assertEqual([file.filename for file in files], ["big.png"])
+        self.assertEqual(notes, ["📎 [video.mp4](https://cdn.example/video.mp4) (File too large, see original)"])
+
+
+if __name__ == "__main__":
+    unittest.main()
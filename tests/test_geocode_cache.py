@@ -0,0 +1,137 @@
+import asyncio
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+from geocode_cache import (
+    GeocodeCache,
+    ProviderRateLimiter,
+    normalize_geocode_query,
+    shared_geocode_cache,
+)
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class GeocodeCacheTests(unittest.TestCase):
+    def test_geocoding_cogs_package_the_shared_cache_locally(self):
+        repo_root = Path(__file__).resolve().parents[1]
+        shared_source = (repo_root / "geocode_cache.py").read_text(encoding="utf-8")
+        cog_sources = {
+            "eventpinger": "eventpinger.py",
+            "eventmanager": "event_manager.py",
+            "buildingmanager": "buildingmanager.py",
+        }
+
+        for cog_folder, source_name in cog_sources.items():
+            with self.subTest(cog_folder=cog_folder):
+                helper_path = repo_root / cog_folder / "geocode_cache.py"
+                self.assertEqual(helper_path.read_text(encoding="utf-8"), shared_source)
+                self.assertIn(
+                    "from .geocode_cache import",
+                    (repo_root / cog_folder / source_name).read_text(encoding="utf-8"),
+                )
+
+    def test_entries_expire_negative_entries_sooner_and_lru_evicts(self):
+        clock = FakeClock()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = GeocodeCache(
+                Path(temp_dir) / "geocode_cache.db",
+                max_entries=3,
+                ttl=100,
+                negative_ttl=10,
+                clock=clock,
+            )
+            cache.put_sync("ns", normalize_geocode_query("  Main  Street "), [{"lat": "1"}])
+            cache.put_sync("ns", "nowhere", [])
+
+            self.assertEqual(asyncio.run(cache.get("ns", "main street")), [{"lat": "1"}])
+            self.assertEqual(asyncio.run(cache.get("ns", "Nowhere")), [])
+
+            clock.now += 11
+            self.assertIsNone(asyncio.run(cache.get("ns", "nowhere")))
+            self.assertEqual(asyncio.run(cache.get("ns", "main street")), [{"lat": "1"}])
+
+            for index in range(2):
+                clock.now += 1
+                cache.put_sync("ns", f"filler {index}", [index])
+            clock.now += 1
+            cache.get_sync("ns", "main street")
+            clock.now += 1
+            cache.put_sync("ns", "newest", [9])
+
+            stats = cache.stats_sync()
+            self.assertEqual(stats["entries"], 2)
+            self.assertEqual(stats["evicted"], 2)
+            self.assertIsNone(asyncio.run(cache.get("ns", "filler 0")))
+            self.assertIsNone(asyncio.run(cache.get("ns", "filler 1")))
+            self.assertEqual(asyncio.run(cache.get("ns", "main street")), [{"lat": "1"}])
+            cache.close()
+
+    def test_concurrent_lookups_share_one_fetch_and_errors_are_not_cached(self):
+        async def run():
+            cache = GeocodeCache()
+            calls = []
+            release = asyncio.Event()
+
+            async def fetch():
+                calls.append("fetch")
+                await release.wait()
+                return [{"lat": "52.1"}]
+
+            lookups = [
+                asyncio.create_task(cache.lookup("ns", query, fetch))
+                for query in ("Dam 1 Amsterdam", "dam 1  amsterdam", "DAM 1 AMSTERDAM")
+            ]
+            await asyncio.sleep(0.05)
+            release.set()
+            results = await asyncio.gather(*lookups)
+
+            self.assertEqual(calls, ["fetch"])
+            self.assertEqual(results, [([{"lat": "52.1"}], False)] * 3)
+            self.assertEqual(cache.metrics["shared"], 2)
+            self.assertEqual(await cache.lookup("ns", "dam 1 amsterdam", fetch), ([{"lat": "52.1"}], True))
+
+            async def failing():
+                raise RuntimeError("provider down")
+
+            with self.assertRaises(RuntimeError):
+                await cache.lookup("ns", "elsewhere", failing)
+            self.assertIsNone(await cache.get("ns", "elsewhere"))
+
+        asyncio.run(run())
+
+    def test_rate_limiter_spaces_calls_per_provider(self):
+        clock = FakeClock(0.0)
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(round(seconds, 3))
+            clock.now += seconds
+
+        limiter = ProviderRateLimiter({"nominatim": 1.0, "google": 0.0}, clock=clock, sleep=fake_sleep)
+
+        async def run():
+            await limiter.wait("nominatim")
+            clock.now += 0.25
+            await limiter.wait("nominatim")
+            await limiter.wait("google")
+            await limiter.wait("google")
+
+        asyncio.run(run())
+        self.assertEqual(sleeps, [0.75])
+
+    def test_shared_cache_lives_on_the_bot(self):
+        bot = types.SimpleNamespace()
+        self.assertIs(shared_geocode_cache(bot, None), shared_geocode_cache(bot))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,13 +2,52 @@ import asyncio
 import sqlite3
 import tempfile
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 from zoneinfo import ZoneInfo
 
 from incomescraper.income_scraper import IncomeScraper
 
+# Yearless expense dates are resolved against the scrape time, so tests pin it
+SCRAPED_AT = datetime(2026, 6, 15, 16, 0, tzinfo=ZoneInfo("UTC"))
+
+
+def expenses_page(*rows):
+    body = "".join(
+        f"<tr><td>{amount:,} Credits</td><td><a href='/profile/1'>{name}</a></td>"
+        f"<td>{description}</td><td>{date}</td></tr>"
+        for amount, name, description, date in rows
+    )
+    header = "<tr><th>Credits</th><th>Name</th><th>Description</th><th>Date</th></tr>"
+    return f"<html><body>{'<!-- padding -->' * 80}<table>{header}{body}</table></body></html>"
+
+
+class FakeResponse:
+    def __init__(self, html):
+        self.status = 200
+        self.html = html
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def text(self):
+        return self.html
+
+
+class FakeSession:
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+
+    def get(self, url):
+        self.requested.append(url)
+        page = int(url.rsplit("page=", 1)[1]) if "page=" in url else 1
+        return FakeResponse(self.pages[page - 1] if page <= len(self.pages) else expenses_page())
+
 
 class IncomeScraperContractTests(unittest.TestCase):
     def test_next_pre_reset_snapshot_is_2355_new_york(self):
@@ -82,6 +121,7 @@ class IncomeScraperContractTests(unittest.TestCase):
             scraper = IncomeScraper.__new__(IncomeScraper)
             scraper.db_path = Path(temp_dir) / "income.db"
             scraper._scrape_lock = asyncio.Lock()
+            scraper._utcnow = lambda: SCRAPED_AT
             scraper._get_session = AsyncMock(return_value=object())
             scraper._scrape_income_tab = AsyncMock(return_value=[])
             scraper._debug_log = AsyncMock()
@@ -91,7 +131,7 @@ class IncomeScraperContractTests(unittest.TestCase):
                 "username": "Member",
                 "amount": 25000,
                 "description": "Extended guard",
-                "source_date": datetime.now(ZoneInfo("America/New_York")).strftime(
+                "source_date": SCRAPED_AT.astimezone(ZoneInfo("America/New_York")).strftime(
                     "%d %b %H:%M"
                 ),
             }
@@ -125,5 +165,55 @@ class IncomeScraperContractTests(unittest.TestCase):
         self.assertEqual(count, 4)
 
 
+    def test_incremental_refresh_stops_at_first_stored_page_and_records_high_water_mark(self):
+        today = SCRAPED_AT.astimezone(ZoneInfo("America/New_York"))
+        recent = (today - timedelta(hours=1)).strftime("%d %b %H:%M")
+        older = (today - timedelta(hours=2)).strftime("%d %b %H:%M")
+        first_pages = [
+            expenses_page((5000, "Member", "Guard", recent)),
+            expenses_page((7000, "Member", "Building", older), (7000, "Member", "Building", older)),
+            expenses_page((9000, "Other", "Extension", "01 Feb 06:52")),
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            scraper = IncomeScraper.__new__(IncomeScraper)
+            scraper.db_path = Path(temp_dir) / "income.db"
+            scraper.income_url = "https://www.missionchief.com/verband/kasse"
+            scraper.debug_mode = False
+            scraper._scrape_lock = asyncio.Lock()
+            scraper._utcnow = lambda: SCRAPED_AT
+            scraper._scrape_income_tab = AsyncMock(return_value=[])
+            scraper._debug_log = AsyncMock()
+            scraper._report_bot_status = AsyncMock()
+            scraper._init_database()
+
+            def run(pages, **kwargs):
+                session = FakeSession(pages)
+                scraper._get_session = AsyncMock(return_value=session)
+                with patch("incomescraper.income_scraper.asyncio.sleep", new=AsyncMock()):
+                    asyncio.run(scraper._scrape_all_income(include_expenses=True, max_expense_pages=3, **kwargs))
+                return session
+
+            run(first_pages)
+            newest = (today - timedelta(minutes=5)).strftime("%d %b %H:%M")
+            session = run([expenses_page((3000, "Member", "Guard", newest)), *first_pages])
+
+            connection = sqlite3.connect(scraper.db_path)
+            count = connection.execute("SELECT COUNT(*) FROM expenses").fetchone()[0]
+            run_row = connection.execute(
+                "SELECT pages_attempted, message, high_water_mark FROM scrape_runs ORDER BY run_id DESC LIMIT 1"
+            ).fetchone()
+            connection.close()
+
+            deep = run([expenses_page((3000, "Member", "Guard", newest)), *first_pages], incremental=False)
+
+        self.assertEqual(count, 5)
+        self.assertEqual(len(session.requested), 2)
+        self.assertEqual(run_row[0], 2)
+        self.assertIn("1 new, stopped at stored page 2", run_row[1])
+        self.assertTrue(run_row[2].startswith(today.astimezone(ZoneInfo("UTC")).strftime("%Y-")))
+        self.assertEqual(len(deep.requested), 3)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,224 @@
+import asyncio
+import types
+import unittest
+from pathlib import Path
+
+from mc_actions import (
+    BrowserPool,
+    MissionChiefActionEngine,
+    ReplayUnavailable,
+    format_action_stats,
+    shared_action_engine,
+)
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+
+    def set_default_timeout(self, timeout):
+        self.timeout = timeout
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, viewport):
+        self.viewport = viewport
+        self.cookies = []
+        self.closed = False
+
+    async def add_cookies(self, cookies):
+        self.cookies.extend(cookies)
+
+    async def new_page(self):
+        return FakePage(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    async def new_context(self, viewport):
+        context = FakeContext(viewport)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.stopped = False
+
+    async def stop(self):
+        self.stopped = True
+
+
+def cookies(value):
+    return [{"name": "_session_id", "value": value, "url": "https://www.missionchief.com"}]
+
+
+class MissionChiefActionEngineTests(unittest.TestCase):
+    def test_action_cogs_package_the_shared_engine_locally(self):
+        repo_root = Path(__file__).resolve().parents[1]
+        shared_source = (repo_root / "mc_actions.py").read_text(encoding="utf-8")
+        cog_sources = {
+            "buildingmanager": "buildingmanager.py",
+            "eventmanager": "event_manager.py",
+        }
+
+        for cog_folder, source_name in cog_sources.items():
+            with self.subTest(cog_folder=cog_folder):
+                helper_path = repo_root / cog_folder / "mc_actions.py"
+                self.assertEqual(helper_path.read_text(encoding="utf-8"), shared_source)
+                self.assertIn(
+                    "from .mc_actions import",
+                    (repo_root / cog_folder / source_name).read_text(encoding="utf-8"),
+                )
+
+    def test_replay_result_stands_and_unavailable_replays_fall_back_to_the_browser(self):
+        clock = FakeClock()
+        engine = MissionChiefActionEngine(clock=clock)
+        browser_calls = []
+
+        async def replay_ok():
+            clock.now += 0.2
+            return types.SimpleNamespace(ok=True, path="replay")
+
+        async def replay_failed():
+            # Submitted and rejected: the browser must not post a second time
+            clock.now += 0.3
+            return types.SimpleNamespace(ok=False, path="replay")
+
+        async def replay_unavailable():
+            raise ReplayUnavailable("form was not free")
+
+        async def browser():
+            browser_calls.append(True)
+            clock.now += 4.0
+            return types.SimpleNamespace(ok=True, path="browser")
+
+        async def run():
+            results = [
+                await engine.run("start_event", browser, replay=replay_ok),
+                await engine.run("start_event", browser, replay=replay_failed),
+                await engine.run("start_event", browser, replay=replay_unavailable),
+                await engine.run("building_create", browser),
+            ]
+            return [result.path for result in results]
+
+        paths = asyncio.run(run())
+
+        self.assertEqual(paths, ["replay", "replay", "browser", "browser"])
+        self.assertEqual(len(browser_calls), 2)
+        stats = engine.stats["start_event"]
+        self.assertEqual((stats.replay_ok, stats.replay_failed, stats.fallbacks, stats.browser_ok), (1, 1, 1, 1))
+        self.assertAlmostEqual(stats.fallback_rate, 1 / 3)
+        self.assertIsNone(engine.stats["building_create"].fallback_rate)
+        lines = format_action_stats(engine)
+        self.assertIn("building_create: replay 0 ok / 0 failed, browser 1 ok / 0 failed, fallback rate n/a", lines)
+        self.assertIn("start_event: replay 1 ok / 1 failed, browser 1 ok / 0 failed, fallback rate 33%", lines)
+        self.assertIn("  last fallback: form was not free", lines)
+
+    def test_unavailable_replays_are_recognized_across_module_copies(self):
+        class OtherCopyReplayUnavailable(Exception):
+            replay_unavailable = True
+
+        async def replay():
+            raise OtherCopyReplayUnavailable("no session")
+
+        async def browser():
+            return "browser"
+
+        async def failing_replay():
+            raise RuntimeError("POST timed out")
+
+        engine = MissionChiefActionEngine()
+
+        self.assertEqual(asyncio.run(engine.run("lookup", browser, replay=replay)), "browser")
+        with self.assertRaises(RuntimeError):
+            asyncio.run(engine.run("lookup", browser, replay=failing_replay))
+        self.assertEqual((engine.stats["lookup"].fallbacks, engine.stats["lookup"].replay_failed), (1, 1))
+
+    def test_shared_engine_lives_on_the_bot(self):
+        bot = types.SimpleNamespace()
+
+        self.assertIs(shared_action_engine(bot), shared_action_engine(bot))
+
+
+class BrowserPoolTests(unittest.TestCase):
+    def test_pool_reuses_one_browser_and_rebuilds_the_context_when_cookies_change(self):
+        launched = []
+
+        async def launcher():
+            launched.append((FakePlaywright(), FakeBrowser()))
+            return launched[-1]
+
+        async def run():
+            pool = BrowserPool(idle_seconds=60, launcher=launcher)
+            async with pool.page(cookies("a")) as first:
+                async with pool.page(cookies("a")) as second:
+                    self.assertIs(first.context, second.context)
+                async with pool.page(cookies("b")) as refreshed:
+                    pass
+            self.assertTrue(first.closed and refreshed.closed)
+            self.assertFalse(refreshed.context.closed)
+            # The old context was closed once its last page was done with it
+            self.assertTrue(first.context.closed)
+            self.assertEqual(first.context.cookies, cookies("a"))
+            self.assertEqual(first.timeout, 30000)
+            self.assertTrue(pool.running)
+            return pool
+
+        pool = asyncio.run(run())
+
+        self.assertEqual(len(launched), 1)
+        self.assertEqual((pool.launches, pool.contexts_created), (1, 2))
+
+    def test_idle_pool_closes_the_browser_and_relaunches_on_demand(self):
+        launched = []
+
+        async def launcher():
+            launched.append((FakePlaywright(), FakeBrowser()))
+            return launched[-1]
+
+        async def run():
+            pool = BrowserPool(idle_seconds=0.01, launcher=launcher)
+            async with pool.page(cookies("a")):
+                pass
+            await asyncio.sleep(0.05)
+            self.assertFalse(pool.running)
+            async with pool.page(cookies("a")):
+                pass
+            await pool.close()
+            return pool
+
+        pool = asyncio.run(run())
+
+        self.assertEqual(pool.launches, 2)
+        playwright, browser = launched[0]
+        self.assertTrue(playwright.stopped and browser.closed)
+        self.assertTrue(launched[1][1].closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,19 @@
 import asyncio
+import sqlite3
+import tempfile
 import types
 import unittest
+from pathlib import Path
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock
 
 from MemberManager import automation as automation_module
 from MemberManager.automation import ContributionMonitor
+from MemberManager.database import MemberDatabase
 from MemberManager.membermanager import MemberManager
 from MemberManager.models import MemberData
 from MemberManager.views import MemberOverviewView
+from membersscraper.members_scraper import MembersScraper
 
 
 class MemberManagerContributionTests(unittest.TestCase):
@@ -199,6 +204,107 @@ class MemberManagerContributionTests(unittest.TestCase):
         self.assertEqual(monitor._send_contribution_alert.await_count, 2)
         self.assertEqual(len(monitor._last_alerts), 2)
 
+    def test_membersscraper_contribution_overview_is_single_bulk_query(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = str(Path(temp_dir) / "members.db")
+            connection = sqlite3.connect(db_path)
+            connection.execute(
+                "CREATE TABLE members (member_id INTEGER, contribution_rate REAL, timestamp TEXT)"
+            )
+            connection.executemany(
+                "INSERT INTO members VALUES (?, ?, ?)",
+                [
+                    (456, 1.0, "2026-06-01T12:00:00"),
+                    (456, 2.0, "2026-06-02T12:00:00"),
+                    (456, 3.0, "2026-06-03T12:00:00"),
+                    (789, 9.0, "2026-06-02T12:00:00"),
+                ],
+            )
+            connection.commit()
+            connection.close()
+            scraper = MembersScraper.__new__(MembersScraper)
+            scraper.db_path = db_path
+
+            overview = asyncio.run(scraper.get_members_contribution_overview(limit=2))
+
+        self.assertEqual(overview["456"]["first_seen"], "2026-06-01T12:00:00")
+        self.assertEqual(overview["456"]["history"], [3.0, 2.0])
+        self.assertEqual(overview["789"]["history"], [9.0])
+
+    def test_contribution_monitor_prefers_bulk_overview(self):
+        members_scraper = types.SimpleNamespace(
+            get_members=AsyncMock(
+                return_value=[
+                    {"mc_user_id": "456", "name": "LowTaxMember", "contribution_rate": 1.0},
+                    {"mc_user_id": "789", "name": "NewMember", "contribution_rate": 1.0},
+                ]
+            ),
+            get_members_contribution_overview=AsyncMock(
+                return_value={
+                    "456": {"first_seen": "2026-01-01T00:00:00", "history": [1.0] * 8},
+                    "789": {"first_seen": datetime.now(timezone.utc).isoformat(), "history": [1.0] * 8},
+                }
+            ),
+            get_member_contribution_history=AsyncMock(return_value=[]),
+        )
+        monitor = ContributionMonitor(
+            bot=types.SimpleNamespace(get_cog=lambda name: None),
+            db=types.SimpleNamespace(),
+            config=types.SimpleNamespace(contribution_threshold=AsyncMock(return_value=5.0)),
+            member_source=members_scraper,
+        )
+        monitor._send_contribution_alert = AsyncMock(return_value=True)
+
+        asyncio.run(monitor._check_all_contributions())
+
+        members_scraper.get_members_contribution_overview.assert_awaited_once_with(limit=8)
+        members_scraper.get_member_contribution_history.assert_not_awaited()
+        monitor._send_contribution_alert.assert_awaited_once()
+        self.assertEqual(list(monitor._last_alerts), ["456"])
+
+    def test_contribution_alert_cooldown_survives_restart(self):
+        async def run_test():
+            with tempfile.TemporaryDirectory() as temp_dir:
+                database = MemberDatabase(str(Path(temp_dir) / "membermanager.db"))
+                await database.initialize()
+                try:
+                    members_scraper = types.SimpleNamespace(
+                        get_members=AsyncMock(
+                            return_value=[
+                                {"mc_user_id": "456", "name": "LowTaxMember", "contribution_rate": 1.0}
+                            ]
+                        ),
+                        get_member_contribution_history=AsyncMock(return_value=[1.0] * 4),
+                    )
+
+                    def make_monitor():
+                        monitor = ContributionMonitor(
+                            bot=types.SimpleNamespace(get_cog=lambda name: None),
+                            db=database,
+                            config=types.SimpleNamespace(
+                                contribution_threshold=AsyncMock(return_value=5.0)
+                            ),
+                            member_source=members_scraper,
+                        )
+                        monitor._send_contribution_alert = AsyncMock(return_value=True)
+                        return monitor
+
+                    first = make_monitor()
+                    await first._check_all_contributions()
+                    restarted = make_monitor()
+                    await restarted._check_all_contributions()
+                    stored = await database.get_contribution_alert_times()
+                finally:
+                    await database.close()
+                return first, restarted, stored
+
+        first, restarted, stored = asyncio.run(run_test())
+
+        first._send_contribution_alert.assert_awaited_once()
+        restarted._send_contribution_alert.assert_not_awaited()
+        self.assertEqual(list(stored), ["456"])
+        self.assertEqual(restarted._last_alerts["456"], stored["456"])
+
     def test_membermanager_resolves_membersscraper_member_by_name(self):
         members_scraper = types.SimpleNamespace(
             get_members=AsyncMock(
@@ -0,0 +1,93 @@
+import asyncio
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from MemberManager.database import MemberDatabase
+from MemberManager.membermanager import MemberManager
+from MemberManager.models import MemberData
+from MemberManager.profile_cache import MemberProfileCache
+
+
+def _make_cog(db=None):
+    cog = MemberManager.__new__(MemberManager)
+    cog.membersync = None
+    cog.members_scraper = None
+    cog.logs_scraper = None
+    cog.sanction_manager = None
+    cog.db = db
+    cog._profile_cache = MemberProfileCache()
+    cog._last_profile_timings = {}
+    return cog
+
+
+class MemberProfileCacheTests(unittest.TestCase):
+    def test_profile_is_served_from_cache_until_refresh(self):
+        cog = _make_cog()
+        cog._assemble_member_data = AsyncMock(
+            side_effect=lambda guild, discord_id, mc_user_id: MemberData(
+                discord_id=discord_id,
+                mc_user_id=mc_user_id,
+            )
+        )
+        guild = types.SimpleNamespace(id=1)
+
+        first = asyncio.run(cog._build_member_data(guild, mc_user_id="456"))
+        first.notes_count = 99
+        second = asyncio.run(cog._build_member_data(guild, mc_user_id="456"))
+        asyncio.run(cog._build_member_data(guild, mc_user_id="456", use_cache=False))
+
+        self.assertEqual(cog._assemble_member_data.await_count, 2)
+        self.assertEqual(second.notes_count, 0)
+        self.assertEqual(cog._profile_cache.hits, 1)
+
+    def test_invalidate_matches_resolved_identity(self):
+        cache = MemberProfileCache()
+        key = cache.make_key(1, 123, None)
+        cache.set(key, MemberData(discord_id=123, mc_user_id="456"))
+        cache.set(cache.make_key(2, 123, None), MemberData(discord_id=123, mc_user_id="456"))
+
+        removed = cache.invalidate(guild_id=1, mc_user_id="456")
+
+        self.assertEqual(removed, 1)
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(len(cache), 1)
+
+    def test_note_write_invalidates_cached_profile(self):
+        async def run_test():
+            with tempfile.TemporaryDirectory() as temp_dir:
+                database = MemberDatabase(str(Path(temp_dir) / "membermanager.db"))
+                await database.initialize()
+                try:
+                    cog = _make_cog(db=database)
+                    database.add_write_listener(cog._profile_cache.invalidate)
+                    guild = types.SimpleNamespace(id=1, get_member=lambda member_id: None)
+
+                    before = await cog._build_member_data(guild, mc_user_id="456")
+                    await database.add_note(
+                        guild_id=1,
+                        discord_id=None,
+                        mc_user_id="456",
+                        note_text="Fixture note",
+                        author_id=999,
+                        author_name="Admin",
+                    )
+                    after = await cog._build_member_data(guild, mc_user_id="456")
+                finally:
+                    await database.close()
+                return before, after
+
+        before, after = asyncio.run(run_test())
+
+        self.assertEqual(before.notes_count, 0)
+        self.assertEqual(after.notes_count, 1)
+        self.assertEqual(
+            set(after.source_timings),
+            {"membersync", "missionchief", "notes", "sanctions", "watchlist"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
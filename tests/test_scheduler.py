@@ -0,0 +1,130 @@
+import asyncio
+import tempfile
+import time
+import types
+import unittest
+from pathlib import Path
+
+from scheduler.scheduler import Scheduler, SchedulerStore
+
+
+class _OwnerCog:
+    def __init__(self, *, fail=False):
+        self.jobs = []
+        self.fail = fail
+
+    async def handle_scheduled_job(self, job):
+        self.jobs.append(job)
+        if self.fail:
+            raise RuntimeError("handler failed")
+
+
+def _make_scheduler(db_path, cogs):
+    scheduler = Scheduler.__new__(Scheduler)
+    scheduler.bot = types.SimpleNamespace(cogs=cogs, get_cog=cogs.get)
+    scheduler.store = SchedulerStore(db_path)
+    scheduler.store.initialize()
+    scheduler._handlers = {}
+    scheduler._wake = asyncio.Event()
+    scheduler._task = None
+    scheduler.stats = {"wakeups": 0, "fired": 0, "failed": 0, "dropped": 0}
+    return scheduler
+
+
+class SchedulerTests(unittest.TestCase):
+    def test_keyed_jobs_are_rescheduled_instead_of_duplicated(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = SchedulerStore(Path(temp_dir) / "scheduler.db")
+            store.initialize()
+
+            first = store.add("Owner", 200.0, {"step": 1}, key="mission:1")
+            second = store.add("Owner", 100.0, {"step": 2}, key="mission:1")
+            store.add("Owner", 150.0, {"step": 3})
+
+            jobs = store.due_jobs(["Owner"], now=300.0)
+
+        self.assertEqual(first, second)
+        self.assertEqual([job["payload"]["step"] for job in jobs], [2, 3])
+        self.assertEqual(jobs[0]["late_seconds"], 200.0)
+
+    def test_overdue_jobs_fire_after_restart_for_loaded_owners_only(self):
+        async def run_test(db_path):
+            owner = _OwnerCog()
+            before_restart = _make_scheduler(db_path, {})
+            await before_restart.schedule("Owner", time.time() - 60, {"text": "missed"})
+            await before_restart.schedule("Unloaded", time.time() - 60, {"text": "waits"})
+
+            restarted = _make_scheduler(db_path, {"Owner": owner})
+            fired = await restarted.run_due_jobs()
+            remaining = restarted.store.counts_by_owner()
+            return owner, fired, remaining
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            owner, fired, remaining = asyncio.run(run_test(Path(temp_dir) / "scheduler.db"))
+
+        self.assertEqual(fired, 1)
+        self.assertEqual(owner.jobs[0]["payload"], {"text": "missed"})
+        self.assertEqual(list(remaining), ["Unloaded"])
+
+    def test_failed_job_is_retried_later(self):
+        async def run_test(db_path):
+            owner = _OwnerCog(fail=True)
+            scheduler = _make_scheduler(db_path, {"Owner": owner})
+            await scheduler.schedule("Owner", time.time() - 1, {})
+            await scheduler.run_due_jobs()
+            next_due = scheduler.store.next_due_at(["Owner"])
+            return scheduler, next_due
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            scheduler, next_due = asyncio.run(run_test(Path(temp_dir) / "scheduler.db"))
+
+        self.assertEqual(scheduler.stats["failed"], 1)
+        self.assertGreater(next_due, time.time())
+
+    def test_job_scheduled_during_a_run_wakes_the_loop(self):
+        async def run_test(db_path):
+            owner = _OwnerCog()
+            scheduler = _make_scheduler(db_path, {"Owner": owner})
+            scheduler.bot.wait_until_red_ready = lambda: asyncio.sleep(0)
+            in_run = asyncio.Event()
+            release = asyncio.Event()
+            run_due_jobs = scheduler.run_due_jobs
+            next_due_at = scheduler.store.next_due_at
+            calls = []
+
+            async def suspended_run_due_jobs():
+                calls.append(None)
+                if len(calls) == 1:
+                    in_run.set()
+                    await release.wait()
+                    return 0
+                return await run_due_jobs()
+
+            def stale_next_due_at(owners):
+                # The first lookup misses the job, as if it committed just after the query
+                return None if len(calls) == 1 else next_due_at(owners)
+
+            scheduler.run_due_jobs = suspended_run_due_jobs
+            scheduler.store.next_due_at = stale_next_due_at
+            task = asyncio.create_task(scheduler._run())
+            try:
+                await in_run.wait()
+                await scheduler.schedule("Owner", time.time() - 1, {"text": "late"})
+                release.set()
+                for _ in range(200):
+                    if owner.jobs:
+                        break
+                    await asyncio.sleep(0.01)
+            finally:
+                task.cancel()
+            return owner
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            owner = asyncio.run(run_test(Path(temp_dir) / "scheduler.db"))
+
+        # Fired within two seconds instead of after IDLE_RECHECK_SECONDS
+        self.assertEqual([job["payload"] for job in owner.jobs], [{"text": "late"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock
 
 from trainings_manager.trainings_manager import (
     AUTO_BUILDING_LIST_PATH,
+    AcademyPageCache,
     AutoTrainingResult,
     BoardTrainingPost,
     BoardTrainingMatch,
@@ -28,6 +29,8 @@ from trainings_manager.trainings_manager import (
     parse_profile_username,
     parse_training_board_page,
 )
+from trainings_manager import trainings_manager as trainings_manager_module
+from trainings_manager.training_matcher import ChunkProfile, PhraseTrie, containing_phrases
 
 
 ACADEMY_HTML = """
@@ -362,6 +365,7 @@ def _manager(*, session=None, contribution_rate=None, member_link=None, member_s
     )
     manager = TrainingManager.__new__(TrainingManager)
     manager.bot = bot
+    manager._academy_pages = AcademyPageCache()
     return manager, guild, user, session or cookie_manager.get_session.return_value
 
 
@@ -452,6 +456,34 @@ def test_board_fire_wildland_mobile_command_typo_matches_wildland_training():
     ) is None
 
 
+def test_phrase_trie_finds_whole_word_runs_only():
+    trie = PhraseTrie(["mobile command", "wildland mobile command center", "hazmat"])
+
+    assert trie.find("need wildland mobile command center and hazmat".split()) == {
+        "mobile command",
+        "wildland mobile command center",
+        "hazmat",
+    }
+    assert trie.find("hazmatic mobile".split()) == set()
+    assert containing_phrases("mobile command", ["wildland mobile command center", "mobile commander"]) == {
+        "wildland mobile command center"
+    }
+
+
+def test_board_training_catalog_is_compiled_once_and_bounds_never_undershoot():
+    compiled = trainings_manager_module._compiled_training_catalog()
+
+    assert trainings_manager_module._compiled_training_catalog() is compiled
+    assert extract_board_training_matches("Can I get hotshot crew traning and HazMat?")
+    assert trainings_manager_module._compiled_training_catalog() is compiled
+    chunk = "fire wildland mobile comand center 1 class"
+    profile = ChunkProfile(chunk)
+    for candidates in compiled.candidates:
+        for candidate in candidates:
+            score = trainings_manager_module._candidate_training_score(chunk, candidate)
+            assert compiled.score_bound(candidate, profile) >= score
+
+
 def test_ambiguous_board_training_request_explains_lifeguard_options():
     explanation = describe_ambiguous_board_training_request("Lifeguard Training")
 
@@ -937,6 +969,49 @@ def test_collect_training_availability_counts_classrooms_by_discipline():
     assert availability["EMS"].available_classrooms == 4
 
 
+def test_collect_training_availability_reuses_cached_and_full_academy_pages():
+    clock = types.SimpleNamespace(now=0.0)
+    full_html = NO_ROOM_ACADEMY_HTML.replace(
+        '<option value="1">1</option>', ""
+    ).replace(
+        "</body>",
+        "<script>educationCountdown(7200, 'education_schooling_1');</script>"
+        "<script>educationCountdown(1800, 'education_schooling_2');</script></body>",
+    )
+    session = _Session(
+        {
+            f"https://www.missionchief.com{AUTO_BUILDING_LIST_PATH}": BUILDING_LIST_HTML,
+            "https://www.missionchief.com/buildings/100": full_html,
+            "https://www.missionchief.com/buildings/200": ACADEMY_HTML.replace("4951748", "200"),
+            "https://www.missionchief.com/buildings/300": ACADEMY_HTML.replace("4951748", "300"),
+            "https://www.missionchief.com/buildings/400": ACADEMY_HTML.replace("4951748", "400"),
+        }
+    )
+    manager, _guild, _user, _ = _manager(session=session, contribution_rate=None)
+    manager._academy_pages = AcademyPageCache(ttl_seconds=300, clock=lambda: clock.now)
+
+    def academy_fetches():
+        return [url for url in session.get_urls if "/buildings/" in url]
+
+    first, _ = asyncio.run(manager._collect_training_availability())
+    assert len(academy_fetches()) == 4
+    assert parse_academy_page(full_html).running_seconds == [7200, 1800]
+
+    clock.now = 299.0
+    second, _ = asyncio.run(manager._collect_training_availability())
+    assert len(academy_fetches()) == 4
+    assert second == first
+
+    # Open academies expire with the TTL; the full one only when its first course ends
+    clock.now = 300.0
+    asyncio.run(manager._collect_training_availability())
+    assert len(academy_fetches()) == 7
+    assert academy_fetches().count("https://www.missionchief.com/buildings/100") == 1
+    clock.now = 1800.0
+    asyncio.run(manager._collect_training_availability())
+    assert academy_fetches().count("https://www.missionchief.com/buildings/100") == 2
+
+
 def test_training_availability_embed_uses_simple_class_counts():
     manager, _guild, _user, _ = _manager(session=_Session(ACADEMY_HTML), contribution_rate=None)
     availability = {
@@ -1201,3 +1276,21 @@ def test_member_panel_refresh_updates_existing_message_before_posting_new_one():
     existing_message.edit.assert_awaited_once()
     channel.send.assert_not_awaited()
     panel_message_id.set.assert_awaited_once_with(456)
+
+
+def test_migrated_config_reminder_keeps_one_scheduler_job(tmp_path):
+    from scheduler.scheduler import SchedulerStore
+
+    store = SchedulerStore(tmp_path / "scheduler.db")
+    store.initialize()
+    manager = TrainingManager.__new__(TrainingManager)
+    reminder = {"user_id": 123, "text": "Training starts", "when_ts": 1_700_000_000, "fallback_channel_id": 9}
+
+    # A migration pass interrupted before reminders.set([]) schedules the same reminder again
+    for _ in range(2):
+        store.add("TrainingManager", reminder["when_ts"], reminder, manager._reminder_job_key(1, dict(reminder)))
+    other = dict(reminder, text="Another training")
+    store.add("TrainingManager", other["when_ts"], other, manager._reminder_job_key(1, other))
+
+    assert manager._reminder_job_key(1, reminder).startswith("reminder:1:1700000000:")
+    assert store.counts_by_owner()["TrainingManager"]["pending"] == 2
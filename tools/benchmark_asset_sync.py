@@ -0,0 +1,217 @@
+"""Time an AssetManager full sync against generated LSSM-style fixtures.
+
+Compares the previous shape of a sync (files fetched one after another, vehicles
+written and linked row by row with a commit each) with the current one (files
+fetched concurrently, all sources written with executemany in one transaction).
+GitHub is simulated with a fixed per-file latency, so no network is needed.
+Run from the repository root:
+
+    python tools/benchmark_asset_sync.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load(name: str):
+    # Load by path so the benchmark runs without discord/redbot installed
+    spec = importlib.util.spec_from_file_location(f"assetmanager_{name}", ROOT / "assetmanager" / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_github_sync = _load("github_sync")
+_database = _load("database")
+_asset_sync = _load("asset_sync")
+GitHubSync = _github_sync.GitHubSync
+AssetDatabase = _database.AssetDatabase
+
+VEHICLES = 400
+BUILDINGS = 40
+BUILDING_TYPES = 8
+EDUCATIONS_PER_TYPE = 8
+EQUIPMENT = 30
+LATENCY_SECONDS = 0.15
+ROUNDS = 3
+
+
+def _vehicles_ts() -> str:
+    entries = []
+    for game_id in range(VEHICLES):
+        training = game_id % (BUILDING_TYPES * EDUCATIONS_PER_TYPE)
+        entries.append(
+            f"""    {game_id}: {{
+        caption: 'Vehicle {game_id} (Driver\\'s cab)', // fixture
+        color: '#bb0000',
+        coins: 25,
+        credits: 5_{game_id:03d},
+        staff: {{
+            min: 1,
+            max: 6,
+            training: {{ 'Type {training % BUILDING_TYPES}': {{ training_{training}: {{ all: true }} }} }},
+        }},
+        waterTank: 2_000,
+        possibleBuildings: [{game_id % BUILDINGS}, {(game_id + 1) % BUILDINGS}],
+        special: "Needs a \\"station\\" upgrade",
+        iconFunction: (vehicle) => {{ return vehicle.icon ?? 'default'; }},
+        wtank: [...Array(2).fill(0)],
+    }},"""
+        )
+    return "import type { InternalVehicle } from 'typings/Vehicle';\n\n/* Generated fixture */\nexport default {\n" + "\n".join(entries) + "\n} as Record<number, InternalVehicle>;\n"
+
+
+def _buildings_ts() -> str:
+    entries = [
+        f"    {game_id}: {{ caption: 'Building {game_id}', credits: 100_000, maxLevel: 39, startVehicles: ['Vehicle {game_id}'] }},"
+        for game_id in range(BUILDINGS)
+    ]
+    return "export default {\n" + "\n".join(entries) + "\n};\n"
+
+
+def _educations_ts() -> str:
+    groups = []
+    for building_type in range(BUILDING_TYPES):
+        items = []
+        for offset in range(EDUCATIONS_PER_TYPE):
+            key = building_type + BUILDING_TYPES * offset
+            items.append(
+                f"        {{ caption: 'Training {key}', duration: '{offset + 1} Days', staff_key: 'training_{key}', key: 'training_{key}' }},"
+            )
+        groups.append(f"    'Type {building_type}': [\n" + "\n".join(items) + "\n    ],")
+    return "export default {\n" + "\n".join(groups) + "\n};\n"
+
+
+def _equipment_ts() -> str:
+    entries = [
+        f"    equipment_{index}: {{ id: 'equipment_{index}', caption: 'Equipment {index}', size: 1, credits: 1_000, coins: 5, staff: {{ min: 1, max: 2 }} }},"
+        for index in range(EQUIPMENT)
+    ]
+    return "export default registerEquipment({\n" + "\n".join(entries) + "\n});\n"
+
+
+FIXTURES = {
+    _github_sync.GITHUB_URLS["vehicles"]: _vehicles_ts(),
+    _github_sync.GITHUB_URLS["buildings"]: _buildings_ts(),
+    _github_sync.GITHUB_URLS["educations"]: _educations_ts(),
+    _github_sync.GITHUB_URLS["equipment"]: _equipment_ts(),
+}
+
+
+class _FakeResponse:
+    status = 200
+
+    def __init__(self, body: str):
+        self.body = body
+        self.headers = {}
+
+    async def __aenter__(self):
+        await asyncio.sleep(LATENCY_SECONDS)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def text(self):
+        return self.body
+
+
+class _FakeSession:
+    closed = False
+
+    def get(self, url, **kwargs):
+        return _FakeResponse(FIXTURES[url])
+
+    async def close(self):
+        pass
+
+
+def _github() -> GitHubSync:
+    github = GitHubSync()
+    github.session = _FakeSession()
+    return github
+
+
+async def _fetch_sequential(github: GitHubSync) -> dict:
+    return {
+        "vehicles": await github.fetch_vehicles(),
+        "buildings": await github.fetch_buildings(),
+        "equipment": await github.fetch_equipment(),
+        "educations": await github.fetch_educations(),
+    }
+
+
+def _write_row_by_row(db: AssetDatabase, github: GitHubSync, data: dict) -> None:
+    for game_id, raw in data["educations"].items():
+        db.insert_education(github.normalize_education_data(game_id, raw))
+    for game_id, raw in data["buildings"].items():
+        db.insert_building(github.normalize_building_data(game_id, raw))
+    educations = db.get_all_educations()
+    for game_id, raw in data["vehicles"].items():
+        vehicle = github.normalize_vehicle_data(game_id, raw)
+        vehicle_id = db.insert_vehicle(vehicle)
+        db.clear_all_relations(vehicle_id)
+        for building_game_id in raw.get("possibleBuildings", []):
+            building = db.conn.execute("SELECT id FROM buildings WHERE game_id = ?", (building_game_id,)).fetchone()
+            if building:
+                db.link_vehicle_building(vehicle_id, building["id"])
+        for key in vehicle["education_keys"]:
+            for education in educations:
+                if education.get("key") == key:
+                    db.link_vehicle_education(vehicle_id, education["id"])
+                    break
+    for game_id, raw in data["equipment"].items():
+        db.insert_equipment(github.normalize_equipment_data(game_id, raw))
+
+
+def _run(db_path: Path, concurrent: bool) -> tuple[float, float, float]:
+    db = AssetDatabase(db_path)
+    db.connect()
+    db.initialize_tables()
+    github = _github()
+    started = time.perf_counter()
+    data = asyncio.run(github.fetch_all() if concurrent else _fetch_sequential(github))
+    fetched = time.perf_counter()
+    if concurrent:
+        _asset_sync.apply_full_sync(db, github, data)
+    else:
+        _write_row_by_row(db, github, data)
+    written = time.perf_counter()
+    db.close()
+    return fetched - started, written - fetched, written - started
+
+
+def main() -> None:
+    _github_sync.log.disabled = True
+    _asset_sync.log.disabled = True
+    _database.log.disabled = True
+
+    parse_started = time.perf_counter()
+    for content in FIXTURES.values():
+        GitHubSync().parse_typescript_export(content)
+    parse_ms = (time.perf_counter() - parse_started) * 1000
+    print(f"fixtures: {VEHICLES} vehicles, {BUILDINGS} buildings, "
+          f"{BUILDING_TYPES * EDUCATIONS_PER_TYPE} educations, {EQUIPMENT} equipment; "
+          f"{LATENCY_SECONDS * 1000:.0f} ms simulated latency per file")
+    print(f"parse all four files: {parse_ms:.1f} ms")
+    print(f"{'mode':>24}  {'fetch+parse ms':>14}  {'write ms':>9}  {'total ms':>9}")
+    for label, concurrent in (("sequential, row by row", False), ("concurrent, one txn", True)):
+        timings = []
+        for _ in range(ROUNDS):
+            with tempfile.TemporaryDirectory() as temp_dir:
+                timings.append(_run(Path(temp_dir) / "assets.db", concurrent))
+        fetch, write, total = (min(values) * 1000 for values in zip(*timings))
+        print(f"{label:>24}  {fetch:>14.1f}  {write:>9.1f}  {total:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Time board training-request matching with the compiled catalog.
+
+Compares scoring every catalog candidate against every chunk of a post (what
+``extract_board_training_matches`` used to do, with the catalog rebuilt per
+post) with the compiled catalog, whose character-count bound skips entries that
+cannot beat the best score so far. Both must pick the same training per chunk.
+No real board posts ship with the repository, so the posts are generated from
+the catalog itself with typos, academy prefixes and filler words.
+Run from the repository root:
+
+    python tools/benchmark_board_training_matcher.py
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+POSTS = 200
+
+try:
+    import discord  # noqa: F401
+except ImportError:
+    # trainings_manager imports discord and redbot; reuse the test suite's stubs
+    sys.path.insert(0, str(ROOT / "tests"))
+    import conftest
+
+    conftest.pytest_configure()
+
+spec = importlib.util.spec_from_file_location("trainings_manager_module", ROOT / "trainings_manager" / "trainings_manager.py")
+tm = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = tm
+sys.path.insert(0, str(ROOT / "trainings_manager"))
+spec.loader.exec_module(tm)
+
+PREFIXES = ("", "Fire Station - ", "Water Rescue - ", "Police ", "EMS ", "fire academy ", "coastal ")
+FILLERS = ("Can I get", "Requesting please", "Hi, could someone open", "need", "pls", "Thanks!", "1 class", "for 3 people")
+SEPARATORS = (" and ", ", ", "\n", " & ", " + ", "; ")
+
+
+def _posts(count: int) -> list[str]:
+    rng = random.Random(5)
+    names = [training for discipline, trainings in tm.DISCIPLINES.items() if discipline != "OTHER" for training, _ in trainings]
+
+    def typo(name: str) -> str:
+        if len(name) < 5 or rng.random() < 0.5:
+            return name
+        index = rng.randrange(1, len(name) - 1)
+        return name[:index] + name[index + 1:]
+
+    posts = ["Can I get hotshot crew traning and HazMat?", "Requesting please FIRE Wildland Mobile Comand Center 1 class"]
+    while len(posts) < count:
+        parts = [rng.choice(PREFIXES) + typo(rng.choice(names)) for _ in range(rng.randint(1, 4))]
+        posts.append(f"{rng.choice(FILLERS)} {rng.choice(SEPARATORS).join(parts)} {rng.choice(FILLERS)}")
+    return posts
+
+
+def _chunks(post: str) -> list[str]:
+    chunks = [
+        tm._normalize_training_search_text(chunk)
+        for chunk in re.split(r"[\n;,/|]+|\band\b|&|\+", post, flags=re.IGNORECASE)
+    ]
+    return [chunk for chunk in chunks if len(chunk) >= 3]
+
+
+def _best_exhaustive(compiled, chunk: str):
+    best = (0.0, None)
+    for index, entry in enumerate(compiled.entries):
+        candidates = compiled.candidates[index]
+        if not candidates:
+            continue
+        score = max(tm._candidate_training_score(chunk, candidate) for candidate in candidates)
+        if any(candidate in chunk for candidate in candidates):
+            score = max(score, 0.88)
+        if score > best[0]:
+            best = (score, entry)
+    return best
+
+
+def _best_bounded(compiled, chunk: str):
+    best = (0.0, None)
+    profile = tm.ChunkProfile(chunk)
+    for index, entry in enumerate(compiled.entries):
+        candidates = compiled.candidates[index]
+        if not candidates:
+            continue
+        contained = any(candidate in chunk for candidate in candidates)
+        bound = max(compiled.score_bound(candidate, profile) for candidate in candidates)
+        if contained:
+            bound = max(bound, 0.88)
+        if bound < tm.BOARD_MATCH_THRESHOLD or bound <= best[0]:
+            continue
+        score = max(tm._candidate_training_score(chunk, candidate) for candidate in candidates)
+        if contained:
+            score = max(score, 0.88)
+        if score > best[0]:
+            best = (score, entry)
+    return best
+
+
+def main() -> None:
+    posts = _posts(POSTS)
+    chunks = [chunk for post in posts for chunk in _chunks(post)]
+
+    started = time.perf_counter()
+    compiled = tm.CompiledTrainingCatalog.build(tm._training_catalog())
+    compile_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for post in posts:
+        tm._training_catalog()
+        tm._ambiguous_board_training_names()
+    rebuild_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    exhaustive = [_best_exhaustive(compiled, chunk) for chunk in chunks]
+    exhaustive_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    bounded = [_best_bounded(compiled, chunk) for chunk in chunks]
+    bounded_seconds = time.perf_counter() - started
+
+    for chunk, (old_score, old_entry), (new_score, new_entry) in zip(chunks, exhaustive, bounded):
+        picked_old = old_entry if old_score >= tm.BOARD_MATCH_THRESHOLD else None
+        picked_new = new_entry if new_score >= tm.BOARD_MATCH_THRESHOLD else None
+        assert picked_old == picked_new, chunk
+
+    started = time.perf_counter()
+    for post in posts:
+        tm.extract_board_training_matches(post)
+    extract_seconds = time.perf_counter() - started
+
+    print(f"{len(posts)} posts, {len(chunks)} chunks, {len(compiled.entries)} catalog entries")
+    print(f"catalog compile (once):   {compile_seconds * 1000:8.1f} ms")
+    print(f"plain catalog per post:   {rebuild_seconds * 1000:8.1f} ms total")
+    print(f"fuzzy pass, every entry:  {exhaustive_seconds:8.2f} s")
+    print(f"fuzzy pass, bounded:      {bounded_seconds:8.2f} s ({exhaustive_seconds / bounded_seconds:.1f}x)")
+    print(f"extract_board_training_matches: {extract_seconds / len(posts) * 1000:.2f} ms per post")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Measure auto-build candidate sampling latency as the candidate table grows.
+
+Compares the previous ``ORDER BY RANDOM() LIMIT`` query with
+``BuildingDatabase.get_random_auto_candidates`` (index-seek sampling plus a row
+load by id) on tables where a quarter of the rows are still available.
+Run from the repository root:
+
+    python tools/benchmark_candidate_sampling.py [rows ...]
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SIZES = (10_000, 100_000, 400_000)
+LIMIT = 50
+REPEATS = 30
+STATUSES = ("available", "used", "duplicate", "failed")
+
+
+def _load_buildingmanager():
+    try:
+        import discord  # noqa: F401
+    except ImportError:
+        # buildingmanager imports discord and redbot; reuse the test suite's stubs
+        sys.path.insert(0, str(ROOT / "tests"))
+        import conftest
+
+        conftest.pytest_configure()
+    sys.path.insert(0, str(ROOT))
+    import buildingmanager.buildingmanager as bm
+
+    return bm
+
+
+def _fill(db_path: str, rows: int) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        """
+        INSERT INTO building_auto_candidates (
+            source, source_id, building_type, name, lat, lon, status, raw_tags_json, imported_at, updated_at
+        )
+        VALUES ('openstreetmap', ?, ?, ?, ?, ?, ?, '{}', 0, 0)
+        """,
+        (
+            (
+                f"node/{index}",
+                "Hospital" if index % 2 else "Prison",
+                f"Candidate {index}",
+                30.0 + (index % 1000) / 100,
+                -100.0 + (index // 1000) / 100,
+                STATUSES[(index // 2) % len(STATUSES)],
+            )
+            for index in range(rows)
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _order_by_random(db_path: str) -> int:
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        """
+        SELECT *
+        FROM building_auto_candidates
+        WHERE building_type = ?
+          AND status = 'available'
+        ORDER BY RANDOM()
+        LIMIT ?
+        """,
+        ("Hospital", LIMIT),
+    ).fetchall()
+    conn.close()
+    return len(rows)
+
+
+def _median_ms(sample) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        sample()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    bm = _load_buildingmanager()
+    sizes = [int(value) for value in sys.argv[1:]] or list(SIZES)
+    print(f"Median of {REPEATS} draws of {LIMIT} available Hospital candidates")
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db = bm.BuildingDatabase(f"{temp_dir}/building_manager.db")
+            _fill(db.db_path, rows)
+            if len(db.get_random_auto_candidates("Hospital", limit=LIMIT)) != _order_by_random(db.db_path):
+                raise SystemExit("Both samplers must return a full draw.")
+            before = _median_ms(lambda: _order_by_random(db.db_path))
+            after = _median_ms(lambda: db.get_random_auto_candidates("Hospital", limit=LIMIT))
+            print(f"{rows:>9,} rows  ORDER BY RANDOM() {before:8.2f} ms  indexed sample {after:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Compare per-action latency of Config-style blobs and the FSC SQLite player store.
+
+Red's JSON Config driver rewrites the player's whole blob (and the cog's data
+file) on each change. The SQLite store only rewrites the rows that changed.
+Run from the repository root:
+
+    python tools/benchmark_fsc_player_store.py
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Load the module by path so the benchmark runs without discord/redbot installed
+_spec = importlib.util.spec_from_file_location("fsc_player_store", ROOT / "FireStationCommand" / "player_store.py")
+_player_store = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_player_store)
+PlayerStore = _player_store.PlayerStore
+
+FLEET_SIZES = (10, 100, 1000, 5000)
+OTHER_PLAYERS = 200
+ACTIONS = 50
+
+
+def _player(fleet_size: int) -> dict:
+    return {
+        "started": True,
+        "xp": 1000,
+        "vehicles": [
+            {"id": index, "catalog_id": "engine_basic", "name": f"Engine {index}", "condition": 100}
+            for index in range(1, fleet_size + 1)
+        ],
+        "equipment": [{"catalog_id": "hose", "quantity": 4}],
+        "active_mission": {},
+    }
+
+
+def _bench_config_blob(path: Path, fleet_size: int) -> float:
+    users = {str(user_id): _player(10) for user_id in range(OTHER_PLAYERS)}
+    users["me"] = _player(fleet_size)
+    path.write_text(json.dumps(users))
+
+    started = time.perf_counter()
+    for action in range(ACTIONS):
+        users = json.loads(path.read_text())
+        users["me"]["vehicles"][action % fleet_size]["condition"] = 90 - (action % 10)
+        users["me"]["xp"] += 10
+        path.write_text(json.dumps(users))
+    return (time.perf_counter() - started) / ACTIONS
+
+
+def _bench_store(path: Path, fleet_size: int) -> float:
+    store = PlayerStore(path, {"started": False, "xp": 0, "vehicles": [], "equipment": [], "active_mission": {}})
+    store.initialize()
+    store.import_players({user_id: _player(10) for user_id in range(1, OTHER_PLAYERS + 1)})
+    store.set_field(0, "vehicles", _player(fleet_size)["vehicles"])
+
+    started = time.perf_counter()
+    for action in range(ACTIONS):
+        data = store.load_player(0)
+        data["vehicles"][action % fleet_size]["condition"] = 90 - (action % 10)
+        store.set_field(0, "vehicles", data["vehicles"])
+        store.set_field(0, "xp", data["xp"] + 10)
+    return (time.perf_counter() - started) / ACTIONS
+
+
+def main() -> None:
+    print(f"{'fleet':>6}  {'config blob ms':>15}  {'sqlite store ms':>16}")
+    for fleet_size in FLEET_SIZES:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            blob_ms = _bench_config_blob(Path(temp_dir) / "settings.json", fleet_size) * 1000
+            store_ms = _bench_store(Path(temp_dir) / "fsc_players.db", fleet_size) * 1000
+        print(f"{fleet_size:>6}  {blob_ms:>15.2f}  {store_ms:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
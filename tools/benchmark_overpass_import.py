@@ -0,0 +1,149 @@
+"""Measure Overpass candidate imports: elements per second and peak RSS.
+
+Compares the previous import (``json.loads`` of the whole response, every
+element converted, then one upsert of the full list) with the streamed one
+(``OverpassCandidateImport`` reading the response in chunks and upserting in
+batches). The fixture is a generated state-sized Overpass response written to a
+temporary file; each mode runs in its own process so their peak RSS does not mix.
+Run from the repository root:
+
+    python tools/benchmark_overpass_import.py [elements]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+ELEMENTS = 60_000
+CHUNK_BYTES = 64 * 1024
+
+
+def _load_buildingmanager():
+    try:
+        import discord  # noqa: F401
+    except ImportError:
+        # buildingmanager imports discord and redbot; reuse the test suite's stubs
+        sys.path.insert(0, str(ROOT / "tests"))
+        import conftest
+
+        conftest.pytest_configure()
+    sys.path.insert(0, str(ROOT))
+    import buildingmanager.buildingmanager as bm
+
+    return bm
+
+
+def _write_fixture(path: Path, count: int) -> None:
+    rng = random.Random(48)
+    kinds = (
+        ({"amenity": "hospital"}, "General Hospital"),
+        ({"healthcare": "hospital"}, "Medical Center"),
+        ({"amenity": "prison"}, "Correctional Facility"),
+        ({"amenity": "hospital"}, "Urgent Care Clinic"),
+    )
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write('{\n  "version": 0.6,\n  "generator": "Overpass API fixture",\n  "elements": [\n')
+        for index in range(count):
+            tags, suffix = kinds[index % len(kinds)]
+            element_type = ("node", "way", "relation")[index % 3]
+            element = {
+                "type": element_type,
+                "id": 1_000_000 + index,
+                "tags": {
+                    **tags,
+                    "name": f"County {index} {suffix}",
+                    "addr:city": f"Town {index % 500}",
+                    "addr:state": "TX",
+                    "addr:country": "US",
+                    "operator": "Example Health",
+                    "website": f"https://example.org/{index}",
+                },
+            }
+            position = {"lat": round(rng.uniform(26.0, 36.0), 7), "lon": round(rng.uniform(-106.0, -94.0), 7)}
+            if element_type == "node":
+                element.update(position)
+            else:
+                element["center"] = position
+            handle.write(("    " if index == 0 else ",\n    ") + json.dumps(element))
+        handle.write("\n  ]\n}\n")
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_mode(mode: str, fixture: Path, db_dir: str) -> dict:
+    bm = _load_buildingmanager()
+    db = bm.BuildingDatabase(f"{db_dir}/{mode}.db")
+    baseline_rss = _peak_rss_mb()
+    started = time.perf_counter()
+    if mode == "loads":
+        data = json.loads(fixture.read_bytes().decode("utf-8-sig"))
+        candidates, stats = bm.parse_overpass_auto_build_candidates(data)
+        stats.update(db.upsert_auto_candidates(candidates))
+    else:
+
+        async def chunks():
+            with fixture.open("rb") as handle:
+                while chunk := handle.read(CHUNK_BYTES):
+                    yield chunk
+
+        importer = bm.OverpassCandidateImport(db)
+        asyncio.run(importer.read(chunks()))
+        stats = importer.stats
+    elapsed = time.perf_counter() - started
+    return {
+        "seconds": elapsed,
+        "elements": stats["source_elements"],
+        "inserted": stats["inserted"],
+        "baseline_rss_mb": baseline_rss,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def main() -> None:
+    if len(sys.argv) == 5 and sys.argv[1] == "--mode":
+        print(json.dumps(_run_mode(sys.argv[2], Path(sys.argv[3]), sys.argv[4])))
+        return
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else ELEMENTS
+    with tempfile.TemporaryDirectory() as temp_dir:
+        fixture = Path(temp_dir) / "overpass.json"
+        _write_fixture(fixture, count)
+        size_mb = fixture.stat().st_size / (1024 * 1024)
+        print(f"Fixture: {count:,} elements, {size_mb:.1f} MB")
+        results = {}
+        for mode in ("loads", "stream"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, str(fixture), temp_dir],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            results[mode] = json.loads(output.strip().splitlines()[-1])
+
+    for mode, label in (("loads", "json.loads + one upsert"), ("stream", "streamed + batched upserts")):
+        result = results[mode]
+        print(
+            f"{label:28} {result['elements'] / result['seconds']:>9,.0f} elements/s  "
+            f"{result['seconds']:6.2f}s  peak RSS {result['peak_rss_mb']:6.1f} MB "
+            f"(+{result['peak_rss_mb'] - result['baseline_rss_mb']:.1f} MB over import start)  "
+            f"{result['inserted']:,} inserted"
+        )
+    if results["loads"]["inserted"] != results["stream"]["inserted"]:
+        raise SystemExit("Both imports must store the same candidates.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, Optional, Sequence, Set, Tuple
+
+# Trie nodes map a token to the next node; this key holds the phrase ending there
+_PHRASE = None
+
+
+class PhraseTrie:
+    """Token trie over normalized phrases (lowercase words joined by single spaces).
+
+    ``find`` reports every phrase that occurs as a whole-word run in a text; each
+    start position walks at most as many tokens as the longest phrase, so a scan
+    is linear in the text for a fixed catalog.
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        self._root: Dict = {}
+        self.max_tokens = 0
+        for phrase in phrases:
+            tokens = phrase.split()
+            if not tokens:
+                continue
+            node = self._root
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node[_PHRASE] = phrase
+            self.max_tokens = max(self.max_tokens, len(tokens))
+
+    def find(self, tokens: Sequence[str]) -> Set[str]:
+        found: Set[str] = set()
+        for start in range(len(tokens)):
+            node = self._root
+            for token in tokens[start:start + self.max_tokens]:
+                node = node.get(token)
+                if node is None:
+                    break
+                phrase = node.get(_PHRASE)
+                if phrase is not None:
+                    found.add(phrase)
+        return found
+
+
+def contains_phrase(longer: str, shorter: str) -> bool:
+    """Whether ``shorter`` occurs as a whole-word run inside ``longer``."""
+    return f" {shorter} " in f" {longer} "
+
+
+def containing_phrases(phrase: str, others: Iterable[str]) -> FrozenSet[str]:
+    """Phrases among ``others`` with more words than ``phrase`` that contain it."""
+    size = len(phrase.split())
+    return frozenset(
+        other for other in others if len(other.split()) > size and contains_phrase(other, phrase)
+    )
+
+
+class TextProfile:
+    """Character counts for an upper bound on ``SequenceMatcher.ratio``."""
+
+    __slots__ = ("length", "counts")
+
+    def __init__(self, text: str):
+        self.length = len(text)
+        self.counts = Counter(text)
+
+    def ratio_bound(self, other: "TextProfile") -> float:
+        """Same value as ``SequenceMatcher.quick_ratio``, which never undershoots ``ratio``."""
+        total = self.length + other.length
+        if not total:
+            return 1.0
+        small, large = (self.counts, other.counts) if len(self.counts) <= len(other.counts) else (other.counts, self.counts)
+        shared = sum(min(count, large.get(char, 0)) for char, count in small.items())
+        return 2.0 * shared / total
+
+
+class ChunkProfile:
+    """Profiles of one chunk, with per-token bounds memoized across candidates."""
+
+    def __init__(self, chunk: str):
+        self.whole = TextProfile(chunk)
+        self.tokens = [TextProfile(token) for token in chunk.split()]
+        self._token_best: Dict[str, float] = {}
+
+    def best_token_bound(self, token: str, profile: TextProfile) -> float:
+        best = self._token_best.get(token)
+        if best is None:
+            best = max((profile.ratio_bound(chunk_token) for chunk_token in self.tokens), default=0.0)
+            self._token_best[token] = best
+        return best
+
+
+def token_ratio_bound(candidate_tokens: Sequence[Tuple[str, TextProfile]], chunk: ChunkProfile) -> float:
+    """Upper bound on the mean best per-token ratio used for multi-word candidates."""
+    if not candidate_tokens or not chunk.tokens:
+        return 0.0
+    return sum(chunk.best_token_bound(token, profile) for token, profile in candidate_tokens) / len(candidate_tokens)
+
+
+def longest_first(candidates: Iterable[str]) -> Tuple[str, ...]:
+    """Longest candidate first, ties in alphabetical order so the pick is stable."""
+    return tuple(sorted(set(candidate for candidate in candidates if candidate), key=lambda value: (-len(value), value)))
+
+
+def first_present(candidates: Sequence[str], found: Set[str], blocked: Optional[Dict[str, FrozenSet[str]]] = None) -> Optional[str]:
+    """First of ``candidates`` found in the text and not inside a longer phrase also found."""
+    for candidate in candidates:
+        if candidate not in found:
+            continue
+        containers = (blocked or {}).get(candidate)
+        if containers and not containers.isdisjoint(found):
+            continue
+        return candidate
+    return None
+
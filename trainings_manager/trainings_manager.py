@@ -2,15 +2,16 @@
 
 import asyncio
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 import hashlib
 from html.parser import HTMLParser
 import logging
 import re
+import time
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import discord
@@ -18,6 +19,51 @@ from redbot.core import commands, Config
 from redbot.core.bot import Red
 from redbot.core.utils.chat_formatting import box
 
+try:
+    from .board_watcher import (
+        BoardPage,
+        BoardPageParser,
+        BoardPost,
+        BoardUpdate,
+        fetch_latest_board_page,
+        format_board_watch_stats,
+        parse_board_page,
+        shared_board_watcher,
+    )
+    from .mc_requests import mc_request_slot
+    from .training_matcher import (
+        ChunkProfile,
+        PhraseTrie,
+        TextProfile,
+        contains_phrase,
+        containing_phrases,
+        first_present,
+        longest_first,
+        token_ratio_bound,
+    )
+except ImportError:  # pragma: no cover - direct module loading in local tooling
+    from board_watcher import (
+        BoardPage,
+        BoardPageParser,
+        BoardPost,
+        BoardUpdate,
+        fetch_latest_board_page,
+        format_board_watch_stats,
+        parse_board_page,
+        shared_board_watcher,
+    )
+    from mc_requests import mc_request_slot
+    from training_matcher import (
+        ChunkProfile,
+        PhraseTrie,
+        TextProfile,
+        contains_phrase,
+        containing_phrases,
+        first_present,
+        longest_first,
+        token_ratio_bound,
+    )
+
 log = logging.getLogger("red.cog.trainings_manager")
 
 AMS = ZoneInfo("Europe/Amsterdam")
@@ -160,8 +206,13 @@ AUTO_ALLIANCE_DURATION_SECONDS = 3600
 AUTO_MIN_CONTRIBUTION_RATE = 5.0
 AUTO_MAX_CLASSES = 4
 AVAILABILITY_REFRESH_SECONDS = 60 * 60
+# Academy pages are reused for this long by availability refreshes; full academies
+# are reused until their first running course ends instead
+ACADEMY_PAGE_CACHE_SECONDS = 5 * 60
+ACADEMY_FETCH_CONCURRENCY = 4
+REMINDER_MIGRATION_INTERVAL_SECONDS = 5 * 60
 BOARD_THREAD_ID = 5935
-BOARD_POLL_SECONDS = 5 * 60
+BOARD_WATCH_OWNER = "TrainingManager"
 BOARD_DEFAULT_FEE = 0
 BOARD_MATCH_THRESHOLD = 0.78
 BOARD_GUIDE_MARKER_PREFIX = "TM-GUIDE"
@@ -198,6 +249,8 @@ class AcademyPage:
     available_rooms: int
     costs: List[int]
     courses: List[AcademyCourse]
+    # Seconds left on each running course, from the page's countdown scripts
+    running_seconds: List[int] = field(default_factory=list)
 
 
 @dataclass
@@ -230,22 +283,8 @@ class DisciplineAvailability:
     errors: int = 0
 
 
-@dataclass
-class BoardTrainingPost:
-    post_id: int
-    author_id: Optional[str]
-    author_name: str
-    created_at: str
-    content: str
-
-
-@dataclass
-class BoardPage:
-    posts: List[BoardTrainingPost]
-    last_page: int = 1
-    current_user_id: Optional[str] = None
-    reply_action: Optional[str] = None
-    reply_token: Optional[str] = None
+# Board pages are parsed by the shared watcher into one post model for every cog
+BoardTrainingPost = BoardPost
 
 
 @dataclass(frozen=True)
@@ -330,8 +369,10 @@ def _board_training_aliases(discipline: str, training: str) -> Tuple[str, ...]:
     return tuple(sorted(alias for alias in aliases if alias))
 
 
-def _mentions_board_discipline_prefix(normalized_text: str, discipline: str, training: Optional[str] = None) -> bool:
+def _board_discipline_prefix_phrases(discipline: str, training: Optional[str] = None) -> Tuple[str, ...]:
+    """Normalized academy prefixes that make an ambiguous training request specific."""
     normalized_training = _normalize_training_search_text(training or "")
+    phrases = []
     for prefix in BOARD_DISCIPLINE_SEARCH_PREFIXES.get(discipline, (discipline,)):
         normalized_prefix = _normalize_training_search_text(prefix)
         if (
@@ -340,18 +381,17 @@ def _mentions_board_discipline_prefix(normalized_text: str, discipline: str, tra
             and len(normalized_prefix.split()) == 1
         ):
             continue
-        if normalized_prefix and re.search(rf"\b{re.escape(normalized_prefix)}\b", normalized_text):
-            return True
-    return False
+        if normalized_prefix:
+            phrases.append(normalized_prefix)
+    return tuple(phrases)
 
 
-def _has_board_training_specific_tokens(normalized_text: str, training: str) -> bool:
-    tokens = [
+def _board_training_specific_tokens(training: str) -> FrozenSet[str]:
+    return frozenset(
         token
         for token in _normalize_training_search_text(training).split()
         if len(token) >= 4 and token not in BOARD_AMBIGUOUS_HELP_SKIP_TOKENS
-    ]
-    return all(re.search(rf"\b{re.escape(token)}\b", normalized_text) for token in tokens)
+    )
 
 
 def _training_name_alias_variants(training: str) -> Tuple[str, ...]:
@@ -462,30 +502,88 @@ def _training_catalog() -> List[TrainingCatalogEntry]:
     return entries
 
 
-def _is_short_training_candidate_inside_longer_training(
-    normalized_text: str,
-    candidate: str,
-    entry: TrainingCatalogEntry,
-    catalog: List[TrainingCatalogEntry],
-) -> bool:
-    """Avoid matching a generic course name inside a longer requested course name."""
-    candidate_tokens = candidate.split()
-    if len(candidate_tokens) < 2:
-        return False
+@dataclass(frozen=True)
+class CompiledTrainingCatalog:
+    """The board catalog prepared once for matching many posts.
+
+    Per entry it keeps the exact candidates (longest first) and, for multi-word
+    candidates, the longer phrases of other trainings that contain them; the
+    trie finds every catalog phrase in a text in one scan.
+    """
+
+    entries: Tuple[TrainingCatalogEntry, ...]
+    ambiguous: Tuple[bool, ...]
+    # For ambiguous names: a chunk must mention an academy prefix and these tokens
+    prefixes: Tuple[Tuple[str, ...], ...]
+    specific_tokens: Tuple[FrozenSet[str], ...]
+    candidates: Tuple[Tuple[str, ...], ...]
+    containers: Tuple[Dict[str, FrozenSet[str]], ...]
+    trie: PhraseTrie
+    profiles: Dict[str, Tuple[TextProfile, Tuple[Tuple[str, TextProfile], ...]]]
+
+    @classmethod
+    def build(cls, catalog: List[TrainingCatalogEntry]) -> "CompiledTrainingCatalog":
+        ambiguous_names = set(_ambiguous_board_training_names())
+        phrases_by_entry = [{entry.normalized, *entry.aliases} - {""} for entry in catalog]
+        candidates = []
+        containers = []
+        for index, entry in enumerate(catalog):
+            exact = set(entry.aliases)
+            if entry.normalized not in ambiguous_names:
+                exact.add(entry.normalized)
+            ordered = longest_first(exact)
+            other_phrases = {
+                phrase
+                for other_index, phrases in enumerate(phrases_by_entry)
+                if other_index != index
+                for phrase in phrases
+            }
+            candidates.append(ordered)
+            containers.append({
+                candidate: containing_phrases(candidate, other_phrases)
+                for candidate in ordered
+                if len(candidate.split()) >= 2
+            })
+        all_phrases = set().union(*phrases_by_entry) if phrases_by_entry else set()
+        return cls(
+            entries=tuple(catalog),
+            ambiguous=tuple(entry.normalized in ambiguous_names for entry in catalog),
+            prefixes=tuple(_board_discipline_prefix_phrases(entry.discipline, entry.training) for entry in catalog),
+            specific_tokens=tuple(_board_training_specific_tokens(entry.training) for entry in catalog),
+            candidates=tuple(candidates),
+            containers=tuple(containers),
+            trie=PhraseTrie(all_phrases),
+            profiles={
+                candidate: (
+                    TextProfile(candidate),
+                    tuple(
+                        (token, TextProfile(token))
+                        for token in candidate.split()
+                        if token not in BOARD_AMBIGUOUS_HELP_SKIP_TOKENS
+                    ),
+                )
+                for ordered in candidates
+                for candidate in ordered
+            },
+        )
+
+    def score_bound(self, candidate: str, chunk: ChunkProfile) -> float:
+        """Upper bound on ``_candidate_training_score`` for an already normalized chunk."""
+        profile, token_profiles = self.profiles[candidate]
+        bound = profile.ratio_bound(chunk.whole)
+        if len(token_profiles) >= 2:
+            bound = max(bound, token_ratio_bound(token_profiles, chunk))
+        return bound
 
-    for other in catalog:
-        if other is entry:
-            continue
-        longer_candidates = {other.normalized, *other.aliases}
-        for longer_candidate in longer_candidates:
-            longer_tokens = longer_candidate.split()
-            if len(longer_tokens) <= len(candidate_tokens):
-                continue
-            if not re.search(rf"\b{re.escape(candidate)}\b", longer_candidate):
-                continue
-            if re.search(rf"\b{re.escape(longer_candidate)}\b", normalized_text):
-                return True
-    return False
+
+_COMPILED_TRAINING_CATALOG: Optional[CompiledTrainingCatalog] = None
+
+
+def _compiled_training_catalog() -> CompiledTrainingCatalog:
+    global _COMPILED_TRAINING_CATALOG
+    if _COMPILED_TRAINING_CATALOG is None:
+        _COMPILED_TRAINING_CATALOG = CompiledTrainingCatalog.build(_training_catalog())
+    return _COMPILED_TRAINING_CATALOG
 
 
 def extract_board_training_matches(text: str) -> List[BoardTrainingMatch]:
@@ -496,27 +594,13 @@ def extract_board_training_matches(text: str) -> List[BoardTrainingMatch]:
 
     matches: List[BoardTrainingMatch] = []
     seen_trainings: set[Tuple[str, str]] = set()
-    catalog = _training_catalog()
-    ambiguous_names = set(_ambiguous_board_training_names())
-
-    for entry in catalog:
-        exact_candidates = set(entry.aliases)
-        if entry.normalized not in ambiguous_names:
-            exact_candidates.add(entry.normalized)
-        matched_candidate = next(
-            (
-                candidate
-                for candidate in sorted(exact_candidates, key=len, reverse=True)
-                if candidate and re.search(rf"\b{re.escape(candidate)}\b", normalized_text)
-                and not _is_short_training_candidate_inside_longer_training(
-                    normalized_text,
-                    candidate,
-                    entry,
-                    catalog,
-                )
-            ),
-            None,
-        )
+    compiled = _compiled_training_catalog()
+
+    # A short name inside a longer requested name (mobile command in wildland
+    # mobile command center) only counts when the longer one is absent
+    found = compiled.trie.find(normalized_text.split())
+    for index, entry in enumerate(compiled.entries):
+        matched_candidate = first_present(compiled.candidates[index], found, compiled.containers[index])
         if matched_candidate:
             seen_trainings.add((entry.discipline, entry.training))
             matches.append(
@@ -535,34 +619,36 @@ def extract_board_training_matches(text: str) -> List[BoardTrainingMatch]:
     ]
     chunks = [chunk for chunk in chunks if len(chunk) >= 3]
     for chunk in chunks:
+        chunk_tokens = chunk.split()
+        chunk_found = compiled.trie.find(chunk_tokens)
+        chunk_profile = ChunkProfile(chunk)
         best: Tuple[float, Optional[TrainingCatalogEntry]] = (0.0, None)
-        for entry in catalog:
+        for index, entry in enumerate(compiled.entries):
             key = (entry.discipline, entry.training)
             if key in seen_trainings:
                 continue
-            if entry.normalized in ambiguous_names:
-                if not _mentions_board_discipline_prefix(chunk, entry.discipline, entry.training):
+            if compiled.ambiguous[index]:
+                if not any(contains_phrase(chunk, prefix) for prefix in compiled.prefixes[index]):
                     continue
-                if not _has_board_training_specific_tokens(chunk, entry.training):
+                if not compiled.specific_tokens[index].issubset(chunk_tokens):
                     continue
-            candidates = list(entry.aliases)
-            if entry.normalized not in ambiguous_names:
-                candidates.append(entry.normalized)
-            candidates = [candidate for candidate in candidates if candidate]
+            containers = compiled.containers[index]
             candidates = [
                 candidate
-                for candidate in candidates
-                if not _is_short_training_candidate_inside_longer_training(
-                    chunk,
-                    candidate,
-                    entry,
-                    catalog,
-                )
+                for candidate in compiled.candidates[index]
+                if not (containers.get(candidate) and not containers[candidate].isdisjoint(chunk_found))
             ]
             if not candidates:
                 continue
+            contained = any(candidate in chunk for candidate in candidates)
+            # Only score entries whose best possible score could still win
+            bound = max(compiled.score_bound(candidate, chunk_profile) for candidate in candidates)
+            if contained:
+                bound = max(bound, 0.88)
+            if bound < BOARD_MATCH_THRESHOLD or bound <= best[0]:
+                continue
             score = max(_candidate_training_score(chunk, candidate) for candidate in candidates)
-            if any(candidate in chunk for candidate in candidates):
+            if contained:
                 score = max(score, 0.88)
             if score > best[0]:
                 best = (score, entry)
@@ -620,164 +706,8 @@ def describe_ambiguous_board_training_request(text: str) -> Optional[str]:
     return " ".join(descriptions[:3])
 
 
-class TrainingBoardPageParser(HTMLParser):
-    """Parse MissionChief alliance board pages for training requests and reply form data."""
-
-    def __init__(self):
-        super().__init__(convert_charrefs=True)
-        self.posts: List[BoardTrainingPost] = []
-        self.page_numbers: List[int] = []
-        self.current_user_id: Optional[str] = None
-        self.reply_action: Optional[str] = None
-        self.reply_token: Optional[str] = None
-        self._post: Optional[dict] = None
-        self._post_depth = 0
-        self._content_depth = 0
-        self._capture_author = False
-        self._capture_content = False
-        self._capture_page_number = False
-        self._capture_active_page = False
-
-    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
-        attr = {key: value for key, value in attrs}
-
-        if tag == "div" and str(attr.get("id") or "").startswith("post-on-page-"):
-            self._post = {
-                "post_id": None,
-                "author_id": None,
-                "author_name": "",
-                "created_at": "",
-                "content": [],
-            }
-            self._post_depth = 1
-            return
-
-        if self._post is not None and tag == "div":
-            self._post_depth += 1
-            classes = str(attr.get("class") or "")
-            if "col-md-11" in classes:
-                self._content_depth = self._post_depth
-                self._capture_content = True
-
-        if self._post is not None and tag == "a":
-            href = str(attr.get("href") or "")
-            profile_match = re.search(r"/profile/(\d+)", href)
-            if profile_match and not self._post.get("author_id"):
-                self._post["author_id"] = profile_match.group(1)
-                self._capture_author = True
-
-            post_match = re.search(r"/alliance_posts/(\d+)", href)
-            if post_match:
-                self._post["post_id"] = int(post_match.group(1))
-
-        if self._post is not None and tag == "span":
-            title = attr.get("title")
-            if title and not self._post.get("created_at"):
-                self._post["created_at"] = str(title)
-
-        if self._post is not None and self._capture_content and tag == "br":
-            self._post["content"].append("\n")
-
-        if tag == "a":
-            href = str(attr.get("href") or "")
-            page_match = re.search(r"[?&]page=(\d+)", href)
-            if page_match:
-                self.page_numbers.append(int(page_match.group(1)))
-            self._capture_page_number = bool(page_match)
-
-        if tag == "li" and "active" in str(attr.get("class") or ""):
-            self._capture_active_page = True
-
-        if tag == "form" and str(attr.get("id") or "") == "new_alliance_post":
-            self.reply_action = attr.get("action")
-
-        if tag == "input" and attr.get("name") == "authenticity_token":
-            token = attr.get("value")
-            if token:
-                self.reply_token = token
-
-    def handle_data(self, data: str):
-        if "user_id =" in data:
-            match = re.search(r"user_id\s*=\s*(\d+)", data)
-            if match:
-                self.current_user_id = match.group(1)
-
-        if self._post is not None and self._capture_author:
-            text = re.sub(r"\s+", " ", data).strip()
-            if text:
-                self._post["author_name"] = text
-
-        if self._post is not None and self._capture_content:
-            self._post["content"].append(data)
-
-        if self._capture_page_number:
-            try:
-                self.page_numbers.append(int(data.strip()))
-            except ValueError:
-                pass
-
-        if self._capture_active_page:
-            try:
-                self.page_numbers.append(int(data.strip()))
-            except ValueError:
-                pass
-
-    def handle_endtag(self, tag: str):
-        if self._capture_author and tag == "a":
-            self._capture_author = False
-
-        if self._capture_page_number and tag == "a":
-            self._capture_page_number = False
-
-        if self._capture_active_page and tag == "li":
-            self._capture_active_page = False
-
-        if self._post is not None and tag == "div":
-            if self._capture_content and self._post_depth == self._content_depth:
-                self._capture_content = False
-                self._content_depth = 0
-
-            self._post_depth -= 1
-            if self._post_depth <= 0:
-                self._finish_post()
-
-    def _finish_post(self) -> None:
-        if self._post is None:
-            return
-
-        post_id = self._post.get("post_id")
-        if post_id is None:
-            self._post = None
-            return
-
-        content = "".join(self._post.get("content") or [])
-        content = re.sub(r"\n\s*\n+", "\n", content)
-        content = re.sub(r"[ \t]+", " ", content).strip()
-        self.posts.append(
-            BoardTrainingPost(
-                post_id=int(post_id),
-                author_id=self._post.get("author_id"),
-                author_name=str(self._post.get("author_name") or "Unknown"),
-                created_at=str(self._post.get("created_at") or ""),
-                content=content,
-            )
-        )
-        self._post = None
-
-    def page(self) -> BoardPage:
-        return BoardPage(
-            posts=self.posts,
-            last_page=max(self.page_numbers or [1]),
-            current_user_id=self.current_user_id,
-            reply_action=self.reply_action,
-            reply_token=self.reply_token,
-        )
-
-
-def parse_training_board_page(html: str) -> BoardPage:
-    parser = TrainingBoardPageParser()
-    parser.feed(html or "")
-    return parser.page()
+TrainingBoardPageParser = BoardPageParser
+parse_training_board_page = parse_board_page
 
 
 class MissionChiefFormParser(HTMLParser):
@@ -853,7 +783,9 @@ class AcademyPageParser(HTMLParser):
         self.room_options: List[int] = []
         self.cost_options: List[int] = []
         self.courses: List[AcademyCourse] = []
+        self.running_seconds: List[int] = []
         self._select_name: Optional[str] = None
+        self._in_script = False
         self._current_option_value: Optional[str] = None
         self._current_option_text: List[str] = []
 
@@ -870,10 +802,14 @@ class AcademyPageParser(HTMLParser):
         elif tag == "option" and self._select_name:
             self._current_option_value = attr.get("value") or ""
             self._current_option_text = []
+        elif tag == "script":
+            self._in_script = True
 
     def handle_data(self, data: str):
         if self._current_option_value is not None:
             self._current_option_text.append(data)
+        if self._in_script:
+            self.running_seconds.extend(int(value) for value in re.findall(r"educationCountdown\(\s*(\d+)", data))
 
     def handle_endtag(self, tag: str):
         if tag == "option" and self._select_name and self._current_option_value is not None:
@@ -901,6 +837,8 @@ class AcademyPageParser(HTMLParser):
             self._current_option_text = []
         elif tag == "select":
             self._select_name = None
+        elif tag == "script":
+            self._in_script = False
 
     def page(self) -> AcademyPage:
         return AcademyPage(
@@ -909,6 +847,7 @@ class AcademyPageParser(HTMLParser):
             available_rooms=max(self.room_options) if self.room_options else 0,
             costs=sorted(set(self.cost_options)),
             courses=self.courses,
+            running_seconds=self.running_seconds,
         )
 
 
@@ -918,6 +857,41 @@ def parse_academy_page(html: str) -> AcademyPage:
     return parser.page()
 
 
+class AcademyPageCache:
+    """Parsed academy pages by building id, for availability refreshes.
+
+    A page is reused for ``ttl_seconds``. When every classroom is running and the
+    page shows when the courses end, nothing can change before the first one
+    ends, so the page is reused until then instead.
+    """
+
+    def __init__(self, ttl_seconds: float = ACADEMY_PAGE_CACHE_SECONDS, clock=time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._pages: Dict[int, Tuple[float, AcademyPage]] = {}
+
+    def get(self, building_id: int) -> Optional[AcademyPage]:
+        cached = self._pages.get(building_id)
+        if cached is None:
+            return None
+        expires_at, page = cached
+        if self._clock() >= expires_at:
+            del self._pages[building_id]
+            return None
+        return page
+
+    def put(self, building_id: int, page: AcademyPage) -> None:
+        now = self._clock()
+        if page.available_rooms == 0 and page.running_seconds:
+            expires_at = now + min(page.running_seconds)
+        else:
+            expires_at = now + self.ttl_seconds
+        self._pages[building_id] = (expires_at, page)
+
+    def invalidate(self, building_id: int) -> None:
+        self._pages.pop(building_id, None)
+
+
 class MissionChiefProfileParser(HTMLParser):
     def __init__(self):
         super().__init__(convert_charrefs=True)
@@ -2245,8 +2219,11 @@ class TrainingManager(commands.Cog):
         self._reminder_task = self.bot.loop.create_task(self._reminder_loop())
         self._panel_task = self.bot.loop.create_task(self._ensure_member_panels())
         self._developer_panel_task = self.bot.loop.create_task(self._ensure_developer_panels())
+        self._academy_pages = AcademyPageCache()
         self._availability_task = self.bot.loop.create_task(self._availability_loop())
-        self._board_poll_task = self.bot.loop.create_task(self._board_poll_loop())
+        self._board_poll_targets: Dict[int, Tuple[discord.Guild, dict]] = {}
+        self._board_watcher = shared_board_watcher(self.bot)
+        self._board_watcher.subscribe(BOARD_WATCH_OWNER, self._board_watch_threads, self._on_board_update)
         self._board_guide_task = self.bot.loop.create_task(self._board_guide_loop())
         self._board_cleanup_task = self.bot.loop.create_task(self._board_cleanup_loop())
 
@@ -2259,8 +2236,7 @@ class TrainingManager(commands.Cog):
             self._developer_panel_task.cancel()
         if self._availability_task:
             self._availability_task.cancel()
-        if self._board_poll_task:
-            self._board_poll_task.cancel()
+        self._board_watcher.unsubscribe(BOARD_WATCH_OWNER)
         if self._board_guide_task:
             self._board_guide_task.cancel()
         if self._board_cleanup_task:
@@ -2278,27 +2254,76 @@ class TrainingManager(commands.Cog):
 
     # --------------- Reminder machinery ---------------
 
+    def _get_scheduler(self):
+        bot = getattr(self, "bot", None)
+        return bot.get_cog("Scheduler") if bot else None
+
+    def _reminder_job_key(self, guild_id: int, reminder: dict) -> str:
+        """Stable Scheduler key so migrating the same Config reminder twice reschedules it."""
+        fields = (
+            reminder.get("user_id"),
+            reminder.get("when_ts"),
+            reminder.get("fallback_channel_id"),
+            reminder.get("text"),
+        )
+        digest = hashlib.sha256(repr(fields).encode("utf-8")).hexdigest()[:16]
+        return f"reminder:{int(guild_id)}:{int(reminder.get('when_ts', 0))}:{digest}"
+
     async def _add_reminder(self, guild_id: int, user_id: int, text: str, when, fallback_channel_id: int):
-        """Persist a reminder and let the loop pick it up."""
+        """Persist a reminder with the shared Scheduler, or in Config for the loop."""
         if isinstance(when, datetime):
             when_ts = int(when.replace(tzinfo=timezone.utc).timestamp())
         else:
             when_ts = int(when)
+        reminder = {
+            "user_id": int(user_id),
+            "text": str(text),
+            "when_ts": int(when_ts),
+            "fallback_channel_id": int(fallback_channel_id),
+        }
+        scheduler = self._get_scheduler()
+        if scheduler:
+            await scheduler.schedule(
+                "TrainingManager",
+                when_ts,
+                {"kind": "reminder", "guild_id": int(guild_id), **reminder},
+            )
+            return
         async with self.config.guild_from_id(guild_id).reminders() as rems:
-            rems.append({
-                "user_id": int(user_id),
-                "text": str(text),
-                "when_ts": int(when_ts),
-                "fallback_channel_id": int(fallback_channel_id),
-            })
+            rems.append(reminder)
+
+    async def handle_scheduled_job(self, job: dict):
+        """Scheduler callback: deliver a reminder that became due."""
+        payload = job.get("payload") or {}
+        if payload.get("kind") != "reminder":
+            return
+        guild = self.bot.get_guild(int(payload.get("guild_id", 0)))
+        if not guild:
+            return
+        async with self._bot_status(f"sending 1 training reminders in {guild.name}"):
+            await self._deliver_reminder(guild, payload)
 
     async def _reminder_loop(self):
+        """Deliver Config reminders; hand them to the Scheduler when it is loaded."""
         await self.bot.wait_until_red_ready()
         while True:
+            scheduler = self._get_scheduler()
             try:
                 for guild in self.bot.guilds:
                     conf = await self.config.guild(guild).all()
                     rems = conf.get("reminders", [])
+                    if not rems:
+                        continue
+                    if scheduler:
+                        for r in rems:
+                            await scheduler.schedule(
+                                "TrainingManager",
+                                int(r.get("when_ts", 0)),
+                                {"kind": "reminder", "guild_id": guild.id, **r},
+                                key=self._reminder_job_key(guild.id, r),
+                            )
+                        await self.config.guild(guild).reminders.set([])
+                        continue
                     now_ts = int(datetime.now(timezone.utc).timestamp())
                     due = [r for r in rems if r.get("when_ts", 10**18) <= now_ts]
                     if not due:
@@ -2317,7 +2342,8 @@ class TrainingManager(commands.Cog):
                 break
             except Exception as e:
                 log.exception("Reminder loop error: %r", e)
-            await asyncio.sleep(30)
+            # With the Scheduler loaded this loop only migrates stragglers
+            await asyncio.sleep(REMINDER_MIGRATION_INTERVAL_SECONDS if scheduler else 30)
 
     async def _deliver_reminder(self, guild: discord.Guild, r: dict):
         user = guild.get_member(int(r["user_id"]))
@@ -2457,6 +2483,10 @@ class TrainingManager(commands.Cog):
             filtered.sort(key=lambda academy: academy.building_id != preferred_id)
         return filtered, status
 
+    def _mc_request_slot(self, priority: str = "scraper"):
+        """Pace one MissionChief request through CookieManager's request governor."""
+        return mc_request_slot(getattr(self, "bot", None), "TrainingManager", priority)
+
     async def _fetch_all_available_academies(self, session) -> Tuple[List[AvailableAcademy], Optional[int]]:
         next_url = f"https://www.missionchief.com{AUTO_BUILDING_LIST_PATH}"
         academies: List[AvailableAcademy] = []
@@ -2468,7 +2498,7 @@ class TrainingManager(commands.Cog):
                 break
             seen_urls.add(next_url)
 
-            async with session.get(next_url, allow_redirects=True) as response:
+            async with self._mc_request_slot(), session.get(next_url, allow_redirects=True) as response:
                 status = getattr(response, "status", None)
                 html = await response.text()
             last_status = status
@@ -2503,32 +2533,65 @@ class TrainingManager(commands.Cog):
         if status is not None and int(status) >= 400:
             return availability, f"Academy list returned HTTP {status}"
 
+        pending: List[AvailableAcademy] = []
         for academy in academies:
             if academy.discipline not in availability:
                 continue
+            availability[academy.discipline].academies_checked += 1
+            if academy.has_start_button:
+                pending.append(academy)
+
+        pages = await self._fetch_academy_pages(session, pending)
+        for academy in pending:
             stats = availability[academy.discipline]
-            stats.academies_checked += 1
-            if not academy.has_start_button:
-                continue
-            try:
-                async with session.get(f"https://www.missionchief.com/buildings/{academy.building_id}", allow_redirects=True) as response:
-                    academy_status = getattr(response, "status", None)
-                    html = await response.text()
-                if academy_status is not None and int(academy_status) >= 400:
-                    stats.errors += 1
-                    continue
-                page = parse_academy_page(html)
-            except Exception as exc:
-                log.info("Could not inspect academy %s: %s", academy.building_id, exc)
+            page = pages.get(academy.building_id)
+            if page is None:
                 stats.errors += 1
                 continue
-
             if page.available_rooms > 0:
                 stats.academies_available += 1
                 stats.available_classrooms += page.available_rooms
 
         return availability, None
 
+    async def _fetch_academy_pages(self, session, academies: List[AvailableAcademy]) -> Dict[int, AcademyPage]:
+        """Academy pages by building id, from the cache or fetched a few at a time."""
+        cache = self._academy_pages
+        pages: Dict[int, AcademyPage] = {}
+        to_fetch: List[int] = []
+        for academy in academies:
+            page = cache.get(academy.building_id)
+            if page is None:
+                to_fetch.append(academy.building_id)
+            else:
+                pages[academy.building_id] = page
+
+        semaphore = asyncio.Semaphore(ACADEMY_FETCH_CONCURRENCY)
+
+        async def fetch(building_id: int) -> None:
+            url = f"https://www.missionchief.com/buildings/{building_id}"
+            try:
+                async with semaphore, self._mc_request_slot():
+                    async with session.get(url, allow_redirects=True) as response:
+                        status = getattr(response, "status", None)
+                        html = await response.text()
+                if status is not None and int(status) >= 400:
+                    return
+                page = parse_academy_page(html)
+            except Exception as exc:
+                log.info("Could not inspect academy %s: %s", building_id, exc)
+                return
+            cache.put(building_id, page)
+            pages[building_id] = page
+
+        await asyncio.gather(*(fetch(building_id) for building_id in to_fetch))
+        log.debug(
+            "Academy availability: %s page(s) fetched, %s from cache",
+            len(to_fetch),
+            len(academies) - len(to_fetch),
+        )
+        return pages
+
     async def _try_auto_open_training(
         self,
         guild: discord.Guild,
@@ -2697,6 +2760,8 @@ class TrainingManager(commands.Cog):
             post_status = getattr(response, "status", None)
             await response.text()
 
+        # The academy's classrooms changed (or may have), so the next refresh reloads it
+        self._academy_pages.invalidate(academy_id)
         if post_status is None or int(post_status) >= 400:
             return AutoTrainingResult(
                 False,
@@ -2721,40 +2786,30 @@ class TrainingManager(commands.Cog):
             status=post_status,
         )
 
-    async def _board_poll_loop(self) -> None:
-        await self.bot.wait_until_red_ready()
-        while True:
-            try:
-                poll_targets: Dict[int, Tuple[discord.Guild, dict]] = {}
-                for guild in self.bot.guilds:
-                    conf = await self.config.guild(guild).all()
-                    if not conf.get("board_poll_enabled"):
-                        continue
-                    thread_id = int(conf.get("board_thread_id") or BOARD_THREAD_ID)
-                    poll_targets.setdefault(thread_id, (guild, conf))
-
-                for guild, conf in poll_targets.values():
-                    async with self._bot_status(f"checking training board in {guild.name}", priority=55):
-                        await self._poll_training_board_for_guild(guild, conf)
-            except asyncio.CancelledError:
-                break
-            except Exception as exc:
-                log.exception("Training board poll loop error: %s", exc)
-            await asyncio.sleep(BOARD_POLL_SECONDS)
-
-    async def _poll_training_board_for_guild(self, guild: discord.Guild, conf: dict) -> None:
-        cookie_manager = self.bot.get_cog("CookieManager")
-        if not cookie_manager or not hasattr(cookie_manager, "get_session"):
-            log.info("Training board poll skipped: CookieManager is not loaded")
-            return
-
-        thread_id = int(conf.get("board_thread_id") or BOARD_THREAD_ID)
-        session = await cookie_manager.get_session()
-        page, status = await self._fetch_training_board_latest_page(session, thread_id)
-        if status is not None and int(status) >= 400:
-            log.warning("Training board poll failed: thread %s returned HTTP %s", thread_id, status)
+    async def _board_watch_threads(self) -> List[int]:
+        """Board threads the shared watcher should poll for this cog, one guild per thread."""
+        poll_targets: Dict[int, Tuple[discord.Guild, dict]] = {}
+        for guild in self.bot.guilds:
+            conf = await self.config.guild(guild).all()
+            if not conf.get("board_poll_enabled"):
+                continue
+            thread_id = int(conf.get("board_thread_id") or BOARD_THREAD_ID)
+            poll_targets.setdefault(thread_id, (guild, conf))
+        self._board_poll_targets = poll_targets
+        return list(poll_targets)
+
+    async def _on_board_update(self, update: BoardUpdate) -> None:
+        target = self._board_poll_targets.get(update.thread_id)
+        if target is None:
             return
-
+        guild, conf = target
+        async with self._bot_status(f"checking training board in {guild.name}", priority=55):
+            await self._process_training_board_update(guild, conf, update)
+
+    async def _process_training_board_update(self, guild: discord.Guild, conf: dict, update: BoardUpdate) -> None:
+        thread_id = update.thread_id
+        session = update.session
+        page = update.page
         if not page.posts:
             return
 
@@ -2782,7 +2837,7 @@ class TrainingManager(commands.Cog):
             processed_post_ids = list(dict.fromkeys([*processed_post_ids, *guild_processed_post_ids]))
         new_posts = [
             post
-            for post in sorted(page.posts, key=lambda item: item.post_id)
+            for post in update.new_posts
             if post.post_id > last_seen
             and post.post_id not in processed_post_ids
             and post.author_id != page.current_user_id
@@ -2822,21 +2877,7 @@ class TrainingManager(commands.Cog):
             await self.config.guild(guild).board_last_seen_post_id.set(latest_post_id)
 
     async def _fetch_training_board_latest_page(self, session, thread_id: int) -> Tuple[BoardPage, Optional[int]]:
-        base_url = f"https://www.missionchief.com/alliance_threads/{thread_id}"
-        async with session.get(base_url, allow_redirects=True) as response:
-            status = getattr(response, "status", None)
-            html = await response.text()
-        page = parse_training_board_page(html)
-        if status is not None and int(status) >= 400:
-            return page, status
-
-        if page.last_page > 1:
-            last_url = f"{base_url}?page={page.last_page}"
-            async with session.get(last_url, allow_redirects=True) as response:
-                status = getattr(response, "status", None)
-                html = await response.text()
-            page = parse_training_board_page(html)
-        return page, status
+        return await fetch_latest_board_page(session, thread_id)
 
     def _normalize_board_post_ids(self, values) -> List[int]:
         post_ids: List[int] = []
@@ -4139,16 +4180,19 @@ class TrainingManager(commands.Cog):
             return
         if normalized == "reset":
             await self.config.guild(ctx.guild).board_last_seen_post_id.set(None)
+            self._board_watcher.rewind(BOARD_WATCH_OWNER)
             await ctx.send("Training board baseline reset. The next poll will baseline the latest post without processing older posts.")
             return
 
         conf = await self.config.guild(ctx.guild).all()
+        thread_id = int(conf.get("board_thread_id") or BOARD_THREAD_ID)
         await ctx.send(
             "Training board polling status\n"
             f"Enabled: {bool(conf.get('board_poll_enabled'))}\n"
-            f"Thread ID: {conf.get('board_thread_id') or BOARD_THREAD_ID}\n"
+            f"Thread ID: {thread_id}\n"
             f"Last seen post ID: {conf.get('board_last_seen_post_id') or 'not set'}\n"
-            f"Interval: {BOARD_POLL_SECONDS // 60} minutes"
+            f"Interval: {int(self._board_watcher.poll_seconds) // 60} minutes\n"
+            f"{format_board_watch_stats(self._board_watcher.stats(thread_id).get(thread_id))}"
         )
 
     @tmset.command(name="boardthread")
@@ -4157,6 +4201,7 @@ class TrainingManager(commands.Cog):
         """Set the MissionChief alliance thread ID used for board training requests."""
         await self.config.guild(ctx.guild).board_thread_id.set(int(thread_id))
         await self.config.guild(ctx.guild).board_last_seen_post_id.set(None)
+        self._board_watcher.rewind(BOARD_WATCH_OWNER)
         await ctx.send(
             f"Training board thread set to `{int(thread_id)}`. "
             "The next poll will baseline the latest post without processing older posts."